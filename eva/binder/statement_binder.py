@@ -32,12 +32,13 @@ from eva.parser.alias import Alias
 from eva.parser.create_mat_view_statement import CreateMaterializedViewStatement
 from eva.parser.drop_statement import DropTableStatement
 from eva.parser.load_statement import LoadDataStatement
+from eva.parser.optimize_statement import OptimizeTableStatement
 from eva.parser.select_statement import SelectStatement
 from eva.parser.statement import AbstractStatement
 from eva.parser.table_ref import TableRef
 from eva.parser.types import FileFormatType
 from eva.parser.upload_statement import UploadStatement
-from eva.utils.generic_utils import path_to_class
+from eva.utils.generic_utils import configure_udf, find_files, path_to_class
 from eva.utils.logging_manager import logger
 
 if sys.version_info >= (3, 8):
@@ -124,10 +125,7 @@ class StatementBinder:
                 upload_dir = Path(
                     ConfigurationManager().get_value("storage", "upload_dir")
                 )
-                if (
-                    Path(node.path).exists()
-                    or Path(Path(upload_dir) / node.path).exists()
-                ):
+                if find_files(str(node.path), upload_dir):
                     create_video_metadata(name)
 
                 # else raise error
@@ -171,6 +169,17 @@ class StatementBinder:
         for table in node.table_refs:
             self.bind(table)
 
+    @bind.register(OptimizeTableStatement)
+    def _bind_optimize_table_statement(self, node: OptimizeTableStatement):
+        self.bind(node.table_ref)
+        table_obj = node.table_ref.table.table_obj
+        if node.sort_column is not None:
+            column_names = [column.name for column in table_obj.columns]
+            if node.sort_column not in column_names:
+                err_msg = f"Table {table_obj.name} has no column {node.sort_column}"
+                logger.error(err_msg)
+                raise BinderError(err_msg)
+
     @bind.register(TableRef)
     def _bind_tableref(self, node: TableRef):
         if node.is_table_atom():
@@ -246,6 +255,14 @@ class StatementBinder:
             logger.error(err_msg)
             raise BinderError(err_msg)
 
+        node.udf_options = udf_obj.options
+        try:
+            configure_udf(node.function, udf_obj.options)
+        except Exception as e:
+            err_msg = f"Failed to configure UDF {udf_obj.name}: {str(e)}"
+            logger.error(err_msg)
+            raise BinderError(err_msg)
+
         output_objs = self._catalog.get_udf_outputs(udf_obj)
         if node.output:
             for obj in output_objs:
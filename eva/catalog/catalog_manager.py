@@ -206,6 +206,7 @@ class CatalogManager(object):
         impl_file_path: str,
         type: str,
         udf_io_list: List[UdfIO],
+        options: dict = None,
     ) -> UdfMetadata:
         """Creates an udf metadata object and udf_io objects and persists them
         in database.
@@ -217,12 +218,13 @@ class CatalogManager(object):
             type(str): what kind of udf operator like classification,
                                                         detection etc
             udf_io_list(List[UdfIO]): input/output info of this udf
+            options(dict): options of the udf, e.g., its execution backend
 
         Returns:
             The persisted UdfMetadata object with the id field populated.
         """
 
-        metadata = self._udf_service.create_udf(name, impl_file_path, type)
+        metadata = self._udf_service.create_udf(name, impl_file_path, type, options)
         for udf_io in udf_io_list:
             udf_io.udf_id = metadata.id
         self._udf_io_service.add_udf_io(udf_io_list)
@@ -12,7 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from sqlalchemy import Column, Integer
+from sqlalchemy import Column, Integer, inspect
 from sqlalchemy.exc import DatabaseError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy_utils import create_database, database_exists, drop_database
@@ -102,6 +102,42 @@ def init_db():
         create_database(engine.url)
     logger.info("Creating tables")
     BaseModel.metadata.create_all()
+    upgrade_db(engine)
+
+
+def upgrade_db(engine=None):
+    """Add the columns missing from the tables of an existing catalog.
+
+    create_all only creates the missing tables, so a catalog created by an
+    older version lacks the columns added to the models since (e.g.,
+    udf.options). Only nullable columns can be added, the rows already in
+    the catalog get NULL for them.
+    """
+    engine = engine or SQLConfig().engine
+    inspector = inspect(engine)
+    table_names = set(inspector.get_table_names())
+    preparer = engine.dialect.identifier_preparer
+    for table in BaseModel.metadata.sorted_tables:
+        if table.name not in table_names:
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable:
+                msg = (
+                    f"Cannot upgrade the catalog table {table.name}, the column "
+                    f"{column.name} is not nullable. Reset the catalog."
+                )
+                logger.error(msg)
+                raise RuntimeError(msg)
+            logger.info(f"Adding column {column.name} to table {table.name}")
+            column_type = column.type.compile(dialect=engine.dialect)
+            with engine.begin() as conn:
+                conn.execute(
+                    f"ALTER TABLE {preparer.quote(table.name)} "
+                    f"ADD COLUMN {preparer.quote(column.name)} {column_type}"
+                )
 
 
 def drop_db():
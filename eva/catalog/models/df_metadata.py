@@ -63,6 +63,15 @@ class DataFrameMetadata(BaseModel):
     def columns(self):
         return self._columns
 
+    def load_columns(self):
+        """
+        Loads the columns of the table from the catalog unless they are
+        loaded already, e.g., before the table is read by another thread,
+        which cannot use the catalog session. Columns expired by a commit
+        are reloaded.
+        """
+        return list(self._columns)
+
     @property
     def identifier_column(self):
         return self._unique_identifier_column
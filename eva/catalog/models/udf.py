@@ -12,7 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from sqlalchemy import Column, String
+from sqlalchemy import JSON, Column, String
 from sqlalchemy.orm import relationship
 
 from eva.catalog.models.base_model import BaseModel
@@ -24,15 +24,17 @@ class UdfMetadata(BaseModel):
     _name = Column("name", String(100), unique=True)
     _impl_file_path = Column("impl_file_path", String(128))
     _type = Column("type", String(100))
+    _options = Column("options", JSON, nullable=True)
 
     _cols = relationship(
         "UdfIO", back_populates="_udf", cascade="all, delete, delete-orphan"
     )
 
-    def __init__(self, name: str, impl_file_path: str, type: str):
+    def __init__(self, name: str, impl_file_path: str, type: str, options: dict = None):
         self._name = name
         self._impl_file_path = impl_file_path
         self._type = type
+        self._options = options
 
     @property
     def id(self):
@@ -50,6 +52,10 @@ class UdfMetadata(BaseModel):
     def type(self):
         return self._type
 
+    @property
+    def options(self):
+        return self._options or {}
+
     def display_format(self):
         inputs = []
         outputs = []
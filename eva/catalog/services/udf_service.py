@@ -23,18 +23,21 @@ class UdfService(BaseService):
     def __init__(self):
         super().__init__(UdfMetadata)
 
-    def create_udf(self, name: str, impl_path: str, type: str) -> UdfMetadata:
+    def create_udf(
+        self, name: str, impl_path: str, type: str, options: dict = None
+    ) -> UdfMetadata:
         """Creates a new udf entry
 
         Arguments:
             name (str): name of the udf
             impl_path (str): path to the udf implementation relative to eva/udf
             type (str): udf operator kind, classification or detection or etc
+            options (dict): options of the udf, e.g., its execution backend
 
         Returns:
             UdfMetadata: Returns the new entry created
         """
-        metadata = self.model(name, impl_path, type)
+        metadata = self.model(name, impl_path, type, options)
         metadata = metadata.save()
         return metadata
 
@@ -23,6 +23,9 @@ from eva.configuration.constants import (
     EVA_INSTALLATION_DIR,
 )
 
+# default of get_value for the keys that must be in the configuration
+_REQUIRED = object()
+
 
 class ConfigurationManager(object):
     _instance = None
@@ -65,8 +68,18 @@ class ConfigurationManager(object):
             yml_file.truncate()
 
     @classmethod
-    def get_value(cls, category: str, key: str) -> Any:
-        return cls._get(category, key)
+    def get_value(cls, category: str, key: str, default: Any = _REQUIRED) -> Any:
+        """
+        Returns the value of the key, or default if the configuration has no
+        such key, e.g., a key added after the eva.yml of the installation was
+        created. Raises KeyError for a missing key without a default.
+        """
+        try:
+            return cls._get(category, key)
+        except KeyError:
+            if default is _REQUIRED:
+                raise
+            return default
 
     @classmethod
     def update_value(cls, category, key, value) -> None:
@@ -16,3 +16,7 @@ DISCRETE = 0
 CONTINUOUS = 1
 NO_GPU = -1
 UNDEFINED_GROUP_ID = -1
+
+# UDF execution modes, set by the mode option of CREATE UDF
+UDF_THREAD_MODE = "thread"
+UDF_PROCESS_MODE = "process"
@@ -83,6 +83,7 @@ class CreateMaterializedViewExecutor(AbstractExecutor):
             StorageEngine.create(table=view_metainfo)
 
             # Populate the view
-            for batch in child.exec():
-                batch.drop_column_alias()
-                StorageEngine.write(view_metainfo, batch)
+            with StorageEngine.open_write_session(view_metainfo) as session:
+                for batch in child.exec():
+                    batch.drop_column_alias()
+                    session.append(batch)
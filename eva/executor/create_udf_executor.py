@@ -18,7 +18,7 @@ from eva.catalog.catalog_manager import CatalogManager
 from eva.executor.abstract_executor import AbstractExecutor
 from eva.models.storage.batch import Batch
 from eva.planner.create_udf_plan import CreateUDFPlan
-from eva.utils.generic_utils import path_to_class
+from eva.utils.generic_utils import configure_udf, path_to_class
 from eva.utils.logging_manager import logger
 
 
@@ -52,7 +52,7 @@ class CreateUDFExecutor(AbstractExecutor):
         impl_path = self.node.impl_path.absolute().as_posix()
         # check if we can create the udf object
         try:
-            path_to_class(impl_path, self.node.name)()
+            udf = path_to_class(impl_path, self.node.name)()
         except Exception as e:
             err_msg = (
                 f"{str(e)}. Please verify that the UDF class name in the "
@@ -60,8 +60,19 @@ class CreateUDFExecutor(AbstractExecutor):
             )
             logger.error(err_msg)
             raise RuntimeError(err_msg)
+        # check if the udf supports its options
+        try:
+            configure_udf(udf, self.node.udf_options)
+        except Exception as e:
+            err_msg = f"Invalid options for UDF {self.node.name}: {str(e)}"
+            logger.error(err_msg)
+            raise RuntimeError(err_msg)
         catalog_manager.create_udf(
-            self.node.name, impl_path, self.node.udf_type, io_list
+            self.node.name,
+            impl_path,
+            self.node.udf_type,
+            io_list,
+            self.node.udf_options,
         )
         yield Batch(
             pd.DataFrame([f"UDF {self.node.name} successfully added to the database."])
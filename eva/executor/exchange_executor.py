@@ -0,0 +1,97 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import queue
+import threading
+from typing import Iterator
+
+from eva.executor.abstract_executor import AbstractExecutor
+from eva.models.storage.batch import Batch
+from eva.planner.exchange_plan import ExchangePlan
+from eva.utils.logging_manager import logger
+
+# Sentinel marking the end of the child stream
+_END_OF_STREAM = object()
+
+
+class ExchangeExecutor(AbstractExecutor):
+    """
+    Runs the child executor in a background thread and yields its batches
+    through a bounded queue. The producer blocks once queue_size batches are
+    buffered, which bounds the memory held by the exchange. Exceptions raised
+    by the child are re-raised in the consumer, and the producer is stopped
+    if the consumer terminates early (e.g., LIMIT).
+
+    Arguments:
+        node (ExchangePlan): The Exchange Plan
+
+    """
+
+    # Interval at which a blocked producer checks whether it should stop
+    _POLL_INTERVAL = 0.1
+
+    def __init__(self, node: ExchangePlan):
+        super().__init__(node)
+        self._queue_size = max(1, node.queue_size)
+
+    def validate(self):
+        pass
+
+    def _produce(
+        self,
+        child_batches: Iterator[Batch],
+        batches: queue.Queue,
+        stop: threading.Event,
+    ):
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=self._POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            for batch in child_batches:
+                if not put(batch):
+                    return
+            put(_END_OF_STREAM)
+        except Exception as e:
+            logger.exception("Exchange child failed: {}".format(e))
+            put(e)
+
+    def exec(self) -> Iterator[Batch]:
+        # the child may load catalog objects when its iterator is created,
+        # which can only be done in the calling thread
+        child_batches = self.children[0].exec()
+        batches = queue.Queue(maxsize=self._queue_size)
+        stop = threading.Event()
+        producer = threading.Thread(
+            target=self._produce,
+            args=(child_batches, batches, stop),
+            name="eva-exchange",
+            daemon=True,
+        )
+        producer.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is _END_OF_STREAM:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
@@ -12,13 +12,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import os
 import random
 import socket
-from typing import List, Set
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Set, Tuple
 
 from eva.configuration.configuration_manager import ConfigurationManager
 from eva.constants import NO_GPU
+from eva.executor.replica_pool import ReplicaPool
+from eva.executor.udf_process_pool import UDFProcessPool
 from eva.utils.generic_utils import is_gpu_available
 
 
@@ -30,6 +35,10 @@ class Context:
     """
 
     _instance = None
+    _thread_pool = None
+    _replica_pools: Dict[Tuple[str, str], ReplicaPool] = {}
+    _pools_lock = threading.Lock()
+    _process_pools: Dict[Tuple[str, str], UDFProcessPool] = {}
 
     def __new__(cls):
         if cls._instance is None:
@@ -44,6 +53,54 @@ class Context:
     def gpus(self):
         return self._gpus
 
+    @property
+    def thread_pool(self) -> ThreadPoolExecutor:
+        """
+        Thread pool shared by all the queries to evaluate independent
+        expressions concurrently. None if expression_threads <= 1.
+        """
+        if Context._thread_pool is None:
+            num_threads = self._config_manager.get_value(
+                "executor", "expression_threads", 4
+            )
+            if num_threads and num_threads > 1:
+                Context._thread_pool = ThreadPoolExecutor(
+                    max_workers=num_threads, thread_name_prefix="eva-expression"
+                )
+        return Context._thread_pool
+
+    def replica_pool(self, udf: Callable, options: dict = None) -> ReplicaPool:
+        """
+        Pool of CPU replicas of the UDF shared by all the queries, created on
+        first use. UDFs of the same class with different options get their
+        own replicas. None if cpu_replicas <= 1.
+        """
+        num_replicas = self._config_manager.get_value("executor", "cpu_replicas", 1)
+        if not num_replicas or num_replicas <= 1:
+            return None
+        key = _pool_key(udf, options or {})
+        with Context._pools_lock:
+            if key not in Context._replica_pools:
+                Context._replica_pools[key] = ReplicaPool(udf, num_replicas)
+            return Context._replica_pools[key]
+
+    def process_pool(self, udf: Callable, options: dict = None) -> UDFProcessPool:
+        """
+        Pool of worker processes running the UDF shared by all the queries,
+        created on first use. UDFs of the same class with different options
+        get their own pool. The number of workers is the workers option, by
+        default udf_workers.
+        """
+        options = options or {}
+        num_workers = options.get("workers")
+        if not num_workers:
+            num_workers = self._config_manager.get_value("executor", "udf_workers", 2)
+        key = _pool_key(udf, options)
+        with Context._pools_lock:
+            if key not in Context._process_pools:
+                Context._process_pools[key] = UDFProcessPool(udf, num_workers)
+            return Context._process_pools[key]
+
     def _possible_addresses(self) -> Set:
         host = socket.gethostname()
         result_address = {host}
@@ -93,3 +150,21 @@ class Context:
             # TODO: Should allow choosing GPU based on Spark and Horovod
             return self._select_random_gpu()
         return NO_GPU
+
+
+def _pool_key(udf: Callable, options: dict) -> Tuple[str, str]:
+    udf_class = "{}.{}".format(type(udf).__module__, type(udf).__qualname__)
+    return udf_class, json.dumps(options, sort_keys=True, default=str)
+
+
+def _reset_pools_after_fork():
+    # The threads and the worker processes of the pools are not inherited
+    # by forked children (e.g., partition workers), so the child creates its
+    # own pools on demand.
+    Context._thread_pool = None
+    Context._replica_pools = {}
+    Context._process_pools = {}
+    Context._pools_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_pools_after_fork)
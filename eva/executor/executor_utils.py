@@ -12,9 +12,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
+import numpy as np
+
+from eva.executor.execution_context import Context
 from eva.expression.abstract_expression import AbstractExpression
+from eva.expression.expression_compiler import get_predicate_kernel
+from eva.expression.expression_utils import (
+    expression_tree_to_conjunction_list,
+    get_function_expressions,
+)
 from eva.models.storage.batch import Batch
 
 
@@ -24,14 +33,84 @@ class ExecutorError(Exception):
 
 def apply_project(batch: Batch, project_list: List[AbstractExpression]):
     if not batch.empty() and project_list:
-        batches = [expr.evaluate(batch) for expr in project_list]
+        batches = evaluate_expressions(batch, project_list)
         batch = Batch.merge_column_wise(batches)
     return batch
 
 
 def apply_predicate(batch: Batch, predicate: AbstractExpression) -> Batch:
     if not batch.empty() and predicate is not None:
-        outcomes = predicate.evaluate(batch)
-        batch.drop_zero(outcomes)
-        batch.reset_index()
+        # the kernel, compiled on the first batch, avoids materializing a
+        # Batch per tree node
+        kernel = get_predicate_kernel(predicate)
+        if kernel is not None:
+            batch.filter(kernel(batch))
+            return batch
+
+        conjuncts = [predicate]
+        if isinstance(predicate, AbstractExpression):
+            conjuncts = expression_tree_to_conjunction_list(predicate)
+        if _concurrent_thread_pool(conjuncts) is None:
+            outcomes = predicate.evaluate(batch)
+            batch.drop_zero(outcomes)
+            return batch
+
+        # evaluate the cheap conjuncts first as they may prune rows, and
+        # then the UDF calls concurrently on the remaining rows
+        for conjunct in conjuncts:
+            if not _can_evaluate_concurrently(conjunct):
+                apply_predicate(batch, conjunct)
+        concurrent = [conj for conj in conjuncts if _can_evaluate_concurrently(conj)]
+        if not batch.empty():
+            outcomes = evaluate_expressions(batch, concurrent)
+            masks = [
+                (outcome.frames > 0).to_numpy().all(axis=1) for outcome in outcomes
+            ]
+            batch.filter(np.logical_and.reduce(masks))
     return batch
+
+
+def evaluate_expressions(
+    batch: Batch, expr_list: List[AbstractExpression]
+) -> List[Batch]:
+    """Evaluate the expressions on the batch and return the outcomes in
+    order. Expressions calling UDFs that only read the batch are evaluated
+    concurrently on the shared thread pool of the execution context.
+    """
+    thread_pool = _concurrent_thread_pool(expr_list)
+    if thread_pool is None:
+        return [expr.evaluate(batch) for expr in expr_list]
+
+    # expressions that may modify the batch go first
+    outcomes = [
+        None if _can_evaluate_concurrently(expr) else expr.evaluate(batch)
+        for expr in expr_list
+    ]
+    futures = {
+        idx: thread_pool.submit(expr.evaluate, batch)
+        for idx, expr in enumerate(expr_list)
+        if outcomes[idx] is None
+    }
+    for idx, future in futures.items():
+        outcomes[idx] = future.result()
+    return outcomes
+
+
+def _can_evaluate_concurrently(expr: AbstractExpression) -> bool:
+    # UDF calls dominate the cost of an expression. A UDF call only reads
+    # the batch unless it takes no arguments or shares hidden columns
+    # with other expressions.
+    if not isinstance(expr, AbstractExpression):
+        return False
+    func_exprs = get_function_expressions(expr)
+    return len(func_exprs) > 0 and all(
+        len(func_expr.children) and func_expr.hidden_alias is None
+        for func_expr in func_exprs
+    )
+
+
+def _concurrent_thread_pool(expr_list: List[AbstractExpression]) -> ThreadPoolExecutor:
+    num_concurrent = sum(_can_evaluate_concurrently(expr) for expr in expr_list)
+    if num_concurrent < 2:
+        return None
+    return Context().thread_pool
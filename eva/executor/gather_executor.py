@@ -0,0 +1,119 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import multiprocessing
+import queue
+from typing import Iterator
+
+from eva.executor.abstract_executor import AbstractExecutor
+from eva.models.storage.batch import Batch
+from eva.planner.gather_plan import GatherPlan
+from eva.utils.logging_manager import logger
+
+
+def _execute_partition(executor: AbstractExecutor, output: multiprocessing.Queue):
+    """
+    Entry point of a partition worker. The executor is inherited from the
+    parent through fork, so neither the plan nor the UDFs are pickled; only
+    the output batches are sent back. None marks the end of the partition.
+    """
+    try:
+        for batch in executor.exec():
+            output.put(batch)
+        output.put(None)
+    except Exception as e:
+        msg = "Partition execution failed: {}".format(e)
+        logger.exception(msg)
+        output.put(RuntimeError(msg))
+
+
+class GatherExecutor(AbstractExecutor):
+    """
+    Runs every child (a plan fragment over one partition of a table) in a
+    separate worker process and yields their batches partition by partition.
+    The partitions of video and Parquet tables are contiguous ranges of the
+    table, so the output order matches the serial plan; Petastorm assigns
+    the row groups to its shards round robin, so the rows of a Petastorm
+    table come out in a different order. Every worker computes up to
+    queue_size batches ahead of the consumer, and workers still running when
+    the consumer terminates early (e.g., LIMIT) are terminated.
+
+    Falls back to running the fragments one after another in the calling
+    process if the platform does not support fork.
+
+    Arguments:
+        node (GatherPlan): The Gather Plan
+
+    """
+
+    # Interval at which the consumer checks whether a worker died
+    _POLL_INTERVAL = 0.1
+
+    def __init__(self, node: GatherPlan):
+        super().__init__(node)
+
+    def validate(self):
+        pass
+
+    def exec(self) -> Iterator[Batch]:
+        if "fork" not in multiprocessing.get_all_start_methods():
+            for child in self.children:
+                yield from child.exec()
+            return
+
+        mp_context = multiprocessing.get_context("fork")
+        workers = []
+        try:
+            for child in self.children:
+                output = mp_context.Queue(maxsize=self.node.queue_size)
+                worker = mp_context.Process(
+                    target=_execute_partition,
+                    args=(child, output),
+                    name="eva-partition",
+                    daemon=True,
+                )
+                worker.start()
+                workers.append((worker, output))
+
+            for worker, output in workers:
+                yield from self._fetch(worker, output)
+        finally:
+            for worker, output in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join()
+                output.close()
+
+    def _fetch(self, worker, output: multiprocessing.Queue) -> Iterator[Batch]:
+        while True:
+            try:
+                item = output.get(timeout=self._POLL_INTERVAL)
+            except queue.Empty:
+                if worker.is_alive():
+                    continue
+                # the worker may have flushed its last items right before
+                # exiting
+                try:
+                    item = output.get(timeout=self._POLL_INTERVAL)
+                except queue.Empty:
+                    msg = "Partition worker exited unexpectedly with code {}".format(
+                        worker.exitcode
+                    )
+                    logger.error(msg)
+                    raise RuntimeError(msg)
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
@@ -12,7 +12,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
 
 import pandas as pd
 
@@ -22,38 +25,112 @@ from eva.models.storage.batch import Batch
 from eva.planner.load_data_plan import LoadDataPlan
 from eva.readers.csv_reader import CSVReader
 from eva.storage.storage_engine import StorageEngine
+from eva.utils.generic_utils import find_files
+from eva.utils.logging_manager import logger
+
+# Sentinel marking the end of the batches of a file
+_END_OF_FILE = object()
 
 
 class LoadCSVExecutor(AbstractExecutor):
+    """
+    Loads the CSV files matching the path of the LOAD statement, which may
+    be a glob pattern, into the table. The path is searched relative to the
+    working directory and then to storage.upload_dir.
+
+    The files are parsed by up to storage.load_threads threads, each
+    buffering up to _QUEUE_SIZE batches of its file, while the calling
+    thread appends the batches to a single write session in the order of
+    the files.
+    """
+
+    # Batches of a file buffered ahead of the write session
+    _QUEUE_SIZE = 2
+    # Interval at which a blocked reader checks whether it should stop
+    _POLL_INTERVAL = 0.1
+
     def __init__(self, node: LoadDataPlan):
         super().__init__(node)
         config = ConfigurationManager()
         self.upload_dir = config.get_value("storage", "upload_dir")
+        self.load_threads = config.get_value("storage", "load_threads", 4)
 
     def validate(self):
         pass
 
+    def _file_paths(self) -> List[str]:
+        file_paths = find_files(str(self.node.file_path), self.upload_dir)
+        if not file_paths:
+            err_msg = f"No CSV file matches {self.node.file_path}"
+            logger.error(err_msg)
+            raise RuntimeError(err_msg)
+        return [str(file_path) for file_path in file_paths]
+
+    def _read_file(self, file_path: str, batches: queue.Queue, stop: threading.Event):
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=self._POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            csv_reader = CSVReader(
+                file_path,
+                column_list=self.node.column_list,
+                batch_mem_size=self.node.batch_mem_size,
+            )
+            for batch in csv_reader.read():
+                if not put(batch):
+                    return
+            put(_END_OF_FILE)
+        except Exception as e:
+            logger.exception(f"Failed to read {file_path}: {e}")
+            put(e)
+
+    def _read_files(self, file_paths: List[str]) -> Iterator[Batch]:
+        stop = threading.Event()
+        file_batches = [queue.Queue(maxsize=self._QUEUE_SIZE) for _ in file_paths]
+        num_threads = max(1, min(self.load_threads, len(file_paths)))
+        with ThreadPoolExecutor(
+            max_workers=num_threads, thread_name_prefix="eva-load-csv"
+        ) as readers:
+            # the files are read in the order they are submitted, so the one
+            # the batches are taken from is always being read
+            futures = [
+                readers.submit(self._read_file, file_path, batches, stop)
+                for file_path, batches in zip(file_paths, file_batches)
+            ]
+            try:
+                for batches in file_batches:
+                    while True:
+                        item = batches.get()
+                        if item is _END_OF_FILE:
+                            break
+                        if isinstance(item, Exception):
+                            raise item
+                        yield item
+            finally:
+                # the running readers stop at their next batch, and the files
+                # not being read yet are skipped
+                stop.set()
+                for future in futures:
+                    future.cancel()
+
     def exec(self):
         """
-        Read the input meta file using pandas and persist data
-        using storage engine
+        Read the input CSV files with pyarrow and persist their rows
+        using the storage engine
         """
 
-        # Read the CSV file
-        # converters is a dictionary of functions that convert the values
-        # in the column to the desired type
-        csv_reader = CSVReader(
-            os.path.join(self.upload_dir, self.node.file_path),
-            column_list=self.node.column_list,
-            batch_mem_size=self.node.batch_mem_size,
-        )
-
         # write with storage engine in batches
         num_loaded_frames = 0
-        for batch in csv_reader.read():
-            StorageEngine.write(self.node.table_metainfo, batch)
-            num_loaded_frames += len(batch)
-
+        with StorageEngine.open_write_session(self.node.table_metainfo) as session:
+            for batch in self._read_files(self._file_paths()):
+                session.append(batch)
+                num_loaded_frames += len(batch)
         # yield result
         df_yield_result = Batch(
             pd.DataFrame(
@@ -12,6 +12,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import glob
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
@@ -20,53 +22,87 @@ from eva.configuration.configuration_manager import ConfigurationManager
 from eva.executor.abstract_executor import AbstractExecutor
 from eva.models.storage.batch import Batch
 from eva.planner.load_data_plan import LoadDataPlan
+from eva.readers.opencv_reader import probe_video
+from eva.storage.opencv_storage_engine import COPY, LINK_MODES
 from eva.storage.storage_engine import VideoStorageEngine
+from eva.utils.generic_utils import find_files
 from eva.utils.logging_manager import logger
 
 
 class LoadVideoExecutor(AbstractExecutor):
+    """
+    Loads the videos matching the path of the LOAD statement, which may be
+    a glob pattern, into the table. The videos are probed for their
+    properties by up to storage.load_threads threads, and added to the
+    table at once.
+    """
+
     def __init__(self, node: LoadDataPlan):
         super().__init__(node)
         config = ConfigurationManager()
         self.upload_dir = Path(config.get_value("storage", "upload_dir"))
+        self.load_threads = config.get_value("storage", "load_threads", 4)
 
     def validate(self):
         pass
 
     def exec(self):
         """
-        Read the input video using opencv and persist data
+        Probe the input videos using opencv and persist them
         using storage engine
         """
 
-        video_file_path = None
-        # Validate file_path
-        if Path(self.node.file_path).exists():
-            video_file_path = self.node.file_path
-        # check in the upload directory
-        else:
-            video_path = Path(Path(self.upload_dir) / self.node.file_path)
-            if video_path.exists():
-                video_file_path = video_path
-
-        if video_file_path is None:
+        video_file_paths = find_files(str(self.node.file_path), self.upload_dir)
+        if not video_file_paths:
             error = "Failed to find a video file at location: {}".format(
                 self.node.file_path
             )
             logger.error(error)
             raise RuntimeError(error)
 
+        link_mode = str(self.node.file_options.get("link", COPY)).lower()
+        if link_mode not in LINK_MODES:
+            error = "Invalid link mode {}, expected one of {}".format(
+                link_mode, ", ".join(LINK_MODES)
+            )
+            logger.error(error)
+            raise RuntimeError(error)
+
+        num_threads = max(1, min(self.load_threads, len(video_file_paths)))
+        with ThreadPoolExecutor(
+            max_workers=num_threads, thread_name_prefix="eva-load-video"
+        ) as probers:
+            video_properties = list(
+                probers.map(probe_video, map(str, video_file_paths))
+            )
+        invalid_paths = [
+            str(path)
+            for path, properties in zip(video_file_paths, video_properties)
+            if properties is None
+        ]
+        if invalid_paths:
+            error = "Failed to open the video files: {}".format(
+                ", ".join(invalid_paths)
+            )
+            logger.error(error)
+            raise RuntimeError(error)
+
+        videos = pd.DataFrame(video_properties)
+        videos.insert(0, "video_file_path", list(map(str, video_file_paths)))
         VideoStorageEngine.create(self.node.table_metainfo, if_not_exists=True)
         success = VideoStorageEngine.write(
-            self.node.table_metainfo,
-            Batch(pd.DataFrame([{"video_file_path": str(video_file_path)}])),
+            self.node.table_metainfo, Batch(videos), link_mode=link_mode
         )
 
         # ToDo: Add logic for indexing the video file
         # Create an index of I frames to speed up random video seek
         if success:
-            yield Batch(
-                pd.DataFrame(
-                    [f"Video successfully added at location: {video_file_path}"]
+            if glob.has_magic(str(self.node.file_path)):
+                message = "{} videos successfully added from location: {}".format(
+                    len(video_file_paths), self.node.file_path
                 )
-            )
+            else:
+                message = "Video successfully added at location: {}".format(
+                    video_file_paths[0]
+                )
+            yield Batch(pd.DataFrame([message]))
@@ -0,0 +1,84 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Iterator
+
+import numpy as np
+
+from eva.executor.abstract_executor import AbstractExecutor
+from eva.models.storage.batch import Batch
+from eva.planner.materialize_plan import MaterializePlan
+from eva.readers.opencv_reader import FrameReference, decode_frames
+
+
+class MaterializeExecutor(AbstractExecutor):
+    """
+    Replaces the FrameReferences of the batches with the decoded frames.
+    The frames of every batch are decoded with a single pass over each
+    video file they belong to, and the rows whose frame is past the end of
+    the video are dropped.
+
+    Arguments:
+        node (MaterializePlan): The Materialize Plan
+
+    """
+
+    def __init__(self, node: MaterializePlan):
+        super().__init__(node)
+
+    def validate(self):
+        pass
+
+    def _materialize(self, batch: Batch) -> Batch:
+        frames = batch.frames
+        decoded = np.ones(len(frames), dtype=bool)
+        columns = {}
+        for column in frames.columns:
+            references = frames[column].to_numpy()
+            if references.dtype != object or not isinstance(
+                references[0], FrameReference
+            ):
+                continue
+            frame_ids = {}
+            for reference in references:
+                frame_ids.setdefault(
+                    (reference.file_url, reference.frame_info), []
+                ).append(reference.frame_id)
+            video_frames = {
+                key: decode_frames(key[0], ids, key[1])
+                for key, ids in frame_ids.items()
+            }
+            values = np.empty(len(references), dtype=object)
+            for idx, reference in enumerate(references):
+                frame = video_frames[(reference.file_url, reference.frame_info)].get(
+                    reference.frame_id
+                )
+                values[idx] = frame
+                decoded[idx] &= frame is not None
+            columns[column] = values
+        if not columns:
+            return batch
+        # the frames of the child batch may be shared with other batches
+        batch = Batch(frames.assign(**columns))
+        if not decoded.all():
+            batch.filter(decoded)
+        return batch
+
+    def exec(self, *args, **kwargs) -> Iterator[Batch]:
+        for batch in self.children[0].exec(*args, **kwargs):
+            if batch.empty():
+                continue
+            batch = self._materialize(batch)
+            if not batch.empty():
+                yield batch
@@ -0,0 +1,229 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import statistics
+import threading
+import time
+from typing import Dict, Iterator, List
+
+from eva.configuration.configuration_manager import ConfigurationManager
+from eva.expression.abstract_expression import AbstractExpression, ExpressionType
+from eva.expression.expression_utils import get_function_expressions
+from eva.models.storage.batch import Batch
+
+_AGGREGATION_TYPES = {
+    ExpressionType.AGGREGATION_COUNT,
+    ExpressionType.AGGREGATION_SUM,
+    ExpressionType.AGGREGATION_MIN,
+    ExpressionType.AGGREGATION_MAX,
+    ExpressionType.AGGREGATION_AVG,
+}
+
+
+class BatchSizeTuner:
+    """
+    Profiles the throughput of a set of UDFs evaluated together and tunes
+    the number of rows they are invoked with. Starting from a small batch
+    size, it keeps doubling the batch size while that improves the measured
+    throughput (rows/sec) and settles on the best one otherwise.
+
+    Tuners are shared by all the queries evaluating the same UDFs.
+
+    Arguments:
+        max_batch_size (int): upper bound of the batch size
+    """
+
+    _tuners: Dict[str, "BatchSizeTuner"] = {}
+    _tuners_lock = threading.Lock()
+
+    # batch size the exploration starts from
+    _INITIAL_BATCH_SIZE = 8
+    # full batches profiled for a batch size before moving on
+    _NUM_SAMPLES = 3
+    # minimum throughput gain required to keep doubling the batch size
+    _MIN_GAIN = 1.1
+
+    def __init__(self, max_batch_size: int):
+        self._max_batch_size = max(1, max_batch_size)
+        self._batch_size = min(self._INITIAL_BATCH_SIZE, self._max_batch_size)
+        self._best_batch_size = None
+        self._samples = []
+        self._converged = False
+        self._lock = threading.Lock()
+        self.throughput: Dict[int, float] = {}
+
+    @classmethod
+    def get(cls, key: str, max_batch_size: int) -> "BatchSizeTuner":
+        with cls._tuners_lock:
+            if key not in cls._tuners:
+                cls._tuners[key] = BatchSizeTuner(max_batch_size)
+            return cls._tuners[key]
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def converged(self) -> bool:
+        return self._converged
+
+    def record(self, num_rows: int, elapsed: float):
+        """Records the time taken to evaluate num_rows rows. Only full
+        batches are profiled, as partial ones underestimate the throughput
+        of the batch size being explored."""
+        with self._lock:
+            if self._converged or num_rows < self._batch_size or elapsed <= 0:
+                return
+            self._samples.append(num_rows / elapsed)
+            if len(self._samples) < self._NUM_SAMPLES:
+                return
+
+            throughput = statistics.median(self._samples)
+            self._samples = []
+            self.throughput[self._batch_size] = throughput
+            best_throughput = self.throughput.get(self._best_batch_size)
+            if (
+                best_throughput is None
+                or throughput >= best_throughput * self._MIN_GAIN
+            ):
+                self._best_batch_size = self._batch_size
+                if self._batch_size >= self._max_batch_size:
+                    self._converged = True
+                else:
+                    self._batch_size = min(2 * self._batch_size, self._max_batch_size)
+            else:
+                self._batch_size = self._best_batch_size
+                self._converged = True
+
+
+class MicroBatchScheduler:
+    """
+    Sits in front of the evaluation of UDF calls and decouples the batches
+    the model sees from the batches produced by the storage layer and the
+    predicates. Rows are accumulated across incoming batches until the
+    tuned batch size is reached or the oldest row has waited for the
+    deadline. The accumulated rows are evaluated in model sized chunks and
+    the outcomes are scattered back to the originating batches, so the
+    operators downstream see the same batch boundaries.
+
+    Scattering assumes that the evaluation returns one row per input row.
+    The scheduler is therefore only enabled for target lists without
+    aggregates, and it falls back to evaluating every batch on its own as
+    soon as an evaluation returns a different number of rows.
+
+    Arguments:
+        expr_list (List[AbstractExpression]): row preserving expressions
+            (e.g., a projection list) evaluated on every batch
+    """
+
+    def __init__(self, expr_list: List[AbstractExpression]):
+        config = ConfigurationManager()
+        self._deadline = config.get_value("executor", "micro_batch_deadline", 0)
+        func_exprs = [
+            func_expr
+            for expr in expr_list or []
+            if isinstance(expr, AbstractExpression)
+            for func_expr in get_function_expressions(expr)
+        ]
+        self._tuner = None
+        row_preserving = all(_is_row_preserving(expr) for expr in expr_list or [])
+        if func_exprs and row_preserving and self._deadline:
+            max_batch_size = config.get_value("executor", "gpu_batch_size")
+            key = ",".join(sorted({func_expr.name for func_expr in func_exprs}))
+            self._tuner = BatchSizeTuner.get(key, max_batch_size or 1)
+
+    @property
+    def enabled(self) -> bool:
+        return self._tuner is not None
+
+    def schedule(self, batches: Iterator[Batch], evaluate) -> Iterator[Batch]:
+        """Evaluates the batches in micro batches
+
+        Arguments:
+            batches (Iterator[Batch]): incoming batches
+            evaluate (Callable[[Batch], Batch]): row preserving evaluation
+
+        Returns:
+            Iterator[Batch]: the outcome for every incoming batch
+        """
+        pending = []
+        num_rows = 0
+        first_arrival = None
+        for batch in batches:
+            if not self.enabled:
+                yield evaluate(batch)
+                continue
+            if batch.empty():
+                continue
+            pending.append(batch)
+            num_rows += len(batch)
+            if first_arrival is None:
+                first_arrival = time.perf_counter()
+            if (
+                num_rows >= self._tuner.batch_size
+                or time.perf_counter() - first_arrival >= self._deadline
+            ):
+                yield from self._flush(pending, evaluate)
+                pending = []
+                num_rows = 0
+                first_arrival = None
+        if pending:
+            yield from self._flush(pending, evaluate)
+
+    def _flush(self, pending: List[Batch], evaluate) -> Iterator[Batch]:
+        batch_size = self._tuner.batch_size
+        if len(pending) == 1 and len(pending[0]) <= batch_size:
+            yield self._evaluate(pending[0], evaluate)
+            return
+
+        merged = Batch.concat(pending, copy=False)
+        outcomes = [
+            self._evaluate(_slice(merged, begin, begin + batch_size), evaluate)
+            for begin in range(0, len(merged), batch_size)
+        ]
+        outcome = Batch.concat(outcomes, copy=False)
+        if len(outcome) != len(merged):
+            # the evaluation is not row preserving, so the outcome cannot be
+            # scattered back; evaluate every batch on its own from now on
+            self._tuner = None
+            for batch in pending:
+                yield evaluate(batch)
+            return
+
+        # scatter the outcomes back to the originating batches
+        offset = 0
+        for batch in pending:
+            yield _slice(outcome, offset, offset + len(batch))
+            offset += len(batch)
+
+    def _evaluate(self, batch: Batch, evaluate) -> Batch:
+        num_rows = len(batch)
+        start = time.perf_counter()
+        outcome = evaluate(batch)
+        self._tuner.record(num_rows, time.perf_counter() - start)
+        return outcome
+
+
+def _is_row_preserving(expr) -> bool:
+    if not isinstance(expr, AbstractExpression):
+        return True
+    if expr.etype in _AGGREGATION_TYPES:
+        return False
+    return all(_is_row_preserving(child) for child in expr.children)
+
+
+def _slice(batch: Batch, begin: int, end: int) -> Batch:
+    rows = batch[begin : min(end, len(batch))]
+    rows.reset_index()
+    return rows
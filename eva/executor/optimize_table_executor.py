@@ -0,0 +1,53 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pandas as pd
+
+from eva.executor.abstract_executor import AbstractExecutor
+from eva.models.storage.batch import Batch
+from eva.planner.optimize_table_plan import OptimizeTablePlan
+from eva.storage.storage_engine import StorageEngine
+from eva.utils.logging_manager import logger
+
+
+class OptimizeTableExecutor(AbstractExecutor):
+    def __init__(self, node: OptimizeTablePlan):
+        super().__init__(node)
+
+    def validate(self):
+        pass
+
+    def exec(self):
+        """Optimize table executor
+
+        Compacts the small files of the table in the storage engine.
+        """
+        table_obj = self.node.table_ref.table.table_obj
+        if table_obj.is_video:
+            err_msg = f"Optimizing video table {table_obj.name} is not supported"
+            logger.error(err_msg)
+            raise RuntimeError(err_msg)
+
+        num_removed_files, num_added_files = StorageEngine.compact(
+            table_obj, self.node.sort_column
+        )
+        yield Batch(
+            pd.DataFrame(
+                {
+                    f"Table {table_obj.name} optimized, {num_removed_files} "
+                    f"files rewritten into {num_added_files}"
+                },
+                index=[0],
+            )
+        )
@@ -20,13 +20,17 @@ from eva.executor.create_mat_view_executor import CreateMaterializedViewExecutor
 from eva.executor.create_udf_executor import CreateUDFExecutor
 from eva.executor.drop_executor import DropExecutor
 from eva.executor.drop_udf_executor import DropUDFExecutor
+from eva.executor.exchange_executor import ExchangeExecutor
 from eva.executor.function_scan_executor import FunctionScanExecutor
+from eva.executor.gather_executor import GatherExecutor
 from eva.executor.hash_join_executor import HashJoinExecutor
 from eva.executor.insert_executor import InsertExecutor
 from eva.executor.join_build_executor import BuildJoinExecutor
 from eva.executor.lateral_join_executor import LateralJoinExecutor
 from eva.executor.limit_executor import LimitExecutor
 from eva.executor.load_executor import LoadDataExecutor
+from eva.executor.materialize_executor import MaterializeExecutor
+from eva.executor.optimize_table_executor import OptimizeTableExecutor
 from eva.executor.orderby_executor import OrderByExecutor
 from eva.executor.pp_executor import PPExecutor
 from eva.executor.predicate_executor import PredicateExecutor
@@ -92,6 +96,8 @@ class PlanExecutor:
             executor_node = CreateUDFExecutor(node=plan)
         elif plan_opr_type == PlanOprType.DROP_UDF:
             executor_node = DropUDFExecutor(node=plan)
+        elif plan_opr_type == PlanOprType.OPTIMIZE_TABLE:
+            executor_node = OptimizeTableExecutor(node=plan)
         elif plan_opr_type == PlanOprType.LOAD_DATA:
             executor_node = LoadDataExecutor(node=plan)
         elif plan_opr_type == PlanOprType.UPLOAD:
@@ -118,6 +124,12 @@ class PlanExecutor:
             executor_node = PredicateExecutor(node=plan)
         elif plan_opr_type == PlanOprType.SHOW_INFO:
             executor_node = ShowInfoExecutor(node=plan)
+        elif plan_opr_type == PlanOprType.EXCHANGE:
+            executor_node = ExchangeExecutor(node=plan)
+        elif plan_opr_type == PlanOprType.GATHER:
+            executor_node = GatherExecutor(node=plan)
+        elif plan_opr_type == PlanOprType.MATERIALIZE:
+            executor_node = MaterializeExecutor(node=plan)
         # Build Executor Tree for children
         for children in plan.children:
             executor_node.append_child(self._build_execution_tree(children))
@@ -16,6 +16,7 @@ from typing import Iterator
 
 from eva.executor.abstract_executor import AbstractExecutor
 from eva.executor.executor_utils import apply_project
+from eva.executor.micro_batch_scheduler import MicroBatchScheduler
 from eva.models.storage.batch import Batch
 from eva.planner.project_plan import ProjectPlan
 
@@ -32,8 +33,9 @@ class ProjectExecutor(AbstractExecutor):
 
     def exec(self) -> Iterator[Batch]:
         child_executor = self.children[0]
-        for batch in child_executor.exec():
-            batch = apply_project(batch, self.target_list)
-
+        scheduler = MicroBatchScheduler(self.target_list)
+        for batch in scheduler.schedule(
+            child_executor.exec(), lambda batch: apply_project(batch, self.target_list)
+        ):
             if not batch.empty():
                 yield batch
@@ -0,0 +1,73 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from typing import Callable, List, Tuple
+
+from eva.executor.worker_pool import WorkerPool
+
+
+def _pin_replica(cores: List[int]):
+    """
+    Initializer of a replica worker. The worker is pinned to its cores and,
+    if torch is installed, sizes the intra-op thread pool of torch to match
+    them and disables autograd.
+    """
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+    try:
+        # imported here so that the execution context does not load torch
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(len(cores))
+    torch.set_grad_enabled(False)
+
+
+class ReplicaPool(WorkerPool):
+    """
+    Runs num_replicas instances of a UDF, each in its own worker process
+    pinned to a disjoint slice of the cores (shared only if there are fewer
+    cores than replicas). A call splits the frames into one chunk per
+    replica and dispatches every chunk to the least-loaded replica, so a
+    single batch is processed by all the replicas in parallel.
+
+    Arguments:
+        udf (Callable): UDF instance replicated by the pool
+        num_replicas (int): number of replicas
+    """
+
+    def __init__(self, udf: Callable, num_replicas: int):
+        cores = (
+            sorted(os.sched_getaffinity(0))
+            if hasattr(os, "sched_getaffinity")
+            else list(range(os.cpu_count() or 1))
+        )
+        num_replicas = max(1, num_replicas)
+        if len(cores) >= num_replicas:
+            self._core_slices = [
+                cores[idx::num_replicas] for idx in range(num_replicas)
+            ]
+        else:
+            self._core_slices = [
+                [cores[idx % len(cores)]] for idx in range(num_replicas)
+            ]
+        super().__init__(udf, num_replicas)
+
+    @property
+    def num_replicas(self) -> int:
+        return self.num_workers
+
+    def _initializer(self, idx: int) -> Tuple[Callable, Tuple]:
+        return _pin_replica, (self._core_slices[idx],)
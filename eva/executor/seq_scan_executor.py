@@ -16,6 +16,7 @@ from typing import Iterator
 
 from eva.executor.abstract_executor import AbstractExecutor
 from eva.executor.executor_utils import apply_predicate, apply_project
+from eva.executor.micro_batch_scheduler import MicroBatchScheduler
 from eva.models.storage.batch import Batch
 from eva.planner.seq_scan_plan import SeqScanPlan
 
@@ -37,8 +38,7 @@ class SequentialScanExecutor(AbstractExecutor):
     def validate(self):
         pass
 
-    def exec(self) -> Iterator[Batch]:
-
+    def _filter(self) -> Iterator[Batch]:
         child_executor = self.children[0]
         for batch in child_executor.exec():
             # apply alias to the batch
@@ -47,9 +47,13 @@ class SequentialScanExecutor(AbstractExecutor):
                 batch.modify_column_alias(self.alias)
 
             # We do the predicate first
-            batch = apply_predicate(batch, self.predicate)
-            # Then do project
-            batch = apply_project(batch, self.project_expr)
+            yield apply_predicate(batch, self.predicate)
 
+    def exec(self) -> Iterator[Batch]:
+        # Then do project, accumulating the rows across batches for the UDFs
+        scheduler = MicroBatchScheduler(self.project_expr)
+        for batch in scheduler.schedule(
+            self._filter(), lambda batch: apply_project(batch, self.project_expr)
+        ):
             if not batch.empty():
                 yield batch
@@ -28,12 +28,28 @@ class StorageExecutor(AbstractExecutor):
         pass
 
     def exec(self) -> Iterator[Batch]:
+        # the read may run in a prefetching thread (see ExchangeExecutor),
+        # which cannot use the catalog session, and the metadata may have
+        # been expired by a commit since the plan was built (e.g., by
+        # CREATE MATERIALIZED VIEW)
+        self.node.video.load_columns()
         if self.node.video.is_video:
             return VideoStorageEngine.read(
                 self.node.video,
                 self.node.batch_mem_size,
                 predicate=self.node.predicate,
                 sampling_rate=self.node.sampling_rate,
+                curr_shard=self.node.curr_shard,
+                total_shards=self.node.total_shards,
+                frame_info=self.node.frame_info,
+                lazy_frames=self.node.lazy_frames,
             )
         else:
-            return StorageEngine.read(self.node.video, self.node.batch_mem_size)
+            return StorageEngine.read(
+                self.node.video,
+                self.node.batch_mem_size,
+                curr_shard=self.node.curr_shard,
+                total_shards=self.node.total_shards,
+                projection=self.node.projection,
+                predicate=self.node.predicate,
+            )
@@ -0,0 +1,141 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from eva.executor.worker_pool import PipeTransport, WorkerPool
+
+# A column is either a list of values pickled with the request or the
+# (name, shape, dtype) of the shared memory block holding its stacked values
+_Columns = List[Tuple[str, object]]
+
+
+def _is_stackable(values: np.ndarray) -> bool:
+    if len(values) == 0 or not isinstance(values[0], np.ndarray):
+        return False
+    first = values[0]
+    return first.dtype != object and all(
+        isinstance(value, np.ndarray)
+        and value.shape == first.shape
+        and value.dtype == first.dtype
+        for value in values
+    )
+
+
+def _to_shared_memory(frames: pd.DataFrame) -> Tuple[_Columns, List[SharedMemory]]:
+    """
+    Stacks every column of equally shaped arrays (e.g., frames) into a
+    shared memory block, so that only its name is sent to the other process.
+    The remaining columns are pickled.
+    """
+    columns = []
+    blocks = []
+    for name in frames.columns:
+        values = frames[name].to_numpy()
+        if not _is_stackable(values):
+            columns.append((name, list(values)))
+            continue
+        shape = (len(values),) + values[0].shape
+        dtype = values[0].dtype
+        block = SharedMemory(create=True, size=max(1, len(values) * values[0].nbytes))
+        blocks.append(block)
+        stacked = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        for idx, value in enumerate(values):
+            stacked[idx] = value
+        del stacked
+        columns.append((name, (block.name, shape, dtype.str)))
+    return columns, blocks
+
+
+def _from_shared_memory(
+    columns: _Columns, copy: bool
+) -> Tuple[pd.DataFrame, List[SharedMemory]]:
+    """
+    Rebuilds the frames sent by _to_shared_memory. Without copy, the arrays
+    are views of the shared memory blocks, which must outlive them.
+    """
+    data = {}
+    blocks = []
+    for name, column in columns:
+        if not isinstance(column, tuple):
+            data[name] = column
+            continue
+        block_name, shape, dtype = column
+        block = SharedMemory(name=block_name)
+        blocks.append(block)
+        stacked = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        if copy:
+            stacked = stacked.copy()
+        data[name] = list(stacked)
+    return pd.DataFrame(data, columns=[name for name, _ in columns]), blocks
+
+
+def _release(blocks: List[SharedMemory], unlink: bool):
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            # views of the block are still referenced, it is unmapped when
+            # they are garbage collected
+            pass
+        if unlink:
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class SharedMemoryTransport(PipeTransport):
+    """
+    Passes the columns of equally shaped arrays, such as frames, through
+    shared memory blocks and pickles the remaining columns.
+    """
+
+    def encode(self, frames: pd.DataFrame) -> Tuple[_Columns, List[SharedMemory]]:
+        return _to_shared_memory(frames)
+
+    def decode(
+        self, payload: _Columns, copy: bool
+    ) -> Tuple[pd.DataFrame, List[SharedMemory]]:
+        return _from_shared_memory(payload, copy)
+
+    def release(self, resources: List[SharedMemory], unlink: bool):
+        _release(resources, unlink)
+
+
+class UDFProcessPool(WorkerPool):
+    """
+    Runs a UDF in num_workers worker processes, which hold the UDF and its
+    model loaded once by the server. This way pure Python UDFs are not
+    serialized on the GIL of the server, and a UDF crashing its worker fails
+    only the pending calls: the worker is replaced by a new one.
+
+    Columns of equally shaped arrays, such as frames, are passed to and from
+    the workers through shared memory instead of being pickled.
+
+    Arguments:
+        udf (Callable): UDF instance run by the pool
+        num_workers (int): number of worker processes
+    """
+
+    def __init__(self, udf: Callable, num_workers: int):
+        # workers attach to the blocks created by the parent and vice versa,
+        # they must share its resource tracker
+        resource_tracker.ensure_running()
+        super().__init__(udf, num_workers, SharedMemoryTransport())
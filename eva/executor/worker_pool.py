@@ -0,0 +1,262 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Tuple
+
+import pandas as pd
+
+from eva.utils.logging_manager import logger
+
+
+class PipeTransport:
+    """
+    Passes the frames to and from the workers by pickling them through the
+    request and result queues. Subclasses pass them by other means; the
+    resources they allocate for a payload (e.g., shared memory blocks) are
+    released by the receiver once it decoded the payload.
+    """
+
+    def encode(self, frames: pd.DataFrame) -> Tuple[object, List]:
+        """Returns the payload sent to the other process and its resources"""
+        return frames, []
+
+    def decode(self, payload: object, copy: bool) -> Tuple[pd.DataFrame, List]:
+        """Rebuilds the frames of a payload. Without copy, they may refer to
+        resources that must outlive them."""
+        return payload, []
+
+    def release(self, resources: List, unlink: bool):
+        """Releases the resources of a payload, unlink frees them for good"""
+
+
+def _serve_worker(
+    udf: Callable,
+    transport: PipeTransport,
+    initializer: Callable,
+    initargs: Tuple,
+    requests: multiprocessing.Queue,
+    results: multiprocessing.Queue,
+    parent_pid: int,
+    poll_interval: float,
+):
+    """
+    Entry point of a worker process. The UDF, including its model, is
+    inherited from the parent through fork. The resources of the inputs are
+    owned, and unlinked, by the parent; those of the outputs by the parent
+    once it decoded them.
+    """
+    if initializer is not None:
+        initializer(*initargs)
+    while True:
+        try:
+            request = requests.get(timeout=poll_interval)
+        except queue.Empty:
+            if os.getppid() != parent_pid:
+                # the parent died without shutting the pool down
+                break
+            continue
+        if request is None:
+            break
+        request_id, payload = request
+        resources = []
+        try:
+            frames, resources = transport.decode(payload, copy=False)
+            outcome = udf(frames)
+            # copies the outputs, which may refer to the inputs
+            response, output_resources = transport.encode(outcome)
+            transport.release(output_resources, unlink=False)
+        except Exception as e:
+            msg = "UDF worker failed: {}".format(e)
+            logger.exception(msg)
+            response = RuntimeError(msg)
+        finally:
+            frames = outcome = None
+            transport.release(resources, unlink=False)
+        results.put((request_id, response))
+
+
+class _Worker:
+    def __init__(
+        self,
+        mp_context,
+        udf: Callable,
+        transport: PipeTransport,
+        initializer: Callable,
+        initargs: Tuple,
+        poll_interval: float,
+    ):
+        # futures of the requests dispatched to the worker and the resources
+        # of their inputs
+        self.futures: Dict[int, Tuple[Future, List]] = {}
+        self.requests = mp_context.Queue()
+        self.results = mp_context.Queue()
+        self.process = mp_context.Process(
+            target=_serve_worker,
+            args=(
+                udf,
+                transport,
+                initializer,
+                initargs,
+                self.requests,
+                self.results,
+                os.getpid(),
+                poll_interval,
+            ),
+            name="eva-udf-worker",
+            daemon=True,
+        )
+        self.process.start()
+
+
+class WorkerPool:
+    """
+    Runs a UDF in num_workers worker processes forked from the server, so
+    they inherit the UDF and its model loaded once. A UDF crashing its
+    worker fails only the pending calls: the worker is replaced by a new
+    one. `submit` returns a future of the outputs; a call splits the frames
+    into one chunk per worker and dispatches every chunk to the least-loaded
+    worker.
+
+    Arguments:
+        udf (Callable): UDF instance run by the pool
+        num_workers (int): number of worker processes
+        transport (PipeTransport): how the frames are passed to and from the
+            workers, pickled through the queues by default
+    """
+
+    # Interval at which the collectors check whether a worker died
+    _POLL_INTERVAL = 0.5
+
+    def __init__(
+        self, udf: Callable, num_workers: int, transport: PipeTransport = None
+    ):
+        self._udf = udf
+        self._transport = transport or PipeTransport()
+        self._mp_context = multiprocessing.get_context("fork")
+        self._lock = threading.Lock()
+        self._next_request_id = 0
+        self._closed = False
+        self._workers = []
+        with self._lock:
+            for idx in range(max(1, num_workers)):
+                self._workers.append(self._start_worker(idx))
+
+    @property
+    def num_workers(self) -> int:
+        return len(self._workers)
+
+    def _initializer(self, idx: int) -> Tuple[Callable, Tuple]:
+        """Function, and its arguments, the idx-th worker runs on start"""
+        return None, ()
+
+    def _start_worker(self, idx: int) -> _Worker:
+        initializer, initargs = self._initializer(idx)
+        worker = _Worker(
+            self._mp_context,
+            self._udf,
+            self._transport,
+            initializer,
+            initargs,
+            self._POLL_INTERVAL,
+        )
+        threading.Thread(
+            target=self._collect,
+            args=(worker,),
+            name="eva-udf-collector",
+            daemon=True,
+        ).start()
+        return worker
+
+    def _collect(self, worker: _Worker):
+        while True:
+            try:
+                result = worker.results.get(timeout=self._POLL_INTERVAL)
+            except queue.Empty:
+                if worker.process.is_alive():
+                    continue
+                self._replace(worker)
+                break
+            if result is None:
+                break
+            request_id, response = result
+            with self._lock:
+                future, resources = worker.futures.pop(request_id)
+            self._transport.release(resources, unlink=True)
+            if isinstance(response, Exception):
+                future.set_exception(response)
+                continue
+            outcome, output_resources = self._transport.decode(response, copy=True)
+            self._transport.release(output_resources, unlink=True)
+            future.set_result(outcome)
+
+    def _replace(self, worker: _Worker):
+        msg = "UDF worker exited unexpectedly with code {}".format(
+            worker.process.exitcode
+        )
+        with self._lock:
+            if self._closed:
+                return
+            logger.error(msg)
+            pending = list(worker.futures.values())
+            worker.futures.clear()
+            idx = self._workers.index(worker)
+            self._workers[idx] = self._start_worker(idx)
+        for future, resources in pending:
+            self._transport.release(resources, unlink=True)
+            future.set_exception(RuntimeError(msg))
+
+    def submit(self, frames: pd.DataFrame) -> Future:
+        """Dispatches the frames to the least-loaded worker"""
+        future = Future()
+        payload, resources = self._transport.encode(frames)
+        with self._lock:
+            workers = [worker for worker in self._workers if worker.process.is_alive()]
+            if self._closed or not workers:
+                self._transport.release(resources, unlink=True)
+                msg = "No UDF worker is alive"
+                logger.error(msg)
+                raise RuntimeError(msg)
+            worker = min(workers, key=lambda worker: len(worker.futures))
+            request_id = self._next_request_id
+            self._next_request_id += 1
+            worker.futures[request_id] = (future, resources)
+        worker.requests.put((request_id, payload))
+        return future
+
+    def __call__(self, frames: pd.DataFrame) -> pd.DataFrame:
+        chunk_size = max(1, math.ceil(len(frames) / self.num_workers))
+        futures = [
+            self.submit(frames.iloc[begin : begin + chunk_size])
+            for begin in range(0, len(frames), chunk_size)
+        ]
+        outcomes = [future.result() for future in futures]
+        if not outcomes:
+            return pd.DataFrame()
+        return pd.concat(outcomes, ignore_index=True)
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+        for worker in workers:
+            worker.requests.put(None)
+            worker.results.put(None)
+        for worker in workers:
+            worker.process.join()
@@ -0,0 +1,135 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import operator
+from typing import Callable, Optional
+
+import numpy as np
+
+from eva.catalog.column_type import ColumnType
+from eva.expression.abstract_expression import AbstractExpression, ExpressionType
+from eva.models.storage.batch import Batch
+
+# A kernel maps a batch onto either a NumPy array with one entry per row or a
+# scalar that is broadcast against the other operand.
+Kernel = Callable[[Batch], np.ndarray]
+
+_COMPARISON_OPS = {
+    ExpressionType.COMPARE_EQUAL: operator.eq,
+    ExpressionType.COMPARE_GREATER: operator.gt,
+    ExpressionType.COMPARE_LESSER: operator.lt,
+    ExpressionType.COMPARE_GEQ: operator.ge,
+    ExpressionType.COMPARE_LEQ: operator.le,
+    ExpressionType.COMPARE_NEQ: operator.ne,
+}
+
+_ARITHMETIC_OPS = {
+    ExpressionType.ARITHMETIC_ADD: operator.add,
+    ExpressionType.ARITHMETIC_SUBTRACT: operator.sub,
+    ExpressionType.ARITHMETIC_MULTIPLY: operator.mul,
+    ExpressionType.ARITHMETIC_DIVIDE: operator.truediv,
+}
+
+_SCALAR_TYPES = (bool, int, float, str, np.generic)
+
+# marks the predicates that were not compiled yet, as opposed to the ones
+# that cannot be compiled (None)
+_NOT_COMPILED = object()
+
+
+def compile_expression(expr: AbstractExpression) -> Optional[Kernel]:
+    """Compile an expression tree into a single closure over the NumPy
+    column arrays of a batch.
+
+    Only comparison, logical and arithmetic expressions over columns and
+    scalar constants are supported. Trees containing UDF calls, aggregates
+    or array-valued operands are not compiled and None is returned, so the
+    caller can fall back to `AbstractExpression.evaluate`.
+
+    Arguments:
+        expr (AbstractExpression): bound expression tree
+
+    Returns:
+        Optional[Kernel]: callable returning the per-row result array
+    """
+    if not isinstance(expr, AbstractExpression):
+        return None
+
+    etype = expr.etype
+    if etype == ExpressionType.TUPLE_VALUE:
+        col_object = expr.col_object
+        if col_object is not None and col_object.type == ColumnType.NDARRAY:
+            return None
+        col_alias = expr.col_alias
+        return lambda batch: batch.column_as_numpy_array(col_alias)
+
+    if etype == ExpressionType.CONSTANT_VALUE:
+        value = expr.value
+        if not isinstance(value, _SCALAR_TYPES):
+            return None
+        return lambda batch: value
+
+    children = [compile_expression(child) for child in expr.children]
+    if any(child is None for child in children):
+        return None
+
+    if etype in _COMPARISON_OPS:
+        return _binary_kernel(_COMPARISON_OPS[etype], *children)
+    if etype in _ARITHMETIC_OPS:
+        return _binary_kernel(_ARITHMETIC_OPS[etype], *children)
+    if etype == ExpressionType.LOGICAL_AND:
+        return _binary_kernel(np.logical_and, *children)
+    if etype == ExpressionType.LOGICAL_OR:
+        return _binary_kernel(np.logical_or, *children)
+    if etype == ExpressionType.LOGICAL_NOT:
+        (child,) = children
+        return lambda batch: np.logical_not(child(batch))
+
+    return None
+
+
+def compile_predicate(predicate: AbstractExpression) -> Optional[Kernel]:
+    """Compile a predicate into a kernel returning a boolean mask with one
+    entry per row of the input batch. See `compile_expression`.
+    """
+    kernel = compile_expression(predicate)
+    if kernel is None:
+        return None
+
+    def predicate_kernel(batch: Batch) -> np.ndarray:
+        mask = np.asarray(kernel(batch), dtype=bool)
+        if mask.ndim == 0:
+            mask = np.full(len(batch), bool(mask))
+        return mask
+
+    return predicate_kernel
+
+
+def get_predicate_kernel(predicate: AbstractExpression) -> Optional[Kernel]:
+    """Compile a predicate once and memoise the kernel, or None, on the
+    predicate. Executors evaluate the same predicate on every batch, so they
+    use this instead of `compile_predicate`. The predicate must not be
+    modified afterwards.
+    """
+    if not isinstance(predicate, AbstractExpression):
+        return None
+    kernel = getattr(predicate, "_predicate_kernel", _NOT_COMPILED)
+    if kernel is _NOT_COMPILED:
+        kernel = compile_predicate(predicate)
+        predicate._predicate_kernel = kernel
+    return kernel
+
+
+def _binary_kernel(op: Callable, left: Kernel, right: Kernel) -> Kernel:
+    return lambda batch: op(left(batch), right(batch))
@@ -18,6 +18,7 @@ from typing import List, Set
 from eva.expression.abstract_expression import AbstractExpression, ExpressionType
 from eva.expression.comparison_expression import ComparisonExpression
 from eva.expression.constant_value_expression import ConstantValueExpression
+from eva.expression.function_expression import FunctionExpression
 from eva.expression.logical_expression import LogicalExpression
 from eva.expression.tuple_value_expression import TupleValueExpression
 
@@ -146,7 +147,8 @@ def extract_range_list_from_predicate(
         upper_bound (int): upper bound of the comparison predicate
 
     Returns:
-        List[Tuple]: list of (start, end) pairs of valid ranges
+        List[Tuple]: list of (start, end) pairs of valid ranges, within the
+            bounds
 
     Example:
             id < 10 : [(0, 9)]
@@ -197,9 +199,13 @@ def extract_range_list_from_predicate(
         return union(left_ranges + right_ranges)
 
     elif isinstance(predicate, ComparisonExpression):
-        return union(
-            extract_range_list_from_comparison_expr(predicate, lower_bound, upper_bound)
+        ranges = extract_range_list_from_comparison_expr(
+            predicate, lower_bound, upper_bound
         )
+        # drop the parts of the ranges out of the bounds, e.g., past the last
+        # frame of a video
+        ranges = [overlap(x, (lower_bound, upper_bound)) for x in ranges]
+        return union([x for x in ranges if x])
 
     else:
         raise RuntimeError(f"Contains unsuporrted expression {type(predicate)}")
@@ -224,6 +230,24 @@ def get_columns_in_predicate(predicate: AbstractExpression) -> Set[str]:
     return cols
 
 
+def get_function_expressions(expr: AbstractExpression) -> List[FunctionExpression]:
+    """Collect all the FunctionExpressions in the expression tree, including
+    the nested ones, in evaluation order.
+
+    Args:
+        expr (AbstractExpression): input expression
+
+    Returns:
+        List[FunctionExpression]: list of FunctionExpressions in the tree
+    """
+    func_exprs = []
+    for child in expr.children:
+        func_exprs.extend(get_function_expressions(child))
+    if isinstance(expr, FunctionExpression):
+        func_exprs.append(expr)
+    return func_exprs
+
+
 def contains_single_column(predicate: AbstractExpression, column: str = None) -> bool:
     """Checks if predicate contains conditions on single predicate
 
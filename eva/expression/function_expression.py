@@ -12,10 +12,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Callable, List
+from typing import Any, Callable, Dict, List
 
 from eva.catalog.models.udf_io import UdfIO
-from eva.constants import NO_GPU
+from eva.constants import NO_GPU, UDF_PROCESS_MODE
 from eva.executor.execution_context import Context
 from eva.expression.abstract_expression import AbstractExpression, ExpressionType
 from eva.models.storage.batch import Batch
@@ -39,6 +39,16 @@ class FunctionExpression(AbstractExpression):
     projected columns. This is important as other parts of the query
     might be assessing the results using alias. Eg,
     `Select OD.labels FROM Video JOIN LATERAL ObjDetector AS OD;`
+
+    `hidden_alias`: It is set by the optimizer when the same
+    FunctionExpression appears multiple times in a query. The first
+    evaluation attaches its outcomes to the input batch as hidden
+    columns prefixed with this alias, and later evaluations over the
+    same batch read them back instead of invoking the UDF again.
+
+    `udf_options`: It is populated by the binder with the options of
+    the UDF in the catalog. With mode = 'process', the UDF runs in a
+    pool of worker processes.
     """
 
     def __init__(
@@ -58,6 +68,8 @@ class FunctionExpression(AbstractExpression):
         self.alias = alias
         self.output_objs: List[UdfIO] = []
         self.projection_columns: List[str] = []
+        self.hidden_alias: str = None
+        self.udf_options: Dict[str, Any] = {}
 
     @property
     def name(self):
@@ -75,7 +87,23 @@ class FunctionExpression(AbstractExpression):
     def function(self, func: Callable):
         self._function = func
 
+    @property
+    def hidden_columns(self) -> List[str]:
+        if self.hidden_alias is None:
+            return []
+        return [
+            "{}.{}".format(self.hidden_alias, col_name)
+            for col_name in self.alias.col_names
+        ]
+
     def evaluate(self, batch: Batch, **kwargs) -> Batch:
+        hidden_columns = self.hidden_columns
+        if hidden_columns and batch is not None:
+            if all(col in batch.columns for col in hidden_columns):
+                outcomes = batch.project(hidden_columns)
+                outcomes.modify_column_alias(self.alias)
+                return outcomes
+
         new_batch = batch
         child_batches = [child.evaluate(batch, **kwargs) for child in self.children]
         if len(child_batches):
@@ -86,16 +114,25 @@ class FunctionExpression(AbstractExpression):
         outcomes.apply_function_expression(func)
         outcomes = outcomes.project(self.projection_columns)
         outcomes.modify_column_alias(self.alias)
+        if hidden_columns and batch is not None:
+            batch.add_columns(outcomes, hidden_columns)
         return outcomes
 
     def _gpu_enabled_function(self):
+        if self.udf_options.get("mode") == UDF_PROCESS_MODE:
+            return self._context.process_pool(self._function, self.udf_options)
         if isinstance(self._function, GPUCompatible):
             device = self._context.gpu_device()
             if device != NO_GPU:
                 return self._function.to_device(device)
+            replica_pool = self._context.replica_pool(self._function, self.udf_options)
+            if replica_pool is not None:
+                return replica_pool
         return self._function
 
     def __eq__(self, other):
+        # UDF objects bound from the same catalog entry are interchangeable,
+        # so compare their classes instead of their identities
         is_subtree_equal = super().__eq__(other)
         if not isinstance(other, FunctionExpression):
             return False
@@ -104,7 +141,7 @@ class FunctionExpression(AbstractExpression):
             and self.name == other.name
             and self.output == other.output
             and self.alias == other.alias
-            and self.function == other.function
+            and _udf_class_name(self.function) == _udf_class_name(other.function)
             and self.output_objs == other.output_objs
         )
 
@@ -115,7 +152,13 @@ class FunctionExpression(AbstractExpression):
                 self.name,
                 self.output,
                 self.alias,
-                self.function,
+                _udf_class_name(self.function),
                 tuple(self.output_objs),
             )
         )
+
+
+def _udf_class_name(func: Callable) -> str:
+    # the binder imports the UDF implementation file for every
+    # FunctionExpression, so the class objects differ across expressions
+    return "{}.{}".format(type(func).__module__, type(func).__qualname__)
@@ -12,11 +12,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import numpy as np
+
 from eva.expression.abstract_expression import (
     AbstractExpression,
     ExpressionReturnType,
     ExpressionType,
 )
+from eva.models.storage.batch import Batch
 
 
 class LogicalExpression(AbstractExpression):
@@ -35,25 +38,32 @@ class LogicalExpression(AbstractExpression):
             exp_type, rtype=ExpressionReturnType.BOOLEAN, children=children
         )
 
-    def evaluate(self, *args, **kwargs):
+    def evaluate(self, batch: Batch, **kwargs):
         if self.get_children_count() == 2:
 
-            left_batch = self.get_child(0).evaluate(*args, **kwargs)
+            left_batch = self.get_child(0).evaluate(batch, **kwargs)
             if self.etype == ExpressionType.LOGICAL_AND:
 
                 if left_batch.all_false():  # check if all are false
                     return left_batch
-                kwargs["mask"] = left_batch.create_mask()
+                mask = left_batch.create_mask()
             elif self.etype == ExpressionType.LOGICAL_OR:
                 if left_batch.all_true():  # check if all are true
                     return left_batch
-                kwargs["mask"] = left_batch.create_inverted_mask()
-            right_batch = self.get_child(1).evaluate(*args, **kwargs)
-            left_batch.update_indices(kwargs["mask"], right_batch)
+                mask = left_batch.create_inverted_mask()
+            # evaluate the right side only on the undecided rows; the
+            # selection is narrowed on a view without copying the batch
+            if batch is not None:
+                if len(mask) == 1 and len(batch) != 1:
+                    left_batch.repeat(len(batch))
+                    mask = np.repeat(mask, len(batch))
+                batch = batch.select(mask)
+            right_batch = self.get_child(1).evaluate(batch, **kwargs)
+            left_batch.update_indices(mask, right_batch)
 
             return left_batch
         else:
-            batch = self.get_child(0).evaluate(*args, **kwargs)
+            batch = self.get_child(0).evaluate(batch, **kwargs)
             if self.etype == ExpressionType.LOGICAL_NOT:
                 batch.invert()
                 return batch
@@ -76,8 +76,6 @@ class TupleValueExpression(AbstractExpression):
         self._col_alias = value
 
     def evaluate(self, batch: Batch, *args, **kwargs):
-        if "mask" in kwargs:
-            batch = batch[kwargs["mask"]]
         return batch.project([self.col_alias])
 
     def __eq__(self, other):
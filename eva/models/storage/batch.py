@@ -48,6 +48,11 @@ class Batch:
     id: integer index of frame
     data: frame as np.array
 
+    A batch can carry a selection vector, a boolean mask over the rows of
+    the underlying DataFrame. Filters narrow the selection instead of
+    copying the surviving rows; the rows are only copied out when the
+    frames are accessed, e.g. at pipeline breakers or before a UDF call.
+
     Arguments:
         frames (DataFrame): pandas Dataframe holding frames data
         identifier_column (str): A column used to uniquely a row
@@ -60,12 +65,17 @@ class Batch:
                 "Batch constructor not properly called.\n" "Expected pandas.DataFrame"
             )
         self._identifier_column = identifier_column
+        self._selection = None
+        self._num_selected = 0
 
     @property
     def frames(self) -> pd.DataFrame:
+        self._materialize()
         return self._frames
 
     def __len__(self):
+        if self._selection is not None:
+            return self._num_selected
         return len(self._frames)
 
     @property
@@ -73,11 +83,67 @@ class Batch:
         return self._frames.columns
 
     def column_as_numpy_array(self, column_name="data"):
-        return np.array(self._frames[column_name])
+        values = self._frames[column_name].to_numpy()
+        if self._selection is not None:
+            values = values[self._selection]
+        return values
+
+    def filter(self, mask: np.ndarray) -> None:
+        """Keep only the selected rows without copying them.
+
+        Arguments:
+            mask (np.ndarray): boolean mask or index array over the rows
+            of this batch (i.e., relative to the current selection)
+        """
+        mask = np.asarray(mask)
+        if mask.dtype != bool:
+            indices = mask
+            mask = np.zeros(len(self), dtype=bool)
+            mask[indices] = True
+        if self._selection is None:
+            self._selection = mask.copy()
+        else:
+            self._selection[self._selection] = mask
+        self._num_selected = int(np.count_nonzero(mask))
+
+    def select(self, mask: np.ndarray) -> Batch:
+        """Returns a batch with the selected rows that shares the underlying
+        frames with this batch. See `filter`.
+        """
+        view = Batch(self._frames, self._identifier_column)
+        if self._selection is not None:
+            view._selection = self._selection.copy()
+            view._num_selected = self._num_selected
+        view.filter(mask)
+        return view
+
+    def add_columns(self, other: Batch, names: List[str]) -> None:
+        """Attach the columns of other, which holds one row per selected row
+        of this batch, in place. The columns are added to the underlying
+        frames, so they are also visible to the batches sharing them.
+
+        Arguments:
+            other (Batch): batch with the column values
+            names (List[str]): names of the new columns
+        """
+        for name, column in zip(names, other.frames.columns):
+            values = other.frames[column].to_numpy()
+            if self._selection is not None:
+                full_values = np.full(len(self._frames), None, dtype=object)
+                full_values[self._selection] = values
+                values = full_values
+            self._frames[name] = values
+
+    def _materialize(self) -> None:
+        """Copy out the selected rows and drop the selection vector."""
+        if self._selection is not None:
+            self._frames = self._frames[self._selection]
+            self._frames.reset_index(drop=True, inplace=True)
+            self._selection = None
 
     def to_json(self):
         obj = {
-            "frames": self._frames,
+            "frames": self.frames,
             "batch_size": len(self),
             "identifier_column": self._identifier_column,
         }
@@ -90,39 +156,27 @@ class Batch:
 
     @classmethod
     def from_eq(cls, batch1: Batch, batch2: Batch) -> Batch:
-        return Batch(
-            pd.DataFrame(batch1._frames.to_numpy() == batch2._frames.to_numpy())
-        )
+        return Batch(pd.DataFrame(batch1.frames.to_numpy() == batch2.frames.to_numpy()))
 
     @classmethod
     def from_greater(cls, batch1: Batch, batch2: Batch) -> Batch:
-        return Batch(
-            pd.DataFrame(batch1._frames.to_numpy() > batch2._frames.to_numpy())
-        )
+        return Batch(pd.DataFrame(batch1.frames.to_numpy() > batch2.frames.to_numpy()))
 
     @classmethod
     def from_lesser(cls, batch1: Batch, batch2: Batch) -> Batch:
-        return Batch(
-            pd.DataFrame(batch1._frames.to_numpy() < batch2._frames.to_numpy())
-        )
+        return Batch(pd.DataFrame(batch1.frames.to_numpy() < batch2.frames.to_numpy()))
 
     @classmethod
     def from_greater_eq(cls, batch1: Batch, batch2: Batch) -> Batch:
-        return Batch(
-            pd.DataFrame(batch1._frames.to_numpy() >= batch2._frames.to_numpy())
-        )
+        return Batch(pd.DataFrame(batch1.frames.to_numpy() >= batch2.frames.to_numpy()))
 
     @classmethod
     def from_lesser_eq(cls, batch1: Batch, batch2: Batch) -> Batch:
-        return Batch(
-            pd.DataFrame(batch1._frames.to_numpy() <= batch2._frames.to_numpy())
-        )
+        return Batch(pd.DataFrame(batch1.frames.to_numpy() <= batch2.frames.to_numpy()))
 
     @classmethod
     def from_not_eq(cls, batch1: Batch, batch2: Batch) -> Batch:
-        return Batch(
-            pd.DataFrame(batch1._frames.to_numpy() != batch2._frames.to_numpy())
-        )
+        return Batch(pd.DataFrame(batch1.frames.to_numpy() != batch2.frames.to_numpy()))
 
     @classmethod
     def compare_contains(cls, batch1: Batch, batch2: Batch) -> None:
@@ -130,7 +184,7 @@ class Batch:
             pd.DataFrame(
                 [all(x in p for x in q) for p, q in zip(left, right)]
                 for left, right in zip(
-                    batch1._frames.to_numpy(), batch2._frames.to_numpy()
+                    batch1.frames.to_numpy(), batch2.frames.to_numpy()
                 )
             )
         )
@@ -141,7 +195,7 @@ class Batch:
             pd.DataFrame(
                 [all(x in q for x in p) for p, q in zip(left, right)]
                 for left, right in zip(
-                    batch1._frames.to_numpy(), batch2._frames.to_numpy()
+                    batch1.frames.to_numpy(), batch2.frames.to_numpy()
                 )
             )
         )
@@ -151,12 +205,11 @@ class Batch:
             "Batch Object:\n"
             "@dataframe: %s\n"
             "@batch_size: %d\n"
-            "@identifier_column: %s"
-            % (self._frames, len(self), self._identifier_column)
+            "@identifier_column: %s" % (self.frames, len(self), self._identifier_column)
         )
 
     def __eq__(self, other: Batch):
-        return self._frames[sorted(self.columns)].equals(
+        return self.frames[sorted(self.columns)].equals(
             other.frames[sorted(other.columns)]
         )
 
@@ -174,9 +227,9 @@ class Batch:
             return self._get_frames_from_indices(indices)
         elif isinstance(indices, slice):
             start = indices.start if indices.start else 0
-            end = indices.stop if indices.stop else len(self.frames)
+            end = indices.stop if indices.stop else len(self)
             if end < 0:
-                end = len(self._frames) + end
+                end = len(self) + end
             step = indices.step if indices.step else 1
             return self._get_frames_from_indices(range(start, end, step))
         elif isinstance(indices, int):
@@ -185,7 +238,7 @@ class Batch:
             raise TypeError("Invalid argument type: {}".format(type(indices)))
 
     def _get_frames_from_indices(self, required_frame_ids):
-        new_frames = self._frames.iloc[required_frame_ids, :]
+        new_frames = self.frames.iloc[required_frame_ids, :]
         new_batch = Batch(new_frames)
         return new_batch
 
@@ -193,12 +246,13 @@ class Batch:
         """
         Execute function expression on frames.
         """
-        self._frames = expr(self._frames)
+        self._frames = expr(self.frames)
 
     def sort(self, by=None) -> None:
         """
         in_place sort
         """
+        self._materialize()
         if by is None:
             if self._identifier_column in self._frames:
                 by = [self._identifier_column]
@@ -224,6 +278,7 @@ class Batch:
         if sort_type is None:
             sort_type = [True]
 
+        self._materialize()
         if by is not None:
             for column in by:
                 if column not in self._frames.columns:
@@ -241,30 +296,34 @@ class Batch:
             logger.warn("Columns and Sort Type are required for orderby")
 
     def invert(self) -> None:
-        self._frames = ~self._frames
+        self._frames = ~self.frames
 
     def all_true(self) -> bool:
-        return self._frames.all().bool()
+        return self.frames.all().bool()
 
     def all_false(self) -> bool:
-        inverted = ~self._frames
+        inverted = ~self.frames
         return inverted.all().bool()
 
-    def create_mask(self) -> List:
+    def create_mask(self) -> np.ndarray:
         """
-        Return list of indices of first row.
+        Return boolean mask of the first column.
         """
-        return self._frames[self._frames[0]].index.tolist()
+        return self.column_as_numpy_array(0).astype(bool)
 
-    def create_inverted_mask(self) -> List:
-        return self._frames[~self._frames[0]].index.tolist()
+    def create_inverted_mask(self) -> np.ndarray:
+        return ~self.create_mask()
 
-    def update_indices(self, indices: List, other: Batch):
-        self._frames.iloc[indices] = other._frames
-        self._frames = pd.DataFrame(self._frames)
+    def update_indices(self, mask: np.ndarray, other: Batch):
+        """
+        Overwrite the rows selected by the boolean mask with the rows of
+        the other batch.
+        """
+        self._materialize()
+        self._frames.iloc[np.flatnonzero(mask)] = other.frames.to_numpy()
 
     def video_file_paths(self) -> Iterable:
-        yield from self._frames["video_file_path"]
+        yield from self.column_as_numpy_array("video_file_path")
 
     def project(self, cols: None) -> Batch:
         """
@@ -278,8 +337,13 @@ class Batch:
             logger.warn(
                 "Unexpected columns %s\n\
                                  Frames: %s"
-                % (unknown_cols, self._frames)
+                % (unknown_cols, self.frames)
             )
+        if self._selection is not None:
+            # copy out only the selected rows of the projected columns
+            frames = self._frames.loc[self._selection, verfied_cols]
+            frames.reset_index(drop=True, inplace=True)
+            return Batch(frames, self._identifier_column)
         return Batch(self._frames[verfied_cols], self._identifier_column)
 
     def repeat(self, times: int) -> None:
@@ -289,7 +353,7 @@ class Batch:
         Arguments:
             times: number of times to repeat
         """
-        self._frames = pd.DataFrame(np.repeat(self._frames.to_numpy(), times, axis=0))
+        self._frames = pd.DataFrame(np.repeat(self.frames.to_numpy(), times, axis=0))
 
     @classmethod
     def merge_column_wise(cls, batches: List[Batch], auto_renaming=False) -> Batch:
@@ -329,7 +393,7 @@ class Batch:
         if other.empty():
             return self
 
-        new_frames = self._frames.append(other.frames, ignore_index=True)
+        new_frames = self.frames.append(other.frames, ignore_index=True)
 
         return Batch(new_frames)
 
@@ -352,8 +416,8 @@ class Batch:
     @classmethod
     def join(cls, first: Batch, second: Batch, how="inner") -> Batch:
         return cls(
-            first._frames.merge(
-                second._frames, left_index=True, right_index=True, how=how
+            first.frames.merge(
+                second.frames, left_index=True, right_index=True, how=how
             )
         )
 
@@ -365,18 +429,19 @@ class Batch:
         Creates Batch by combining two batches using some arithmetic expression.
         """
         if expression == ExpressionType.ARITHMETIC_ADD:
-            return Batch(pd.DataFrame(first._frames + second._frames))
+            return Batch(pd.DataFrame(first.frames + second.frames))
         elif expression == ExpressionType.ARITHMETIC_SUBTRACT:
-            return Batch(pd.DataFrame(first._frames - second._frames))
+            return Batch(pd.DataFrame(first.frames - second.frames))
         elif expression == ExpressionType.ARITHMETIC_MULTIPLY:
-            return Batch(pd.DataFrame(first._frames * second._frames))
+            return Batch(pd.DataFrame(first.frames * second.frames))
         elif expression == ExpressionType.ARITHMETIC_DIVIDE:
-            return Batch(pd.DataFrame(first._frames / second._frames))
+            return Batch(pd.DataFrame(first.frames / second.frames))
 
     def reassign_indices_to_hash(self, indices) -> None:
         """
         Hash indices and replace the indices with those hash values.
         """
+        self._materialize()
         self._frames.index = self._frames[indices].apply(
             lambda x: hash(tuple(x)), axis=1
         )
@@ -389,7 +454,7 @@ class Batch:
         Arguments:
             method: string with one of the five above options
         """
-        self._frames = self._frames.agg([method])
+        self._frames = self.frames.agg([method])
 
     def empty(self):
         """Checks if the batch is empty
@@ -402,20 +467,21 @@ class Batch:
         """
         Unnest columns and drop columns with no data
         """
-        self._frames = self._frames.explode(list(self._frames.columns))
+        self._frames = self.frames.explode(list(self.columns))
         self._frames.dropna(inplace=True)
 
     def reverse(self) -> None:
         """Reverses dataframe"""
-        self._frames = self._frames[::-1]
+        self._frames = self.frames[::-1]
         self._frames.reset_index(drop=True, inplace=True)
 
     def drop_zero(self, outcomes: Batch) -> None:
         """Drop all columns with corresponding outcomes containing zero."""
-        self._frames = self._frames[(outcomes._frames > 0).to_numpy()]
+        self.filter((outcomes.frames > 0).to_numpy().all(axis=1))
 
     def reset_index(self):
         """Resets the index of the data frame in the batch"""
+        self._materialize()
         self._frames.reset_index(drop=True, inplace=True)
 
     def modify_column_alias(self, alias: Union[Alias, str]) -> None:
@@ -423,6 +489,8 @@ class Batch:
         # t1.a -> t2.a
         if isinstance(alias, str):
             alias = Alias(alias)
+        # the underlying frames may be shared with other selections
+        self._materialize()
         new_col_names = []
         if len(alias.col_names):
             if len(self.columns) != len(alias.col_names):
@@ -449,6 +517,7 @@ class Batch:
 
     def drop_column_alias(self) -> None:
         # table1.a, table1.b, table1.c -> a, b, c
+        self._materialize()
         new_col_names = []
         for col_name in self.columns:
             if "." in col_name:
@@ -79,6 +79,14 @@ class Binder:
             # the content in the group expression and manage the
             # parent-child relationship separately. Refer
             # optimizer_context:_xform_opr_to_group_expr
-            match_copy = [copy.copy(opr) for opr in match]
+            match_copy = Binder._copy_pre_order_repr(match)
             x = Binder.build_opr_tree_from_pre_order_repr(match_copy)
             yield x
+
+    @staticmethod
+    def _copy_pre_order_repr(pre_order_repr: tuple) -> tuple:
+        # copy the operators at every level of the match, patterns with
+        # more than two levels return nested tuples
+        if isinstance(pre_order_repr, Operator):
+            return copy.copy(pre_order_repr)
+        return tuple(Binder._copy_pre_order_repr(opr) for opr in pre_order_repr)
@@ -0,0 +1,99 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Dict, List, Set
+
+from eva.expression.abstract_expression import AbstractExpression
+from eva.expression.tuple_value_expression import TupleValueExpression
+from eva.optimizer.optimizer_utils import get_plan_expressions
+from eva.planner.abstract_plan import AbstractPlan
+from eva.planner.types import PlanOprType
+
+
+def _collect_columns(expr: AbstractExpression, columns: Dict[int, Set[str]]):
+    if expr is None:
+        return
+    if isinstance(expr, TupleValueExpression):
+        # the outputs of UDFs belong to no table
+        metadata_id = getattr(expr.col_object, "metadata_id", None)
+        if metadata_id is not None:
+            columns.setdefault(metadata_id, set()).add(expr.col_object.name)
+        return
+    for child in expr.children:
+        _collect_columns(child, columns)
+
+
+def _projects_columns(plan: AbstractPlan) -> bool:
+    """
+    Returns whether the output of the operator only holds the columns of
+    its expressions.
+    """
+    opr_type = plan.opr_type
+    if opr_type == PlanOprType.SEQUENTIAL_SCAN:
+        return bool(plan.columns)
+    if opr_type == PlanOprType.PROJECT:
+        return bool(plan.target_list)
+    if opr_type in (PlanOprType.LATERAL_JOIN, PlanOprType.HASH_JOIN):
+        return bool(plan.join_project)
+    return False
+
+
+def _collect_projected_scans(
+    plan: AbstractPlan, projected: bool, scans: List[AbstractPlan]
+):
+    projected = projected or _projects_columns(plan)
+    if plan.opr_type == PlanOprType.STORAGE_PLAN:
+        if projected and not plan.video.is_video:
+            scans.append(plan)
+        return
+    for child in plan.children:
+        _collect_projected_scans(child, projected, scans)
+
+
+def prune_scan_columns(plan: AbstractPlan) -> AbstractPlan:
+    """Limits the reads of structured tables to the columns the query uses
+
+    The projection of the storage plan of a table is set to the columns of
+    the table referenced by the expressions of the plan, if an operator
+    above the scan projects its output to its expressions (e.g., not for
+    SELECT *). The storage engine then only decodes those columns.
+
+    Arguments:
+        plan (AbstractPlan): physical plan
+
+    Returns:
+        AbstractPlan: the plan, whose storage plans are updated in place
+    """
+    columns = {}
+    nodes = [plan]
+    while nodes:
+        node = nodes.pop()
+        nodes.extend(node.children)
+        expressions = get_plan_expressions(node)
+        if expressions is None:
+            return plan
+        for expr in expressions:
+            _collect_columns(expr, columns)
+
+    scans = []
+    _collect_projected_scans(plan, False, scans)
+    for scan in scans:
+        table = scan.video
+        used_columns = columns.get(table.id, set())
+        projection = [
+            column.name for column in table.columns if column.name in used_columns
+        ]
+        # read a column anyway to keep the number of rows
+        scan.projection = projection or [table.columns[0].name]
+    return plan
@@ -14,11 +14,14 @@
 # limitations under the License.
 from functools import singledispatch
 
+from eva.expression.expression_utils import extract_range_list_from_predicate
 from eva.optimizer.group_expression import GroupExpression
 from eva.planner.abstract_plan import AbstractPlan
 from eva.planner.hash_join_build_plan import HashJoinBuildPlan
 from eva.planner.hash_join_probe_plan import HashJoinProbePlan
 from eva.planner.seq_scan_plan import SeqScanPlan
+from eva.planner.storage_plan import StoragePlan
+from eva.storage.storage_engine import VideoStorageEngine
 
 
 class CostModel:
@@ -50,4 +53,36 @@ class CostModel:
         def cost_seq_scan(opr: SeqScanPlan):
             return 1.0
 
+        @cost.register(StoragePlan)
+        def cost_storage_plan(opr: StoragePlan):
+            if not opr.video.is_video:
+                return 1.0
+            num_frames = self.estimate_num_frames(opr)
+            return 1.0 if num_frames is None else float(num_frames)
+
         return cost(gexpr.opr)
+
+    def estimate_num_frames(self, opr: StoragePlan):
+        """
+        Estimates the number of frames read by the storage plan of a video
+        table from the properties of its videos cached at load time.
+
+        Returns:
+            int: the number of frames, None if a video has no cached
+            properties
+        """
+        num_frames = 0
+        for _, properties in VideoStorageEngine.get_video_properties(opr.video):
+            if properties is None:
+                return None
+            range_list = [(0, properties.num_frames - 1)]
+            if opr.predicate is not None:
+                range_list = extract_range_list_from_predicate(
+                    opr.predicate, 0, properties.num_frames - 1
+                )
+            sampling_rate = opr.sampling_rate or 1
+            for begin, end in range_list:
+                num_frames += len(range(begin, end + 1, sampling_rate))
+        if opr.limit is not None:
+            num_frames = min(num_frames, opr.limit)
+        return num_frames
@@ -0,0 +1,122 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Optional
+
+from eva.catalog.models.df_metadata import DataFrameMetadata
+from eva.expression.abstract_expression import AbstractExpression
+from eva.expression.function_expression import FunctionExpression
+from eva.expression.tuple_value_expression import TupleValueExpression
+from eva.models.catalog.frame_info import FrameInfo
+from eva.models.catalog.properties import ColorSpace
+from eva.optimizer.optimizer_utils import get_plan_expressions, is_video_data_column
+from eva.planner.abstract_plan import AbstractPlan
+from eva.planner.types import PlanOprType
+
+# color spaces the readers convert the decoded BGR frames to
+_CONVERTIBLE_COLOR_SPACES = {ColorSpace.GRAY, ColorSpace.HSV}
+
+
+def _collect_consumer_formats(
+    expr: AbstractExpression,
+    parent: AbstractExpression,
+    video: DataFrameMetadata,
+    formats: List[FrameInfo],
+) -> bool:
+    """
+    Appends the input formats of the UDFs reading the pixel column of the
+    video in the expression to formats. Returns False if the pixels are used
+    by anything else than a UDF declaring its input format.
+    """
+    if expr is None:
+        return True
+    if isinstance(expr, TupleValueExpression):
+        if not is_video_data_column(expr, {video.id}):
+            return True
+        input_format = None
+        if isinstance(parent, FunctionExpression):
+            input_format = getattr(parent.function, "input_format", None)
+        if not isinstance(input_format, FrameInfo):
+            return False
+        formats.append(input_format)
+        return True
+    return all(
+        _collect_consumer_formats(child, expr, video, formats)
+        for child in expr.children
+    )
+
+
+def _merge_formats(formats: List[FrameInfo]) -> Optional[FrameInfo]:
+    """
+    The widest resolution and the common color space requested by the UDFs,
+    None if the frames must be kept as decoded.
+    """
+    if not formats:
+        return None
+    width = height = -1
+    if all(info.width > 0 and info.height > 0 for info in formats):
+        width = max(info.width for info in formats)
+        height = max(info.height for info in formats)
+    color_space = formats[0].color_space
+    if color_space not in _CONVERTIBLE_COLOR_SPACES or any(
+        info.color_space != color_space for info in formats
+    ):
+        color_space = ColorSpace.BGR
+    if width < 0 and color_space == ColorSpace.BGR:
+        return None
+    channels = 3 if color_space == ColorSpace.BGR else formats[0].channels
+    return FrameInfo(width, height, channels, color_space)
+
+
+def _collect_plans(plan: AbstractPlan, plans: List[AbstractPlan]):
+    plans.append(plan)
+    for child in plan.children:
+        _collect_plans(child, plans)
+
+
+def push_down_frame_format(plan: AbstractPlan) -> AbstractPlan:
+    """Pushes the input format of the UDFs into the storage plans of videos
+
+    If the frames of a video are only read by UDFs declaring their
+    `input_format`, the reader resizes the frames to the widest resolution
+    they request (if they all request one) and converts them to their color
+    space (if they all request the same GRAY or HSV color space) right after
+    decoding, which shrinks the batches flowing through the plan. Otherwise,
+    e.g., if the query projects the frames, the frames are kept as decoded.
+
+    Arguments:
+        plan (AbstractPlan): physical plan
+
+    Returns:
+        AbstractPlan: the plan, whose storage plans are updated in place
+    """
+    plans = []
+    _collect_plans(plan, plans)
+    expressions = []
+    for node in plans:
+        node_expressions = get_plan_expressions(node)
+        if node_expressions is None:
+            return plan
+        expressions.extend(node_expressions)
+
+    for node in plans:
+        if node.opr_type != PlanOprType.STORAGE_PLAN or not node.video.is_video:
+            continue
+        formats = []
+        if all(
+            _collect_consumer_formats(expr, None, node.video, formats)
+            for expr in expressions
+        ):
+            node.frame_info = _merge_formats(formats)
+    return plan
@@ -0,0 +1,158 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Set, Tuple
+
+from eva.expression.abstract_expression import AbstractExpression
+from eva.optimizer.optimizer_utils import get_plan_expressions, is_video_data_column
+from eva.planner.abstract_plan import AbstractPlan
+from eva.planner.materialize_plan import MaterializePlan
+from eva.planner.types import PlanOprType
+
+
+def _references_frames(expr: AbstractExpression, video_ids: Set[int]) -> bool:
+    if expr is None:
+        return False
+    if is_video_data_column(expr, video_ids):
+        return True
+    return any(_references_frames(child, video_ids) for child in expr.children)
+
+
+def _projection_usage(
+    target_list: List[AbstractExpression], video_ids: Set[int]
+) -> Tuple[bool, bool]:
+    # projecting the pixel column as is only copies the references
+    needs_frames = any(
+        _references_frames(expr, video_ids)
+        for expr in target_list or []
+        if not is_video_data_column(expr, video_ids)
+    )
+    keeps_frames = not target_list or any(
+        is_video_data_column(expr, video_ids) for expr in target_list
+    )
+    return needs_frames, keeps_frames
+
+
+def _frame_usage(plan: AbstractPlan, video_ids: Set[int]) -> Tuple[bool, bool]:
+    """
+    Returns whether the operator needs the decoded frames of its input, and
+    whether its output keeps the frames of its input.
+    """
+    opr_type = plan.opr_type
+    if opr_type == PlanOprType.SEQUENTIAL_SCAN:
+        needs_frames, keeps_frames = _projection_usage(plan.columns, video_ids)
+        return (
+            needs_frames or _references_frames(plan.predicate, video_ids),
+            keeps_frames,
+        )
+    if opr_type == PlanOprType.PROJECT:
+        return _projection_usage(plan.target_list, video_ids)
+    if opr_type in (PlanOprType.LATERAL_JOIN, PlanOprType.HASH_JOIN):
+        needs_frames, keeps_frames = _projection_usage(plan.join_project, video_ids)
+        # the function scans of a lateral join read the outer batches
+        func_exprs = [
+            child.func_expr
+            for child in plan.children
+            if child.opr_type == PlanOprType.FUNCTION_SCAN
+        ]
+        needs_frames = needs_frames or any(
+            _references_frames(expr, video_ids)
+            for expr in [plan.join_predicate] + func_exprs
+        )
+        return needs_frames, keeps_frames
+    expressions = get_plan_expressions(plan)
+    if expressions is None:
+        return True, True
+    return (
+        any(_references_frames(expr, video_ids) for expr in expressions),
+        True,
+    )
+
+
+def _keeps_all_rows(plan: AbstractPlan) -> bool:
+    if plan.opr_type == PlanOprType.SEQUENTIAL_SCAN:
+        return plan.predicate is None
+    return plan.opr_type in (PlanOprType.PROJECT, PlanOprType.EXCHANGE)
+
+
+def _materialize(plan: AbstractPlan) -> AbstractPlan:
+    if _keeps_all_rows(plan):
+        # decoding the same rows earlier costs nothing, and keeps it in the
+        # background worker of an exchange
+        child = _materialize(plan.children[0])
+        plan.clear_children()
+        plan.append_child(child)
+        return plan
+    if plan.opr_type == PlanOprType.STORAGE_PLAN:
+        # every frame read is needed, decode them while reading the video
+        plan.lazy_frames = False
+        return plan
+    materialize = MaterializePlan()
+    materialize.append_child(plan)
+    return materialize
+
+
+def _place_materialize(plan: AbstractPlan, video_ids: Set[int]) -> bool:
+    """
+    Inserts a MaterializePlan below the operator if it needs the frames of
+    a child. Returns whether the output of the operator holds frame
+    references.
+    """
+    if plan.opr_type == PlanOprType.STORAGE_PLAN:
+        return plan.lazy_frames
+    needs_frames, keeps_frames = _frame_usage(plan, video_ids)
+    has_references = False
+    children = list(plan.children)
+    plan.clear_children()
+    for child in children:
+        if _place_materialize(child, video_ids):
+            if needs_frames:
+                child = _materialize(child)
+            else:
+                has_references = True
+        plan.append_child(child)
+    return has_references and keeps_frames
+
+
+def place_frame_materialization(plan: AbstractPlan) -> AbstractPlan:
+    """Defers the decoding of the frames of videos to the operators using them
+
+    The storage plans of videos read the frames as FrameReferences (video
+    file and frame id) instead of decoding them. A MaterializePlan decodes
+    the referenced frames right below each operator evaluating an
+    expression on the pixels (e.g., a UDF), or at the root if the query
+    returns the frames. The frames of the rows filtered out or cut by a
+    LIMIT in between are never decoded, and the references are cheap to
+    sort, hash or exchange. If every frame read is needed right away, the
+    storage plan decodes them as before.
+
+    Arguments:
+        plan (AbstractPlan): physical plan
+
+    Returns:
+        AbstractPlan: the plan with the MaterializePlans
+    """
+    video_ids = set()
+    nodes = [plan]
+    while nodes:
+        node = nodes.pop()
+        nodes.extend(node.children)
+        if node.opr_type == PlanOprType.STORAGE_PLAN and node.video.is_video:
+            node.lazy_frames = True
+            video_ids.add(node.video.id)
+    if not video_ids:
+        return plan
+    if _place_materialize(plan, video_ids):
+        plan = _materialize(plan)
+    return plan
@@ -14,7 +14,7 @@
 # limitations under the License.
 from enum import IntEnum, auto
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 
 from eva.catalog.models.df_column import DataFrameColumn
 from eva.catalog.models.df_metadata import DataFrameMetadata
@@ -53,6 +53,7 @@ class OperatorType(IntEnum):
     LOGICAL_CREATE_MATERIALIZED_VIEW = auto()
     LOGICAL_SHOW = auto()
     LOGICALDROPUDF = auto()
+    LOGICALOPTIMIZETABLE = auto()
     LOGICALDELIMITER = auto()
 
 
@@ -566,6 +567,8 @@ class LogicalCreateUDF(Operator):
             the path provided should be relative to the UDF dir.
         udf_type: str
             udf type. it ca be object detection, classification etc.
+        udf_options: Dict[str, Any]
+            options of the udf, e.g., its execution backend
     """
 
     def __init__(
@@ -576,6 +579,7 @@ class LogicalCreateUDF(Operator):
         outputs: List[UdfIO],
         impl_path: Path,
         udf_type: str = None,
+        udf_options: Dict[str, Any] = None,
         children: List = None,
     ):
         super().__init__(OperatorType.LOGICALCREATEUDF, children)
@@ -585,6 +589,7 @@ class LogicalCreateUDF(Operator):
         self._outputs = outputs
         self._impl_path = impl_path
         self._udf_type = udf_type
+        self._udf_options = udf_options or {}
 
     @property
     def name(self):
@@ -610,6 +615,10 @@ class LogicalCreateUDF(Operator):
     def udf_type(self):
         return self._udf_type
 
+    @property
+    def udf_options(self):
+        return self._udf_options
+
     def __eq__(self, other):
         is_subtree_equal = super().__eq__(other)
         if not isinstance(other, LogicalCreateUDF):
@@ -622,6 +631,7 @@ class LogicalCreateUDF(Operator):
             and self.outputs == other.outputs
             and self.udf_type == other.udf_type
             and self.impl_path == other.impl_path
+            and self.udf_options == other.udf_options
         )
 
     def __hash__(self) -> int:
@@ -634,6 +644,7 @@ class LogicalCreateUDF(Operator):
                 tuple(self.outputs),
                 self.udf_type,
                 self.impl_path,
+                tuple(self.udf_options.items()),
             )
         )
 
@@ -677,6 +688,46 @@ class LogicalDropUDF(Operator):
         return hash((super().__hash__(), self.name, self.if_exists))
 
 
+class LogicalOptimizeTable(Operator):
+    """
+    Logical node for OPTIMIZE TABLE operations
+
+    Attributes:
+        table_ref: TableRef
+            table to compact
+        sort_column: str
+            column to sort the rows by, None for the identifier column
+    """
+
+    def __init__(
+        self, table_ref: TableRef, sort_column: str = None, children: List = None
+    ):
+        super().__init__(OperatorType.LOGICALOPTIMIZETABLE, children)
+        self._table_ref = table_ref
+        self._sort_column = sort_column
+
+    @property
+    def table_ref(self):
+        return self._table_ref
+
+    @property
+    def sort_column(self):
+        return self._sort_column
+
+    def __eq__(self, other):
+        is_subtree_equal = super().__eq__(other)
+        if not isinstance(other, LogicalOptimizeTable):
+            return False
+        return (
+            is_subtree_equal
+            and self.table_ref == other.table_ref
+            and self.sort_column == other.sort_column
+        )
+
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), self.table_ref, self.sort_column))
+
+
 class LogicalLoadData(Operator):
     """Logical node for load data operation
 
@@ -12,21 +12,31 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 from eva.catalog.catalog_manager import CatalogManager
 from eva.expression.abstract_expression import AbstractExpression, ExpressionType
+from eva.expression.expression_compiler import compile_predicate
 from eva.expression.expression_utils import (
     conjuction_list_to_expression_tree,
     contains_single_column,
     expression_tree_to_conjunction_list,
     get_columns_in_predicate,
+    get_function_expressions,
     is_simple_predicate,
 )
+from eva.expression.function_expression import FunctionExpression
+from eva.expression.logical_expression import LogicalExpression
+from eva.expression.tuple_value_expression import TupleValueExpression
 from eva.parser.alias import Alias
 from eva.parser.create_statement import ColumnDefinition
+from eva.planner.abstract_plan import AbstractPlan
+from eva.planner.types import PlanOprType
 from eva.utils.logging_manager import logger
 
+# name of the pixel column of video tables
+VIDEO_DATA_COLUMN = "data"
+
 
 def column_definition_to_udf_io(col_list: List[ColumnDefinition], is_input: bool):
     """Create the UdfIO object fro each column definition provided
@@ -123,6 +133,40 @@ def extract_pushdown_predicate(
     )
 
 
+def extract_table_pushdown_predicate(
+    predicate: AbstractExpression,
+) -> Tuple[AbstractExpression, AbstractExpression]:
+    """Decompose the predicate on a structured table into the predicate the
+    storage engine evaluates while reading the table and the remaining
+    predicate
+
+    The conjuncts comparing a single column of scalars with constants are
+    pushed down, the storage engine uses them to skip data and evaluates
+    them vectorized.
+
+    Args:
+        predicate (AbstractExpression): predicate that needs to be decomposed
+    Returns:
+        Tuple[AbstractExpression, AbstractExpression]: (pushdown predicate,
+        remaining predicate)
+    """
+    if predicate is None:
+        return None, None
+
+    pushdown_preds = []
+    rem_pred = []
+    for pred in expression_tree_to_conjunction_list(predicate):
+        if is_simple_predicate(pred) and compile_predicate(pred) is not None:
+            pushdown_preds.append(pred)
+        else:
+            rem_pred.append(pred)
+
+    return (
+        conjuction_list_to_expression_tree(pushdown_preds),
+        conjuction_list_to_expression_tree(rem_pred),
+    )
+
+
 def extract_pushdown_predicate_for_alias(
     predicate: AbstractExpression, aliases: List[Alias]
 ):
@@ -153,3 +197,126 @@ def extract_pushdown_predicate_for_alias(
         conjuction_list_to_expression_tree(pushdown_preds),
         conjuction_list_to_expression_tree(rem_pred),
     )
+
+
+def _contains_logical_expression(expr: AbstractExpression) -> bool:
+    if isinstance(expr, LogicalExpression):
+        return True
+    return any(_contains_logical_expression(child) for child in expr.children)
+
+
+def extract_shared_function_expressions(
+    predicate: AbstractExpression, target_list: List[AbstractExpression]
+) -> List[List[FunctionExpression]]:
+    """Group the identical FunctionExpressions of a predicate and the
+    projection above it that can be evaluated only once per batch.
+
+    A FunctionExpression in the predicate is only considered if it is part
+    of a conjunct without logical operators, i.e., it is evaluated for
+    every row satisfying the predicate. Otherwise, the rows surviving the
+    filter might miss its outcomes.
+
+    Args:
+        predicate (AbstractExpression): predicate of the filter
+        target_list (List[AbstractExpression]): projection list
+
+    Returns:
+        List[List[FunctionExpression]]: groups of identical expressions that
+        are not shared yet and appear more than once
+    """
+    candidates = []
+    for conjunct in expression_tree_to_conjunction_list(predicate):
+        if not _contains_logical_expression(conjunct):
+            candidates.extend(get_function_expressions(conjunct))
+    for expr in target_list or []:
+        candidates.extend(get_function_expressions(expr))
+
+    groups = {}
+    for func_expr in candidates:
+        groups.setdefault(func_expr, []).append(func_expr)
+
+    return [
+        group
+        for group in groups.values()
+        if len(group) > 1 and any(expr.hidden_alias is None for expr in group)
+    ]
+
+
+def share_function_expressions(
+    groups: List[List[FunctionExpression]], alias_prefix: str = "__cse"
+):
+    """Make each group of identical FunctionExpressions read and write the
+    same hidden columns, and share a single UDF object.
+    """
+    for idx, group in enumerate(groups):
+        hidden_alias = "{}{}".format(alias_prefix, idx)
+        for func_expr in group:
+            func_expr.hidden_alias = hidden_alias
+            func_expr.function = group[0].function
+
+
+def projected_function_expression_to_column(
+    expr: AbstractExpression, target_list: List[AbstractExpression]
+) -> TupleValueExpression:
+    """Returns a TupleValueExpression referring to the output column of the
+    projected FunctionExpression identical to the input expression, if any.
+    Only FunctionExpressions with a single output column qualify.
+    """
+    if not isinstance(expr, FunctionExpression) or expr.alias is None:
+        return None
+    if len(expr.alias.col_names) != 1:
+        return None
+    for target in target_list or []:
+        if target == expr:
+            alias_name = expr.alias.alias_name
+            col_name = expr.alias.col_names[0]
+            return TupleValueExpression(
+                col_name=col_name,
+                table_alias=alias_name,
+                col_alias="{}.{}".format(alias_name, col_name),
+            )
+    return None
+
+
+def get_plan_expressions(plan: AbstractPlan) -> Optional[List[AbstractExpression]]:
+    """Returns the expressions evaluated by the physical operator, None if
+    the operator is unknown (e.g., it writes its input to a table).
+    """
+    opr_type = plan.opr_type
+    if opr_type == PlanOprType.SEQUENTIAL_SCAN:
+        return [plan.predicate] + list(plan.columns or [])
+    if opr_type == PlanOprType.PREDICATE_FILTER:
+        return [plan.predicate]
+    if opr_type == PlanOprType.PROJECT:
+        return list(plan.target_list)
+    if opr_type in (PlanOprType.LATERAL_JOIN, PlanOprType.HASH_JOIN):
+        return [plan.join_predicate] + list(plan.join_project or [])
+    if opr_type == PlanOprType.FUNCTION_SCAN:
+        return [plan.func_expr]
+    if opr_type == PlanOprType.ORDER_BY:
+        return list(plan.columns)
+    if opr_type == PlanOprType.STORAGE_PLAN:
+        return [plan.predicate]
+    if opr_type in (
+        PlanOprType.LIMIT,
+        PlanOprType.SAMPLE,
+        PlanOprType.UNION,
+        PlanOprType.HASH_BUILD,
+        PlanOprType.EXCHANGE,
+        PlanOprType.GATHER,
+        PlanOprType.MATERIALIZE,
+    ):
+        return []
+    return None
+
+
+def is_video_data_column(expr: AbstractExpression, video_ids: Iterable[int]) -> bool:
+    """Checks if the expression is the pixel column of one of the videos"""
+    if not isinstance(expr, TupleValueExpression) or expr.col_object is None:
+        return False
+    col_object = expr.col_object
+    # the outputs of UDFs belong to no table
+    return (
+        col_object.name == VIDEO_DATA_COLUMN
+        and getattr(col_object, "metadata_id", None) in video_ids
+    )
@@ -12,11 +12,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from eva.configuration.configuration_manager import ConfigurationManager
+from eva.optimizer.column_pruning import prune_scan_columns
 from eva.optimizer.cost_model import CostModel
+from eva.optimizer.frame_format_pushdown import push_down_frame_format
+from eva.optimizer.frame_materialization import place_frame_materialization
 from eva.optimizer.operators import Operator
 from eva.optimizer.optimizer_context import OptimizerContext
 from eva.optimizer.optimizer_task_stack import OptimizerTaskStack
 from eva.optimizer.optimizer_tasks import BottomUpRewrite, OptimizeGroup, TopDownRewrite
+from eva.optimizer.plan_partitioner import partition_plan
 from eva.optimizer.property import PropertyType
 from eva.optimizer.rules.rules import RulesManager
 
@@ -86,8 +91,23 @@ class PlanGenerator:
         optimal_plan = self.build_optimal_physical_plan(root_grp_id, optimizer_context)
         return optimal_plan
 
-    def build(self, logical_plan: Operator):
+    def build(self, logical_plan: Operator, degree_of_parallelism: int = None):
+        """
+        Arguments:
+            logical_plan (Operator): logical plan of the query
+            degree_of_parallelism (int): number of partitions the scans are
+                split into; defaults to executor.degree_of_parallelism
+        """
         # apply optimizations
 
         plan = self.optimize(logical_plan)
+        plan = push_down_frame_format(plan)
+        plan = place_frame_materialization(plan)
+        plan = prune_scan_columns(plan)
+
+        if degree_of_parallelism is None:
+            degree_of_parallelism = ConfigurationManager().get_value(
+                "executor", "degree_of_parallelism", 1
+            )
+        plan = partition_plan(plan, degree_of_parallelism)
         return plan
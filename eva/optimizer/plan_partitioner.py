@@ -0,0 +1,120 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import copy
+
+from eva.configuration.configuration_manager import ConfigurationManager
+from eva.planner.abstract_plan import AbstractPlan
+from eva.planner.gather_plan import GatherPlan
+from eva.planner.storage_plan import StoragePlan
+from eva.planner.types import PlanOprType
+
+# Operators that process every batch independently of the others, so a plan
+# fragment made of them returns the same rows whether it reads the whole table
+# or each partition separately.
+_PARTITIONABLE_OPR_TYPES = {
+    PlanOprType.SEQUENTIAL_SCAN,
+    PlanOprType.PREDICATE_FILTER,
+    PlanOprType.PROJECT,
+    PlanOprType.LATERAL_JOIN,
+    PlanOprType.FUNCTION_SCAN,
+    PlanOprType.EXCHANGE,
+    PlanOprType.MATERIALIZE,
+    PlanOprType.STORAGE_PLAN,
+}
+
+
+def _count_partitionable_scans(plan: AbstractPlan) -> int:
+    """
+    Returns the number of storage plans in the subtree if every operator of
+    the subtree is partitionable, -1 otherwise.
+    """
+    if plan.opr_type not in _PARTITIONABLE_OPR_TYPES:
+        return -1
+    if plan.opr_type == PlanOprType.STORAGE_PLAN:
+        # already partitioned
+        return 1 if not plan.total_shards else -1
+    num_scans = 0
+    for child in plan.children:
+        child_scans = _count_partitionable_scans(child)
+        if child_scans < 0:
+            return -1
+        num_scans += child_scans
+    return num_scans
+
+
+def _copy_fragment(
+    plan: AbstractPlan, curr_shard: int, total_shards: int
+) -> AbstractPlan:
+    if plan.opr_type == PlanOprType.STORAGE_PLAN:
+        fragment = StoragePlan(
+            plan.video,
+            plan.batch_mem_size,
+            skip_frames=plan.skip_frames,
+            offset=plan.offset,
+            limit=plan.limit,
+            total_shards=total_shards,
+            curr_shard=curr_shard,
+            predicate=plan.predicate,
+            sampling_rate=plan.sampling_rate,
+            frame_info=plan.frame_info,
+            lazy_frames=plan.lazy_frames,
+            projection=plan.projection,
+        )
+    else:
+        # copy.copy creates the node without its children
+        fragment = copy.copy(plan)
+        for child in plan.children:
+            fragment.append_child(_copy_fragment(child, curr_shard, total_shards))
+    return fragment
+
+
+def partition_plan(plan: AbstractPlan, degree_of_parallelism: int) -> AbstractPlan:
+    """Splits the scans of the physical plan into partitions
+
+    Every maximal subtree that reads a single table and is made only of
+    partitionable operators (e.g., SeqScan -> Predicate -> Project) is
+    replaced by a Gather over degree_of_parallelism copies of it, each
+    reading a different partition of the table (range of the frames of the
+    videos in table order, range of Parquet row groups or Petastorm shard).
+
+    Arguments:
+        plan (AbstractPlan): physical plan
+        degree_of_parallelism (int): number of partitions, <= 1 disables it
+
+    Returns:
+        AbstractPlan: the partitioned plan
+    """
+    if degree_of_parallelism is None or degree_of_parallelism <= 1:
+        return plan
+
+    if _count_partitionable_scans(plan) == 1:
+        # bounds the batches the workers compute ahead of the consumer, as the
+        # partitions are consumed one after another
+        config = ConfigurationManager()
+        queue_size = max(
+            1,
+            config.get_value("executor", "gather_mem_size", 150000000)  # 150mb
+            // config.get_value("executor", "batch_mem_size"),
+        )
+        gather = GatherPlan(degree_of_parallelism, queue_size)
+        for shard in range(degree_of_parallelism):
+            gather.append_child(_copy_fragment(plan, shard, degree_of_parallelism))
+        return gather
+
+    children = [partition_plan(child, degree_of_parallelism) for child in plan.children]
+    plan.clear_children()
+    for child in children:
+        plan.append_child(child)
+    return plan
@@ -23,6 +23,10 @@ from eva.optimizer.optimizer_utils import (
     extract_equi_join_keys,
     extract_pushdown_predicate,
     extract_pushdown_predicate_for_alias,
+    extract_shared_function_expressions,
+    extract_table_pushdown_predicate,
+    projected_function_expression_to_column,
+    share_function_expressions,
 )
 from eva.optimizer.rules.pattern import Pattern
 from eva.parser.types import JoinType
@@ -50,6 +54,7 @@ from eva.optimizer.operators import (
     LogicalJoin,
     LogicalLimit,
     LogicalLoadData,
+    LogicalOptimizeTable,
     LogicalOrderBy,
     LogicalProject,
     LogicalQueryDerivedGet,
@@ -65,12 +70,14 @@ from eva.planner.create_plan import CreatePlan
 from eva.planner.create_udf_plan import CreateUDFPlan
 from eva.planner.drop_plan import DropPlan
 from eva.planner.drop_udf_plan import DropUDFPlan
+from eva.planner.exchange_plan import ExchangePlan
 from eva.planner.function_scan_plan import FunctionScanPlan
 from eva.planner.hash_join_probe_plan import HashJoinProbePlan
 from eva.planner.insert_plan import InsertPlan
 from eva.planner.lateral_join_plan import LateralJoinPlan
 from eva.planner.limit_plan import LimitPlan
 from eva.planner.load_data_plan import LoadDataPlan
+from eva.planner.optimize_table_plan import OptimizeTablePlan
 from eva.planner.orderby_plan import OrderByPlan
 from eva.planner.rename_plan import RenamePlan
 from eva.planner.sample_plan import SamplePlan
@@ -97,6 +104,8 @@ class RuleType(Flag):
     EMBED_PROJECT_INTO_DERIVED_GET = auto()
     EMBED_PROJECT_INTO_GET = auto()
     PUSHDOWN_FILTER_THROUGH_JOIN = auto()
+    SHARE_FUNCTION_EXPRESSIONS_WITH_FILTER = auto()
+    REUSE_PROJECTED_FUNCTION_EXPRESSIONS_IN_ORDERBY = auto()
     REWRITE_DELIMETER = auto()
 
     # TRANSFORMATION RULES (LOGICAL -> LOGICAL)
@@ -125,6 +134,7 @@ class RuleType(Flag):
     LOGICAL_PROJECT_TO_PHYSICAL = auto()
     LOGICAL_SHOW_TO_PHYSICAL = auto()
     LOGICAL_DROP_UDF_TO_PHYSICAL = auto()
+    LOGICAL_OPTIMIZE_TABLE_TO_PHYSICAL = auto()
     IMPLEMENTATION_DELIMETER = auto()
 
     NUM_RULES = auto()
@@ -159,6 +169,7 @@ class Promise(IntEnum):
     LOGICAL_PROJECT_TO_PHYSICAL = auto()
     LOGICAL_SHOW_TO_PHYSICAL = auto()
     LOGICAL_DROP_UDF_TO_PHYSICAL = auto()
+    LOGICAL_OPTIMIZE_TABLE_TO_PHYSICAL = auto()
     IMPLEMENTATION_DELIMETER = auto()
 
     # TRANSFORMATION RULES (LOGICAL -> LOGICAL)
@@ -171,6 +182,8 @@ class Promise(IntEnum):
     EMBED_PROJECT_INTO_DERIVED_GET = auto()
     EMBED_SAMPLE_INTO_GET = auto()
     PUSHDOWN_FILTER_THROUGH_JOIN = auto()
+    SHARE_FUNCTION_EXPRESSIONS_WITH_FILTER = auto()
+    REUSE_PROJECTED_FUNCTION_EXPRESSIONS_IN_ORDERBY = auto()
 
 
 class Rule(ABC):
@@ -244,26 +257,27 @@ class EmbedFilterIntoGet(Rule):
         return Promise.EMBED_FILTER_INTO_GET
 
     def check(self, before: LogicalFilter, context: OptimizerContext):
-        # System supports predicate pushdown only while reading video data
         predicate = before.predicate
         lget: LogicalGet = before.children[0]
-        if predicate and lget.dataset_metadata.is_video:
-            # System only supports pushing basic range predicates on id
-            video_alias = lget.video.alias
-            col_alias = f"{video_alias}.id"
-            pushdown_pred, _ = extract_pushdown_predicate(predicate, col_alias)
+        if predicate:
+            pushdown_pred, _ = self._extract_pushdown_predicate(predicate, lget)
             if pushdown_pred:
                 return True
         return False
 
+    def _extract_pushdown_predicate(self, predicate, lget: LogicalGet):
+        if lget.dataset_metadata.is_video:
+            # System only supports pushing basic range predicates on id
+            video_alias = lget.video.alias
+            col_alias = f"{video_alias}.id"
+            return extract_pushdown_predicate(predicate, col_alias)
+        return extract_table_pushdown_predicate(predicate)
+
     def apply(self, before: LogicalFilter, context: OptimizerContext):
         predicate = before.predicate
         lget = before.children[0]
-        # System only supports pushing basic range predicates on id
-        video_alias = lget.video.alias
-        col_alias = f"{video_alias}.id"
-        pushdown_pred, unsupported_pred = extract_pushdown_predicate(
-            predicate, col_alias
+        pushdown_pred, unsupported_pred = self._extract_pushdown_predicate(
+            predicate, lget
         )
         if pushdown_pred:
             new_get_opr = LogicalGet(
@@ -461,6 +475,72 @@ class PushDownFilterThroughJoin(Rule):
         return new_join_node
 
 
+class ShareFunctionExpressionsWithFilter(Rule):
+    """Evaluate the FunctionExpressions shared by the filter and the projection
+    above it only once per batch. The filter attaches the outcomes to the
+    batch as hidden columns, which the projection reads back.
+    """
+
+    def __init__(self):
+        pattern = Pattern(OperatorType.LOGICALPROJECT)
+        pattern_filter = Pattern(OperatorType.LOGICALFILTER)
+        pattern_filter.append_child(Pattern(OperatorType.DUMMY))
+        pattern.append_child(pattern_filter)
+        super().__init__(RuleType.SHARE_FUNCTION_EXPRESSIONS_WITH_FILTER, pattern)
+
+    def promise(self):
+        return Promise.SHARE_FUNCTION_EXPRESSIONS_WITH_FILTER
+
+    def check(self, before: LogicalProject, context: OptimizerContext):
+        predicate = before.children[0].predicate
+        if predicate is None:
+            return False
+        groups = extract_shared_function_expressions(predicate, before.target_list)
+        return len(groups) > 0
+
+    def apply(self, before: LogicalProject, context: OptimizerContext):
+        predicate = before.children[0].predicate
+        groups = extract_shared_function_expressions(predicate, before.target_list)
+        share_function_expressions(groups)
+        return before
+
+
+class ReuseProjectedFunctionExpressionsInOrderBy(Rule):
+    """Sort on the output column of a projected FunctionExpression instead of
+    evaluating the identical FunctionExpression in the order by list again.
+    """
+
+    def __init__(self):
+        pattern = Pattern(OperatorType.LOGICALORDERBY)
+        pattern_project = Pattern(OperatorType.LOGICALPROJECT)
+        pattern_project.append_child(Pattern(OperatorType.DUMMY))
+        pattern.append_child(pattern_project)
+        super().__init__(
+            RuleType.REUSE_PROJECTED_FUNCTION_EXPRESSIONS_IN_ORDERBY, pattern
+        )
+
+    def promise(self):
+        return Promise.REUSE_PROJECTED_FUNCTION_EXPRESSIONS_IN_ORDERBY
+
+    def check(self, before: LogicalOrderBy, context: OptimizerContext):
+        target_list = before.children[0].target_list
+        return any(
+            projected_function_expression_to_column(expr, target_list)
+            for expr, _ in before.orderby_list
+        )
+
+    def apply(self, before: LogicalOrderBy, context: OptimizerContext):
+        target_list = before.children[0].target_list
+        orderby_list = []
+        for expr, sort_type in before.orderby_list:
+            column = projected_function_expression_to_column(expr, target_list)
+            orderby_list.append((column or expr, sort_type))
+        new_orderby_opr = LogicalOrderBy(orderby_list)
+        for child in before.children:
+            new_orderby_opr.append_child(child)
+        return new_orderby_opr
+
+
 # REWRITE RULES END
 ##############################################
 
@@ -568,6 +648,7 @@ class LogicalCreateUDFToPhysical(Rule):
             before.outputs,
             before.impl_path,
             before.udf_type,
+            before.udf_options,
         )
         return after
 
@@ -588,6 +669,22 @@ class LogicalDropUDFToPhysical(Rule):
         return after
 
 
+class LogicalOptimizeTableToPhysical(Rule):
+    def __init__(self):
+        pattern = Pattern(OperatorType.LOGICALOPTIMIZETABLE)
+        super().__init__(RuleType.LOGICAL_OPTIMIZE_TABLE_TO_PHYSICAL, pattern)
+
+    def promise(self):
+        return Promise.LOGICAL_OPTIMIZE_TABLE_TO_PHYSICAL
+
+    def check(self, before: Operator, context: OptimizerContext):
+        return True
+
+    def apply(self, before: LogicalOptimizeTable, context: OptimizerContext):
+        after = OptimizeTablePlan(before.table_ref, before.sort_column)
+        return after
+
+
 class LogicalInsertToPhysical(Rule):
     def __init__(self):
         pattern = Pattern(OperatorType.LOGICALINSERT)
@@ -693,14 +790,26 @@ class LogicalGetToSeqScan(Rule):
         if config_batch_mem_size:
             batch_mem_size = config_batch_mem_size
         after = SeqScanPlan(None, before.target_list, before.alias)
-        after.append_child(
-            StoragePlan(
-                before.dataset_metadata,
-                batch_mem_size=batch_mem_size,
-                predicate=before.predicate,
-                sampling_rate=before.sampling_rate,
-            )
+        storage_plan = StoragePlan(
+            before.dataset_metadata,
+            batch_mem_size=batch_mem_size,
+            predicate=before.predicate,
+            sampling_rate=before.sampling_rate,
         )
+        # Prefetch the batches from storage in the background so that reading
+        # and decoding overlap with the rest of the plan. The number of
+        # buffered batches is bounded by prefetch_mem_size.
+        prefetch_mem_size = ConfigurationManager().get_value(
+            "executor", "prefetch_mem_size", 60000000  # 60mb
+        )
+        if prefetch_mem_size:
+            exchange_plan = ExchangePlan(
+                queue_size=max(1, prefetch_mem_size // batch_mem_size)
+            )
+            exchange_plan.append_child(storage_plan)
+            after.append_child(exchange_plan)
+        else:
+            after.append_child(storage_plan)
         return after
 
 
@@ -983,6 +1092,8 @@ class RulesManager:
             # EmbedProjectIntoDerivedGet(),
             EmbedSampleIntoGet(),
             PushDownFilterThroughJoin(),
+            ShareFunctionExpressionsWithFilter(),
+            ReuseProjectedFunctionExpressionsInOrderBy(),
         ]
 
         self._implementation_rules = [
@@ -991,6 +1102,7 @@ class RulesManager:
             LogicalDropToPhysical(),
             LogicalCreateUDFToPhysical(),
             LogicalDropUDFToPhysical(),
+            LogicalOptimizeTableToPhysical(),
             LogicalInsertToPhysical(),
             LogicalLoadToPhysical(),
             LogicalUploadToPhysical(),
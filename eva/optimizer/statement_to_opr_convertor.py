@@ -25,6 +25,7 @@ from eva.optimizer.operators import (
     LogicalJoin,
     LogicalLimit,
     LogicalLoadData,
+    LogicalOptimizeTable,
     LogicalOrderBy,
     LogicalProject,
     LogicalQueryDerivedGet,
@@ -42,6 +43,7 @@ from eva.parser.drop_statement import DropTableStatement
 from eva.parser.drop_udf_statement import DropUDFStatement
 from eva.parser.insert_statement import InsertTableStatement
 from eva.parser.load_statement import LoadDataStatement
+from eva.parser.optimize_statement import OptimizeTableStatement
 from eva.parser.rename_statement import RenameTableStatement
 from eva.parser.select_statement import SelectStatement
 from eva.parser.show_statement import ShowStatement
@@ -223,6 +225,14 @@ class StatementToPlanConvertor:
         drop_opr = LogicalDrop(statement.table_refs, statement.if_exists)
         self._plan = drop_opr
 
+    def visit_optimize_table(self, statement: OptimizeTableStatement):
+        """Convertor for parsed optimize table statement
+
+        Arguments:
+            statement {OptimizeTableStatement} - Optimize Table Statement
+        """
+        self._plan = LogicalOptimizeTable(statement.table_ref, statement.sort_column)
+
     def visit_create_udf(self, statement: CreateUDFStatement):
         """Convertor for parsed create udf statement
 
@@ -239,6 +249,7 @@ class StatementToPlanConvertor:
             annotated_outputs,
             statement.impl_path,
             statement.udf_type,
+            statement.udf_options,
         )
         self._plan = create_udf_opr
 
@@ -314,6 +325,8 @@ class StatementToPlanConvertor:
             self.visit_create_udf(statement)
         elif isinstance(statement, DropUDFStatement):
             self.visit_drop_udf(statement)
+        elif isinstance(statement, OptimizeTableStatement):
+            self.visit_optimize_table(statement)
         elif isinstance(statement, LoadDataStatement):
             self.visit_load_data(statement)
         elif isinstance(statement, UploadStatement):
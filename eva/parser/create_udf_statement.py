@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 
 from eva.parser.create_statement import ColumnDefinition
 from eva.parser.statement import AbstractStatement
@@ -39,6 +39,9 @@ class CreateUDFStatement(AbstractStatement):
             the path provided should be relative to the UDF dir.
         udf_type: str
             udf type. it ca be object detection, classification etc.
+        udf_options: Dict[str, Any]
+            options provided in the WITH clause, e.g., the execution
+            backend of the udf
     """
 
     def __init__(
@@ -49,6 +52,7 @@ class CreateUDFStatement(AbstractStatement):
         outputs: List[ColumnDefinition],
         impl_path: str,
         udf_type: str = None,
+        udf_options: Dict[str, Any] = None,
     ):
         super().__init__(StatementType.CREATE_UDF)
         self._name = name
@@ -57,6 +61,7 @@ class CreateUDFStatement(AbstractStatement):
         self._outputs = outputs
         self._impl_path = Path(impl_path)
         self._udf_type = udf_type
+        self._udf_options = udf_options or {}
 
     def __str__(self) -> str:
         print_str = "CREATE UDF {} INPUT ({}) OUTPUT ({}) TYPE {} IMPL {}".format(
@@ -66,6 +71,10 @@ class CreateUDFStatement(AbstractStatement):
             self._udf_type,
             self._impl_path.name,
         )
+        if self._udf_options:
+            print_str += " WITH {}".format(
+                ", ".join(f"{key}={value}" for key, value in self._udf_options.items())
+            )
         return print_str
 
     @property
@@ -92,6 +101,10 @@ class CreateUDFStatement(AbstractStatement):
     def udf_type(self):
         return self._udf_type
 
+    @property
+    def udf_options(self):
+        return self._udf_options
+
     def __eq__(self, other):
         if not isinstance(other, CreateUDFStatement):
             return False
@@ -102,6 +115,7 @@ class CreateUDFStatement(AbstractStatement):
             and self.outputs == other.outputs
             and self.impl_path == other.impl_path
             and self.udf_type == other.udf_type
+            and self.udf_options == other.udf_options
         )
 
     def __hash__(self) -> int:
@@ -111,6 +125,9 @@ class CreateUDFStatement(AbstractStatement):
                 self.name,
                 self.if_not_exists,
                 tuple(self.inputs),
-                tuple(self.outputs, self.impl_path, self.udf_type),
+                tuple(self.outputs),
+                self.impl_path,
+                self.udf_type,
+                tuple(self.udf_options.items()),
             )
         )
@@ -61,6 +61,7 @@ NOT:                                 'NOT';
 NULL_LITERAL:                        'NULL';
 OFFSET:                              'OFFSET';
 ON:                                  'ON';
+OPTIMIZE:                            'OPTIMIZE';
 OR:                                  'OR';
 ORDER:                               'ORDER';
 PATH:                                'PATH';
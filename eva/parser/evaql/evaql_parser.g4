@@ -27,6 +27,7 @@ emptyStatement
 ddlStatement
     : createDatabase | createTable | createIndex | createUdf | createMaterializedView
     | dropDatabase | dropTable | dropUdf | dropIndex | renameTable
+    | optimizeTable
     ;
 
 dmlStatement
@@ -66,6 +67,12 @@ renameTable
       TO newtableName
     ;
 
+// Optimize statements
+optimizeTable
+    : OPTIMIZE TABLE tableName
+      (ORDER BY sortColumn=uid)?
+    ;
+
 // Create UDFs
 createUdf
     : CREATE UDF
@@ -75,6 +82,7 @@ createUdf
       OUTPUT createDefinitions
       TYPE   udfType
       IMPL   udfImpl
+      (WITH  udfOptions)?
     ;
 
 // Create Materialized View
@@ -99,6 +107,14 @@ udfImpl
     : stringLiteral
     ;
 
+udfOptions
+    : udfOption (',' udfOption)*
+    ;
+
+udfOption
+    : uid '=' (uid | constant)
+    ;
+
 indexType
     : USING (BTREE | HASH)
     ;
@@ -186,7 +202,7 @@ loadStatement
     ;
 
 fileOptions
-    : FORMAT fileFormat=(CSV|VIDEO)
+    : FORMAT fileFormat=(CSV|VIDEO) (',' udfOption)*
     ;
 
 uploadStatement
@@ -0,0 +1,56 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from eva.parser.statement import AbstractStatement
+from eva.parser.table_ref import TableRef
+from eva.parser.types import StatementType
+
+
+class OptimizeTableStatement(AbstractStatement):
+    """Optimize Table Statement constructed after parsing the input query
+
+    Attributes:
+        table_ref: table reference of the table to compact
+        sort_column: column to sort the rows of the compacted table by,
+            None sorts them by the identifier column of the table
+    """
+
+    def __init__(self, table_ref: TableRef, sort_column: str = None):
+        super().__init__(StatementType.OPTIMIZE_TABLE)
+        self._table_ref = table_ref
+        self._sort_column = sort_column
+
+    def __str__(self) -> str:
+        print_str = "OPTIMIZE TABLE {}".format(self._table_ref.table.table_name)
+        if self._sort_column is not None:
+            print_str += " ORDER BY {}".format(self._sort_column)
+        return print_str
+
+    @property
+    def table_ref(self):
+        return self._table_ref
+
+    @property
+    def sort_column(self):
+        return self._sort_column
+
+    def __eq__(self, other):
+        if not isinstance(other, OptimizeTableStatement):
+            return False
+        return (
+            self.table_ref == other.table_ref and self.sort_column == other.sort_column
+        )
+
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), self.table_ref, self.sort_column))
@@ -22,6 +22,7 @@ from eva.parser.parser_visitor._expressions import Expressions
 from eva.parser.parser_visitor._functions import Functions
 from eva.parser.parser_visitor._insert_statements import Insert
 from eva.parser.parser_visitor._load_statement import Load
+from eva.parser.parser_visitor._optimize_statement import OptimizeTable
 from eva.parser.parser_visitor._rename_statement import RenameTable
 from eva.parser.parser_visitor._select_statement import Select
 from eva.parser.parser_visitor._show_statements import Show
@@ -47,6 +48,7 @@ class ParserVisitor(
     Upload,
     RenameTable,
     DropTable,
+    OptimizeTable,
     Show,
 ):
     def visitRoot(self, ctx: evaql_parser.RootContext):
@@ -60,6 +60,7 @@ class Functions(evaql_parserVisitor):
         output_definitions = []
         impl_path = None
         udf_type = None
+        udf_options = {}
         for child in ctx.children:
             try:
                 if isinstance(child, TerminalNode):
@@ -92,6 +93,9 @@ class Functions(evaql_parserVisitor):
                 elif rule_idx == evaql_parser.RULE_udfImpl:
                     impl_path = self.visit(ctx.udfImpl()).value
 
+                elif rule_idx == evaql_parser.RULE_udfOptions:
+                    udf_options = self.visit(ctx.udfOptions())
+
             except BaseException:
                 logger.error("CREATE/DROP UDF Failed")
                 # stop parsing something bad happened
@@ -107,8 +111,21 @@ class Functions(evaql_parserVisitor):
             output_definitions,
             impl_path,
             udf_type,
+            udf_options,
         )
 
+    def visitUdfOptions(self, ctx: evaql_parser.UdfOptionsContext):
+        return dict(self.visit(option) for option in ctx.udfOption())
+
+    def visitUdfOption(self, ctx: evaql_parser.UdfOptionContext):
+        key = self.visit(ctx.uid(0)).lower()
+        # the value is either an identifier or a constant
+        if ctx.constant() is not None:
+            value = self.visit(ctx.constant()).value
+        else:
+            value = self.visit(ctx.uid(1))
+        return key, value
+
     # Drop UDF
     def visitDropUdf(self, ctx: evaql_parser.DropUdfContext):
         udf_info = self.getUDFInfo(ctx)
@@ -46,8 +46,7 @@ class Load(evaql_parserVisitor):
         if ctx.CSV() is not None:
             file_format = FileFormatType.CSV
 
-        # parse and add more file options in future
-        file_options = {}
+        file_options = dict(self.visit(option) for option in ctx.udfOption())
         file_options["file_format"] = file_format
 
         return file_options
@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 
 from eva.catalog.models.udf_io import UdfIO
 from eva.planner.abstract_plan import AbstractPlan
@@ -40,6 +40,8 @@ class CreateUDFPlan(AbstractPlan):
             the path provided should be relative to the eva dir.
         udf_type: str
             udf type. it ca be object detection, classification etc.
+        udf_options: Dict[str, Any]
+            options of the udf, e.g., its execution backend
     """
 
     def __init__(
@@ -50,6 +52,7 @@ class CreateUDFPlan(AbstractPlan):
         outputs: List[UdfIO],
         impl_file_path: Path,
         udf_type: str = None,
+        udf_options: Dict[str, Any] = None,
     ):
         super().__init__(PlanOprType.CREATE_UDF)
         self._name = name
@@ -58,6 +61,7 @@ class CreateUDFPlan(AbstractPlan):
         self._outputs = outputs
         self._impl_path = impl_file_path
         self._udf_type = udf_type
+        self._udf_options = udf_options or {}
 
     @property
     def name(self):
@@ -83,6 +87,10 @@ class CreateUDFPlan(AbstractPlan):
     def udf_type(self):
         return self._udf_type
 
+    @property
+    def udf_options(self):
+        return self._udf_options
+
     def __hash__(self) -> int:
         return hash(
             (
@@ -92,5 +100,6 @@ class CreateUDFPlan(AbstractPlan):
                 tuple(self.outputs),
                 self.impl_path,
                 self.udf_type,
+                tuple(self.udf_options.items()),
             )
         )
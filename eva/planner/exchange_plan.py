@@ -0,0 +1,39 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from eva.planner.abstract_plan import AbstractPlan
+from eva.planner.types import PlanOprType
+
+
+class ExchangePlan(AbstractPlan):
+    """
+    This plan is used to decouple the child subtree from its parent. The
+    child runs in a background worker and hands over its batches through a
+    bounded queue, so that producing the next batch (e.g., decoding frames)
+    overlaps with the processing of the current one in the parent.
+
+    Arguments:
+        queue_size (int): maximum number of batches buffered in the queue
+    """
+
+    def __init__(self, queue_size: int):
+        self._queue_size = queue_size
+        super().__init__(PlanOprType.EXCHANGE)
+
+    @property
+    def queue_size(self):
+        return self._queue_size
+
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), self.queue_size))
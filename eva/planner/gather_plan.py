@@ -0,0 +1,53 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from eva.planner.abstract_plan import AbstractPlan
+from eva.planner.types import PlanOprType
+
+
+class GatherPlan(AbstractPlan):
+    """
+    This plan merges the output of identical plan fragments, each reading a
+    different partition of the same table. Every child is one fragment and
+    runs in its own worker process; the results are returned in the order
+    of the partitions.
+
+    Arguments:
+        degree_of_parallelism (int): number of partitions (and workers)
+        queue_size (int): number of batches a worker computes ahead of the
+            consumer of its partition
+    """
+
+    def __init__(self, degree_of_parallelism: int, queue_size: int = 1):
+        self._degree_of_parallelism = degree_of_parallelism
+        self._queue_size = queue_size
+        super().__init__(PlanOprType.GATHER)
+
+    @property
+    def degree_of_parallelism(self):
+        return self._degree_of_parallelism
+
+    @property
+    def queue_size(self):
+        return self._queue_size
+
+    def __hash__(self) -> int:
+        return hash(
+            (
+                super().__hash__(),
+                self.degree_of_parallelism,
+                self.queue_size,
+                tuple(self.children),
+            )
+        )
@@ -0,0 +1,45 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from eva.parser.table_ref import TableRef
+from eva.planner.abstract_plan import AbstractPlan
+from eva.planner.types import PlanOprType
+
+
+class OptimizeTablePlan(AbstractPlan):
+    """
+    This plan is used for storing information required to compact a table
+
+    Attributes:
+        table_ref: TableRef
+            table to compact
+        sort_column: str
+            column to sort the rows by, None for the identifier column
+    """
+
+    def __init__(self, table_ref: TableRef, sort_column: str = None):
+        super().__init__(PlanOprType.OPTIMIZE_TABLE)
+        self._table_ref = table_ref
+        self._sort_column = sort_column
+
+    @property
+    def table_ref(self):
+        return self._table_ref
+
+    @property
+    def sort_column(self):
+        return self._sort_column
+
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), self.table_ref, self.sort_column))
@@ -12,8 +12,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import List
+
 from eva.catalog.models.df_metadata import DataFrameMetadata
 from eva.expression.abstract_expression import AbstractExpression
+from eva.models.catalog.frame_info import FrameInfo
 from eva.planner.abstract_plan import AbstractPlan
 from eva.planner.types import PlanOprType
 
@@ -32,6 +35,13 @@ class StoragePlan(AbstractPlan):
         total_shards (int): number of shards of data (if sharded)
         curr_shard (int): current curr_shard if data is sharded
         sampling_rate (int): uniform sampling rate
+        frame_info (FrameInfo): resolution and color space the frames are
+            converted to right after decoding, None to keep them as decoded
+        lazy_frames (bool): if set, the frames are not decoded and the
+            data column holds FrameReferences, which are decoded by a
+            MaterializePlan above
+        projection (List[str]): columns of the structured table to read,
+            None reads all of them
     """
 
     def __init__(
@@ -45,6 +55,9 @@ class StoragePlan(AbstractPlan):
         curr_shard: int = 0,
         predicate: AbstractExpression = None,
         sampling_rate: int = None,
+        frame_info: FrameInfo = None,
+        lazy_frames: bool = False,
+        projection: List[str] = None,
     ):
         super().__init__(PlanOprType.STORAGE_PLAN)
         self._video = video
@@ -56,6 +69,9 @@ class StoragePlan(AbstractPlan):
         self._curr_shard = curr_shard
         self._predicate = predicate
         self._sampling_rate = sampling_rate
+        self._frame_info = frame_info
+        self._lazy_frames = lazy_frames
+        self._projection = projection
 
     @property
     def video(self):
@@ -93,6 +109,30 @@ class StoragePlan(AbstractPlan):
     def sampling_rate(self):
         return self._sampling_rate
 
+    @property
+    def frame_info(self):
+        return self._frame_info
+
+    @frame_info.setter
+    def frame_info(self, frame_info: FrameInfo):
+        self._frame_info = frame_info
+
+    @property
+    def lazy_frames(self):
+        return self._lazy_frames
+
+    @lazy_frames.setter
+    def lazy_frames(self, lazy_frames: bool):
+        self._lazy_frames = lazy_frames
+
+    @property
+    def projection(self):
+        return self._projection
+
+    @projection.setter
+    def projection(self, projection: List[str]):
+        self._projection = projection
+
     def __hash__(self) -> int:
         return hash(
             (
@@ -106,5 +146,8 @@ class StoragePlan(AbstractPlan):
                 self.curr_shard,
                 self.predicate,
                 self.sampling_rate,
+                self.frame_info,
+                self.lazy_frames,
+                tuple(self.projection or []),
             )
         )
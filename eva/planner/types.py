@@ -41,4 +41,8 @@ class PlanOprType(Enum):
     PROJECT = auto()
     SHOW_INFO = auto()
     DROP_UDF = auto()
+    EXCHANGE = auto()
+    GATHER = auto()
+    MATERIALIZE = auto()
+    OPTIMIZE_TABLE = auto()
     # add other types
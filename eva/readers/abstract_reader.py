@@ -53,8 +53,7 @@ class AbstractReader(metaclass=ABCMeta):
         row_size = None
         for data in self._read():
             if row_size is None:
-                row_size = 0
-                row_size = get_size(data)
+                row_size = self._row_size(data)
             data_batch.append(data)
             if len(data_batch) * row_size >= self.batch_mem_size:
                 yield Batch(pd.DataFrame(data_batch))
@@ -62,6 +61,12 @@ class AbstractReader(metaclass=ABCMeta):
         if data_batch:
             yield Batch(pd.DataFrame(data_batch))
 
+    def _row_size(self, data: Dict) -> int:
+        """
+        Returns the memory size of a row, used to size the batches.
+        """
+        return get_size(data)
+
     @abstractmethod
     def _read(self) -> Iterator[Dict]:
         """
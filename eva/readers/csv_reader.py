@@ -12,14 +12,47 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, Iterator
+from typing import Iterator
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as csv
 
+from eva.catalog.column_type import ColumnType
+from eva.models.storage.batch import Batch
 from eva.readers.abstract_reader import AbstractReader
 from eva.utils.logging_manager import logger
 
+# types the values of the columns are parsed as, NDARRAY values are parsed
+# as strings of comma separated values and then converted
+_ARROW_TYPES = {
+    ColumnType.BOOLEAN: pa.bool_(),
+    ColumnType.INTEGER: pa.int64(),
+    ColumnType.FLOAT: pa.float64(),
+    ColumnType.TEXT: pa.string(),
+    ColumnType.NDARRAY: pa.string(),
+}
+
+# size of the blocks of the file parsed in parallel
+_BLOCK_SIZE = 1 << 22
+
+
+def convert_csv_strings_to_ndarrays(strings: pa.Array) -> pd.Series:
+    """
+    Converts strings of comma separated values to numpy float arrays,
+    parsing the values of all the strings at once.
+    """
+    lists = pc.split_pattern(strings, ",")
+    values = pc.cast(pc.utf8_trim_whitespace(lists.flatten()), pa.float32())
+    offsets = lists.offsets.to_numpy()
+    arrays = np.split(values.to_numpy(), offsets[1:-1] - offsets[0])
+    series = pd.Series(arrays, dtype=object)
+    if strings.null_count:
+        series[strings.is_null().to_numpy(zero_copy_only=False)] = None
+    return series
+
 
 class CSVReader(AbstractReader):
     def __init__(self, *args, column_list, **kwargs):
@@ -33,37 +66,47 @@ class CSVReader(AbstractReader):
         self._column_list = column_list
         super().__init__(*args, **kwargs)
 
-    def _read(self) -> Iterator[Dict]:
-
-        # TODO: What is a good location to put this code?
-        def convert_csv_string_to_ndarray(row_string):
-            """
-            Conver a string of comma seperated values to a numpy
-            float array
-            """
-            return np.array([np.float32(val) for val in row_string.split(",")])
+    def read(self) -> Iterator[Batch]:
+        for chunk in self._read():
+            yield Batch(chunk)
 
+    def _read(self) -> Iterator[pd.DataFrame]:
+        """
+        Parses the file with the multi-threaded CSV reader of pyarrow, and
+        yields column-oriented chunks of about batch_mem_size bytes.
+        """
         logger.info("Reading CSV frames")
 
-        # TODO: Need to add strong sanity checks on the columns.
-
-        # read the csv in chunks, and only keep the columns we need
+        # only keep the columns we need, parsed as the types of the table
         col_list_names = [col.col_name for col in self._column_list]
-        col_map = {col.col_name: col for col in self._column_list}
-        for chunk in pd.read_csv(self.file_url, chunksize=512, usecols=col_list_names):
-
-            # apply the required conversions
-            for col in chunk.columns:
-
-                # TODO: Is there a better way to do this?
-                if (
-                    isinstance(chunk[col].iloc[0], str)
-                    and col_map[col].col_object.type.name == "NDARRAY"
-                ):
-
-                    # convert the string to a numpy array
-                    chunk[col] = chunk[col].apply(convert_csv_string_to_ndarray)
-
-            # yield the chunk
-            for chunk_index, chunk_row in chunk.iterrows():
-                yield chunk_row
+        column_types = {
+            col.col_name: _ARROW_TYPES[col.col_object.type]
+            for col in self._column_list
+            if col.col_object is not None and col.col_object.type in _ARROW_TYPES
+        }
+        ndarray_columns = [
+            col.col_name
+            for col in self._column_list
+            if col.col_object is not None and col.col_object.type == ColumnType.NDARRAY
+        ]
+        reader = csv.open_csv(
+            self.file_url,
+            read_options=csv.ReadOptions(use_threads=True, block_size=_BLOCK_SIZE),
+            convert_options=csv.ConvertOptions(
+                column_types=column_types, include_columns=col_list_names
+            ),
+        )
+        for record_batch in reader:
+            if record_batch.num_rows == 0:
+                continue
+            row_size = max(1, record_batch.nbytes // record_batch.num_rows)
+            chunk_size = max(1, self.batch_mem_size // row_size)
+            for start in range(0, record_batch.num_rows, chunk_size):
+                rows = record_batch.slice(start, chunk_size)
+                chunk = {}
+                for name, column in zip(rows.schema.names, rows.columns):
+                    if name in ndarray_columns:
+                        chunk[name] = convert_csv_strings_to_ndarrays(column)
+                    else:
+                        chunk[name] = column.to_pandas()
+                yield pd.DataFrame(chunk)
@@ -12,15 +12,143 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, Iterator
+from typing import Dict, Iterable, Iterator, NamedTuple, Tuple
 
 import cv2
+import numpy as np
 
 from eva.expression.abstract_expression import AbstractExpression
 from eva.expression.expression_utils import extract_range_list_from_predicate
+from eva.models.catalog.frame_info import FrameInfo
+from eva.models.catalog.properties import ColorSpace
 from eva.readers.abstract_reader import AbstractReader
+from eva.storage.frame_cache import FrameCache
+from eva.utils.generic_utils import get_size
 from eva.utils.logging_manager import logger
 
+# conversions of the decoded BGR frames, the other color spaces are kept BGR
+_COLOR_CONVERSIONS = {
+    ColorSpace.GRAY: cv2.COLOR_BGR2GRAY,
+    ColorSpace.HSV: cv2.COLOR_BGR2HSV,
+}
+
+# frames up to this far ahead are reached by decoding the frames in between
+# rather than seeking, which restarts decoding at the previous key frame
+_MAX_FRAMES_SKIPPED = 30
+
+
+class VideoProperties(NamedTuple):
+    """
+    Properties of a video file, see `probe_video`.
+    """
+
+    num_frames: int
+    fps: float
+    width: int
+    height: int
+    codec: str
+
+
+def probe_video(file_url: str) -> VideoProperties:
+    """
+    Reads the properties of the video from its container, without decoding
+    any frame.
+
+    Returns:
+        VideoProperties: the properties, None if the file cannot be opened
+    """
+    video = cv2.VideoCapture(file_url)
+    if not video.isOpened():
+        return None
+    fourcc = int(video.get(cv2.CAP_PROP_FOURCC))
+    properties = VideoProperties(
+        num_frames=int(video.get(cv2.CAP_PROP_FRAME_COUNT)),
+        fps=float(video.get(cv2.CAP_PROP_FPS)),
+        width=int(video.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        height=int(video.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        codec="".join(chr((fourcc >> 8 * idx) & 0xFF) for idx in range(4)),
+    )
+    video.release()
+    return properties
+
+
+class FrameReference(NamedTuple):
+    """
+    Placeholder of a frame that is not decoded yet, see `decode_frames`.
+
+    Arguments:
+        file_url (str): path of the video file
+        frame_id (int): index of the frame in the video
+        frame_info (FrameInfo): format the frame is converted to after
+            decoding, None to keep it as decoded
+    """
+
+    file_url: str
+    frame_id: int
+    frame_info: FrameInfo = None
+
+
+def format_frame(frame: np.ndarray, frame_info: FrameInfo) -> np.ndarray:
+    """
+    Resizes the decoded BGR frame if it is larger than the width or the
+    height of frame_info, and converts it to its color space if GRAY or HSV.
+    """
+    if frame_info is None:
+        return frame
+    height, width = frame.shape[:2]
+    if (
+        frame_info.width > 0
+        and frame_info.height > 0
+        and (width > frame_info.width or height > frame_info.height)
+    ):
+        frame = cv2.resize(
+            frame,
+            (frame_info.width, frame_info.height),
+            interpolation=cv2.INTER_AREA,
+        )
+    conversion = _COLOR_CONVERSIONS.get(frame_info.color_space)
+    if conversion is not None:
+        frame = cv2.cvtColor(frame, conversion)
+    return frame
+
+
+def decode_frames(
+    file_url: str, frame_ids: Iterable[int], frame_info: FrameInfo = None
+) -> Dict[int, np.ndarray]:
+    """
+    Decodes the frames of the video in a single pass over the file.
+
+    Arguments:
+        file_url (str): path of the video file
+        frame_ids (Iterable[int]): indices of the frames
+        frame_info (FrameInfo): see `format_frame`
+
+    Returns:
+        Dict[int, np.ndarray]: the frames by index, without the frames past
+        the end of the video
+    """
+    frames = {}
+    video = cv2.VideoCapture(file_url)
+    # index of the frame returned by the next read
+    position = None
+    for frame_id in sorted(set(frame_ids)):
+        if (
+            position is None
+            or frame_id < position
+            or frame_id - position > _MAX_FRAMES_SKIPPED
+        ):
+            video.set(cv2.CAP_PROP_POS_FRAMES, frame_id)
+        else:
+            while position < frame_id and video.grab():
+                position += 1
+        _, frame = video.read()
+        if frame is None:
+            break
+        frames[frame_id] = format_frame(frame, frame_info)
+        position = frame_id + 1
+    video.release()
+    return frames
+
 
 class OpenCVReader(AbstractReader):
     def __init__(
@@ -28,7 +156,15 @@ class OpenCVReader(AbstractReader):
         *args,
         predicate: AbstractExpression = None,
         sampling_rate: int = None,
-        **kwargs
+        cur_shard: int = None,
+        shard_count: int = None,
+        frame_info: FrameInfo = None,
+        lazy_frames: bool = False,
+        video_properties: VideoProperties = None,
+        frame_cache: FrameCache = None,
+        cache_key: str = None,
+        frame_range: Tuple[int, int] = None,
+        **kwargs,
     ):
         """Read frames from the disk
 
@@ -38,28 +174,78 @@ class OpenCVReader(AbstractReader):
             can be converted to ranges. Defaults to None.
             sampling_rate (int, optional): Set if the caller wants one frame
             every `sampling_rate` number of frames. For example, if `sampling_rate = 10`, it returns every 10th frame. If both `predicate` and `sampling_rate` are specified, `sampling_rate` is given precedence.
+            cur_shard (int, optional): Shard number to read if sharded. The
+            frames of the video are split into `shard_count` contiguous
+            ranges and only the `cur_shard`-th range is read.
+            shard_count (int, optional): Total number of shards if applicable
+            frame_info (FrameInfo, optional): If set, the decoded BGR frames
+            larger than its width or height are resized to them, and
+            converted to its color space if GRAY or HSV.
+            lazy_frames (bool, optional): If set, the frames are not decoded
+            and the data column holds their FrameReferences instead. The
+            batches are sized as if the frames were decoded.
+            video_properties (VideoProperties, optional): Properties of the
+            video cached at load time. The video is probed if not set.
+            frame_cache (FrameCache, optional): If set, the decoded frames
+            are read from the chunks cached under `cache_key`, which
+            identifies the content of the video, and the chunks missing are
+            decoded whole and cached. Lazy frames are not cached.
+            frame_range (Tuple[int, int], optional): If set, only the frames
+            from its first to its last index are read, e.g., the frames of
+            the video in a shard of a table.
         """
         self._predicate = predicate
         self._sampling_rate = sampling_rate or 1
+        self._cur_shard = cur_shard
+        self._shard_count = shard_count if shard_count and shard_count > 1 else None
+        self._frame_info = frame_info
+        self._lazy_frames = lazy_frames
+        self._video_properties = video_properties
+        self._frame_cache = frame_cache
+        self._cache_key = cache_key
+        self._frame_range = frame_range
+        self._frame_size = 0
         super().__init__(*args, **kwargs)
 
     def _read(self) -> Iterator[Dict]:
-        video = cv2.VideoCapture(self.file_url)
-        num_frames = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
+        properties = self._video_properties or probe_video(self.file_url)
+        if properties is None:
+            logger.warn(f"Failed to open the video {self.file_url}")
+            return
+        num_frames = properties.num_frames
         if self._predicate:
             range_list = extract_range_list_from_predicate(
                 self._predicate, 0, num_frames - 1
             )
         else:
             range_list = [(0, num_frames - 1)]
+        if self._shard_count:
+            range_list = self._clip_range_list(
+                range_list,
+                num_frames * self._cur_shard // self._shard_count,
+                num_frames * (self._cur_shard + 1) // self._shard_count - 1,
+            )
+        if self._frame_range:
+            range_list = self._clip_range_list(range_list, *self._frame_range)
+        if self._lazy_frames:
+            self._frame_size = properties.width * properties.height * 3
+            yield from self._read_references(range_list)
+            return
+        if self._frame_cache is not None:
+            yield from self._read_cached(range_list)
+            return
         logger.debug("Reading frames")
+        video = cv2.VideoCapture(self.file_url)
         if self._sampling_rate == 1:
             for (begin, end) in range_list:
                 video.set(cv2.CAP_PROP_POS_FRAMES, begin)
                 _, frame = video.read()
                 frame_id = begin
                 while frame is not None and frame_id <= end:
-                    yield {"id": frame_id, "data": frame}
+                    yield {
+                        "id": frame_id,
+                        "data": format_frame(frame, self._frame_info),
+                    }
                     _, frame = video.read()
                     frame_id += 1
         else:
@@ -72,6 +258,78 @@ class OpenCVReader(AbstractReader):
                     video.set(cv2.CAP_PROP_POS_FRAMES, frame_id)
                     _, frame = video.read()
                     if frame is not None:
-                        yield {"id": frame_id, "data": frame}
+                        yield {
+                            "id": frame_id,
+                            "data": format_frame(frame, self._frame_info),
+                        }
                     else:
                         break
+
+    def _read_cached(self, range_list) -> Iterator[Dict]:
+        chunk_frames = self._frame_cache.chunk_frames
+        video = None
+        # index of the frame returned by the next read
+        position = None
+        for begin, end in range_list:
+            chunk_begin = begin - begin % chunk_frames
+            while chunk_begin <= end:
+                frames = self._frame_cache.get(
+                    self._cache_key, self._frame_info, chunk_begin
+                )
+                if frames is None:
+                    if video is None:
+                        video = cv2.VideoCapture(self.file_url)
+                    if position != chunk_begin:
+                        video.set(cv2.CAP_PROP_POS_FRAMES, chunk_begin)
+                    chunk = []
+                    while len(chunk) < chunk_frames:
+                        _, frame = video.read()
+                        if frame is None:
+                            break
+                        chunk.append(format_frame(frame, self._frame_info))
+                    position = chunk_begin + len(chunk)
+                    if not chunk:
+                        break
+                    self._frame_cache.put(
+                        self._cache_key, self._frame_info, chunk_begin, chunk
+                    )
+                    frames = chunk
+                else:
+                    # the cached frames are views of the chunk, which
+                    # sys.getsizeof does not account for
+                    self._frame_size = frames[0].nbytes
+                # align the first frame with sampling rate
+                frame_id = max(begin, chunk_begin)
+                frame_id += -frame_id % self._sampling_rate
+                last_frame_id = min(end, chunk_begin + len(frames) - 1)
+                for frame_id in range(frame_id, last_frame_id + 1, self._sampling_rate):
+                    yield {"id": frame_id, "data": frames[frame_id - chunk_begin]}
+                if len(frames) < chunk_frames:
+                    # past the end of the video
+                    break
+                chunk_begin += chunk_frames
+        if video is not None:
+            video.release()
+        logger.debug(f"Frame cache hit rate {self._frame_cache.hit_rate:.2f}")
+
+    def _read_references(self, range_list) -> Iterator[Dict]:
+        for begin, end in range_list:
+            # align begin with sampling rate
+            if begin % self._sampling_rate:
+                begin += self._sampling_rate - (begin % self._sampling_rate)
+            for frame_id in range(begin, end + 1, self._sampling_rate):
+                yield {
+                    "id": frame_id,
+                    "data": FrameReference(self.file_url, frame_id, self._frame_info),
+                }
+
+    def _row_size(self, data: Dict) -> int:
+        return get_size(data) + self._frame_size
+
+    def _clip_range_list(self, range_list, clip_begin, clip_end):
+        clipped_range_list = []
+        for begin, end in range_list:
+            begin, end = max(begin, clip_begin), min(end, clip_end)
+            if begin <= end:
+                clipped_range_list.append((begin, end))
+        return clipped_range_list
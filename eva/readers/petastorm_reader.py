@@ -22,7 +22,13 @@ from eva.readers.abstract_reader import AbstractReader
 
 class PetastormReader(AbstractReader):
     def __init__(
-        self, *args, cur_shard=None, shard_count=None, predicate=None, **kwargs
+        self,
+        *args,
+        cur_shard=None,
+        shard_count=None,
+        predicate=None,
+        schema_fields=None,
+        **kwargs
     ):
         """
         Reads data from the petastorm parquet stores. Note this won't
@@ -37,6 +43,8 @@ class PetastormReader(AbstractReader):
                                       applicable
             predicate (PredicateBase, optional): instance of predicate object
                 to filter rows to be returned by reader
+            schema_fields (List[UnischemaField], optional): fields to decode,
+                None decodes all the fields
             cache_type (str): the cache type, if desired.
             Options are [None, ‘null’, ‘local-disk’] to either have a
             null/noop cache or a cache implemented using diskcache.
@@ -47,9 +55,11 @@ class PetastormReader(AbstractReader):
         self.cur_shard = cur_shard
         self.shard_count = shard_count
         self.predicate = predicate
+        self.schema_fields = schema_fields
         petastorm_config = ConfigurationManager().get_value("storage", "petastorm")
-        # cache not allowed with predicates
-        if self.predicate or petastorm_config is None:
+        # cache not allowed with predicates, and the cached rows hold all
+        # the fields
+        if self.predicate or self.schema_fields or petastorm_config is None:
             petastorm_config = {}
         self.cache_type = petastorm_config.get("cache_type", None)
         self.cache_location = petastorm_config.get("cache_location", None)
@@ -58,14 +68,20 @@ class PetastormReader(AbstractReader):
             "cache_row_size_estimate", None
         )
         super().__init__(*args, **kwargs)
-        if self.cur_shard is not None and self.cur_shard <= 0:
-            self.cur_shard = None
-
         if self.shard_count is not None and self.shard_count <= 0:
             self.shard_count = None
 
+        # shard 0 is a valid shard as long as the shard count is set
+        if self.shard_count is None or (
+            self.cur_shard is not None and self.cur_shard < 0
+        ):
+            self.cur_shard = None
+
     def _read(self) -> Iterator[Dict]:
         # `Todo`: Generalize this reader
+        kwargs = {}
+        if self.schema_fields is not None:
+            kwargs["schema_fields"] = self.schema_fields
         with make_reader(
             self.file_url,
             shard_count=self.shard_count,
@@ -75,6 +91,7 @@ class PetastormReader(AbstractReader):
             cache_location=self.cache_location,
             cache_size_limit=self.cache_size_limit,
             cache_row_size_estimate=self.cache_row_size_estimate,
+            **kwargs,
         ) as reader:
             for row in reader:
                 yield row._asdict()
@@ -27,9 +27,13 @@ from eva.utils.logging_manager import logger
 from eva.utils.timer import Timer
 
 
-def execute_query(query, report_time: bool = False) -> Iterator[Batch]:
+def execute_query(
+    query, report_time: bool = False, degree_of_parallelism: int = None
+) -> Iterator[Batch]:
     """
     Execute the query and return a result generator.
+    degree_of_parallelism overrides executor.degree_of_parallelism for
+    this query.
     """
 
     query_compile_time = Timer()
@@ -37,18 +41,22 @@ def execute_query(query, report_time: bool = False) -> Iterator[Batch]:
         stmt = Parser().parse(query)[0]
         StatementBinder(StatementBinderContext()).bind(stmt)
         l_plan = StatementToPlanConvertor().visit(stmt)
-        p_plan = PlanGenerator().build(l_plan)
+        p_plan = PlanGenerator().build(l_plan, degree_of_parallelism)
         output = PlanExecutor(p_plan).execute_plan()
 
     query_compile_time.log_elapsed_time("Query Compile Time")
     return output
 
 
-def execute_query_fetch_all(query) -> Optional[Batch]:
+def execute_query_fetch_all(
+    query, degree_of_parallelism: int = None
+) -> Optional[Batch]:
     """
     Execute the query and fetch all results into one Batch object.
     """
-    output = execute_query(query, report_time=True)
+    output = execute_query(
+        query, report_time=True, degree_of_parallelism=degree_of_parallelism
+    )
     if output:
         batch_list = list(output)
         return Batch.concat(batch_list, copy=False)
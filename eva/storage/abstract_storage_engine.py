@@ -16,8 +16,16 @@ from abc import ABCMeta, abstractmethod
 from typing import Iterator
 
 from eva.catalog.models.df_metadata import DataFrameMetadata
-from eva.expression.abstract_expression import AbstractExpression
+from eva.configuration.configuration_manager import ConfigurationManager
+from eva.expression.abstract_expression import AbstractExpression, ExpressionType
+from eva.expression.expression_compiler import get_predicate_kernel
 from eva.models.storage.batch import Batch
+from eva.storage.write_session import (
+    ROW_GROUP_MEM_SIZE,
+    AbstractWriteSession,
+    AppendWriteSession,
+)
+from eva.utils.logging_manager import logger
 
 
 class AbstractStorageEngine(metaclass=ABCMeta):
@@ -48,6 +56,40 @@ class AbstractStorageEngine(metaclass=ABCMeta):
             rows : rows data to be written
         """
 
+    def open_write_session(self, table: DataFrameMetadata) -> AbstractWriteSession:
+        """Opens a session writing many batches into the table, which
+        buffers the rows to write them in large chunks.
+
+        Attributes:
+            table: storage unit to be written
+
+        Returns:
+            AbstractWriteSession: the session, to be committed
+        """
+        return AppendWriteSession(
+            self,
+            table,
+            ConfigurationManager().get_value(
+                "storage", "row_group_mem_size", ROW_GROUP_MEM_SIZE
+            ),
+        )
+
+    def compact(self, table: DataFrameMetadata, sort_column: str = None):
+        """Rewrites the small files of the table into large files sorted by
+        sort_column, replacing them atomically.
+
+        Attributes:
+            table: storage unit to be compacted
+            sort_column: column to sort the rows by, the identifier column
+                of the table by default
+
+        Returns:
+            Tuple[int, int]: the number of files rewritten and written
+        """
+        error = "{} does not support compacting tables".format(type(self).__name__)
+        logger.error(error)
+        raise RuntimeError(error)
+
     @abstractmethod
     def read(
         self,
@@ -67,3 +109,33 @@ class AbstractStorageEngine(metaclass=ABCMeta):
         Returns:
             Batch: an iterator of the batch read
         """
+
+    def _apply_predicate(self, batch: Batch, predicate: AbstractExpression) -> Batch:
+        """Filters the rows read from the table with a vectorized predicate.
+
+        The columns of the rows are not qualified by the alias of the table,
+        unlike the columns the predicate refers to.
+
+        Attributes:
+            batch: rows read from the table
+            predicate: predicate on the columns of the table
+
+        Returns:
+            Batch: the rows satisfying the predicate
+        """
+        if predicate is None or batch.empty():
+            return batch
+        col_aliases = {}
+        nodes = [predicate]
+        while nodes:
+            node = nodes.pop()
+            if node.etype == ExpressionType.TUPLE_VALUE:
+                col_aliases[node.col_name] = node.col_alias
+            nodes.extend(node.children)
+        aliased_batch = Batch(batch.frames.rename(columns=col_aliases, copy=False))
+        kernel = get_predicate_kernel(predicate)
+        if kernel is not None:
+            batch.filter(kernel(aliased_batch))
+        else:
+            batch.drop_zero(predicate.evaluate(aliased_batch))
+        return batch
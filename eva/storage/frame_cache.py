@@ -0,0 +1,228 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pyarrow as pa
+
+from eva.models.catalog.frame_info import FrameInfo
+from eva.utils.logging_manager import logger
+
+# header of a chunk file: magic, lengths of the codec and of the dtype, and
+# number of dimensions, followed by the codec, the dtype, the shape and the
+# frames
+_MAGIC = b"EVAF"
+_HEADER = "!4sBBB"
+# chunks missed recently, to admit the chunks missed again
+_MAX_MISSED_CHUNKS = 1 << 16
+
+
+class FrameCache:
+    """
+    Caches chunks of decoded frames, so that the videos scanned repeatedly
+    are not decoded again. A chunk holds the frames
+    [chunk_begin, chunk_begin + chunk_frames) of a video, as decoded and
+    formatted to a FrameInfo, and is stored in a file of the cache
+    directory, which is memory mapped when it is read. The chunk is keyed by
+    the fingerprint of the video, the frame info and the frame range.
+
+    A chunk is only stored once it was missed min_misses times, so that the
+    videos scanned once do not pay for writing it. The least recently used
+    chunks are evicted once the files exceed max_size bytes. The budget is
+    tracked by each process, the chunks are written atomically so that
+    processes can share the directory.
+
+    Arguments:
+        cache_dir (Path): directory of the chunk files
+        max_size (int): byte budget of the chunk files
+        chunk_frames (int): number of frames of a chunk
+        compression (str): pyarrow codec compressing the chunks, e.g., zstd
+            or lz4, None to store them uncompressed. Uncompressed chunks are
+            copied straight from the memory map, which is cheaper than
+            decompressing them.
+        min_misses (int): number of misses of a chunk before it is stored
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size: int,
+        chunk_frames: int = 64,
+        compression: str = None,
+        min_misses: int = 2,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.chunk_frames = chunk_frames
+        self.min_misses = min_misses
+        self._codec = pa.Codec(compression) if compression else None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # size of the chunk files, from the least recently used
+        self._chunks = OrderedDict()
+        self._size = 0
+        # number of misses of the chunks not stored
+        self._missed = OrderedDict()
+        if self.cache_dir.exists():
+            entries = [
+                entry
+                for entry in os.scandir(self.cache_dir)
+                if entry.is_file() and entry.name.endswith(".chunk")
+            ]
+            for entry in sorted(entries, key=lambda entry: entry.stat().st_mtime_ns):
+                self._chunks[entry.name] = entry.stat().st_size
+                self._size += entry.stat().st_size
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _chunk_name(
+        self, video_key: str, frame_info: FrameInfo, chunk_begin: int
+    ) -> str:
+        frame_range = (chunk_begin, chunk_begin + self.chunk_frames - 1)
+        key = f"{video_key}|{frame_info!r}|{frame_range}"
+        return hashlib.sha1(key.encode()).hexdigest() + ".chunk"
+
+    def get(
+        self, video_key: str, frame_info: FrameInfo, chunk_begin: int
+    ) -> Optional[np.ndarray]:
+        """
+        Returns the frames of the chunk stacked in an array, None on a miss.
+        """
+        name = self._chunk_name(video_key, frame_info, chunk_begin)
+        with self._lock:
+            cached = name in self._chunks
+            if cached:
+                self._chunks.move_to_end(name)
+        frames = None
+        if cached:
+            try:
+                frames = self._read_chunk(self.cache_dir / name)
+                # keeps the order of the chunks for the next processes
+                os.utime(self.cache_dir / name)
+            except (OSError, ValueError, pa.ArrowException) as e:
+                # evicted by another process, or corrupted
+                logger.debug(f"Failed to read the cached frames {name}: {e}")
+                self._discard(name)
+        with self._lock:
+            if frames is not None:
+                self.hits += 1
+                return frames
+            self.misses += 1
+            self._missed[name] = self._missed.pop(name, 0) + 1
+            if len(self._missed) > _MAX_MISSED_CHUNKS:
+                self._missed.popitem(last=False)
+        return None
+
+    def put(
+        self,
+        video_key: str,
+        frame_info: FrameInfo,
+        chunk_begin: int,
+        frames: List[np.ndarray],
+    ):
+        """
+        Stores the frames of the chunk, of the same shape and dtype, if it
+        was missed min_misses times, and evicts the least recently used
+        chunks beyond the budget.
+        """
+        name = self._chunk_name(video_key, frame_info, chunk_begin)
+        with self._lock:
+            if self._missed.get(name, 0) < self.min_misses:
+                return
+            del self._missed[name]
+        shape = (len(frames),) + frames[0].shape
+        codec = self._codec.name.encode() if self._codec else b""
+        dtype = frames[0].dtype.str.encode()
+        header = (
+            struct.pack(_HEADER, _MAGIC, len(codec), len(dtype), len(shape))
+            + codec
+            + dtype
+            + struct.pack("!%dQ" % len(shape), *shape)
+        )
+        if self._codec:
+            frames = [self._codec.compress(np.stack(frames), asbytes=True)]
+        else:
+            frames = [np.ascontiguousarray(frame) for frame in frames]
+        size = len(header) + sum(memoryview(data).nbytes for data in frames)
+        if size > self.max_size:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / name
+        tmp_path = path.with_name(f"{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            for data in frames:
+                f.write(data)
+        os.replace(tmp_path, path)
+
+        evicted = []
+        with self._lock:
+            self._size -= self._chunks.pop(name, 0)
+            self._chunks[name] = size
+            self._size += size
+            while self._size > self.max_size:
+                evicted_name, evicted_size = self._chunks.popitem(last=False)
+                self._size -= evicted_size
+                evicted.append(evicted_name)
+        for evicted_name in evicted:
+            (self.cache_dir / evicted_name).unlink(missing_ok=True)
+
+    def _discard(self, name: str):
+        with self._lock:
+            self._size -= self._chunks.pop(name, 0)
+        (self.cache_dir / name).unlink(missing_ok=True)
+
+    def _read_chunk(self, path: Path) -> np.ndarray:
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buf:
+            magic, codec_length, dtype_length, ndim = struct.unpack_from(_HEADER, buf)
+            if magic != _MAGIC:
+                raise ValueError("invalid chunk file")
+            offset = struct.calcsize(_HEADER)
+            codec = buf[offset : offset + codec_length].decode()
+            offset += codec_length
+            dtype = np.dtype(buf[offset : offset + dtype_length].decode())
+            offset += dtype_length
+            shape = struct.unpack_from("!%dQ" % ndim, buf, offset)
+            offset += struct.calcsize("!%dQ" % ndim)
+            size = int(np.prod(shape)) * dtype.itemsize
+            with memoryview(buf)[offset:] as view:
+                if codec:
+                    data = pa.Codec(codec).decompress(view, decompressed_size=size)
+                elif len(view) != size:
+                    raise ValueError("truncated chunk file")
+                else:
+                    data = view
+                # copies the frames out of the memory map, writable as the
+                # decoded ones
+                frames = np.frombuffer(data, dtype=dtype).reshape(shape).copy()
+                del data
+        return frames
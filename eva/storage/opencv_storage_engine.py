@@ -12,26 +12,108 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import errno
+import fcntl
+import hashlib
+import itertools
+import os
 import shutil
 import struct
+from collections import Counter
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, List, NamedTuple, Optional, Tuple
 
 from eva.catalog.models.df_metadata import DataFrameMetadata
 from eva.configuration.configuration_manager import ConfigurationManager
+from eva.configuration.constants import EVA_DEFAULT_DIR
 from eva.expression.abstract_expression import AbstractExpression
+from eva.models.catalog.frame_info import FrameInfo
 from eva.models.storage.batch import Batch
-from eva.readers.opencv_reader import OpenCVReader
+from eva.readers.opencv_reader import OpenCVReader, VideoProperties, probe_video
 from eva.storage.abstract_storage_engine import AbstractStorageEngine
+from eva.storage.frame_cache import FrameCache
 from eva.utils.logging_manager import logger
 
+# ways a loaded video is stored in the table directory: copied, hardlinked,
+# or cloned sharing the blocks of the file on a copy-on-write file system,
+# both falling back to copying. A referenced video is not stored at all, the
+# table refers to the file in place.
+COPY = "copy"
+HARDLINK = "hardlink"
+REFLINK = "reflink"
+REFERENCE = "reference"
+LINK_MODES = (COPY, HARDLINK, REFLINK, REFERENCE)
+
+# ioctl cloning a file on Linux (btrfs, xfs)
+_FICLONE = 0x40049409
+# errors of linking or cloning a file the file system does not support,
+# falling back to copying it
+_LINK_FALLBACK_ERRNOS = (errno.EXDEV, errno.EPERM, errno.EOPNOTSUPP, errno.EINVAL)
+# bytes hashed at the beginning and at the end of a referenced video
+_CHECKSUM_BLOCK_SIZE = 1 << 20
+
+FRAME_CACHE_DIR = EVA_DEFAULT_DIR / "frame_cache"
+
+
+class VideoFingerprint(NamedTuple):
+    """
+    Identifies the content of a referenced video, to detect that the file
+    changed after it was loaded. The checksum only covers the first and the
+    last blocks of the file, and is compared when its mtime changed.
+    """
+
+    size: int
+    mtime_ns: int
+    checksum: str
+
+
+def fingerprint_video(video_file: Path, checksum: bool = True) -> VideoFingerprint:
+    stat = video_file.stat()
+    digest = None
+    if checksum:
+        sha1 = hashlib.sha1(struct.pack("!Q", stat.st_size))
+        with open(video_file, "rb") as f:
+            sha1.update(f.read(_CHECKSUM_BLOCK_SIZE))
+            if stat.st_size > _CHECKSUM_BLOCK_SIZE:
+                f.seek(max(_CHECKSUM_BLOCK_SIZE, stat.st_size - _CHECKSUM_BLOCK_SIZE))
+                sha1.update(f.read(_CHECKSUM_BLOCK_SIZE))
+        digest = sha1.hexdigest()
+    return VideoFingerprint(stat.st_size, stat.st_mtime_ns, digest)
+
+
+def _reflink(video_file: Path, target: Path):
+    with open(video_file, "rb") as src, open(target, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    shutil.copystat(str(video_file), str(target))
+
 
 class OpenCVStorageEngine(AbstractStorageEngine):
+    """
+    Stores the videos of a table in its directory, or refers to them in
+    place. The metadata file of the table lists the videos in the order
+    they were loaded, along with their properties probed at load time
+    (version 2), so that scanning and planning do not open the files.
+
+    If storage.frame_cache_size is set, the decoded frames of the videos
+    scanned repeatedly are cached in a FrameCache, and scans of the same
+    videos and frame info read them from the cache instead of decoding them
+    again. Its hits, misses and hit_rate are the metrics of the cache.
+    """
+
     def __init__(self):
         self.metadata = "metadata"
-        self.curr_version = ConfigurationManager().get_value(
-            "storage", "video_engine_version"
-        )
+        config = ConfigurationManager()
+        self.curr_version = config.get_value("storage", "video_engine_version")
+        self.frame_cache = None
+        # the cache is off in the eva.yml of installs predating it
+        frame_cache_size = config.get_value("storage", "frame_cache_size", 0)
+        if frame_cache_size:
+            self.frame_cache = FrameCache(
+                config.get_value("storage", "frame_cache_dir", "") or FRAME_CACHE_DIR,
+                frame_cache_size,
+                config.get_value("storage", "frame_cache_chunk_frames", 64),
+                config.get_value("storage", "frame_cache_compression", "") or None,
+            )
 
     def create(self, table: DataFrameMetadata, if_not_exists=True):
         """
@@ -59,42 +141,222 @@ class OpenCVStorageEngine(AbstractStorageEngine):
         except Exception as e:
             logger.exception(f"Failed to drop the video table {e}")
 
-    def write(self, table: DataFrameMetadata, rows: Batch):
+    def write(self, table: DataFrameMetadata, rows: Batch, link_mode: str = COPY):
+        """
+        Adds the videos to the table, see LINK_MODES for the ways they are
+        stored. Their records are appended to the metadata file at once,
+        with their properties if the rows have the VideoProperties columns.
+        """
+        if link_mode == REFERENCE and self.curr_version < 1:
+            error = "Referencing videos requires video_engine_version 1"
+            logger.error(error)
+            raise RuntimeError(error)
+        if link_mode != REFERENCE:
+            names = Counter(Path(path).name for path in rows.video_file_paths())
+            duplicates = sorted(name for name, count in names.items() if count > 1)
+            if duplicates:
+                error = "Cannot store several videos named {}".format(
+                    ", ".join(duplicates)
+                )
+                logger.error(error)
+                raise RuntimeError(error)
         try:
             dir_path = Path(table.file_url)
-            for video_file_path in rows.video_file_paths():
+            videos = []
+            for video_file_path, properties in zip(
+                rows.video_file_paths(), self._video_properties(rows)
+            ):
                 video_file = Path(video_file_path)
-                shutil.copy2(str(video_file), str(dir_path))
-                self._create_video_metadata(dir_path, video_file.name)
+                if link_mode == REFERENCE:
+                    video_file = video_file.resolve()
+                    fingerprint = fingerprint_video(video_file)
+                else:
+                    self._store_video(video_file, dir_path, link_mode)
+                    video_file, fingerprint = video_file.name, None
+                videos.append((video_file, fingerprint, properties))
+            self._create_video_metadata(dir_path, videos)
         except Exception:
             error = "Current video storage engine only supports loading videos on disk."
             logger.exception(error)
             raise RuntimeError(error)
         return True
 
+    def _video_properties(self, rows: Batch) -> Iterator[VideoProperties]:
+        columns = list(VideoProperties._fields)
+        if self.curr_version < 2 or not set(columns).issubset(rows.frames.columns):
+            yield from itertools.repeat(None)
+            return
+        for num_frames, fps, width, height, codec in rows.frames[columns].itertuples(
+            index=False
+        ):
+            yield VideoProperties(
+                int(num_frames), float(fps), int(width), int(height), str(codec)
+            )
+
+    def _store_video(self, video_file: Path, dir_path: Path, link_mode: str):
+        # the video is staged under a temporary name and renamed, so that a
+        # stored video of the same name, which may be a hardlink of another
+        # file of the user, is replaced rather than written through
+        target = dir_path / video_file.name
+        tmp_target = dir_path / f".{video_file.name}.{os.getpid()}.tmp"
+        tmp_target.unlink(missing_ok=True)
+        try:
+            try:
+                if link_mode == HARDLINK:
+                    os.link(video_file, tmp_target)
+                elif link_mode == REFLINK:
+                    _reflink(video_file, tmp_target)
+                else:
+                    shutil.copy2(str(video_file), str(tmp_target))
+            except OSError as e:
+                if link_mode == COPY or e.errno not in _LINK_FALLBACK_ERRNOS:
+                    raise
+                logger.info(f"Failed to {link_mode} {video_file} ({e}), copying it")
+                tmp_target.unlink(missing_ok=True)
+                shutil.copy2(str(video_file), str(tmp_target))
+            os.replace(tmp_target, target)
+        finally:
+            tmp_target.unlink(missing_ok=True)
+
+    def _check_fingerprint(self, video_file: Path, fingerprint: VideoFingerprint):
+        try:
+            current = fingerprint_video(video_file, checksum=False)
+        except FileNotFoundError:
+            error = f"Referenced video {video_file} does not exist anymore"
+            logger.error(error)
+            raise RuntimeError(error)
+        if current.size != fingerprint.size or (
+            current.mtime_ns != fingerprint.mtime_ns
+            and fingerprint_video(video_file).checksum != fingerprint.checksum
+        ):
+            error = f"Referenced video {video_file} changed since it was loaded"
+            logger.error(error)
+            raise RuntimeError(error)
+
     def read(
         self,
         table: DataFrameMetadata,
         batch_mem_size: int,
         predicate: AbstractExpression = None,
         sampling_rate: int = None,
+        curr_shard: int = 0,
+        total_shards: int = 0,
+        frame_info: FrameInfo = None,
+        lazy_frames: bool = False,
     ) -> Iterator[Batch]:
 
         metadata_file = Path(table.file_url) / self.metadata
-        for video_file_name in self._get_video_file_path(metadata_file):
-            video_file = Path(table.file_url) / video_file_name
+        videos = [
+            # the path of a referenced video is absolute
+            (Path(table.file_url) / video_path, fingerprint, properties)
+            for video_path, fingerprint, properties in self._get_video_file_path(
+                metadata_file
+            )
+        ]
+        frame_ranges = [None] * len(videos)
+        if total_shards and total_shards > 1:
+            videos, frame_ranges = self._shard_videos(videos, curr_shard, total_shards)
+        for (video_file, fingerprint, properties), frame_range in zip(
+            videos, frame_ranges
+        ):
+            if fingerprint is not None:
+                self._check_fingerprint(video_file, fingerprint)
+            cache_key = None
+            if self.frame_cache is not None and not lazy_frames:
+                cache_key = self._cache_key(video_file, fingerprint)
             reader = OpenCVReader(
                 str(video_file),
                 batch_mem_size=batch_mem_size,
                 predicate=predicate,
                 sampling_rate=sampling_rate,
+                frame_info=frame_info,
+                lazy_frames=lazy_frames,
+                video_properties=properties,
+                frame_cache=self.frame_cache if cache_key else None,
+                cache_key=cache_key,
+                frame_range=frame_range,
             )
             for batch in reader.read():
                 column_name = table.columns[0].name
-                batch.frames[column_name] = str(video_file_name)
+                batch.frames[column_name] = video_file.name
                 yield batch
 
-    def _get_video_file_path(self, metadata_file):
+    def _shard_videos(
+        self,
+        videos: List[Tuple[Path, VideoFingerprint, VideoProperties]],
+        curr_shard: int,
+        total_shards: int,
+    ) -> Tuple[List[Tuple[Path, VideoFingerprint, VideoProperties]], List]:
+        """
+        Splits the frames of the table, in the order of its videos, into
+        total_shards contiguous ranges, so that reading the shards one after
+        another reads the frames in the order of the whole table. Returns the
+        videos of the curr_shard-th range, with the range of their frames
+        in it.
+        """
+        probed_videos = []
+        for video_file, fingerprint, properties in videos:
+            # the videos loaded before version 2 are probed for their frame
+            # count
+            if properties is None:
+                if fingerprint is not None:
+                    self._check_fingerprint(video_file, fingerprint)
+                properties = probe_video(str(video_file))
+            probed_videos.append((video_file, fingerprint, properties))
+        videos = probed_videos
+        num_frames = [
+            properties.num_frames if properties else 0 for _, _, properties in videos
+        ]
+        total_frames = sum(num_frames)
+        shard_begin = total_frames * curr_shard // total_shards
+        shard_end = total_frames * (curr_shard + 1) // total_shards - 1
+        shard_videos, frame_ranges = [], []
+        video_begin = 0
+        for video, video_frames in zip(videos, num_frames):
+            begin = max(shard_begin - video_begin, 0)
+            end = min(shard_end - video_begin, video_frames - 1)
+            if begin <= end:
+                shard_videos.append(video)
+                frame_ranges.append((begin, end))
+            video_begin += video_frames
+        return shard_videos, frame_ranges
+
+    def _cache_key(self, video_file: Path, fingerprint: VideoFingerprint) -> str:
+        # the fingerprint of a referenced video is checked against the file,
+        # a stored video is identified by its size and mtime
+        if fingerprint is None:
+            fingerprint = fingerprint_video(video_file, checksum=False)
+        return "{}:{}:{}:{}".format(
+            video_file.resolve(),
+            fingerprint.size,
+            fingerprint.mtime_ns,
+            fingerprint.checksum,
+        )
+
+    def get_video_properties(
+        self, table: DataFrameMetadata
+    ) -> List[Tuple[Path, Optional[VideoProperties]]]:
+        """
+        Returns the paths of the videos of the table with their properties
+        cached in the metadata file, None for the videos loaded before
+        version 2. A table without videos has no metadata file.
+        """
+        metadata_file = Path(table.file_url) / self.metadata
+        if not metadata_file.exists():
+            return []
+        return [
+            (video_path, properties)
+            for video_path, _, properties in self._get_video_file_path(metadata_file)
+        ]
+
+    def _get_video_file_path(
+        self, metadata_file
+    ) -> Iterator[Tuple[Path, VideoFingerprint, VideoProperties]]:
+        """
+        Yields the paths of the videos in the metadata file, along with the
+        fingerprints of the referenced videos (None for the stored ones) and
+        the properties of the videos (None before version 2).
+        """
         with open(metadata_file, "rb") as f:
             while True:
                 buf = f.read(struct.calcsize("!H"))
@@ -107,21 +369,76 @@ class OpenCVStorageEngine(AbstractStorageEngine):
                     raise RuntimeError(error)
                 (length,) = struct.unpack("!H", f.read(struct.calcsize("!H")))
                 path = f.read(length)
-                yield Path(path.decode())
+                fingerprint = None
+                if version >= 1:
+                    size, mtime_ns, length = struct.unpack(
+                        "!QQH", f.read(struct.calcsize("!QQH"))
+                    )
+                    if length:
+                        fingerprint = VideoFingerprint(
+                            size, mtime_ns, f.read(length).decode()
+                        )
+                properties = None
+                if version >= 2:
+                    num_frames, fps, width, height, length = struct.unpack(
+                        "!QdIIH", f.read(struct.calcsize("!QdIIH"))
+                    )
+                    properties = VideoProperties(
+                        num_frames, fps, width, height, f.read(length).decode()
+                    )
+                yield Path(path.decode()), fingerprint, properties
 
-    def _create_video_metadata(self, dir_path, video_file):
-        # File structure
+    def _create_video_metadata(
+        self,
+        dir_path,
+        videos: List[Tuple[Path, VideoFingerprint, VideoProperties]],
+    ):
+        # File structure, a record per video
         # <version> <length> <file_name>
-        with open(dir_path / self.metadata, "ab") as f:
+        # or, in version 1, for the videos referenced in place
+        # <version> <length> <absolute_path> <size> <mtime> <length> <checksum>
+        # or, in version 2, for the videos with properties, where the
+        # fingerprint of a stored video is zeros and an empty checksum
+        # <version 1 record> <num_frames> <fps> <width> <height> <length> <codec>
+        data = b""
+        for video_file, fingerprint, properties in videos:
             # write version number
             file_path_bytes = str(video_file).encode()
             length = len(file_path_bytes)
-            data = struct.pack(
+            if properties is not None:
+                version = 2
+            elif fingerprint is not None:
+                version = 1
+            else:
+                version = 0
+            data += struct.pack(
                 "!HH%ds" % (length,),
-                self.curr_version,
+                version,
                 length,
                 file_path_bytes,
             )
+            if version >= 1:
+                fingerprint = fingerprint or VideoFingerprint(0, 0, "")
+                checksum_bytes = fingerprint.checksum.encode()
+                data += struct.pack(
+                    "!QQH%ds" % (len(checksum_bytes),),
+                    fingerprint.size,
+                    fingerprint.mtime_ns,
+                    len(checksum_bytes),
+                    checksum_bytes,
+                )
+            if version >= 2:
+                codec_bytes = properties.codec.encode()
+                data += struct.pack(
+                    "!QdIIH%ds" % (len(codec_bytes),),
+                    properties.num_frames,
+                    properties.fps,
+                    properties.width,
+                    properties.height,
+                    len(codec_bytes),
+                    codec_bytes,
+                )
+        with open(dir_path / self.metadata, "ab") as f:
             f.write(data)
 
     def _open(self, table):
@@ -0,0 +1,782 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import fcntl
+import io
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from eva.catalog.column_type import ColumnType, NdArrayType
+from eva.catalog.models.df_column import DataFrameColumn
+from eva.catalog.models.df_metadata import DataFrameMetadata
+from eva.configuration.configuration_manager import ConfigurationManager
+from eva.expression.abstract_expression import AbstractExpression, ExpressionType
+from eva.expression.expression_utils import get_columns_in_predicate
+from eva.models.storage.batch import Batch
+from eva.storage.abstract_storage_engine import AbstractStorageEngine
+from eva.storage.write_session import (
+    FILE_MEM_SIZE,
+    ROW_GROUP_MEM_SIZE,
+    BufferedWriteSession,
+)
+from eva.utils.logging_manager import logger
+
+# field metadata describing how an NDARRAY column is encoded
+_ENCODING_KEY = b"eva.ndarray"
+# fixed shape arrays of fixed width elements, stored as their raw bytes in a
+# fixed_size_binary column and read without copying. Unlike the fixed shape
+# tensor extension type of pyarrow>=12, this works with every supported
+# pyarrow and the files stay readable without registering an extension.
+_RAW_ENCODING = b"raw"
+# any other arrays, stored in the .npy format in a binary column
+_NPY_ENCODING = b"npy"
+
+# lists the committed files of a table in the order they were written
+_MANIFEST = "_manifest.json"
+_MANIFEST_LOCK = "_manifest.lock"
+# held while the table is compacted
+_COMPACTION_LOCK = "_compaction.lock"
+# seconds after which the files replaced by a compaction and the hidden files
+# of the write sessions that did not finish are deleted
+_OBSOLETE_FILE_TTL = 600
+# serializes the updates of the manifests by the threads of the process, the
+# file lock serializes them across processes
+_manifest_lock = threading.Lock()
+
+_SCALAR_TYPES = {
+    ColumnType.BOOLEAN: pa.bool_(),
+    ColumnType.INTEGER: pa.int64(),
+    ColumnType.FLOAT: pa.float32(),
+    ColumnType.TEXT: pa.string(),
+}
+
+
+def _ndarray_format(column: DataFrameColumn) -> Tuple[np.dtype, Tuple[int, ...]]:
+    """
+    Returns the dtype and the shape of the arrays of the column if they are
+    stored raw, (None, None) otherwise.
+    """
+    try:
+        dtype = np.dtype(NdArrayType.to_numpy_type(column.array_type))
+    except (TypeError, ValueError):
+        return None, None
+    shape = tuple(column.array_dimensions or [])
+    if (
+        dtype.kind not in "biufc"
+        or not shape
+        or not all(isinstance(dim, int) and dim > 0 for dim in shape)
+    ):
+        return None, None
+    return dtype, shape
+
+
+def _arrow_field(column: DataFrameColumn) -> pa.Field:
+    if column.type in _SCALAR_TYPES:
+        return pa.field(column.name, _SCALAR_TYPES[column.type])
+    if column.type == ColumnType.NDARRAY:
+        dtype, shape = _ndarray_format(column)
+        if dtype is not None:
+            return pa.field(
+                column.name,
+                pa.binary(int(np.prod(shape)) * dtype.itemsize),
+                metadata={_ENCODING_KEY: _RAW_ENCODING},
+            )
+        return pa.field(
+            column.name, pa.binary(), metadata={_ENCODING_KEY: _NPY_ENCODING}
+        )
+    error = "Invalid column type: {}".format(column.type)
+    logger.error(error)
+    raise RuntimeError(error)
+
+
+def _to_npy(value) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, np.asarray(value))
+    return buffer.getvalue()
+
+
+def _to_arrow_array(column: DataFrameColumn, field: pa.Field, values: pd.Series):
+    encoding = (field.metadata or {}).get(_ENCODING_KEY)
+    if encoding is None:
+        return pa.array(values, type=field.type, from_pandas=True)
+    if encoding == _NPY_ENCODING:
+        return pa.array(
+            [None if value is None else _to_npy(value) for value in values],
+            type=field.type,
+        )
+    dtype, shape = _ndarray_format(column)
+    if any(value is None for value in values):
+        return pa.array(
+            [
+                None
+                if value is None
+                else np.asarray(value, dtype=dtype).reshape(shape).tobytes()
+                for value in values
+            ],
+            type=field.type,
+        )
+    try:
+        arrays = np.stack([np.asarray(value, dtype=dtype) for value in values])
+        arrays = np.ascontiguousarray(arrays.reshape((len(values),) + shape))
+    except ValueError as e:
+        error = "Failed to write column {} of shape {}: {}".format(
+            column.name, shape, e
+        )
+        logger.error(error)
+        raise RuntimeError(error)
+    return pa.FixedSizeBinaryArray.from_buffers(
+        field.type, len(values), [None, pa.py_buffer(arrays)]
+    )
+
+
+def _to_numpy(column: DataFrameColumn, field: pa.Field, array: pa.Array):
+    encoding = (field.metadata or {}).get(_ENCODING_KEY)
+    if encoding is None:
+        return array.to_numpy(zero_copy_only=False)
+    values = np.empty(len(array), dtype=object)
+    if encoding == _NPY_ENCODING:
+        for idx, value in enumerate(array):
+            if value.is_valid:
+                values[idx] = np.load(io.BytesIO(value.as_py()), allow_pickle=True)
+        return values
+    dtype, shape = _ndarray_format(column)
+    # read-only views of the row group buffer
+    arrays = np.frombuffer(
+        array.buffers()[1],
+        dtype=dtype,
+        count=len(array) * int(np.prod(shape)),
+        offset=array.offset * field.type.byte_width,
+    ).reshape((len(array),) + shape)
+    values[:] = list(arrays)
+    if array.null_count:
+        values[array.is_null().to_numpy(zero_copy_only=False)] = None
+    return values
+
+
+class ColumnStatistics(NamedTuple):
+    """Statistics of a column over a row group or a file, the bounds are
+    None if they are unknown"""
+
+    min_value: object
+    max_value: object
+    null_count: int
+    num_rows: int
+
+
+# the files are never modified once written, and their names are unique
+@lru_cache(maxsize=4096)
+def _file_metadata(path: str) -> pq.FileMetaData:
+    return pq.read_metadata(path)
+
+
+def _row_group_statistics(
+    metadata: pq.FileMetaData, idx: int
+) -> Dict[str, ColumnStatistics]:
+    row_group = metadata.row_group(idx)
+    statistics = {}
+    for col_idx in range(row_group.num_columns):
+        column = row_group.column(col_idx)
+        stats = column.statistics
+        if stats is None or not stats.has_null_count:
+            continue
+        min_value, max_value = None, None
+        if stats.has_min_max and column.physical_type != "FIXED_LEN_BYTE_ARRAY":
+            min_value, max_value = stats.min, stats.max
+        statistics[column.path_in_schema] = ColumnStatistics(
+            min_value, max_value, stats.null_count, row_group.num_rows
+        )
+    return statistics
+
+
+def _merge_statistics(
+    statistics: List[Dict[str, ColumnStatistics]]
+) -> Dict[str, ColumnStatistics]:
+    merged = {}
+    for name in set.intersection(*(set(stats) for stats in statistics)):
+        column_stats = [stats[name] for stats in statistics]
+        bounded_stats = [
+            stats
+            for stats in column_stats
+            if stats.min_value is not None and stats.max_value is not None
+        ]
+        min_value, max_value = None, None
+        # row groups whose values are all null have no bounds
+        if all(
+            stats in bounded_stats or stats.null_count == stats.num_rows
+            for stats in column_stats
+        ) and len(bounded_stats):
+            min_value = min(stats.min_value for stats in bounded_stats)
+            max_value = max(stats.max_value for stats in bounded_stats)
+        merged[name] = ColumnStatistics(
+            min_value,
+            max_value,
+            sum(stats.null_count for stats in column_stats),
+            sum(stats.num_rows for stats in column_stats),
+        )
+    return merged
+
+
+_MIRRORED_COMPARISONS = {
+    ExpressionType.COMPARE_EQUAL: ExpressionType.COMPARE_EQUAL,
+    ExpressionType.COMPARE_NEQ: ExpressionType.COMPARE_NEQ,
+    ExpressionType.COMPARE_GREATER: ExpressionType.COMPARE_LESSER,
+    ExpressionType.COMPARE_LESSER: ExpressionType.COMPARE_GREATER,
+    ExpressionType.COMPARE_GEQ: ExpressionType.COMPARE_LEQ,
+    ExpressionType.COMPARE_LEQ: ExpressionType.COMPARE_GEQ,
+}
+
+
+def _comparison_may_match(
+    etype: ExpressionType, stats: ColumnStatistics, value
+) -> bool:
+    # null values never satisfy a comparison
+    if stats.null_count == stats.num_rows:
+        return False
+    min_value, max_value = stats.min_value, stats.max_value
+    if min_value is None or max_value is None:
+        return True
+    try:
+        if etype == ExpressionType.COMPARE_EQUAL:
+            return bool(min_value <= value <= max_value)
+        if etype == ExpressionType.COMPARE_GREATER:
+            return bool(max_value > value)
+        if etype == ExpressionType.COMPARE_GEQ:
+            return bool(max_value >= value)
+        if etype == ExpressionType.COMPARE_LESSER:
+            return bool(min_value < value)
+        if etype == ExpressionType.COMPARE_LEQ:
+            return bool(min_value <= value)
+    except TypeError:
+        pass
+    # NaN values are not part of the bounds and are different from any value
+    return True
+
+
+def may_match(
+    predicate: AbstractExpression, statistics: Dict[str, ColumnStatistics]
+) -> bool:
+    """
+    Checks if rows with the given column statistics may satisfy the
+    predicate. Only the comparisons of a column with a constant and their
+    conjunctions and disjunctions are used to rule out rows.
+
+    Arguments:
+        predicate (AbstractExpression): predicate on the columns
+        statistics (Dict[str, ColumnStatistics]): statistics of the columns
+            by name
+
+    Returns:
+        bool: False if no row satisfies the predicate
+    """
+    etype = predicate.etype
+    if etype == ExpressionType.LOGICAL_AND:
+        return all(may_match(child, statistics) for child in predicate.children)
+    if etype == ExpressionType.LOGICAL_OR:
+        return any(may_match(child, statistics) for child in predicate.children)
+    if etype not in _MIRRORED_COMPARISONS:
+        return True
+    left, right = predicate.children
+    if left.etype == ExpressionType.CONSTANT_VALUE:
+        etype = _MIRRORED_COMPARISONS[etype]
+        left, right = right, left
+    if (
+        left.etype != ExpressionType.TUPLE_VALUE
+        or right.etype != ExpressionType.CONSTANT_VALUE
+        or left.col_name not in statistics
+    ):
+        return True
+    return _comparison_may_match(etype, statistics[left.col_name], right.value)
+
+
+def _new_file_name() -> str:
+    # the names sort in the order the files are created
+    return "part-{:020d}-{}.parquet".format(time.time_ns(), uuid.uuid4().hex)
+
+
+class ParquetWriteSession(BufferedWriteSession):
+    """
+    Writes the appended rows into new Parquet files of the table, as row
+    groups of row_group_mem_size bytes and files of file_mem_size bytes.
+    The files are hidden until the session is committed, which adds all of
+    them to the manifest of the table at once.
+
+    Arguments:
+        engine (ParquetStorageEngine): storage engine of the table
+        table (DataFrameMetadata): table to write into
+        row_group_mem_size (int): memory size of a row group
+        file_mem_size (int): memory size of the rows of a file
+    """
+
+    def __init__(
+        self,
+        engine: "ParquetStorageEngine",
+        table: DataFrameMetadata,
+        row_group_mem_size: int,
+        file_mem_size: int,
+    ):
+        super().__init__(row_group_mem_size)
+        self._engine = engine
+        self._table = table
+        self._schema = engine._schema(table)
+        self._dir_path = Path(table.file_url)
+        self._sort_column = engine._default_sort_column(table)
+        self._file_mem_size = file_mem_size
+        self._file_names = []
+        self._writer: pq.ParquetWriter = None
+        self._written_size = 0
+
+    def _tmp_path(self, file_name: str) -> Path:
+        return self._dir_path / ("." + file_name)
+
+    def _prepare(self, rows: Batch) -> Tuple[pa.Table, int]:
+        records = rows.frames
+        arrays = []
+        for column, field in zip(self._table.schema.column_list, self._schema):
+            if column.name in records.columns:
+                arrays.append(_to_arrow_array(column, field, records[column.name]))
+            else:
+                arrays.append(pa.nulls(len(records), type=field.type))
+        arrow_table = pa.Table.from_arrays(arrays, schema=self._schema)
+        return arrow_table, arrow_table.nbytes
+
+    def _close_file(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _write(self, buffer: List[pa.Table]):
+        row_group = pa.concat_tables(buffer)
+        if self._writer is None:
+            file_name = _new_file_name()
+            self._file_names.append(file_name)
+            self._dir_path.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(
+                str(self._tmp_path(file_name)), self._schema
+            )
+            self._written_size = 0
+        self._writer.write_table(row_group, row_group_size=row_group.num_rows)
+        self._written_size += row_group.nbytes
+        if self._written_size >= self._file_mem_size:
+            self._close_file()
+
+    def _finish(self):
+        self._close_file()
+        for file_name in self._file_names:
+            self._tmp_path(file_name).rename(self._dir_path / file_name)
+        if self._file_names:
+            self._engine._commit_files(self._dir_path, added=self._file_names)
+            self._engine._schedule_compaction(self._dir_path, self._sort_column)
+
+    def _discard(self):
+        self._close_file()
+        for file_name in self._file_names:
+            self._tmp_path(file_name).unlink(missing_ok=True)
+
+
+class ParquetStorageEngine(AbstractStorageEngine):
+    """
+    Stores the structured tables as Parquet files written and read by
+    pyarrow in the process, without Spark. The manifest of the table lists
+    its files in the order they were written, a write session adds its
+    files to it atomically once committed.
+
+    NDARRAY columns of fixed shape and numeric type are stored as
+    fixed_size_binary columns holding the raw array bytes, and read as
+    read-only views of the Arrow buffers. The other NDARRAY columns are
+    stored in the .npy format.
+
+    The predicates pushed down to the scan are first checked against the
+    min/max/null count statistics of the columns that Parquet keeps for
+    every row group, to skip the files and the row groups without matching
+    rows, and then applied to the rows read.
+
+    Once a write session leaves compaction_min_files small files in the
+    table, they are compacted into large files in a background thread, see
+    compact.
+    """
+
+    def __init__(self):
+        self._compaction_executor: ThreadPoolExecutor = None
+        self._compaction_lock = threading.Lock()
+        self._scheduled_compactions = set()
+
+    def _schema(self, table: DataFrameMetadata) -> pa.Schema:
+        return pa.schema([_arrow_field(column) for column in table.schema.column_list])
+
+    def _default_sort_column(self, table: DataFrameMetadata) -> str:
+        column_names = [column.name for column in table.schema.column_list]
+        if table.identifier_column in column_names:
+            return table.identifier_column
+        return None
+
+    def _read_manifest(self, dir_path: Path) -> Dict:
+        try:
+            with open(dir_path / _MANIFEST) as manifest:
+                return json.load(manifest)
+        except FileNotFoundError:
+            # the tables written before the manifests were introduced
+            return {
+                "files": sorted(path.name for path in dir_path.glob("part-*.parquet"))
+            }
+
+    def _write_manifest(self, dir_path: Path, manifest: Dict):
+        tmp_path = dir_path / ".{}.{}".format(_MANIFEST, uuid.uuid4().hex)
+        with open(tmp_path, "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+        os.replace(tmp_path, dir_path / _MANIFEST)
+
+    def _files(self, table: DataFrameMetadata) -> List[Path]:
+        dir_path = Path(table.file_url)
+        return [dir_path / name for name in self._read_manifest(dir_path)["files"]]
+
+    @contextmanager
+    def _lock_manifest(self, dir_path: Path):
+        with _manifest_lock:
+            with open(dir_path / _MANIFEST_LOCK, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                yield
+
+    def _commit_files(
+        self, dir_path: Path, added: List[str] = (), removed: List[str] = ()
+    ):
+        """
+        Atomically adds files to the manifest of the table, in place of the
+        removed files if any. The removed files are deleted later, since
+        running scans may still open them.
+        """
+        with self._lock_manifest(dir_path):
+            manifest = self._read_manifest(dir_path)
+            file_names = manifest["files"]
+            position = len(file_names)
+            if removed:
+                position = min(file_names.index(name) for name in removed)
+            file_names = [name for name in file_names if name not in removed]
+            file_names[position:position] = added
+            obsolete_files = manifest.get("obsolete", {})
+            obsolete_files.update({name: time.time() for name in removed})
+            self._write_manifest(
+                dir_path, {"files": file_names, "obsolete": obsolete_files}
+            )
+
+    def _remove_obsolete_files(self, dir_path: Path):
+        """
+        Deletes the files removed from the manifest and the hidden files of
+        the write sessions that did not finish, once no scan or session can
+        use them anymore.
+        """
+        expiry_time = time.time() - _OBSOLETE_FILE_TTL
+        with self._lock_manifest(dir_path):
+            manifest = self._read_manifest(dir_path)
+            obsolete_files = manifest.get("obsolete", {})
+            expired_files = [
+                name
+                for name, removal_time in obsolete_files.items()
+                if removal_time < expiry_time
+            ]
+            for name in expired_files:
+                (dir_path / name).unlink(missing_ok=True)
+                del obsolete_files[name]
+            if expired_files:
+                self._write_manifest(dir_path, manifest)
+        for path in dir_path.glob(".part-*.parquet"):
+            if path.stat().st_mtime < expiry_time:
+                path.unlink(missing_ok=True)
+
+    def _data_size(self, path: Path) -> int:
+        metadata = _file_metadata(str(path))
+        return sum(
+            metadata.row_group(idx).total_byte_size
+            for idx in range(metadata.num_row_groups)
+        )
+
+    def _small_files(self, dir_path: Path, file_mem_size: int) -> List[List[str]]:
+        """
+        Returns the runs of consecutive files smaller than half of
+        file_mem_size, split in groups of up to file_mem_size bytes.
+        """
+        groups = [[]]
+        group_size = 0
+        for name in self._read_manifest(dir_path)["files"]:
+            size = self._data_size(dir_path / name)
+            if size >= file_mem_size // 2 or group_size + size > file_mem_size:
+                groups.append([])
+                group_size = 0
+            if size < file_mem_size // 2:
+                groups[-1].append(name)
+                group_size += size
+        return [group for group in groups if len(group) > 1]
+
+    def _compact(
+        self,
+        dir_path: Path,
+        sort_column: str,
+        row_group_mem_size: int,
+        file_mem_size: int,
+    ) -> Tuple[int, int]:
+        with open(dir_path / _COMPACTION_LOCK, "a") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                logger.info(f"{dir_path} is already being compacted")
+                return 0, 0
+            self._remove_obsolete_files(dir_path)
+            num_removed_files, num_added_files = 0, 0
+            for group in self._small_files(dir_path, file_mem_size):
+                rows = pa.concat_tables(
+                    [pq.read_table(str(dir_path / name)) for name in group]
+                )
+                if sort_column is not None:
+                    rows = rows.sort_by(sort_column)
+                file_name = _new_file_name()
+                tmp_path = dir_path / ("." + file_name)
+                row_size = max(1, rows.nbytes // max(1, rows.num_rows))
+                pq.write_table(
+                    rows,
+                    str(tmp_path),
+                    row_group_size=max(1, row_group_mem_size // row_size),
+                )
+                tmp_path.rename(dir_path / file_name)
+                self._commit_files(dir_path, added=[file_name], removed=group)
+                num_removed_files += len(group)
+                num_added_files += 1
+            return num_removed_files, num_added_files
+
+    def _run_compaction(self, dir_path: Path, *args):
+        try:
+            self._compact(dir_path, *args)
+        except Exception as e:
+            logger.exception(f"Failed to compact {dir_path}: {e}")
+        finally:
+            with self._compaction_lock:
+                self._scheduled_compactions.discard(dir_path)
+
+    def _schedule_compaction(self, dir_path: Path, sort_column: str):
+        """
+        Compacts the table in the background if it has too many small files.
+        """
+        config = ConfigurationManager()
+        min_files = config.get_value("storage", "compaction_min_files", 64)
+        row_group_mem_size = config.get_value(
+            "storage", "row_group_mem_size", ROW_GROUP_MEM_SIZE
+        )
+        file_mem_size = config.get_value("storage", "file_mem_size", FILE_MEM_SIZE)
+        if not min_files:
+            return
+        num_small_files = sum(
+            len(group) for group in self._small_files(dir_path, file_mem_size)
+        )
+        if num_small_files < min_files:
+            return
+        with self._compaction_lock:
+            if dir_path in self._scheduled_compactions:
+                return
+            self._scheduled_compactions.add(dir_path)
+        if self._compaction_executor is None:
+            self._compaction_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="eva-compaction"
+            )
+        self._compaction_executor.submit(
+            self._run_compaction,
+            dir_path,
+            sort_column,
+            row_group_mem_size,
+            file_mem_size,
+        )
+
+    def compact(
+        self, table: DataFrameMetadata, sort_column: str = None
+    ) -> Tuple[int, int]:
+        """
+        Rewrites the runs of small files of the table into files of up to
+        file_mem_size bytes sorted by sort_column, the identifier column of
+        the table by default. The new files replace the old ones atomically,
+        which are deleted once the running scans are done with them.
+
+        Arguments:
+            table: table metadata object to compact
+            sort_column (str): column to sort the rows of the new files by
+
+        Returns:
+            Tuple[int, int]: the number of files rewritten and written
+        """
+        column_names = [column.name for column in table.schema.column_list]
+        if sort_column is None:
+            sort_column = self._default_sort_column(table)
+        elif sort_column not in column_names:
+            error = "Invalid sort column {} of table {}".format(sort_column, table.name)
+            logger.error(error)
+            raise RuntimeError(error)
+        config = ConfigurationManager()
+        return self._compact(
+            Path(table.file_url),
+            sort_column,
+            config.get_value("storage", "row_group_mem_size", ROW_GROUP_MEM_SIZE),
+            config.get_value("storage", "file_mem_size", FILE_MEM_SIZE),
+        )
+
+    def create(self, table: DataFrameMetadata, **kwargs):
+        """
+        Create an empty directory for the table, replacing existing data.
+        """
+        dir_path = Path(table.file_url)
+        shutil.rmtree(str(dir_path), ignore_errors=True)
+        dir_path.mkdir(parents=True)
+        self._write_manifest(dir_path, {"files": []})
+
+    def drop(self, table: DataFrameMetadata):
+        dir_path = Path(table.file_url)
+        try:
+            shutil.rmtree(str(dir_path))
+        except Exception as e:
+            logger.exception(f"Failed to drop the table {e}")
+
+    def open_write_session(self, table: DataFrameMetadata) -> ParquetWriteSession:
+        config = ConfigurationManager()
+        return ParquetWriteSession(
+            self,
+            table,
+            config.get_value("storage", "row_group_mem_size", ROW_GROUP_MEM_SIZE),
+            config.get_value("storage", "file_mem_size", FILE_MEM_SIZE),
+        )
+
+    def write(self, table: DataFrameMetadata, rows: Batch):
+        """
+        Write rows into the table as a new Parquet file.
+
+        Arguments:
+            table: table metadata object to write into
+            rows : batch to be persisted in the storage.
+        """
+        if rows.empty():
+            return
+        with self.open_write_session(table) as session:
+            session.append(rows)
+
+    def read(
+        self,
+        table: DataFrameMetadata,
+        batch_mem_size: int,
+        columns: List[str] = None,
+        predicate_func=None,
+        curr_shard: int = 0,
+        total_shards: int = 0,
+        projection: List[str] = None,
+        predicate: AbstractExpression = None,
+    ) -> Iterator[Batch]:
+        """
+        Reads the table and return a batch iterator for the
+        tuples that passes the predicate func.
+
+        Argument:
+            table: table metadata object to write into
+            batch_mem_size (int): memory size of the batch read from storage
+            columns (List[str]): A list of column names to be
+                considered in predicate_func
+            predicate_func: customized predicate function returns bool
+            curr_shard (int): shard to read if the table is read in
+                partitions, each shard is a contiguous range of row groups
+            total_shards (int): number of partitions, 0 reads the whole table
+            projection (List[str]): columns to read, None reads all of them
+            predicate (AbstractExpression): predicate on the columns of the
+                table, the rows that do not satisfy it are skipped
+
+        Return:
+            Iterator of Batch read.
+        """
+        row_groups = []
+        for path in self._files(table):
+            metadata = _file_metadata(str(path))
+            row_group_ids = range(metadata.num_row_groups)
+            if predicate is not None and metadata.num_row_groups:
+                statistics = [
+                    _row_group_statistics(metadata, idx) for idx in row_group_ids
+                ]
+                if not may_match(predicate, _merge_statistics(statistics)):
+                    continue
+                row_group_ids = [
+                    idx
+                    for idx in row_group_ids
+                    if may_match(predicate, statistics[idx])
+                ]
+            parquet_file = pq.ParquetFile(str(path), metadata=metadata)
+            for idx in row_group_ids:
+                row_groups.append((parquet_file, idx))
+        if total_shards and total_shards > 1:
+            begin = len(row_groups) * curr_shard // total_shards
+            end = len(row_groups) * (curr_shard + 1) // total_shards
+            row_groups = row_groups[begin:end]
+
+        columns_by_name = {column.name: column for column in table.schema.column_list}
+        read_columns = None
+        if projection:
+            # the predicates read their columns from the returned rows
+            predicate_columns = set(columns or [])
+            if predicate is not None:
+                predicate_columns.update(
+                    col.split(".")[-1] for col in get_columns_in_predicate(predicate)
+                )
+            read_columns = [
+                name
+                for name in columns_by_name
+                if name in projection or name in predicate_columns
+            ]
+        for parquet_file, idx in row_groups:
+            metadata = parquet_file.metadata.row_group(idx)
+            read_size = sum(
+                metadata.column(col_idx).total_uncompressed_size
+                for col_idx in range(metadata.num_columns)
+                if read_columns is None
+                or metadata.column(col_idx).path_in_schema in read_columns
+            )
+            row_size = max(1, read_size // max(1, metadata.num_rows))
+            for record_batch in parquet_file.iter_batches(
+                batch_size=max(1, batch_mem_size // row_size),
+                row_groups=[idx],
+                columns=read_columns,
+            ):
+                frames = pd.DataFrame(
+                    {
+                        field.name: _to_numpy(
+                            columns_by_name[field.name],
+                            field,
+                            record_batch.column(field_idx),
+                        )
+                        for field_idx, field in enumerate(record_batch.schema)
+                        if field.name in columns_by_name
+                    }
+                )
+                batch = Batch(frames)
+                if predicate_func and columns:
+                    mask = [
+                        bool(predicate_func(*values))
+                        for values in zip(*(frames[col] for col in columns))
+                    ]
+                    batch.filter(np.array(mask, dtype=bool))
+                batch = self._apply_predicate(batch, predicate)
+                if not batch.empty():
+                    yield batch
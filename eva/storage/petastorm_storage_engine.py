@@ -22,6 +22,8 @@ from petastorm.unischema import dict_to_spark_row
 
 from eva.catalog.models.df_metadata import DataFrameMetadata
 from eva.configuration.configuration_manager import ConfigurationManager
+from eva.expression.abstract_expression import AbstractExpression
+from eva.expression.expression_utils import get_columns_in_predicate
 from eva.models.storage.batch import Batch
 from eva.readers.petastorm_reader import PetastormReader
 from eva.spark.session import Session
@@ -105,6 +107,10 @@ class PetastormStorageEngine(AbstractStorageEngine):
         batch_mem_size: int,
         columns: List[str] = None,
         predicate_func=None,
+        curr_shard: int = 0,
+        total_shards: int = 0,
+        projection: List[str] = None,
+        predicate: AbstractExpression = None,
     ) -> Iterator[Batch]:
         """
         Reads the table and return a batch iterator for the
@@ -116,18 +122,45 @@ class PetastormStorageEngine(AbstractStorageEngine):
             columns (List[str]): A list of column names to be
                 considered in predicate_func
             predicate_func: customized predicate function returns bool
+            curr_shard (int): shard to read if the table is read in
+                partitions
+            total_shards (int): number of partitions, 0 reads the whole table
+            projection (List[str]): columns to decode, None decodes all of
+                them
+            predicate (AbstractExpression): predicate on the columns of the
+                table, applied to the decoded batches
 
         Return:
             Iterator of Batch read.
         """
-        predicate = None
+        row_predicate = None
         if predicate_func and columns:
-            predicate = in_lambda(columns, predicate_func)
+            row_predicate = in_lambda(columns, predicate_func)
+
+        schema_fields = None
+        if projection:
+            fields = table.schema.petastorm_schema.fields
+            # the predicates read their columns from the decoded rows
+            predicate_columns = set(columns or [])
+            if predicate is not None:
+                predicate_columns.update(
+                    col.split(".")[-1] for col in get_columns_in_predicate(predicate)
+                )
+            schema_fields = [
+                fields[name]
+                for name in fields
+                if name in projection or name in predicate_columns
+            ]
 
-        # ToDo: Handle the sharding logic. We might have to maintain a
-        # context for deciding which shard to read
         reader = PetastormReader(
-            self._spark_url(table), batch_mem_size=batch_mem_size, predicate=predicate
+            self._spark_url(table),
+            batch_mem_size=batch_mem_size,
+            predicate=row_predicate,
+            cur_shard=curr_shard,
+            shard_count=total_shards,
+            schema_fields=schema_fields,
         )
         for batch in reader.read():
-            yield batch
+            batch = self._apply_predicate(batch, predicate)
+            if not batch.empty():
+                yield batch
@@ -0,0 +1,169 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from abc import ABCMeta, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Tuple
+
+from eva.catalog.models.df_metadata import DataFrameMetadata
+from eva.models.storage.batch import Batch
+from eva.utils.generic_utils import get_size
+from eva.utils.logging_manager import logger
+
+# defaults of storage.row_group_mem_size and storage.file_mem_size, for the
+# configurations created before they were added
+ROW_GROUP_MEM_SIZE = 64 * 1024 * 1024  # 64mb
+FILE_MEM_SIZE = 512 * 1024 * 1024  # 512mb
+
+
+class AbstractWriteSession(metaclass=ABCMeta):
+    """
+    Writes the rows of several batches into a table. The rows are visible
+    to the readers of the table once the session is committed.
+
+    The session is a context manager, committed if the block succeeds and
+    aborted otherwise, e.g.,
+
+        with StorageEngine.open_write_session(table) as session:
+            for batch in batches:
+                session.append(batch)
+    """
+
+    @abstractmethod
+    def append(self, rows: Batch):
+        """Adds the rows of the batch to the table
+
+        Attributes:
+            rows: rows to be written
+        """
+
+    @abstractmethod
+    def commit(self):
+        """Writes the remaining rows and makes all the rows visible"""
+
+    @abstractmethod
+    def abort(self):
+        """Discards the rows that are not visible yet"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+
+class BufferedWriteSession(AbstractWriteSession):
+    """
+    Buffers the appended rows until they reach buffer_mem_size bytes, and
+    writes the buffered rows in a background thread while the next ones are
+    buffered.
+
+    Arguments:
+        buffer_mem_size (int): memory size of the rows written at once
+    """
+
+    def __init__(self, buffer_mem_size: int):
+        self._buffer_mem_size = buffer_mem_size
+        self._buffer = []
+        self._buffered_size = 0
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending: Future = None
+
+    def _prepare(self, rows: Batch) -> Tuple[object, int]:
+        """
+        Returns the buffered form of the rows and its memory size.
+        """
+        return rows, len(rows) * get_size(rows.frames.iloc[0].to_dict())
+
+    @abstractmethod
+    def _write(self, buffer: List[object]):
+        """
+        Writes the buffered rows, runs in the background thread.
+        """
+
+    def _finish(self):
+        """
+        Makes the written rows visible, called once all of them are written.
+        """
+
+    def _discard(self):
+        """
+        Removes the written rows that are not visible, called on abort.
+        """
+
+    def _wait(self):
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        buffer = self._buffer
+        self._buffer, self._buffered_size = [], 0
+        # at most one buffer is written while the next one is filled
+        self._wait()
+        self._pending = self._executor.submit(self._write, buffer)
+
+    def append(self, rows: Batch):
+        if rows.empty():
+            return
+        item, size = self._prepare(rows)
+        self._buffer.append(item)
+        self._buffered_size += size
+        if self._buffered_size >= self._buffer_mem_size:
+            self._flush()
+
+    def commit(self):
+        try:
+            self._flush()
+            self._wait()
+        except Exception:
+            self.abort()
+            raise
+        self._executor.shutdown()
+        self._finish()
+
+    def abort(self):
+        self._buffer, self._buffered_size = [], 0
+        try:
+            self._wait()
+        except Exception as e:
+            logger.warn(f"Discarding a failed write: {e}")
+        self._executor.shutdown()
+        self._discard()
+
+
+class AppendWriteSession(BufferedWriteSession):
+    """
+    Appends the buffered rows to the table with the write method of the
+    storage engine. The rows are visible once they are written, so aborting
+    the session does not remove the rows already written.
+
+    Arguments:
+        engine (AbstractStorageEngine): storage engine of the table
+        table (DataFrameMetadata): table to write into
+        buffer_mem_size (int): memory size of the rows written at once
+    """
+
+    def __init__(self, engine, table: DataFrameMetadata, buffer_mem_size: int):
+        super().__init__(buffer_mem_size)
+        self._engine = engine
+        self._table = table
+
+    def _write(self, buffer: List[Batch]):
+        self._engine.write(self._table, Batch.concat(buffer, copy=False))
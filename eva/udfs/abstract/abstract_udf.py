@@ -12,14 +12,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 from abc import ABCMeta, abstractmethod
 from typing import List, Union
 
 import pandas as pd
 from numpy.typing import ArrayLike
 
+from eva.configuration.configuration_manager import ConfigurationManager
 from eva.models.catalog.frame_info import FrameInfo
 from eva.models.catalog.properties import ColorSpace
+from eva.udfs.event_loop import udf_event_loop
 
 InputType = Union[pd.DataFrame, ArrayLike]
 
@@ -65,9 +68,87 @@ class AbstractUDF(metaclass=ABCMeta):
 
     @property
     def input_format(self) -> FrameInfo:
+        """
+        Resolution and color space of the frames the UDF needs. If a UDF
+        declares a width and height, or the GRAY or HSV color space, the
+        frames it reads from a video may be resized, or converted, by the
+        reader, so its outputs must not depend on the original resolution.
+        """
         return FrameInfo(-1, -1, 3, ColorSpace.RGB)
 
 
+class AbstractAsyncUDF(AbstractUDF):
+    """
+    Abstract class for I/O-bound UDFs, e.g., UDFs calling an inference
+    server or a lookup service, whose `forward` is a coroutine.
+
+    A call splits the frames into chunks of `chunk_size` rows and awaits
+    their forward calls concurrently on the event loop shared by the UDFs, at
+    most `max_concurrency` at a time across all the calls of the UDF, by
+    default executor.async_udf_concurrency. The outputs are concatenated in
+    the order of the frames.
+    """
+
+    # number of rows passed to a forward call
+    chunk_size: int = 1
+    max_concurrency: int = None
+
+    def __call__(self, *args, **kwargs):
+        frames = args[0]
+        loop = udf_event_loop()
+        return asyncio.run_coroutine_threadsafe(
+            self._forward_chunks(frames), loop
+        ).result()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # the semaphore is bound to the event loop, which is replaced in
+        # forked processes
+        loop = asyncio.get_running_loop()
+        semaphore = getattr(self, "_loop_semaphore", None)
+        if semaphore is None or semaphore[0] is not loop:
+            limit = self.max_concurrency or ConfigurationManager().get_value(
+                "executor", "async_udf_concurrency", 32
+            )
+            semaphore = (loop, asyncio.Semaphore(max(1, limit)))
+            self._loop_semaphore = semaphore
+        return semaphore[1]
+
+    async def _forward_chunks(self, frames: pd.DataFrame) -> pd.DataFrame:
+        semaphore = self._semaphore()
+
+        async def forward_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+            async with semaphore:
+                return await self.forward(chunk)
+
+        chunk_size = max(1, self.chunk_size)
+        tasks = [
+            asyncio.ensure_future(
+                forward_chunk(
+                    frames.iloc[begin : begin + chunk_size].reset_index(drop=True)
+                )
+            )
+            for begin in range(0, len(frames), chunk_size)
+        ]
+        try:
+            outcomes = await asyncio.gather(*tasks)
+        except BaseException:
+            # the calls still in flight are of no use
+            for task in tasks:
+                task.cancel()
+            raise
+        if not outcomes:
+            return pd.DataFrame()
+        return pd.concat(outcomes, ignore_index=True)
+
+    @abstractmethod
+    async def forward(self, frames: InputType) -> InputType:
+        """
+        Implement the UDF for a chunk of the frames by overriding this
+        coroutine. Gets awaited by __call__.
+        """
+        pass
+
+
 class AbstractClassifierUDF(AbstractUDF):
     @property
     @abstractmethod
@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from pathlib import Path
+from typing import List
+
 import numpy as np
 import pandas as pd
 import torch
@@ -22,32 +25,120 @@ from torch import Tensor, nn
 from torchvision.transforms import Compose, transforms
 
 from eva.configuration.configuration_manager import ConfigurationManager
+from eva.udfs import execution_backends
 from eva.udfs.abstract.abstract_udf import (
     AbstractClassifierUDF,
     AbstractTransformationUDF,
 )
 from eva.udfs.gpu_compatible import GPUCompatible
+from eva.utils.logging_manager import logger
 
 
 class PytorchAbstractClassifierUDF(AbstractClassifierUDF, nn.Module, GPUCompatible):
     """
     A pytorch based classifier. Used to make sure we make maximum
     utilization of features provided by pytorch without reinventing the wheel.
+
+    The frames are preprocessed in one of two ways:
+
+    `batch_transforms`: transforms applied at once to the whole batch of
+    frames, stacked as a N x 3 x H x W float tensor with RGB channels in
+    [0, 1] on the device of the model (e.g., torchvision `Resize` and
+    `Normalize`, which accept batched tensors). This is the default, with
+    no transforms, for UDFs that keep the default `transforms`.
+
+    `transforms`: per-frame torchvision transforms applied to the PIL image
+    of every frame, used if `batch_transforms` is None, e.g., by UDFs that
+    set their own `transforms` or override `transform`.
+
+    The `model` of the UDF is run by its execution `backend`, see
+    `set_backend`. UDFs whose model returns anything but tensors or tuples
+    of tensors, which is all that ONNX Runtime returns, restrict
+    `supported_backends`.
     """
 
+    supported_backends = execution_backends.BACKENDS
+
     def __init__(self, *args, **kwargs):
         self.transforms = [transforms.ToTensor()]
+        self.batch_transforms = None
+        self.backend = execution_backends.EAGER
         nn.Module.__init__(self, *args, **kwargs)
         self.setup(*args, **kwargs)
+        if self.batch_transforms is None and self._has_default_transforms():
+            self.batch_transforms = []
+
+    def _has_default_transforms(self) -> bool:
+        return (
+            type(self).transform is PytorchAbstractClassifierUDF.transform
+            and len(self.transforms) == 1
+            and isinstance(self.transforms[0], transforms.ToTensor)
+        )
 
     def get_device(self):
         return next(self.parameters()).device
 
+    def set_backend(self, backend: str, cache_dir: Path = None):
+        """
+        Runs the `model` of the UDF through the given execution backend:
+        `eager` (PyTorch), `torchscript` (frozen TorchScript graph),
+        `quantized` (dynamic int8 quantization of the linear and recurrent
+        layers) or `onnxruntime` (the CPU provider of ONNX Runtime). The
+        compiled models are cached under `cache_dir`, by default
+        ~/.eva/udfs/models.
+
+        Arguments:
+            backend (str): name of the execution backend
+            cache_dir (Path): directory of the compiled models
+        """
+        if backend not in execution_backends.BACKENDS:
+            raise ValueError(
+                f"Unknown execution backend {backend}, expected one of "
+                f"{', '.join(execution_backends.BACKENDS)}."
+            )
+        if backend not in self.supported_backends:
+            raise ValueError(
+                f"{type(self).__name__} does not support the {backend} "
+                f"backend, expected one of {', '.join(self.supported_backends)}."
+            )
+        model = self.model
+        if isinstance(model, execution_backends.CompiledModel):
+            model = model.model
+        if backend != execution_backends.EAGER:
+            model = execution_backends.CompiledModel(
+                model.cpu().eval(), backend, type(self).__name__, cache_dir
+            )
+        self.model = model
+        self.backend = backend
+        return self
+
     def transform(self, images: np.ndarray):
         composed = Compose(self.transforms)
         # reverse the channels from opencv
         return composed(Image.fromarray(images[:, :, ::-1])).unsqueeze(0)
 
+    def batch_transform(self, frames: np.ndarray) -> Tensor:
+        """
+        Converts a N x H x W x 3 uint8 array of BGR frames into a
+        N x 3 x H x W float tensor with RGB channels in [0, 1] on the
+        device of the model and applies the batch transforms.
+        """
+        # move the frames while they are still uint8, 4x smaller than float
+        tensor = torch.from_numpy(frames).to(self.get_device())
+        # reverse the channels from opencv and move them first
+        tensor = tensor.flip(-1).permute(0, 3, 1, 2).float().div(255)
+        if self.batch_transforms:
+            tensor = Compose(self.batch_transforms)(tensor)
+        return tensor.contiguous()
+
+    def _preprocess(self, frames: List[np.ndarray]) -> Tensor:
+        if self.batch_transforms is None:
+            return torch.cat([self.transform(x) for x in frames]).to(self.get_device())
+        if len({frame.shape for frame in frames}) == 1:
+            return self.batch_transform(np.stack(frames))
+        # frames of different sizes (e.g., from different videos)
+        return torch.cat([self.batch_transform(frame[None]) for frame in frames])
+
     def __call__(self, *args, **kwargs) -> pd.DataFrame:
         """
         This method transforms the list of frames by
@@ -65,18 +156,15 @@ class PytorchAbstractClassifierUDF(AbstractClassifierUDF, nn.Module, GPUCompatib
             frames = frames.transpose().values.tolist()[0]
 
         gpu_batch_size = ConfigurationManager().get_value("executor", "gpu_batch_size")
-        tens_batch = torch.cat([self.transform(x) for x in frames]).to(
-            self.get_device()
-        )
+        tens_batch = self._preprocess(frames)
 
         if gpu_batch_size:
             chunks = torch.split(tens_batch, gpu_batch_size)
-            outcome = pd.DataFrame()
-            for tensor in chunks:
-                outcome = outcome.append(self.forward(tensor), ignore_index=True)
-            return outcome
+            return pd.concat(
+                [self.forward(tensor) for tensor in chunks], ignore_index=True
+            )
         else:
-            return self.forward(frames)
+            return self.forward(tens_batch)
 
     def as_numpy(self, val: Tensor) -> np.ndarray:
         """
@@ -92,6 +180,12 @@ class PytorchAbstractClassifierUDF(AbstractClassifierUDF, nn.Module, GPUCompatib
         """
         Required to make class a member of GPUCompatible Protocol.
         """
+        if self.backend != execution_backends.EAGER:
+            logger.warn(
+                f"The {self.backend} backend runs on the CPU, "
+                f"not moving {type(self).__name__} to GPU {device}."
+            )
+            return self
         return self.to(torch.device("cuda:{}".format(device)))
 
 
@@ -0,0 +1,164 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares the throughput and the accuracy of the execution backends of a
+PyTorch UDF on the frames of a video, e.g.,
+
+    python -m eva.udfs.backend_comparison \\
+        --udf eva/udfs/ssd_object_detector.py:SSDObjectDetector \\
+        --video data/ua_detrac/ua_detrac.mp4 --num_frames 64
+"""
+import argparse
+import time
+from pathlib import Path
+from typing import Callable, List, Sequence
+
+import cv2
+import numpy as np
+import pandas as pd
+import torch
+
+from eva.udfs.abstract.pytorch_abstract_udf import PytorchAbstractClassifierUDF
+from eva.udfs.execution_backends import BACKENDS, EAGER
+from eva.utils.generic_utils import path_to_class
+
+
+def _values_match(expected, actual, rtol: float, atol: float) -> bool:
+    expected, actual = np.asarray(expected), np.asarray(actual)
+    if expected.shape != actual.shape:
+        return False
+    if expected.dtype.kind in "biuf" and actual.dtype.kind in "biuf":
+        return np.allclose(expected, actual, rtol=rtol, atol=atol)
+    return bool((expected == actual).all())
+
+
+def _run(
+    udf: PytorchAbstractClassifierUDF, frames: List[np.ndarray], batch_size: int
+) -> pd.DataFrame:
+    with torch.no_grad():
+        outputs = [
+            udf(frames[start : start + batch_size])
+            for start in range(0, len(frames), batch_size)
+        ]
+    return pd.concat(outputs, ignore_index=True)
+
+
+def compare_backends(
+    udf_factory: Callable[[], PytorchAbstractClassifierUDF],
+    frames: List[np.ndarray],
+    backends: Sequence[str] = BACKENDS,
+    batch_size: int = 8,
+    rtol: float = 1e-2,
+    atol: float = 1e-2,
+    cache_dir: Path = None,
+) -> pd.DataFrame:
+    """
+    Runs the UDF on the frames with every backend and compares the results
+    with those of the eager backend.
+
+    Arguments:
+        udf_factory: creates an instance of the UDF
+        frames: the input frames
+        backends: the execution backends to compare
+        batch_size: number of frames passed to the UDF at once
+        rtol, atol: tolerances of numeric outputs
+        cache_dir: directory of the compiled models
+
+    Returns:
+        pd.DataFrame: a row per backend with its throughput in frames per
+        second (after compiling the model on the first batch), its speedup
+        over the eager backend, the fraction of the frames whose outputs
+        agree with the eager backend, and the error if the backend failed
+    """
+    backends = [EAGER] + [backend for backend in backends if backend != EAGER]
+    results = []
+    expected = None
+    eager_throughput = None
+    for backend in backends:
+        result = {
+            "backend": backend,
+            "frames_per_second": np.nan,
+            "speedup": np.nan,
+            "agreement": np.nan,
+            "error": "",
+        }
+        try:
+            udf = udf_factory().set_backend(backend, cache_dir)
+            # warm up, compiling the model
+            _run(udf, frames[:batch_size], batch_size)
+            start = time.perf_counter()
+            output = _run(udf, frames, batch_size)
+            throughput = len(frames) / (time.perf_counter() - start)
+        except Exception as e:
+            if backend == EAGER:
+                raise
+            result["error"] = str(e)
+            results.append(result)
+            continue
+
+        if backend == EAGER:
+            expected = output
+            eager_throughput = throughput
+        result["frames_per_second"] = throughput
+        result["speedup"] = throughput / eager_throughput
+        result["agreement"] = np.mean(
+            [
+                all(
+                    _values_match(
+                        expected.at[idx, col], output.at[idx, col], rtol, atol
+                    )
+                    for col in expected.columns
+                )
+                for idx in expected.index
+            ]
+        )
+        results.append(result)
+    return pd.DataFrame(results)
+
+
+def _read_frames(video: str, num_frames: int) -> List[np.ndarray]:
+    frames = []
+    capture = cv2.VideoCapture(video)
+    while len(frames) < num_frames:
+        success, frame = capture.read()
+        if not success:
+            break
+        frames.append(frame)
+    capture.release()
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the execution backends of a PyTorch UDF."
+    )
+    parser.add_argument(
+        "--udf", required=True, help="implementation of the UDF, as <path>:<class>"
+    )
+    parser.add_argument("--video", required=True, help="video to read frames from")
+    parser.add_argument("--num_frames", type=int, default=64)
+    parser.add_argument("--batch_size", type=int, default=8)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS))
+    args = parser.parse_args()
+
+    impl_path, class_name = args.udf.rsplit(":", 1)
+    udf_class = path_to_class(impl_path, class_name)
+    frames = _read_frames(args.video, args.num_frames)
+    results = compare_backends(udf_class, frames, args.backends, args.batch_size)
+    print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -27,7 +27,10 @@ from torch import Tensor
 from torchvision import transforms
 
 from eva.configuration.constants import EVA_DEFAULT_DIR
+from eva.models.catalog.frame_info import FrameInfo
+from eva.models.catalog.properties import ColorSpace
 from eva.udfs.abstract.pytorch_abstract_udf import PytorchAbstractClassifierUDF
+from eva.udfs.udf_output_builder import UDFOutputBuilder
 
 # VGG configuration
 cfg = {
@@ -138,9 +141,16 @@ class EmotionDetector(PytorchAbstractClassifierUDF):
         return frame
 
     def transform(self, images: np.ndarray):
+        if images.ndim == 2:
+            # already converted to grayscale by the reader
+            return self.transforms_ed(Image.fromarray(images))
         # reverse the channels from opencv
         return self.transforms_ed(Image.fromarray(images[:, :, ::-1]))
 
+    @property
+    def input_format(self) -> FrameInfo:
+        return FrameInfo(48, 48, 1, ColorSpace.GRAY)
+
     @property
     def labels(self) -> List[str]:
         return ["angry", "disgust", "fear", "happy", "sad", "surprise", "neutral"]
@@ -155,29 +165,28 @@ class EmotionDetector(PytorchAbstractClassifierUDF):
             outcome (pd.DataFrame): Emotion Predictions for input frames
         """
 
-        # result dataframe
-        outcome = pd.DataFrame()
+        # frames: N x 48 x 48 grayscale frames
+        num_frames = frames.size(0)
 
-        # convert to 3 channels, ten crop and stack
-        frames = frames.repeat(3, 1, 1)
-        frames = transforms.functional.ten_crop(frames, self.cut_size)
-        frames = torch.stack([crop for crop in frames])
+        # convert to 3 channels, ten crop and stack the crops of all frames
+        frames = frames.unsqueeze(1).repeat(1, 3, 1, 1)
+        crops = transforms.functional.ten_crop(frames, self.cut_size)
+        num_crops = len(crops)
+        crops = torch.stack(crops, dim=1).view(-1, 3, self.cut_size, self.cut_size)
 
-        # perform predictions and take mean over crops
-        predictions = self.model(frames)
-        predictions = torch.mean(predictions, dim=0)
+        # perform predictions and take mean over the crops of every frame
+        predictions = self.model(crops).view(num_frames, num_crops, -1)
+        predictions = torch.mean(predictions, dim=1)
 
         # get the scores
-        score = F.softmax(predictions, dim=0)
-        _, predicted = torch.max(predictions.data, 0)
+        scores = self.as_numpy(F.softmax(predictions, dim=1))
+        predicted = self.as_numpy(torch.argmax(predictions, dim=1))
 
         # save results
-        outcome = outcome.append(
-            {
-                "labels": self.labels[predicted.item()],
-                "scores": score.cpu().detach().numpy()[predicted.item()],
-            },
-            ignore_index=True,
-        )
-
-        return outcome
+        outcome = UDFOutputBuilder(["labels", "scores"], num_rows=num_frames)
+        for frame_scores, label_idx in zip(scores, predicted):
+            outcome.add_row(
+                labels=self.labels[label_idx], scores=frame_scores[label_idx]
+            )
+
+        return outcome.build()
@@ -0,0 +1,47 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import os
+import threading
+
+_event_loop = None
+_event_loop_lock = threading.Lock()
+
+
+def udf_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop shared by all the queries to run the coroutines of async
+    UDFs, started on first use in a daemon thread.
+    """
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="eva-event-loop", daemon=True
+            ).start()
+            _event_loop = loop
+        return _event_loop
+
+
+def _reset_event_loop_after_fork():
+    # the thread running the loop is not inherited by forked children (e.g.,
+    # partition workers), so the child starts its own loop on demand
+    global _event_loop, _event_loop_lock
+    _event_loop = None
+    _event_loop_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_event_loop_after_fork)
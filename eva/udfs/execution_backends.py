@@ -0,0 +1,194 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import copy
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+import torch
+from torch import Tensor, nn
+
+from eva.configuration.constants import EVA_DEFAULT_DIR
+from eva.utils.logging_manager import logger
+
+# the model is run as is by PyTorch
+EAGER = "eager"
+# the model is compiled to a frozen TorchScript graph
+TORCHSCRIPT = "torchscript"
+# the linear and recurrent layers of the model are dynamically quantized to
+# int8 and the result is compiled to TorchScript
+QUANTIZED = "quantized"
+# the model is exported to ONNX and run by the CPU provider of ONNX Runtime
+ONNXRUNTIME = "onnxruntime"
+
+BACKENDS = (EAGER, TORCHSCRIPT, QUANTIZED, ONNXRUNTIME)
+
+MODEL_CACHE_DIR = EVA_DEFAULT_DIR / "udfs" / "models"
+
+# compiled models loaded by this process, keyed by the path of their artifact
+_runners: Dict[Path, Callable] = {}
+_runners_lock = threading.Lock()
+
+
+class CompiledModel(nn.Module):
+    """
+    Runs a PyTorch model through an execution backend.
+
+    The model is compiled lazily for every frame shape it is called with,
+    since exporting requires an example input. The compiled artifact is
+    cached as `<cache_dir>/<name>.<backend>.<shape>.<fingerprint>.<ext>` and
+    reused by later queries and EVA instances, the fingerprint of the
+    architecture and the weights of the model invalidates it when the model
+    changes. All the backends run on the CPU.
+
+    Arguments:
+        model (nn.Module): the model in eval mode
+        backend (str): one of TORCHSCRIPT, QUANTIZED and ONNXRUNTIME
+        name (str): name of the model in the artifact cache
+        cache_dir (Path): directory of the artifact cache
+    """
+
+    def __init__(
+        self, model: nn.Module, backend: str, name: str, cache_dir: Path = None
+    ):
+        super().__init__()
+        if backend not in _COMPILERS:
+            raise ValueError(
+                f"Unknown execution backend {backend}, expected one of "
+                f"{', '.join(BACKENDS)}."
+            )
+        self.model = model
+        self.backend = backend
+        self.name = name
+        self.cache_dir = Path(cache_dir or MODEL_CACHE_DIR)
+        self._fingerprint = None
+
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            digest = hashlib.sha1(repr(self.model).encode())
+            for tensor in self.model.state_dict().values():
+                digest.update(tensor.detach().cpu().contiguous().numpy())
+            self._fingerprint = digest.hexdigest()[:16]
+        return self._fingerprint
+
+    def artifact_path(self, shape: Tuple[int, ...]) -> Path:
+        _, extension = _COMPILERS[self.backend]
+        shape_str = "x".join(str(dim) for dim in shape)
+        return self.cache_dir / (
+            f"{self.name}.{self.backend}.{shape_str}.{self.fingerprint()}.{extension}"
+        )
+
+    def forward(self, frames: Tensor):
+        path = self.artifact_path(tuple(frames.shape[1:]))
+        with _runners_lock:
+            runner = _runners.get(path)
+            if runner is None:
+                compiler, _ = _COMPILERS[self.backend]
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                runner = compiler(self.model, frames.cpu(), path)
+                _runners[path] = runner
+        with torch.no_grad():
+            return runner(frames.cpu())
+
+
+def _save_atomically(path: Path, save: Callable[[str], None]):
+    # replicas and partitions in other processes may compile the same model
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    save(str(tmp_path))
+    os.replace(tmp_path, path)
+
+
+def _script(model: nn.Module, example: Tensor) -> torch.jit.ScriptModule:
+    try:
+        scripted = torch.jit.script(model)
+    except Exception as e:
+        logger.info(f"Scripting failed with {e}, tracing the model instead.")
+        with torch.no_grad():
+            scripted = torch.jit.trace(model, example)
+    try:
+        return torch.jit.freeze(scripted.eval())
+    except Exception as e:
+        logger.warn(f"Freezing the TorchScript model failed with {e}.")
+        return scripted
+
+
+def _wrap_script_module(model: nn.Module, module: torch.jit.ScriptModule) -> Callable:
+    from torchvision.models.detection.generalized_rcnn import GeneralizedRCNN
+
+    if isinstance(model, GeneralizedRCNN):
+        # scripted detection models take a list of images and always return
+        # a (losses, detections) tuple
+        return lambda frames: module(list(frames))[1]
+    return module
+
+
+def _compile_torchscript(model: nn.Module, example: Tensor, path: Path) -> Callable:
+    if path.exists():
+        return _wrap_script_module(model, torch.jit.load(str(path)))
+    module = _script(model, example)
+    _save_atomically(path, lambda tmp_path: torch.jit.save(module, tmp_path))
+    return _wrap_script_module(model, module)
+
+
+def _compile_quantized(model: nn.Module, example: Tensor, path: Path) -> Callable:
+    if path.exists():
+        return _wrap_script_module(model, torch.jit.load(str(path)))
+    quantized = torch.quantization.quantize_dynamic(
+        copy.deepcopy(model), {nn.Linear, nn.LSTM, nn.GRU}, dtype=torch.qint8
+    )
+    return _compile_torchscript(quantized, example, path)
+
+
+def _compile_onnxruntime(model: nn.Module, example: Tensor, path: Path) -> Callable:
+    try:
+        import onnxruntime
+    except ImportError as e:
+        raise ImportError(
+            f"Failed to import with error {e}, \
+            please try `pip install onnxruntime`"
+        )
+    if not path.exists():
+        # outputs must be tensors or (nested) tuples of tensors
+        with torch.no_grad():
+            _save_atomically(
+                path,
+                lambda tmp_path: torch.onnx.export(
+                    model,
+                    example,
+                    tmp_path,
+                    input_names=["frames"],
+                    dynamic_axes={"frames": {0: "batch"}},
+                    opset_version=13,
+                ),
+            )
+    session = onnxruntime.InferenceSession(
+        str(path), providers=["CPUExecutionProvider"]
+    )
+
+    def run(frames: Tensor):
+        outputs = session.run(None, {"frames": frames.numpy()})
+        outputs = tuple(torch.from_numpy(output) for output in outputs)
+        return outputs[0] if len(outputs) == 1 else outputs
+
+    return run
+
+
+_COMPILERS = {
+    TORCHSCRIPT: (_compile_torchscript, "pt"),
+    QUANTIZED: (_compile_quantized, "pt"),
+    ONNXRUNTIME: (_compile_onnxruntime, "onnx"),
+}
@@ -22,6 +22,7 @@ from facenet_pytorch import MTCNN
 
 from eva.udfs.abstract.abstract_udf import AbstractClassifierUDF
 from eva.udfs.gpu_compatible import GPUCompatible
+from eva.udfs.udf_output_builder import UDFOutputBuilder
 
 
 class FaceDetector(AbstractClassifierUDF, GPUCompatible):
@@ -61,16 +62,13 @@ class FaceDetector(AbstractClassifierUDF, GPUCompatible):
         frames = np.asarray(frames_list)
         detections = self.model.detect(frames)
         boxes, scores = detections
-        outcome = pd.DataFrame()
+        outcome = UDFOutputBuilder(["bboxes", "scores"], num_rows=len(frames))
         for frame_boxes, frame_scores in zip(boxes, scores):
             pred_boxes = []
             pred_scores = []
             if frame_boxes is not None and frame_scores is not None:
                 pred_boxes = frame_boxes
                 pred_scores = frame_scores
-            outcome = outcome.append(
-                {"bboxes": pred_boxes, "scores": pred_scores},
-                ignore_index=True,
-            )
+            outcome.add_row(bboxes=pred_boxes, scores=pred_scores)
 
-        return outcome
+        return outcome.build()
@@ -20,6 +20,8 @@ import pandas as pd
 from eva.models.catalog.frame_info import FrameInfo
 from eva.models.catalog.properties import ColorSpace
 from eva.udfs.abstract.pytorch_abstract_udf import PytorchAbstractClassifierUDF
+from eva.udfs.execution_backends import EAGER, QUANTIZED, TORCHSCRIPT
+from eva.udfs.udf_output_builder import UDFOutputBuilder
 
 try:
     from torch import Tensor
@@ -45,6 +47,10 @@ class FastRCNNObjectDetector(PytorchAbstractClassifierUDF):
 
     """
 
+    # the detections are a list of dicts of tensors per frame, which the
+    # TorchScript backends return as is but ONNX Runtime flattens
+    supported_backends = (EAGER, TORCHSCRIPT, QUANTIZED)
+
     @property
     def name(self) -> str:
         return "fastrcnn"
@@ -170,7 +176,9 @@ class FastRCNNObjectDetector(PytorchAbstractClassifierUDF):
 
         """
         predictions = self.model(frames)
-        outcome = pd.DataFrame()
+        outcome = UDFOutputBuilder(
+            ["labels", "scores", "bboxes"], num_rows=len(predictions)
+        )
         for prediction in predictions:
             pred_class = [
                 str(self.labels[i]) for i in list(self.as_numpy(prediction["labels"]))
@@ -190,8 +198,5 @@ class FastRCNNObjectDetector(PytorchAbstractClassifierUDF):
             pred_boxes = np.array(pred_boxes[: pred_t + 1])
             pred_class = np.array(pred_class[: pred_t + 1])
             pred_score = np.array(pred_score[: pred_t + 1])
-            outcome = outcome.append(
-                {"labels": pred_class, "scores": pred_score, "bboxes": pred_boxes},
-                ignore_index=True,
-            )
-        return outcome
+            outcome.add_row(labels=pred_class, scores=pred_score, bboxes=pred_boxes)
+        return outcome.build()
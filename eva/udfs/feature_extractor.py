@@ -21,6 +21,7 @@ from torch import Tensor
 from torchvision import models
 
 from eva.udfs.abstract.pytorch_abstract_udf import PytorchAbstractClassifierUDF
+from eva.udfs.udf_output_builder import UDFOutputBuilder
 
 
 class FeatureExtractor(PytorchAbstractClassifierUDF):
@@ -51,11 +52,10 @@ class FeatureExtractor(PytorchAbstractClassifierUDF):
         Returns:
             features (List[float])
         """
-        outcome = pd.DataFrame()
-        for f in frames:
-            with torch.no_grad():
-                outcome = outcome.append(
-                    {"features": self.as_numpy(self.model(torch.unsqueeze(f, 0)))},
-                    ignore_index=True,
-                )
-        return outcome
+        with torch.no_grad():
+            features = self.as_numpy(self.model(frames))
+        outcome = UDFOutputBuilder(["features"], num_rows=len(features))
+        for idx in range(len(features)):
+            # keep the 1 x N shape of the features of a single frame
+            outcome.add_row(features=features[idx : idx + 1])
+        return outcome.build()
@@ -21,6 +21,7 @@ import pandas as pd
 
 from eva.udfs.abstract.abstract_udf import AbstractClassifierUDF
 from eva.udfs.gpu_compatible import GPUCompatible
+from eva.udfs.udf_output_builder import UDFOutputBuilder
 
 
 class OCRExtractor(AbstractClassifierUDF, GPUCompatible):
@@ -71,7 +72,9 @@ class OCRExtractor(AbstractClassifierUDF, GPUCompatible):
         # Get detections
         detections_in_frames = self.model.readtext_batched(np.vstack(frames))
 
-        outcome = pd.DataFrame()
+        outcome = UDFOutputBuilder(
+            ["labels", "bboxes", "scores"], num_rows=frames.shape[0]
+        )
 
         for i in range(0, frames.shape[0]):
             labels = []
@@ -82,13 +85,6 @@ class OCRExtractor(AbstractClassifierUDF, GPUCompatible):
                 bboxes.append(detection[0])
                 scores.append(detection[2])
 
-            outcome = outcome.append(
-                {
-                    "labels": list(labels),
-                    "bboxes": list(bboxes),
-                    "scores": list(scores),
-                },
-                ignore_index=True,
-            )
+            outcome.add_row(labels=labels, bboxes=bboxes, scores=scores)
 
-        return outcome
+        return outcome.build()
@@ -22,6 +22,7 @@ import pandas as pd
 from eva.models.catalog.frame_info import FrameInfo
 from eva.models.catalog.properties import ColorSpace
 from eva.udfs.abstract.pytorch_abstract_udf import PytorchAbstractClassifierUDF
+from eva.udfs.udf_output_builder import UDFOutputBuilder
 
 try:
     import torch
@@ -49,10 +50,7 @@ class SSDObjectDetector(PytorchAbstractClassifierUDF):
 
     def setup(self, threshold=0.5):
         self.threshold = threshold
-        self.transforms = [
-            transforms.Resize([300, 300]),
-            transforms.ToTensor(),
-        ]
+        self.batch_transforms = [transforms.Resize([300, 300], antialias=True)]
 
         # load ssd from pytorch hub api and default to cpu
         self.model = torch.hub.load(
@@ -160,7 +158,8 @@ class SSDObjectDetector(PytorchAbstractClassifierUDF):
 
     @property
     def input_format(self) -> FrameInfo:
-        return FrameInfo(-1, -1, 3, ColorSpace.RGB)
+        # the boxes are relative to the 300 x 300 input of the model
+        return FrameInfo(300, 300, 3, ColorSpace.RGB)
 
     def forward(self, frames: Tensor) -> pd.DataFrame:
         assert frames.size()[-1] == frames.size()[-2] == 300
@@ -172,7 +171,9 @@ class SSDObjectDetector(PytorchAbstractClassifierUDF):
         ploc, plabel = [val.float() for val in prediction]
         encoded = encoder.decode_batch(ploc, plabel, criteria=0.5)
 
-        res = pd.DataFrame()
+        res = UDFOutputBuilder(
+            ["label", "pred_score", "pred_boxes"], num_rows=len(encoded)
+        )
 
         for batch in encoded:
             bboxes, classes, confidences = [x.detach().cpu().numpy() for x in batch]
@@ -180,9 +181,7 @@ class SSDObjectDetector(PytorchAbstractClassifierUDF):
 
             # deal with empty detection
             if len(best.shape) == 0:
-                res = res.append(
-                    {"label": [], "pred_score": [], "pred_boxes": []}, ignore_index=True
-                )
+                res.add_row(label=[], pred_score=[], pred_boxes=[])
                 continue
 
             label, bbox, conf = [], [], []
@@ -193,12 +192,9 @@ class SSDObjectDetector(PytorchAbstractClassifierUDF):
                 bbox.append([x, y, w, h])
                 conf.append(confidences[idx])
 
-            res = res.append(
-                {"label": label, "pred_score": conf, "pred_boxes": bbox},
-                ignore_index=True,
-            )
+            res.add_row(label=label, pred_score=conf, pred_boxes=bbox)
 
-        return res
+        return res.build()
 
     def classify(self, frames: Tensor) -> pd.DataFrame:
         return self._get_predictions(frames)
@@ -0,0 +1,76 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Any, Dict, List
+
+import pandas as pd
+
+
+class UDFOutputBuilder:
+    """
+    Builds the output DataFrame of a UDF. Values are collected per column and
+    the DataFrame is materialized once in `build`, instead of growing it
+    with `DataFrame.append` per frame, which copies the whole frame every
+    time.
+
+    Every cell holds the value as is, so per-frame arrays or lists (e.g., the
+    boxes detected in a frame) are kept as a single object.
+
+    Arguments:
+        columns (List[str]): output columns, in order
+        num_rows (int, optional): expected number of rows, used to
+            pre-allocate the columns
+
+    Example:
+        builder = UDFOutputBuilder(["labels", "scores"], num_rows=len(frames))
+        for prediction in predictions:
+            builder.add_row(labels=..., scores=...)
+        return builder.build()
+    """
+
+    def __init__(self, columns: List[str], num_rows: int = None):
+        self._columns = list(columns)
+        self._num_rows = 0
+        self._values: Dict[str, List[Any]] = {
+            column: [None] * (num_rows or 0) for column in self._columns
+        }
+
+    def __len__(self):
+        return self._num_rows
+
+    def add_row(self, **values):
+        """Adds a row; every output column must be given a value"""
+        if set(values) != set(self._columns):
+            raise ValueError(
+                "Expected values for columns {}, got {}".format(
+                    self._columns, list(values)
+                )
+            )
+        for column, value in values.items():
+            column_values = self._values[column]
+            if self._num_rows < len(column_values):
+                column_values[self._num_rows] = value
+            else:
+                column_values.append(value)
+        self._num_rows += 1
+
+    def build(self) -> pd.DataFrame:
+        """Materializes the rows added so far into a DataFrame"""
+        return pd.DataFrame(
+            {
+                column: self._values[column][: self._num_rows]
+                for column in self._columns
+            },
+            columns=self._columns,
+        )
@@ -12,13 +12,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import glob
 import hashlib
 import importlib
 import sys
 import uuid
 from pathlib import Path
+from typing import List
 
 from eva.configuration.configuration_manager import ConfigurationManager
+from eva.constants import UDF_PROCESS_MODE, UDF_THREAD_MODE
 from eva.utils.logging_manager import logger
 
 
@@ -70,6 +73,35 @@ def path_to_class(filepath: str, classname: str):
     return classobj
 
 
+def configure_udf(udf, options: dict):
+    """
+    Apply the options given in the WITH clause of CREATE UDF to a UDF object
+
+    Arguments:
+        udf: the UDF object
+        options: the options of the UDF, e.g., its execution backend or mode
+    """
+    for key, value in options.items():
+        if key == "backend":
+            if not hasattr(udf, "set_backend"):
+                raise RuntimeError(
+                    f"{type(udf).__name__} does not support execution backends"
+                )
+            udf.set_backend(value)
+        elif key == "mode":
+            # applied by the FunctionExpression of the UDF
+            if value not in (UDF_THREAD_MODE, UDF_PROCESS_MODE):
+                raise RuntimeError(
+                    f"Unknown UDF mode {value}, expected {UDF_THREAD_MODE} "
+                    f"or {UDF_PROCESS_MODE}"
+                )
+        elif key == "workers":
+            if not isinstance(value, int) or value < 1:
+                raise RuntimeError(f"Invalid number of UDF workers {value}")
+        else:
+            raise RuntimeError(f"Unknown UDF option {key}")
+
+
 def is_gpu_available() -> bool:
     """
     Checks if the system has GPUS available to execute tasks
@@ -109,6 +141,29 @@ def generate_file_path(name: str = "") -> Path:
     return path.resolve()
 
 
+def find_files(file_path: str, search_dir: str) -> List[Path]:
+    """Finds the files at file_path, relative to the working directory or
+    else to search_dir
+
+    Arguments:
+        file_path (str): path of a file, or glob pattern of files
+        search_dir (str): directory the path is searched in if not found
+
+    Returns:
+        List[Path]: the sorted paths of the files, empty if none is found
+    """
+    for path in (Path(file_path), Path(search_dir) / file_path):
+        if glob.has_magic(str(path)):
+            file_paths = sorted(
+                Path(match) for match in glob.glob(str(path)) if Path(match).is_file()
+            )
+            if file_paths:
+                return file_paths
+        elif path.exists():
+            return [path]
+    return []
+
+
 def get_size(obj, seen=None):
     """Recursively finds size of objects
     https://goshippo.com/blog/measure-real-size-any-python-object/
@@ -46,6 +46,7 @@ minimal_requirement = [
     "sqlalchemy-utils==0.36.6",
     "pyspark==3.1.3",
     "petastorm==0.12.0",
+    "pyarrow>=9.0.0",
     "antlr4-python3-runtime==4.10",
     "pyyaml==5.1",
     "importlib-metadata<5.0",
@@ -0,0 +1,66 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+
+from eva.catalog.models.base_model import upgrade_db
+from eva.catalog.models.udf import UdfMetadata
+from eva.catalog.models.udf_io import UdfIO  # noqa: F401
+
+# udf table of a catalog created before udf.options was added
+OLD_UDF_TABLE = """CREATE TABLE udf (
+    id INTEGER NOT NULL,
+    name VARCHAR(100),
+    impl_file_path VARCHAR(128),
+    type VARCHAR(100),
+    PRIMARY KEY (id),
+    UNIQUE (name)
+)"""
+
+
+class BaseModelTest(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.db_path = os.path.join(tmp_dir.name, "eva_catalog.db")
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(OLD_UDF_TABLE)
+            conn.execute(
+                "INSERT INTO udf (name, impl_file_path, type) "
+                "VALUES ('FastRCNN', 'fastrcnn.py', 'Classification')"
+            )
+        self.engine = create_engine(f"sqlite:///{self.db_path}")
+        self.addCleanup(self.engine.dispose)
+
+    def test_should_add_missing_columns_to_old_catalog(self):
+        upgrade_db(self.engine)
+        columns = [col["name"] for col in inspect(self.engine).get_columns("udf")]
+        self.assertIn("options", columns)
+
+        session = sessionmaker(bind=self.engine)()
+        self.addCleanup(session.close)
+        udf = session.query(UdfMetadata).filter(UdfMetadata._name == "FastRCNN").one()
+        self.assertEqual(udf.impl_file_path, "fastrcnn.py")
+        self.assertEqual(udf.options, {})
+
+        # upgrading an up to date catalog is a no-op
+        upgrade_db(self.engine)
+        columns = [col["name"] for col in inspect(self.engine).get_columns("udf")]
+        self.assertEqual(columns.count("options"), 1)
@@ -30,7 +30,7 @@ class UdfServiceTest(TestCase):
     def test_create_udf_should_create_model(self, mocked):
         service = UdfService()
         service.create_udf(UDF_NAME, UDF_IMPL_PATH, UDF_TYPE)
-        mocked.assert_called_with(UDF_NAME, UDF_IMPL_PATH, UDF_TYPE)
+        mocked.assert_called_with(UDF_NAME, UDF_IMPL_PATH, UDF_TYPE, None)
         mocked.return_value.save.assert_called_once()
 
     @patch("eva.catalog.services.udf_service.UdfMetadata")
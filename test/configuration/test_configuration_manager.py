@@ -45,3 +45,12 @@ class ConfigurationManagerTests(unittest.TestCase):
 
         # reset value after updating
         self.config.update_value("core", "mode", value)
+
+    def test_configuration_manager_read_missing_key_with_default(self):
+        self.assertEqual(self.config.get_value("core", "invalid", 1), 1)
+        self.assertIsNone(self.config.get_value("invalid", "", None))
+        # the default is only returned for missing keys
+        self.assertEqual(
+            self.config.get_value("core", "mode", "invalid"),
+            self.config.get_value("core", "mode"),
+        )
@@ -40,11 +40,12 @@ class CreateUdfExecutorTest(unittest.TestCase):
                 "outputs": ["out"],
                 "impl_path": impl_path,
                 "udf_type": "classification",
+                "udf_options": {},
             },
         )
 
         create_udf_executor = CreateUDFExecutor(plan)
         next(create_udf_executor.exec())
         catalog_instance.create_udf.assert_called_with(
-            "udf", "test.py", "classification", ["inp", "out"]
+            "udf", "test.py", "classification", ["inp", "out"], {}
         )
@@ -0,0 +1,96 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import unittest
+from test.executor.utils import DummyExecutor
+
+import numpy as np
+import pandas as pd
+
+from eva.executor.exchange_executor import ExchangeExecutor
+from eva.executor.limit_executor import LimitExecutor
+from eva.expression.constant_value_expression import ConstantValueExpression
+from eva.models.storage.batch import Batch
+from eva.planner.exchange_plan import ExchangePlan
+from eva.planner.limit_plan import LimitPlan
+
+
+class FailingExecutor:
+    def __init__(self, batch: Batch):
+        self.batch = batch
+
+    def exec(self):
+        yield self.batch
+        raise ValueError("storage failure")
+
+
+class ThreadRecordingExecutor:
+    def __init__(self, batches):
+        self.batches = batches
+        self.exec_thread = None
+
+    def exec(self):
+        # e.g., loading the catalog metadata of the table
+        self.exec_thread = threading.current_thread()
+        return iter(self.batches)
+
+
+class ExchangeExecutorTest(unittest.TestCase):
+    def _batches(self, num_batches):
+        return [
+            Batch(pd.DataFrame({"A": np.arange(i * 10, (i + 1) * 10)}))
+            for i in range(num_batches)
+        ]
+
+    def test_should_return_all_batches_in_order(self):
+        batches = self._batches(5)
+        exchange_executor = ExchangeExecutor(ExchangePlan(queue_size=2))
+        exchange_executor.append_child(DummyExecutor(batches))
+
+        self.assertEqual(list(exchange_executor.exec()), batches)
+
+    def test_should_create_child_iterator_in_calling_thread(self):
+        batches = self._batches(3)
+        child = ThreadRecordingExecutor(batches)
+        exchange_executor = ExchangeExecutor(ExchangePlan(queue_size=1))
+        exchange_executor.append_child(child)
+
+        self.assertEqual(list(exchange_executor.exec()), batches)
+        self.assertIs(child.exec_thread, threading.current_thread())
+
+    def test_should_raise_child_exception_in_consumer(self):
+        batch = self._batches(1)[0]
+        exchange_executor = ExchangeExecutor(ExchangePlan(queue_size=1))
+        exchange_executor.append_child(FailingExecutor(batch))
+
+        output = exchange_executor.exec()
+        self.assertEqual(next(output), batch)
+        with self.assertRaises(ValueError):
+            next(output)
+
+    def test_should_stop_producer_on_early_termination(self):
+        batches = self._batches(100)
+        exchange_executor = ExchangeExecutor(ExchangePlan(queue_size=1))
+        exchange_executor.append_child(DummyExecutor(batches))
+        limit_executor = LimitExecutor(LimitPlan(ConstantValueExpression(15)))
+        limit_executor.append_child(exchange_executor)
+
+        output = list(limit_executor.exec())
+        self.assertEqual(sum(len(batch) for batch in output), 15)
+
+        producers = [t for t in threading.enumerate() if t.name == "eva-exchange"]
+        for producer in producers:
+            producer.join(timeout=5)
+            self.assertFalse(producer.is_alive())
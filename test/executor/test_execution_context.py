@@ -13,8 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import unittest
+from test.util import missing_config_keys
 
-from mock import patch
+from mock import Mock, patch
 
 from eva.constants import NO_GPU
 from eva.executor.execution_context import Context
@@ -141,3 +142,61 @@ class ExecutionContextTest(unittest.TestCase):
 
         random.choice.assert_called_with(context.gpus)
         self.assertEqual(selected_device, "2")
+
+    @patch("eva.executor.execution_context.ConfigurationManager")
+    @patch("eva.executor.execution_context.is_gpu_available")
+    @patch("eva.executor.execution_context.UDFProcessPool")
+    @patch.dict(Context._process_pools, clear=True)
+    def test_should_share_process_pools_by_udf_class_and_options(
+        self, pool, gpu_check, cfm
+    ):
+        gpu_check.return_value = False
+        cfm.return_value.get_value.return_value = 2
+        pool.side_effect = lambda udf, num_workers: Mock(num_workers=num_workers)
+        context = Context()
+        udf = Mock()
+
+        default_pool = context.process_pool(udf, {"mode": "process"})
+        self.assertIs(context.process_pool(udf, {"mode": "process"}), default_pool)
+        self.assertEqual(default_pool.num_workers, 2)
+
+        options = {"mode": "process", "workers": 4}
+        other_pool = context.process_pool(udf, options)
+        self.assertIsNot(other_pool, default_pool)
+        self.assertEqual(other_pool.num_workers, 4)
+
+    @patch("eva.executor.execution_context.is_gpu_available")
+    @patch("eva.executor.execution_context.UDFProcessPool")
+    @patch.dict(Context._process_pools, clear=True)
+    @patch.object(Context, "_thread_pool", None)
+    def test_should_default_pool_sizes_missing_in_config(self, pool, gpu_check):
+        gpu_check.return_value = False
+        pool.side_effect = lambda udf, num_workers: Mock(num_workers=num_workers)
+        with missing_config_keys(
+            ("executor", "expression_threads"),
+            ("executor", "cpu_replicas"),
+            ("executor", "udf_workers"),
+        ):
+            context = Context()
+            thread_pool = context.thread_pool
+            self.addCleanup(thread_pool.shutdown)
+            self.assertEqual(thread_pool._max_workers, 4)
+            self.assertIsNone(context.replica_pool(Mock()))
+            self.assertEqual(context.process_pool(Mock()).num_workers, 2)
+
+    @patch("eva.executor.execution_context.ConfigurationManager")
+    @patch("eva.executor.execution_context.is_gpu_available")
+    @patch("eva.executor.execution_context.ReplicaPool")
+    @patch.dict(Context._replica_pools, clear=True)
+    def test_should_share_replica_pools_by_udf_class_and_options(
+        self, pool, gpu_check, cfm
+    ):
+        gpu_check.return_value = False
+        cfm.return_value.get_value.return_value = 2
+        pool.side_effect = lambda udf, num_replicas: Mock()
+        context = Context()
+        udf = Mock()
+
+        cpu_pool = context.replica_pool(udf, {"backend": "cpu"})
+        self.assertIs(context.replica_pool(udf, {"backend": "cpu"}), cpu_pool)
+        self.assertIsNot(context.replica_pool(udf, {"backend": "onnx"}), cpu_pool)
@@ -0,0 +1,74 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import unittest
+
+import pandas as pd
+
+from eva.executor.executor_utils import apply_predicate, apply_project
+from eva.expression.abstract_expression import ExpressionType
+from eva.expression.comparison_expression import ComparisonExpression
+from eva.expression.constant_value_expression import ConstantValueExpression
+from eva.expression.function_expression import FunctionExpression
+from eva.expression.logical_expression import LogicalExpression
+from eva.expression.tuple_value_expression import TupleValueExpression
+from eva.models.storage.batch import Batch
+from eva.parser.alias import Alias
+
+
+class ExecutorUtilsTest(unittest.TestCase):
+    def setUp(self):
+        self.batch = Batch(pd.DataFrame({"T.id": range(6)}))
+        # fails unless both UDFs are running at the same time
+        self.barrier = threading.Barrier(2, timeout=10)
+
+    def _func_expr(self, name, func):
+        def udf(frames):
+            self.barrier.wait()
+            return pd.DataFrame({"out": frames["T.id"].apply(func)})
+
+        func_expr = FunctionExpression(udf, name=name, alias=Alias(name, ["out"]))
+        func_expr.projection_columns = ["out"]
+        func_expr.append_child(TupleValueExpression(col_name="id", col_alias="T.id"))
+        return func_expr
+
+    def test_should_evaluate_udfs_of_projection_concurrently(self):
+        project_list = [
+            self._func_expr("double", lambda x: 2 * x),
+            TupleValueExpression(col_name="id", col_alias="T.id"),
+            self._func_expr("square", lambda x: x * x),
+        ]
+        batch = apply_project(self.batch, project_list)
+        self.assertEqual(list(batch.columns), ["double.out", "T.id", "square.out"])
+        self.assertEqual(batch.frames["double.out"].tolist(), [0, 2, 4, 6, 8, 10])
+        self.assertEqual(batch.frames["square.out"].tolist(), [0, 1, 4, 9, 16, 25])
+
+    def test_should_evaluate_udfs_of_predicate_concurrently(self):
+        def greater(left, value):
+            return ComparisonExpression(
+                ExpressionType.COMPARE_GREATER, left, ConstantValueExpression(value)
+            )
+
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            LogicalExpression(
+                ExpressionType.LOGICAL_AND,
+                greater(self._func_expr("double", lambda x: 2 * x), 2),
+                greater(TupleValueExpression(col_alias="T.id"), 0),
+            ),
+            greater(self._func_expr("square", lambda x: x * x), 10),
+        )
+        batch = apply_predicate(self.batch, predicate)
+        self.assertEqual(batch.frames["T.id"].tolist(), [4, 5])
@@ -0,0 +1,120 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import multiprocessing
+import os
+import time
+import unittest
+from test.executor.utils import DummyExecutor
+
+import numpy as np
+import pandas as pd
+
+from eva.executor.gather_executor import GatherExecutor
+from eva.executor.limit_executor import LimitExecutor
+from eva.expression.constant_value_expression import ConstantValueExpression
+from eva.models.storage.batch import Batch
+from eva.planner.gather_plan import GatherPlan
+from eva.planner.limit_plan import LimitPlan
+
+
+class PidExecutor:
+    def __init__(self, num_batches: int):
+        self.num_batches = num_batches
+
+    def exec(self):
+        for _ in range(self.num_batches):
+            yield Batch(pd.DataFrame({"pid": [os.getpid()]}))
+
+
+class CountingExecutor:
+    def __init__(self, num_batches: int, counter):
+        self.num_batches = num_batches
+        self.counter = counter
+
+    def exec(self):
+        for i in range(self.num_batches):
+            with self.counter.get_lock():
+                self.counter.value += 1
+            yield Batch(pd.DataFrame({"A": [i]}))
+
+
+class FailingExecutor:
+    def exec(self):
+        yield Batch(pd.DataFrame({"A": [1]}))
+        raise ValueError("partition failure")
+
+
+class GatherExecutorTest(unittest.TestCase):
+    def _partitions(self, num_partitions, num_batches):
+        return [
+            [
+                Batch(pd.DataFrame({"A": np.arange(10) + 10 * (i * num_batches + j)}))
+                for j in range(num_batches)
+            ]
+            for i in range(num_partitions)
+        ]
+
+    def test_should_return_batches_in_partition_order(self):
+        partitions = self._partitions(3, 4)
+        gather_executor = GatherExecutor(GatherPlan(3))
+        for batches in partitions:
+            gather_executor.append_child(DummyExecutor(batches))
+
+        output = list(gather_executor.exec())
+        expected = [batch for batches in partitions for batch in batches]
+        self.assertEqual(output, expected)
+
+    def test_should_execute_partitions_in_worker_processes(self):
+        gather_executor = GatherExecutor(GatherPlan(2))
+        gather_executor.append_child(PidExecutor(2))
+        gather_executor.append_child(PidExecutor(2))
+
+        pids = Batch.concat(list(gather_executor.exec())).frames["pid"]
+        self.assertEqual(len(pids), 4)
+        self.assertEqual(pids.nunique(), 2)
+        self.assertNotIn(os.getpid(), set(pids))
+
+    def test_should_raise_partition_exception_in_consumer(self):
+        gather_executor = GatherExecutor(GatherPlan(2))
+        gather_executor.append_child(DummyExecutor(self._partitions(1, 1)[0]))
+        gather_executor.append_child(FailingExecutor())
+
+        with self.assertRaises(RuntimeError):
+            list(gather_executor.exec())
+
+    def test_should_stop_workers_on_early_termination(self):
+        partitions = self._partitions(2, 50)
+        gather_executor = GatherExecutor(GatherPlan(2))
+        for batches in partitions:
+            gather_executor.append_child(DummyExecutor(batches))
+        limit_executor = LimitExecutor(LimitPlan(ConstantValueExpression(15)))
+        limit_executor.append_child(gather_executor)
+
+        output = Batch.concat(list(limit_executor.exec()))
+        self.assertEqual(list(output.frames["A"]), list(range(15)))
+
+    def test_should_bound_batches_computed_ahead_of_consumer(self):
+        counter = multiprocessing.get_context("fork").Value("i", 0)
+        gather_executor = GatherExecutor(GatherPlan(2, queue_size=2))
+        gather_executor.append_child(DummyExecutor(self._partitions(1, 1)[0]))
+        gather_executor.append_child(CountingExecutor(50, counter))
+
+        output = gather_executor.exec()
+        next(output)
+        time.sleep(1)
+        # the batches in the queue, and the one blocked putting it
+        self.assertLessEqual(counter.value, 2 + 2)
+        self.assertEqual(len(list(output)), 50)
+        self.assertEqual(counter.value, 50)
@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import threading
 import unittest
 from pathlib import Path
 from test.util import create_sample_csv, file_remove
@@ -20,17 +21,25 @@ import pandas as pd
 from mock import call, patch
 
 from eva.configuration.configuration_manager import ConfigurationManager
+from eva.executor.load_csv_executor import LoadCSVExecutor
 from eva.executor.load_executor import LoadDataExecutor
 from eva.expression.tuple_value_expression import TupleValueExpression
 from eva.models.storage.batch import Batch
 from eva.parser.types import FileFormatType
+from eva.readers.opencv_reader import VideoProperties
+from eva.storage.opencv_storage_engine import COPY
+
+VIDEO_PROPERTIES = VideoProperties(
+    num_frames=10, fps=25.0, width=2, height=2, codec="MJPG"
+)
 
 
 class LoadExecutorTest(unittest.TestCase):
+    @patch("eva.executor.load_video_executor.probe_video")
     @patch("eva.executor.load_video_executor.VideoStorageEngine.create")
     @patch("eva.executor.load_video_executor.VideoStorageEngine.write")
     def test_should_call_opencv_reader_and_storage_engine(
-        self, write_mock, create_mock
+        self, write_mock, create_mock, probe_mock
     ):
         file_path = "video"
         table_metainfo = "info"
@@ -49,21 +58,31 @@ class LoadExecutorTest(unittest.TestCase):
         )
 
         load_executor = LoadDataExecutor(plan)
+        probe_mock.return_value = VIDEO_PROPERTIES
         with patch.object(Path, "exists") as mock_exists:
             mock_exists.return_value = True
             batch = next(load_executor.exec())
             create_mock.assert_called_once_with(table_metainfo, if_not_exists=True)
             write_mock.assert_called_once_with(
-                table_metainfo, Batch(pd.DataFrame([{"video_file_path": file_path}]))
+                table_metainfo,
+                Batch(
+                    pd.DataFrame(
+                        [{"video_file_path": file_path, **VIDEO_PROPERTIES._asdict()}]
+                    )
+                ),
+                link_mode=COPY,
             )
             expected = Batch(
                 pd.DataFrame([{f"Video successfully added at location: {file_path}"}])
             )
             self.assertEqual(batch, expected)
 
+    @patch("eva.executor.load_video_executor.probe_video")
     @patch("eva.executor.load_video_executor.VideoStorageEngine.create")
     @patch("eva.executor.load_video_executor.VideoStorageEngine.write")
-    def test_should_search_in_upload_directory(self, write_mock, create_mock):
+    def test_should_search_in_upload_directory(
+        self, write_mock, create_mock, probe_mock
+    ):
         self.upload_path = Path(
             ConfigurationManager().get_value("storage", "upload_dir")
         )
@@ -84,6 +103,7 @@ class LoadExecutorTest(unittest.TestCase):
         )
 
         load_executor = LoadDataExecutor(plan)
+        probe_mock.return_value = VIDEO_PROPERTIES
         with patch.object(Path, "exists") as mock_exists:
             mock_exists.side_effect = [False, True]
             batch = next(load_executor.exec())
@@ -91,7 +111,17 @@ class LoadExecutorTest(unittest.TestCase):
             create_mock.assert_called_once_with(table_metainfo, if_not_exists=True)
             write_mock.assert_called_once_with(
                 table_metainfo,
-                Batch(pd.DataFrame([{"video_file_path": str(location)}])),
+                Batch(
+                    pd.DataFrame(
+                        [
+                            {
+                                "video_file_path": str(location),
+                                **VIDEO_PROPERTIES._asdict(),
+                            }
+                        ]
+                    )
+                ),
+                link_mode=COPY,
             )
             expected = Batch(
                 pd.DataFrame([{f"Video successfully added at location: {location}"}])
@@ -169,3 +199,50 @@ class LoadExecutorTest(unittest.TestCase):
 
         # remove the dummy.csv
         file_remove("dummy.csv")
+
+    @patch("eva.executor.load_csv_executor.CSVReader")
+    def test_should_not_read_remaining_files_once_stopped(self, reader_mock):
+        released = threading.Event()
+
+        def read():
+            yield Batch(pd.DataFrame({"id": [1]}))
+            released.wait(timeout=5)
+            yield Batch(pd.DataFrame({"id": [2]}))
+
+        reader_mock.return_value.read.side_effect = read
+        plan = type(
+            "LoadDataPlan",
+            (),
+            {"file_path": "dummy*.csv", "column_list": None, "batch_mem_size": 3000},
+        )
+        load_executor = LoadCSVExecutor(plan)
+        load_executor.load_threads = 1
+
+        batches = load_executor._read_files(["a.csv", "b.csv", "c.csv"])
+        self.assertEqual(list(next(batches).frames["id"]), [1])
+        # stop the load while the first file is being read
+        threading.Timer(0.1, released.set).start()
+        batches.close()
+        self.assertEqual(reader_mock.call_count, 1)
+
+    def test_should_find_csv_files_in_working_and_upload_directory(self):
+        upload_dir = Path(ConfigurationManager().get_value("storage", "upload_dir"))
+        plan = type(
+            "LoadDataPlan",
+            (),
+            {"file_path": "dummy.csv", "column_list": None, "batch_mem_size": 3000},
+        )
+        load_executor = LoadCSVExecutor(plan)
+        with patch.object(Path, "exists") as mock_exists:
+            mock_exists.side_effect = [True]
+            self.assertEqual(load_executor._file_paths(), ["dummy.csv"])
+        with patch.object(Path, "exists") as mock_exists:
+            mock_exists.side_effect = [False, True]
+            self.assertEqual(
+                load_executor._file_paths(), [str(upload_dir / "dummy.csv")]
+            )
+        with patch.object(Path, "exists") as mock_exists:
+            mock_exists.side_effect = [False, False]
+            with self.assertRaises(RuntimeError) as context:
+                load_executor._file_paths()
+            self.assertIn("No CSV file matches dummy.csv", str(context.exception))
@@ -0,0 +1,86 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import unittest
+from test.executor.utils import DummyExecutor
+from test.util import (
+    FRAME_SIZE,
+    NUM_FRAMES,
+    create_sample_video,
+    file_remove,
+    upload_dir_from_config,
+)
+from typing import List
+
+import numpy as np
+
+from eva.executor.materialize_executor import MaterializeExecutor
+from eva.models.storage.batch import Batch
+from eva.planner.materialize_plan import MaterializePlan
+from eva.readers.opencv_reader import OpenCVReader
+
+
+class MaterializeExecutorTest(unittest.TestCase):
+    def setUp(self):
+        create_sample_video()
+        self.video_file = os.path.join(upload_dir_from_config, "dummy.avi")
+
+    def tearDown(self):
+        file_remove("dummy.avi")
+
+    def _references(self, **kwargs):
+        reader = OpenCVReader(
+            file_url=self.video_file,
+            batch_mem_size=FRAME_SIZE * NUM_FRAMES,
+            lazy_frames=True,
+            **kwargs
+        )
+        return list(reader.read())
+
+    def _assert_frames(self, batch: Batch, frame_ids: List[int]):
+        self.assertEqual(list(batch.frames["id"]), frame_ids)
+        for frame_id, frame in zip(frame_ids, batch.frames["data"]):
+            expected = np.ones((2, 2, 3)) * float(frame_id + 1) * 25
+            self.assertTrue(np.array_equal(frame, expected.astype(np.uint8)))
+
+    def test_should_decode_referenced_frames(self):
+        materialize_executor = MaterializeExecutor(MaterializePlan())
+        materialize_executor.append_child(DummyExecutor(self._references()))
+
+        actual = Batch.concat(list(materialize_executor.exec()))
+        self._assert_frames(actual, list(range(NUM_FRAMES)))
+
+    def test_should_decode_frames_of_surviving_rows(self):
+        batches = self._references()
+        for batch in batches:
+            batch.filter(batch.frames["id"].to_numpy() % 3 == 0)
+        # reversed order, as after an ORDER BY id DESC
+        batch = Batch.concat(batches)
+        batch.reverse()
+        materialize_executor = MaterializeExecutor(MaterializePlan())
+        materialize_executor.append_child(DummyExecutor([batch]))
+
+        actual = Batch.concat(list(materialize_executor.exec()))
+        self._assert_frames(actual, list(range(0, NUM_FRAMES, 3))[::-1])
+
+    def test_should_drop_rows_past_end_of_video(self):
+        batch = Batch.concat(self._references())
+        file_remove("dummy.avi")
+        create_sample_video(NUM_FRAMES // 2)
+        materialize_executor = MaterializeExecutor(MaterializePlan())
+        materialize_executor.append_child(DummyExecutor([batch]))
+
+        actual = Batch.concat(list(materialize_executor.exec()))
+        self._assert_frames(actual, list(range(NUM_FRAMES // 2)))
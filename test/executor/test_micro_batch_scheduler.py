@@ -0,0 +1,144 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+import numpy as np
+import pandas as pd
+from mock import patch
+
+from eva.executor.micro_batch_scheduler import BatchSizeTuner, MicroBatchScheduler
+from eva.expression.abstract_expression import AbstractExpression, ExpressionType
+from eva.expression.function_expression import FunctionExpression
+from eva.expression.tuple_value_expression import TupleValueExpression
+from eva.models.storage.batch import Batch
+
+
+class CountExpression(AbstractExpression):
+    def __init__(self, child):
+        super().__init__(ExpressionType.AGGREGATION_COUNT, children=[child])
+
+    def evaluate(self, batch, **kwargs):
+        return Batch(pd.DataFrame({"count": [len(batch)]}))
+
+
+class BatchSizeTunerTest(unittest.TestCase):
+    def _profile(self, tuner, rows_per_sec):
+        for _ in range(BatchSizeTuner._NUM_SAMPLES):
+            tuner.record(tuner.batch_size, tuner.batch_size / rows_per_sec)
+
+    def test_should_double_batch_size_while_throughput_improves(self):
+        tuner = BatchSizeTuner(max_batch_size=64)
+        self.assertEqual(tuner.batch_size, 8)
+        self._profile(tuner, 100)
+        self.assertEqual(tuner.batch_size, 16)
+        self._profile(tuner, 200)
+        self.assertEqual(tuner.batch_size, 32)
+        # no significant gain, go back to the best batch size
+        self._profile(tuner, 205)
+        self.assertEqual(tuner.batch_size, 16)
+        self.assertTrue(tuner.converged)
+        self.assertEqual(sorted(tuner.throughput), [8, 16, 32])
+
+    def test_should_stop_at_max_batch_size(self):
+        tuner = BatchSizeTuner(max_batch_size=12)
+        self._profile(tuner, 100)
+        self.assertEqual(tuner.batch_size, 12)
+        self._profile(tuner, 200)
+        self.assertEqual(tuner.batch_size, 12)
+        self.assertTrue(tuner.converged)
+
+    def test_should_ignore_partial_batches(self):
+        tuner = BatchSizeTuner(max_batch_size=64)
+        for _ in range(10):
+            tuner.record(tuner.batch_size - 1, 1)
+        self.assertEqual(tuner.batch_size, 8)
+        self.assertEqual(tuner.throughput, {})
+
+
+class MicroBatchSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        config = {"micro_batch_deadline": 0.1, "gpu_batch_size": 64}
+        patcher = patch("eva.executor.micro_batch_scheduler.ConfigurationManager")
+        cfm = patcher.start()
+        cfm.return_value.get_value.side_effect = lambda _, key, default=None: config[
+            key
+        ]
+        self.addCleanup(patcher.stop)
+        BatchSizeTuner._tuners.clear()
+
+    def _func_expr(self):
+        func_expr = FunctionExpression(None, name="MicroBatchTestUDF")
+        func_expr.append_child(TupleValueExpression("id"))
+        return func_expr
+
+    def _batches(self, sizes):
+        batches = []
+        start = 0
+        for size in sizes:
+            ids = np.arange(start, start + size)
+            batches.append(Batch(pd.DataFrame({"id": ids})))
+            start += size
+        return batches
+
+    def test_should_evaluate_rows_across_batches_and_scatter_back(self):
+        scheduler = MicroBatchScheduler([self._func_expr()])
+        self.assertTrue(scheduler.enabled)
+
+        evaluated_sizes = []
+
+        def evaluate(batch):
+            evaluated_sizes.append(len(batch))
+            return Batch(pd.DataFrame({"twice": batch.frames["id"] * 2}))
+
+        sizes = [1, 2, 3, 1, 20, 2]
+        batches = self._batches(sizes)
+        outcomes = list(scheduler.schedule(iter(batches), evaluate))
+
+        # rows are accumulated until the initial batch size of 8 is reached
+        # and evaluated in chunks of at most 8 rows
+        self.assertEqual(evaluated_sizes, [8, 8, 8, 3, 2])
+        # one outcome per incoming batch with the matching rows
+        self.assertEqual([len(outcome) for outcome in outcomes], sizes)
+        for batch, outcome in zip(batches, outcomes):
+            self.assertEqual(
+                list(outcome.frames["twice"]), list(batch.frames["id"] * 2)
+            )
+
+    def test_should_evaluate_each_batch_without_udfs(self):
+        scheduler = MicroBatchScheduler([TupleValueExpression("id")])
+        self.assertFalse(scheduler.enabled)
+        batches = self._batches([1, 2])
+        outcomes = list(scheduler.schedule(iter(batches), lambda batch: batch))
+        self.assertEqual(outcomes, batches)
+
+    def test_should_evaluate_each_batch_with_aggregates(self):
+        scheduler = MicroBatchScheduler([CountExpression(self._func_expr())])
+        self.assertFalse(scheduler.enabled)
+
+    def test_should_fall_back_to_each_batch_if_rows_are_not_preserved(self):
+        scheduler = MicroBatchScheduler([self._func_expr()])
+        self.assertTrue(scheduler.enabled)
+
+        def evaluate(batch):
+            # one row per evaluated batch, as an aggregate would return
+            return Batch(pd.DataFrame({"count": [len(batch)]}))
+
+        sizes = [1, 2, 3, 1, 20, 2]
+        outcomes = list(scheduler.schedule(iter(self._batches(sizes)), evaluate))
+        self.assertEqual(
+            [list(outcome.frames["count"]) for outcome in outcomes],
+            [[size] for size in sizes],
+        )
+        self.assertFalse(scheduler.enabled)
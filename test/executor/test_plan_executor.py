@@ -23,6 +23,7 @@ from eva.executor.create_udf_executor import CreateUDFExecutor
 from eva.executor.drop_udf_executor import DropUDFExecutor
 from eva.executor.insert_executor import InsertExecutor
 from eva.executor.load_executor import LoadDataExecutor
+from eva.executor.optimize_table_executor import OptimizeTableExecutor
 from eva.executor.plan_executor import PlanExecutor
 from eva.executor.pp_executor import PPExecutor
 from eva.executor.seq_scan_executor import SequentialScanExecutor
@@ -34,6 +35,7 @@ from eva.planner.drop_plan import DropPlan
 from eva.planner.drop_udf_plan import DropUDFPlan
 from eva.planner.insert_plan import InsertPlan
 from eva.planner.load_data_plan import LoadDataPlan
+from eva.planner.optimize_table_plan import OptimizeTablePlan
 from eva.planner.pp_plan import PPScanPlan
 from eva.planner.rename_plan import RenamePlan
 from eva.planner.seq_scan_plan import SeqScanPlan
@@ -115,6 +117,11 @@ class PlanExecutorTest(unittest.TestCase):
         executor = PlanExecutor(plan)._build_execution_tree(plan)
         self.assertIsInstance(executor, DropUDFExecutor)
 
+        # OptimizeTableExecutor
+        plan = OptimizeTablePlan(MagicMock())
+        executor = PlanExecutor(plan)._build_execution_tree(plan)
+        self.assertIsInstance(executor, OptimizeTableExecutor)
+
         # LoadDataExecutor
         plan = LoadDataPlan(
             MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock()
@@ -0,0 +1,71 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import time
+import unittest
+
+import pandas as pd
+
+from eva.executor.replica_pool import ReplicaPool
+
+
+class PidUDF:
+    def __call__(self, frames: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({"id": frames["id"] * 2, "pid": os.getpid()})
+
+
+class SlowPidUDF(PidUDF):
+    def __call__(self, frames: pd.DataFrame) -> pd.DataFrame:
+        time.sleep(0.2)
+        return super().__call__(frames)
+
+
+class FailingUDF:
+    def __call__(self, frames: pd.DataFrame) -> pd.DataFrame:
+        raise ValueError("inference failure")
+
+
+class ReplicaPoolTest(unittest.TestCase):
+    def test_should_split_frames_across_replicas_in_order(self):
+        pool = ReplicaPool(PidUDF(), num_replicas=2)
+        try:
+            self.assertEqual(pool.num_replicas, 2)
+            outcome = pool(pd.DataFrame({"id": range(10)}))
+            self.assertEqual(list(outcome["id"]), [2 * i for i in range(10)])
+            self.assertEqual(outcome["pid"].nunique(), 2)
+            self.assertNotIn(os.getpid(), set(outcome["pid"]))
+        finally:
+            pool.shutdown()
+
+    def test_should_dispatch_to_least_loaded_replica(self):
+        pool = ReplicaPool(SlowPidUDF(), num_replicas=2)
+        try:
+            frames = pd.DataFrame({"id": [1]})
+            futures = [pool.submit(frames) for _ in range(4)]
+            pids = [future.result()["pid"][0] for future in futures]
+            # requests alternate as the replicas are equally loaded
+            self.assertEqual(pids[0], pids[2])
+            self.assertEqual(pids[1], pids[3])
+            self.assertNotEqual(pids[0], pids[1])
+        finally:
+            pool.shutdown()
+
+    def test_should_raise_replica_exception_in_caller(self):
+        pool = ReplicaPool(FailingUDF(), num_replicas=1)
+        try:
+            with self.assertRaises(RuntimeError):
+                pool(pd.DataFrame({"id": range(3)}))
+        finally:
+            pool.shutdown()
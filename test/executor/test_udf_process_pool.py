@@ -0,0 +1,114 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from eva.executor import udf_process_pool
+from eva.executor.udf_process_pool import UDFProcessPool
+
+
+class BrightnessUDF:
+    def __call__(self, frames: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "inverted": [255 - frame for frame in frames["data"]],
+                "mean": [frame.mean() for frame in frames["data"]],
+                "name": frames["name"],
+                "pid": os.getpid(),
+            }
+        )
+
+
+class CrashingUDF:
+    def __call__(self, frames: pd.DataFrame) -> pd.DataFrame:
+        if (frames["id"] < 0).any():
+            os._exit(3)
+        return pd.DataFrame({"id": frames["id"] + 1})
+
+
+class FailingUDF:
+    def __call__(self, frames: pd.DataFrame) -> pd.DataFrame:
+        raise ValueError("inference failure")
+
+
+def _frames(num_frames):
+    return pd.DataFrame(
+        {
+            "data": [
+                np.full((4, 6, 3), idx, dtype=np.uint8) for idx in range(num_frames)
+            ],
+            "name": [f"frame{idx}" for idx in range(num_frames)],
+        }
+    )
+
+
+class UDFProcessPoolTest(unittest.TestCase):
+    def test_should_pass_frames_through_shared_memory(self):
+        columns, blocks = udf_process_pool._to_shared_memory(_frames(3))
+        try:
+            self.assertIsInstance(columns[0][1], tuple)
+            self.assertEqual(columns[0][1][1], (3, 4, 6, 3))
+            self.assertEqual(columns[1][1], ["frame0", "frame1", "frame2"])
+            frames, attached = udf_process_pool._from_shared_memory(columns, copy=True)
+            udf_process_pool._release(attached, unlink=False)
+            self.assertEqual(frames["data"][2][0, 0, 0], 2)
+            self.assertEqual(list(frames["name"]), ["frame0", "frame1", "frame2"])
+        finally:
+            udf_process_pool._release(blocks, unlink=True)
+
+    def test_should_run_udf_in_worker_processes(self):
+        pool = UDFProcessPool(BrightnessUDF(), num_workers=2)
+        try:
+            self.assertEqual(pool.num_workers, 2)
+            outcome = pool(_frames(6))
+            self.assertEqual(
+                [frame[0, 0, 0] for frame in outcome["inverted"]],
+                [255 - idx for idx in range(6)],
+            )
+            self.assertEqual(list(outcome["mean"]), list(range(6)))
+            self.assertEqual(list(outcome["name"]), list(_frames(6)["name"]))
+            self.assertEqual(outcome["pid"].nunique(), 2)
+            self.assertNotIn(os.getpid(), set(outcome["pid"]))
+        finally:
+            pool.shutdown()
+
+    def test_should_return_results_asynchronously(self):
+        pool = UDFProcessPool(BrightnessUDF(), num_workers=1)
+        try:
+            futures = [pool.submit(_frames(idx + 1)) for idx in range(3)]
+            self.assertEqual([len(future.result()) for future in futures], [1, 2, 3])
+        finally:
+            pool.shutdown()
+
+    def test_should_raise_worker_exception_in_caller(self):
+        pool = UDFProcessPool(FailingUDF(), num_workers=1)
+        try:
+            with self.assertRaises(RuntimeError):
+                pool(_frames(2))
+        finally:
+            pool.shutdown()
+
+    def test_should_replace_crashed_worker(self):
+        pool = UDFProcessPool(CrashingUDF(), num_workers=1)
+        try:
+            with self.assertRaises(RuntimeError):
+                pool(pd.DataFrame({"id": [1, -1]}))
+            outcome = pool.submit(pd.DataFrame({"id": [1, 2]})).result(timeout=10)
+            self.assertEqual(list(outcome["id"]), [2, 3])
+        finally:
+            pool.shutdown()
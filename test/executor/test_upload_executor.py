@@ -24,13 +24,20 @@ from eva.executor.upload_executor import UploadExecutor
 from eva.expression.tuple_value_expression import TupleValueExpression
 from eva.models.storage.batch import Batch
 from eva.parser.types import FileFormatType
+from eva.readers.opencv_reader import VideoProperties
+from eva.storage.opencv_storage_engine import COPY
+
+VIDEO_PROPERTIES = VideoProperties(
+    num_frames=10, fps=25.0, width=2, height=2, codec="MJPG"
+)
 
 
 class UploadExecutorTest(unittest.TestCase):
+    @patch("eva.executor.load_video_executor.probe_video")
     @patch("eva.executor.load_video_executor.VideoStorageEngine.create")
     @patch("eva.executor.load_video_executor.VideoStorageEngine.write")
     def test_should_call_opencv_reader_and_storage_engine(
-        self, write_mock, create_mock
+        self, write_mock, create_mock, probe_mock
     ):
         file_path = "video"
         video_blob = "b'AAAA'"
@@ -51,12 +58,19 @@ class UploadExecutorTest(unittest.TestCase):
         )
 
         upload_executor = UploadExecutor(plan)
+        probe_mock.return_value = VIDEO_PROPERTIES
         with patch.object(Path, "exists") as mock_exists:
             mock_exists.return_value = True
             batch = next(upload_executor.exec())
             create_mock.assert_called_once_with(table_metainfo, if_not_exists=True)
             write_mock.assert_called_once_with(
-                table_metainfo, Batch(pd.DataFrame([{"video_file_path": file_path}]))
+                table_metainfo,
+                Batch(
+                    pd.DataFrame(
+                        [{"video_file_path": file_path, **VIDEO_PROPERTIES._asdict()}]
+                    )
+                ),
+                link_mode=COPY,
             )
             location = file_path
             expected = Batch(
@@ -65,9 +79,12 @@ class UploadExecutorTest(unittest.TestCase):
 
             self.assertEqual(batch, expected)
 
+    @patch("eva.executor.load_video_executor.probe_video")
     @patch("eva.executor.load_video_executor.VideoStorageEngine.create")
     @patch("eva.executor.load_video_executor.VideoStorageEngine.write")
-    def test_should_search_in_upload_directory(self, write_mock, create_mock):
+    def test_should_search_in_upload_directory(
+        self, write_mock, create_mock, probe_mock
+    ):
         self.upload_dir = Path(
             ConfigurationManager().get_value("storage", "upload_dir")
         )
@@ -90,6 +107,7 @@ class UploadExecutorTest(unittest.TestCase):
         )
 
         upload_executor = UploadExecutor(plan)
+        probe_mock.return_value = VIDEO_PROPERTIES
         with patch.object(Path, "exists") as mock_exists:
             mock_exists.side_effect = [False, True]
             batch = next(upload_executor.exec())
@@ -98,7 +116,17 @@ class UploadExecutorTest(unittest.TestCase):
             create_mock.assert_called_once_with(table_metainfo, if_not_exists=True)
             write_mock.assert_called_once_with(
                 table_metainfo,
-                Batch(pd.DataFrame([{"video_file_path": str(location)}])),
+                Batch(
+                    pd.DataFrame(
+                        [
+                            {
+                                "video_file_path": str(location),
+                                **VIDEO_PROPERTIES._asdict(),
+                            }
+                        ]
+                    )
+                ),
+                link_mode=COPY,
             )
             expected = Batch(
                 pd.DataFrame([{f"Video successfully added at location: {location}"}])
@@ -0,0 +1,144 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from eva.catalog.column_type import ColumnType
+from eva.expression import expression_compiler
+from eva.expression.abstract_expression import ExpressionType
+from eva.expression.arithmetic_expression import ArithmeticExpression
+from eva.expression.comparison_expression import ComparisonExpression
+from eva.expression.constant_value_expression import ConstantValueExpression
+from eva.expression.expression_compiler import (
+    compile_expression,
+    compile_predicate,
+    get_predicate_kernel,
+)
+from eva.expression.function_expression import FunctionExpression
+from eva.expression.logical_expression import LogicalExpression
+from eva.expression.tuple_value_expression import TupleValueExpression
+from eva.models.storage.batch import Batch
+
+
+class ExpressionCompilerTest(unittest.TestCase):
+    def setUp(self):
+        self.batch = Batch(
+            pd.DataFrame(
+                {
+                    "T.id": np.arange(10),
+                    "T.label": ["car" if i % 2 else "bus" for i in range(10)],
+                }
+            )
+        )
+
+    def _column(self, name):
+        return TupleValueExpression(col_name=name, col_alias=f"T.{name}")
+
+    def _assert_matches_evaluate(self, predicate):
+        kernel = compile_predicate(predicate)
+        self.assertIsNotNone(kernel)
+        expected = predicate.evaluate(self.batch).frames[0].to_numpy(dtype=bool)
+        np.testing.assert_array_equal(kernel(self.batch), expected)
+
+    def test_should_compile_comparisons(self):
+        for etype in [
+            ExpressionType.COMPARE_EQUAL,
+            ExpressionType.COMPARE_GREATER,
+            ExpressionType.COMPARE_LESSER,
+            ExpressionType.COMPARE_GEQ,
+            ExpressionType.COMPARE_LEQ,
+            ExpressionType.COMPARE_NEQ,
+        ]:
+            predicate = ComparisonExpression(
+                etype, self._column("id"), ConstantValueExpression(4)
+            )
+            self._assert_matches_evaluate(predicate)
+
+    def test_should_compile_logical_and_arithmetic(self):
+        # (id * 2 > 5 AND label = 'car') OR NOT id < 8
+        arith = ArithmeticExpression(
+            ExpressionType.ARITHMETIC_MULTIPLY,
+            self._column("id"),
+            ConstantValueExpression(2),
+        )
+        left = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            ComparisonExpression(
+                ExpressionType.COMPARE_GREATER, arith, ConstantValueExpression(5)
+            ),
+            ComparisonExpression(
+                ExpressionType.COMPARE_EQUAL,
+                self._column("label"),
+                ConstantValueExpression("car", ColumnType.TEXT),
+            ),
+        )
+        right = LogicalExpression(
+            ExpressionType.LOGICAL_NOT,
+            ComparisonExpression(
+                ExpressionType.COMPARE_LESSER,
+                self._column("id"),
+                ConstantValueExpression(8),
+            ),
+            None,
+        )
+        predicate = LogicalExpression(ExpressionType.LOGICAL_OR, left, right)
+        kernel = compile_predicate(predicate)
+        self.assertEqual(np.flatnonzero(kernel(self.batch)).tolist(), [3, 5, 7, 8, 9])
+
+    def test_should_broadcast_constant_predicate(self):
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_EQUAL,
+            ConstantValueExpression(1),
+            ConstantValueExpression(1),
+        )
+        mask = compile_predicate(predicate)(self.batch)
+        self.assertEqual(mask.tolist(), [True] * len(self.batch))
+
+    def test_should_not_compile_udf_or_array_operands(self):
+        func_expr = FunctionExpression(MagicMock(), name="test")
+        func_expr.append_child(self._column("id"))
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER, func_expr, ConstantValueExpression(1)
+        )
+        self.assertIsNone(compile_expression(predicate))
+
+        array_const = ConstantValueExpression(np.array([1, 2]), ColumnType.NDARRAY)
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_CONTAINS, self._column("id"), array_const
+        )
+        self.assertIsNone(compile_predicate(predicate))
+
+    def test_should_compile_predicate_once(self):
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER,
+            self._column("id"),
+            ConstantValueExpression(6),
+        )
+        func_expr = FunctionExpression(MagicMock(), name="test")
+        func_expr.append_child(self._column("id"))
+        udf_predicate = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER, func_expr, ConstantValueExpression(1)
+        )
+        with patch.object(
+            expression_compiler, "compile_predicate", wraps=compile_predicate
+        ) as compile_mock:
+            for _ in range(3):
+                mask = get_predicate_kernel(predicate)(self.batch)
+                self.assertEqual(np.flatnonzero(mask).tolist(), [7, 8, 9])
+                self.assertIsNone(get_predicate_kernel(udf_predicate))
+        self.assertEqual(compile_mock.call_count, 2)
@@ -143,6 +143,12 @@ class ExpressionUtilsTest(unittest.TestCase):
             [(0, 9), (21, 100)],
         )
 
+        # the ranges are clipped to the bounds
+        self.assertEqual(extract_range_list_from_predicate(expr, 0, 7), [(0, 7)])
+        self.assertEqual(
+            extract_range_list_from_predicate(self.gen_cmp_expr(200), 0, 100), []
+        )
+
         with self.assertRaises(RuntimeError):
             expr = ArithmeticExpression(
                 ExpressionType.AGGREGATION_COUNT, Mock(), Mock()
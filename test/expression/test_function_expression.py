@@ -59,6 +59,7 @@ class FunctionExpressionTest(unittest.TestCase):
         mock_function = MagicMock(spec=GPUCompatible, return_value=pd.DataFrame())
 
         context_instance.gpu_device.return_value = NO_GPU
+        context_instance.replica_pool.return_value = None
 
         expression = FunctionExpression(
             mock_function, name="test", alias=Alias("func_expr")
@@ -67,3 +68,42 @@ class FunctionExpressionTest(unittest.TestCase):
         input_batch = Batch(frames=pd.DataFrame())
         expression.evaluate(input_batch)
         mock_function.assert_called()
+
+    @patch("eva.expression.function_expression.Context")
+    def test_should_execute_replica_pool_if_no_gpu(self, context):
+        context_instance = context.return_value
+        mock_function = MagicMock(spec=GPUCompatible)
+        replica_pool = Mock(return_value=pd.DataFrame())
+
+        context_instance.gpu_device.return_value = NO_GPU
+        context_instance.replica_pool.return_value = replica_pool
+
+        expression = FunctionExpression(
+            mock_function, name="test", alias=Alias("func_expr")
+        )
+
+        input_batch = Batch(frames=pd.DataFrame())
+        expression.evaluate(input_batch)
+        context_instance.replica_pool.assert_called_with(mock_function, {})
+        replica_pool.assert_called()
+        mock_function.assert_not_called()
+
+    @patch("eva.expression.function_expression.Context")
+    def test_should_execute_process_pool_in_process_mode(self, context):
+        context_instance = context.return_value
+        mock_function = MagicMock(return_value=pd.DataFrame())
+        process_pool = Mock(return_value=pd.DataFrame())
+        context_instance.process_pool.return_value = process_pool
+
+        expression = FunctionExpression(
+            mock_function, name="test", alias=Alias("func_expr")
+        )
+        expression.udf_options = {"mode": "process", "workers": 3}
+
+        input_batch = Batch(frames=pd.DataFrame())
+        expression.evaluate(input_batch)
+        context_instance.process_pool.assert_called_with(
+            mock_function, {"mode": "process", "workers": 3}
+        )
+        process_pool.assert_called()
+        mock_function.assert_not_called()
@@ -134,7 +134,7 @@ class LogicalExpressionsTest(unittest.TestCase):
             ExpressionType.COMPARE_EQUAL, tup_val_exp_l, tup_val_exp_r
         )
         comp_exp_r = Mock(spec=ComparisonExpression)
-        comp_exp_r.evaluate = Mock(return_value=Mock(_frames=[[True], [False]]))
+        comp_exp_r.evaluate = Mock(return_value=Batch(pd.DataFrame([True, False])))
 
         logical_exp = LogicalExpression(
             ExpressionType.LOGICAL_AND, comp_exp_l, comp_exp_r
@@ -144,7 +144,8 @@ class LogicalExpressionsTest(unittest.TestCase):
         self.assertEqual(
             [True, False, False, False], logical_exp.evaluate(tuples).frames[0].tolist()
         )
-        comp_exp_r.evaluate.assert_called_once_with(tuples, mask=[0, 1])
+        comp_exp_r.evaluate.assert_called_once()
+        self.assertEqual(comp_exp_r.evaluate.call_args[0][0], tuples[[0, 1]])
 
     def test_short_circuiting_or_partial(self):
         # tests whether right-hand side is partially executed with or
@@ -157,7 +158,7 @@ class LogicalExpressionsTest(unittest.TestCase):
             ExpressionType.COMPARE_EQUAL, tup_val_exp_l, tup_val_exp_r
         )
         comp_exp_r = Mock(spec=ComparisonExpression)
-        comp_exp_r.evaluate = Mock(return_value=Mock(_frames=[[True], [False]]))
+        comp_exp_r.evaluate = Mock(return_value=Batch(pd.DataFrame([True, False])))
 
         logical_exp = LogicalExpression(
             ExpressionType.LOGICAL_OR, comp_exp_l, comp_exp_r
@@ -167,4 +168,5 @@ class LogicalExpressionsTest(unittest.TestCase):
         self.assertEqual(
             [True, False, True, True], logical_exp.evaluate(tuples).frames[0].tolist()
         )
-        comp_exp_r.evaluate.assert_called_once_with(tuples, mask=[0, 1])
+        comp_exp_r.evaluate.assert_called_once()
+        self.assertEqual(comp_exp_r.evaluate.call_args[0][0], tuples[[0, 1]])
@@ -24,7 +24,7 @@ class TupleValueExpressionsTest(unittest.TestCase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def test_masking(self):
+    def test_should_project_column(self):
         tup_val_exp1 = TupleValueExpression(col_name=0)
         tup_val_exp2 = TupleValueExpression(col_name=1)
         tup_val_exp3 = TupleValueExpression(col_name=2)
@@ -40,12 +40,10 @@ class TupleValueExpressionsTest(unittest.TestCase):
                 }
             )
         )
-        mask1 = [0, 1, 2, 3, 4, 5]
         self.assertEqual(
-            [1, 2, 3, 4, 5, 6],
-            tup_val_exp1.evaluate(tuples, mask=mask1).frames[0].tolist(),
+            [1, 2, 3, 4, 5, 6], tup_val_exp1.evaluate(tuples).frames[0].tolist()
         )
         self.assertEqual(
-            [7, 9, 11], tup_val_exp2.evaluate(tuples, mask=[0, 2, 4]).frames[1].tolist()
+            [7, 8, 9, 10, 11, 12], tup_val_exp2.evaluate(tuples).frames[1].tolist()
         )
-        self.assertEqual([], tup_val_exp3.evaluate(tuples, mask=[]).frames[2].tolist())
+        self.assertEqual(list(tup_val_exp3.evaluate(tuples).columns), [2])
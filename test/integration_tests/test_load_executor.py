@@ -12,6 +12,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import shutil
 import unittest
 from test.util import (
     create_dummy_batches,
@@ -19,9 +21,11 @@ from test.util import (
     create_sample_csv,
     create_sample_video,
     file_remove,
+    upload_dir_from_config,
 )
 
 from eva.catalog.catalog_manager import CatalogManager
+from eva.models.storage.batch import Batch
 from eva.server.command_handler import execute_query_fetch_all
 
 
@@ -127,3 +131,77 @@ class LoadExecutorTest(unittest.TestCase):
         expected_batch = create_dummy_csv_batches(target_columns=select_columns)
         expected_batch.modify_column_alias("myvideocsv")
         self.assertEqual(actual_batch, expected_batch)
+
+    def test_should_load_videos_matching_glob_in_table(self):
+        video_dir = os.path.join(upload_dir_from_config, "dummy_videos")
+        os.makedirs(video_dir, exist_ok=True)
+        self.addCleanup(shutil.rmtree, video_dir)
+        for idx in range(3):
+            shutil.copy(
+                os.path.join(upload_dir_from_config, "dummy.avi"),
+                os.path.join(video_dir, f"part_{idx}.avi"),
+            )
+
+        query = """LOAD FILE 'dummy_videos/*.avi' INTO MyVideos
+                   WITH FORMAT VIDEO;"""
+        result = execute_query_fetch_all(query)
+        self.assertEqual(
+            result.frames.iloc[0, 0],
+            "3 videos successfully added from location: dummy_videos/*.avi",
+        )
+
+        actual_batch = execute_query_fetch_all("SELECT name, id FROM MyVideos;")
+        expected_batch = list(create_dummy_batches())[0]
+        self.assertEqual(len(actual_batch), 3 * len(expected_batch))
+        self.assertEqual(
+            sorted(set(actual_batch.frames["myvideos.name"])),
+            ["part_0.avi", "part_1.avi", "part_2.avi"],
+        )
+
+        with self.assertRaises(Exception):
+            execute_query_fetch_all(
+                """LOAD FILE 'dummy_videos/*.mp4' INTO MyVideos
+                   WITH FORMAT VIDEO;"""
+            )
+
+    def test_should_load_csv_files_matching_glob_in_table(self):
+        create_table_query = """
+            CREATE TABLE IF NOT EXISTS MyVideoCSV (
+                id INTEGER UNIQUE,
+                frame_id INTEGER,
+                video_id INTEGER,
+                dataset_name TEXT(30),
+                label TEXT(30),
+                bbox NDARRAY FLOAT32(4),
+                object_id INTEGER
+            );
+            """
+        execute_query_fetch_all(create_table_query)
+
+        csv_dir = os.path.join(upload_dir_from_config, "dummy_csvs")
+        os.makedirs(csv_dir, exist_ok=True)
+        self.addCleanup(shutil.rmtree, csv_dir)
+        for idx in range(3):
+            shutil.copy(
+                os.path.join(upload_dir_from_config, "dummy.csv"),
+                os.path.join(csv_dir, f"part_{idx}.csv"),
+            )
+
+        load_query = """LOAD FILE 'dummy_csvs/part_*.csv' INTO MyVideoCSV
+                   WITH FORMAT CSV;"""
+        execute_query_fetch_all(load_query)
+
+        select_query = """SELECT id, frame_id, video_id,
+                          dataset_name, label, bbox,
+                          object_id
+                          FROM MyVideoCSV;"""
+        actual_batch = execute_query_fetch_all(select_query)
+        expected_batch = create_dummy_csv_batches()
+        expected_batch.modify_column_alias("myvideocsv")
+        self.assertEqual(actual_batch, Batch.concat([expected_batch] * 3))
+
+        with self.assertRaises(Exception):
+            execute_query_fetch_all(
+                """LOAD FILE 'dummy_csvs/missing_*.csv' INTO MyVideoCSV
+                   WITH FORMAT CSV;"""
+            )
@@ -22,11 +22,13 @@ from test.util import (
 
 import numpy as np
 import pandas as pd
+from mock import patch
 
 from eva.binder.binder_utils import BinderError
 from eva.catalog.catalog_manager import CatalogManager
 from eva.models.storage.batch import Batch
 from eva.server.command_handler import execute_query_fetch_all
+from eva.udfs.abstract.abstract_udf import AbstractUDF
 
 NUM_FRAMES = 10
 
@@ -66,6 +68,37 @@ class UDFExecutorTest(unittest.TestCase):
         expected_batch = Batch(frames=pd.DataFrame(expected))
         self.assertEqual(actual_batch, expected_batch)
 
+    def test_should_evaluate_shared_udf_once_per_frame(self):
+        select_query = "SELECT id, DummyObjectDetector(data).label FROM MyVideo \
+            WHERE DummyObjectDetector(data).label = ['person'] ORDER BY id;"
+        num_frames = []
+
+        def count_frames(udf, frames):
+            num_frames.append(len(frames))
+            return udf.forward(frames)
+
+        with patch.object(AbstractUDF, "__call__", count_frames):
+            actual_batch = execute_query_fetch_all(select_query)
+
+        self.assertEqual(sum(num_frames), NUM_FRAMES)
+        expected = [
+            {
+                "myvideo.id": i * 2,
+                "dummyobjectdetector.label": np.array(["person"]),
+            }
+            for i in range(NUM_FRAMES // 2)
+        ]
+        expected_batch = Batch(frames=pd.DataFrame(expected))
+        self.assertEqual(actual_batch, expected_batch)
+
+    def test_should_return_same_result_with_partitioned_scan(self):
+        select_query = "SELECT id, DummyObjectDetector(data) FROM MyVideo \
+            WHERE DummyObjectDetector(data).label = ['person'] AND id > 2;"
+        expected_batch = execute_query_fetch_all(select_query, degree_of_parallelism=1)
+        actual_batch = execute_query_fetch_all(select_query, degree_of_parallelism=3)
+        self.assertEqual(list(actual_batch.frames["myvideo.id"]), [4, 6, 8])
+        self.assertEqual(actual_batch, expected_batch)
+
     def test_should_load_and_select_using_udf_video(self):
         # Equality test
         select_query = "SELECT id,DummyObjectDetector(data) FROM MyVideo \
@@ -172,3 +205,57 @@ class UDFExecutorTest(unittest.TestCase):
         """
         with self.assertRaises(RuntimeError):
             execute_query_fetch_all(create_udf_query)
+
+    def test_should_run_udf_with_backend_option(self):
+        create_udf_query = """CREATE UDF TinyClassifier
+                  INPUT  (Frame_Array NDARRAY UINT8(3, ANYDIM, ANYDIM))
+                  OUTPUT (scores NDARRAY FLOAT32(2))
+                  TYPE  Classification
+                  IMPL  'test/udfs/test_execution_backends.py'
+                  WITH  backend = 'torchscript';
+        """
+        execute_query_fetch_all(create_udf_query)
+        udf_obj = CatalogManager().get_udf_by_name("TinyClassifier")
+        self.assertEqual(udf_obj.options, {"backend": "torchscript"})
+
+        select_query = "SELECT id, TinyClassifier(data) FROM MyVideo ORDER BY id;"
+        actual_batch = execute_query_fetch_all(select_query)
+        self.assertEqual(len(actual_batch), NUM_FRAMES)
+
+    def test_should_raise_for_unsupported_backend_option(self):
+        create_udf_query = """CREATE UDF DummyMultiObjectDetector
+                  INPUT  (Frame_Array NDARRAY UINT8(3, 256, 256))
+                  OUTPUT (label NDARRAY STR(10))
+                  TYPE  Classification
+                  IMPL  'test/util.py'
+                  WITH  backend = torchscript;
+        """
+        with self.assertRaises(RuntimeError):
+            execute_query_fetch_all(create_udf_query)
+        self.assertIsNone(CatalogManager().get_udf_by_name("DummyMultiObjectDetector"))
+
+    def test_should_run_udf_in_process_mode(self):
+        execute_query_fetch_all("DROP UDF DummyObjectDetector;")
+        create_udf_query = """CREATE UDF DummyObjectDetector
+                  INPUT  (Frame_Array NDARRAY UINT8(3, 256, 256))
+                  OUTPUT (label NDARRAY STR(10))
+                  TYPE  Classification
+                  IMPL  'test/util.py'
+                  WITH  mode = 'process', workers = 2;
+        """
+        execute_query_fetch_all(create_udf_query)
+        udf_obj = CatalogManager().get_udf_by_name("DummyObjectDetector")
+        self.assertEqual(udf_obj.options, {"mode": "process", "workers": 2})
+
+        select_query = "SELECT id,DummyObjectDetector(data) FROM MyVideo \
+            ORDER BY id;"
+        actual_batch = execute_query_fetch_all(select_query)
+        labels = DummyObjectDetector().labels
+        expected = [
+            {
+                "myvideo.id": i,
+                "dummyobjectdetector.label": np.array([labels[1 + i % 2]]),
+            }
+            for i in range(NUM_FRAMES)
+        ]
+        self.assertEqual(actual_batch, Batch(frames=pd.DataFrame(expected)))
@@ -122,3 +122,25 @@ class BatchTest(unittest.TestCase):
     def test_should_return_empty_dataframe(self):
         batch = Batch()
         self.assertEqual(batch, Batch(create_dataframe(0)))
+
+    def test_filter_should_narrow_selection_without_copying(self):
+        frames = create_dataframe(6)
+        batch = Batch(frames)
+        batch.filter(np.array([True, True, False, True, True, True]))
+        batch.filter(np.array([0, 2]))
+        self.assertIs(batch._frames, frames)
+        self.assertEqual(2, len(batch))
+        self.assertEqual([1, 4], list(batch.column_as_numpy_array("id")))
+        self.assertEqual([1, 4], batch.project(["id"]).frames["id"].tolist())
+
+        expected = Batch(frames.iloc[[0, 3]].reset_index(drop=True))
+        self.assertEqual(expected, batch)
+        self.assertEqual([0, 1], batch.frames.index.tolist())
+
+    def test_select_should_not_modify_original_batch(self):
+        batch = Batch(create_dataframe(4))
+        view = batch.select(np.array([False, True, False, True]))
+        view.modify_column_alias("T")
+        self.assertEqual(2, len(view))
+        self.assertEqual(4, len(batch))
+        self.assertEqual(["id", "data"], list(batch.columns))
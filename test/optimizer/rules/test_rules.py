@@ -18,6 +18,7 @@ from test.util import (
     get_logical_query_plan,
     get_physical_query_plan,
     load_inbuilt_udfs,
+    missing_config_keys,
 )
 
 from mock import MagicMock
@@ -51,6 +52,7 @@ from eva.optimizer.rules.rules import (
     LogicalLateralJoinToPhysical,
     LogicalLimitToPhysical,
     LogicalLoadToPhysical,
+    LogicalOptimizeTableToPhysical,
     LogicalOrderByToPhysical,
     LogicalProjectToPhysical,
     LogicalRenameToPhysical,
@@ -60,8 +62,11 @@ from eva.optimizer.rules.rules import (
     LogicalUploadToPhysical,
     Promise,
     PushDownFilterThroughJoin,
+    ReuseProjectedFunctionExpressionsInOrderBy,
     RulesManager,
+    ShareFunctionExpressionsWithFilter,
 )
+from eva.planner.types import PlanOprType
 from eva.server.command_handler import execute_query_fetch_all
 
 
@@ -92,6 +97,14 @@ class TestRules(unittest.TestCase):
         self.assertTrue(
             Promise.EMBED_PROJECT_INTO_GET > Promise.IMPLEMENTATION_DELIMETER
         )
+        self.assertTrue(
+            Promise.SHARE_FUNCTION_EXPRESSIONS_WITH_FILTER
+            > Promise.IMPLEMENTATION_DELIMETER
+        )
+        self.assertTrue(
+            Promise.REUSE_PROJECTED_FUNCTION_EXPRESSIONS_IN_ORDERBY
+            > Promise.IMPLEMENTATION_DELIMETER
+        )
 
         # Promise of implementation rules should be lesser than rewrite rules
         self.assertTrue(
@@ -133,6 +146,10 @@ class TestRules(unittest.TestCase):
         self.assertTrue(
             Promise.LOGICAL_DROP_TO_PHYSICAL < Promise.IMPLEMENTATION_DELIMETER
         )
+        self.assertTrue(
+            Promise.LOGICAL_OPTIMIZE_TABLE_TO_PHYSICAL
+            < Promise.IMPLEMENTATION_DELIMETER
+        )
 
     def test_supported_rules(self):
         # adding/removing rules should update this test
@@ -143,6 +160,8 @@ class TestRules(unittest.TestCase):
             EmbedSampleIntoGet(),
             #    EmbedProjectIntoDerivedGet(),
             PushDownFilterThroughJoin(),
+            ShareFunctionExpressionsWithFilter(),
+            ReuseProjectedFunctionExpressionsInOrderBy(),
         ]
         self.assertEqual(
             len(supported_rewrite_rules), len(RulesManager().rewrite_rules)
@@ -169,6 +188,7 @@ class TestRules(unittest.TestCase):
             LogicalDropToPhysical(),
             LogicalCreateUDFToPhysical(),
             LogicalDropUDFToPhysical(),
+            LogicalOptimizeTableToPhysical(),
             LogicalInsertToPhysical(),
             LogicalLoadToPhysical(),
             LogicalUploadToPhysical(),
@@ -260,9 +280,23 @@ class TestRules(unittest.TestCase):
         original_predicate = l_plan.children[0].predicate
         pred_1, pred_2 = expression_tree_to_conjunction_list(original_predicate)
         storage_plan = join_node.children[0].children[0]
+        # skip the prefetching exchange inserted above the storage plan
+        if storage_plan.opr_type == PlanOprType.EXCHANGE:
+            storage_plan = storage_plan.children[0]
         right_subtree_filter = join_node.children[1]
         # storage_plan should have the correct predicate
         self.assertEqual(storage_plan.predicate, pred_1)
 
         # Right subtree should have the correct predicate
         self.assertEqual(right_subtree_filter.predicate, pred_2)
+
+
+class LogicalGetToSeqScanTest(unittest.TestCase):
+    def test_should_default_prefetch_mem_size_missing_in_config(self):
+        logi_get = LogicalGet(MagicMock(), MagicMock(), MagicMock())
+        with missing_config_keys(("executor", "prefetch_mem_size")):
+            seq_scan = LogicalGetToSeqScan().apply(logi_get, MagicMock())
+        exchange_plan = seq_scan.children[0]
+        self.assertEqual(exchange_plan.opr_type, PlanOprType.EXCHANGE)
+        self.assertEqual(exchange_plan.queue_size, 2)
+        self.assertEqual(exchange_plan.children[0].opr_type, PlanOprType.STORAGE_PLAN)
@@ -0,0 +1,74 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+from mock import MagicMock
+
+from eva.expression.abstract_expression import ExpressionType
+from eva.expression.comparison_expression import ComparisonExpression
+from eva.expression.tuple_value_expression import TupleValueExpression
+from eva.optimizer.column_pruning import prune_scan_columns
+from eva.planner.project_plan import ProjectPlan
+from eva.planner.seq_scan_plan import SeqScanPlan
+from eva.planner.storage_plan import StoragePlan
+
+
+class ColumnPruningTest(unittest.TestCase):
+    def setUp(self):
+        self.table = MagicMock(id=1, is_video=False)
+        self.table.columns = []
+        for name in ["a0", "a1", "a2"]:
+            column = MagicMock(metadata_id=self.table.id)
+            column.name = name
+            self.table.columns.append(column)
+
+    def _column(self, name):
+        col_object = next(col for col in self.table.columns if col.name == name)
+        return TupleValueExpression(col_name=name, col_object=col_object)
+
+    def _scan(self, columns, predicate=None):
+        self.storage_plan = StoragePlan(self.table, batch_mem_size=3000)
+        seq_scan_plan = SeqScanPlan(predicate, columns, "table1")
+        seq_scan_plan.append_child(self.storage_plan)
+        return seq_scan_plan
+
+    def test_should_read_projected_and_filtered_columns(self):
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER, self._column("a2"), self._column("a0")
+        )
+        plan = self._scan([self._column("a0")], predicate)
+
+        self.assertIs(prune_scan_columns(plan), plan)
+        self.assertEqual(self.storage_plan.projection, ["a0", "a2"])
+
+    def test_should_read_columns_used_above_derived_table(self):
+        project_plan = ProjectPlan([self._column("a1")])
+        project_plan.append_child(self._scan(None))
+
+        prune_scan_columns(project_plan)
+        self.assertEqual(self.storage_plan.projection, ["a1"])
+
+    def test_should_read_all_columns_without_projection(self):
+        plan = self._scan(None)
+
+        prune_scan_columns(plan)
+        self.assertIsNone(self.storage_plan.projection)
+
+    def test_should_not_prune_videos(self):
+        self.table.is_video = True
+        plan = self._scan([self._column("a0")])
+
+        prune_scan_columns(plan)
+        self.assertIsNone(self.storage_plan.projection)
@@ -15,14 +15,21 @@
 import unittest
 from copy import copy
 
-from mock import MagicMock
+from mock import MagicMock, patch
 
+from eva.expression.abstract_expression import ExpressionType
+from eva.expression.comparison_expression import ComparisonExpression
+from eva.expression.constant_value_expression import ConstantValueExpression
+from eva.expression.tuple_value_expression import TupleValueExpression
+from eva.optimizer import cost_model
 from eva.optimizer.group_expression import GroupExpression
 from eva.optimizer.operators import Operator
 from eva.optimizer.optimizer_context import OptimizerContext
 from eva.optimizer.optimizer_tasks import OptimizeGroup
 from eva.optimizer.plan_generator import PlanGenerator
 from eva.optimizer.property import PropertyType
+from eva.planner.storage_plan import StoragePlan
+from eva.readers.opencv_reader import VideoProperties
 
 
 class CostModel(unittest.TestCase):
@@ -112,3 +119,31 @@ class CostModel(unittest.TestCase):
 
         self.assertEqual(plan, expected_plan)
         self.assertEqual(grp.get_best_expr_cost(PropertyType.DEFAULT), 9)
+
+    @patch("eva.optimizer.cost_model.VideoStorageEngine")
+    def test_should_cost_storage_plan_by_cached_frame_count(self, mock_engine):
+        def video_properties(num_frames):
+            return VideoProperties(num_frames, 25.0, 2, 2, "MJPG")
+
+        mock_engine.get_video_properties.return_value = [
+            ("a.mp4", video_properties(100)),
+            ("b.mp4", video_properties(10)),
+        ]
+        video = MagicMock(is_video=True)
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_LESSER,
+            TupleValueExpression(col_name="id"),
+            ConstantValueExpression(50),
+        )
+        cm = cost_model.CostModel()
+
+        self.assertEqual(cm.calculate_cost(GroupExpression(StoragePlan(video, 1))), 110)
+        plan = StoragePlan(video, 1, predicate=predicate, sampling_rate=2)
+        self.assertEqual(cm.estimate_num_frames(plan), 25 + 5)
+        plan = StoragePlan(video, 1, predicate=predicate, limit=20)
+        self.assertEqual(cm.estimate_num_frames(plan), 20)
+
+        # videos loaded without their properties are not estimated
+        mock_engine.get_video_properties.return_value = [("c.mp4", None)]
+        self.assertIsNone(cm.estimate_num_frames(StoragePlan(video, 1)))
+        self.assertEqual(cm.calculate_cost(GroupExpression(StoragePlan(video, 1))), 1.0)
@@ -0,0 +1,91 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+from mock import MagicMock
+
+from eva.expression.function_expression import FunctionExpression
+from eva.expression.tuple_value_expression import TupleValueExpression
+from eva.models.catalog.frame_info import FrameInfo
+from eva.models.catalog.properties import ColorSpace
+from eva.optimizer.frame_format_pushdown import push_down_frame_format
+from eva.planner.project_plan import ProjectPlan
+from eva.planner.seq_scan_plan import SeqScanPlan
+from eva.planner.storage_plan import StoragePlan
+
+
+class FrameFormatPushdownTest(unittest.TestCase):
+    def setUp(self):
+        self.video = MagicMock(id=1, is_video=True)
+
+    def _column(self, name):
+        col_object = MagicMock(metadata_id=self.video.id)
+        col_object.name = name
+        return TupleValueExpression(col_name=name, col_object=col_object)
+
+    def _udf(self, input_format):
+        udf = MagicMock(input_format=input_format)
+        return FunctionExpression(udf, name="udf", children=[self._column("data")])
+
+    def _plan(self, target_list):
+        storage_plan = StoragePlan(self.video, batch_mem_size=3000)
+        seq_scan_plan = SeqScanPlan(None, target_list, "myvideo")
+        seq_scan_plan.append_child(storage_plan)
+        project_plan = ProjectPlan(target_list)
+        project_plan.append_child(seq_scan_plan)
+        return project_plan, storage_plan
+
+    def test_should_push_down_widest_resolution(self):
+        plan, storage_plan = self._plan(
+            [
+                self._column("id"),
+                self._udf(FrameInfo(300, 300, 3, ColorSpace.RGB)),
+                self._udf(FrameInfo(48, 64, 1, ColorSpace.GRAY)),
+            ]
+        )
+        self.assertIs(push_down_frame_format(plan), plan)
+        self.assertEqual(
+            storage_plan.frame_info, FrameInfo(300, 300, 3, ColorSpace.BGR)
+        )
+
+    def test_should_push_down_common_color_space(self):
+        plan, storage_plan = self._plan(
+            [
+                self._udf(FrameInfo(48, 48, 1, ColorSpace.GRAY)),
+                self._udf(FrameInfo(-1, -1, 1, ColorSpace.GRAY)),
+            ]
+        )
+        push_down_frame_format(plan)
+        self.assertEqual(storage_plan.frame_info, FrameInfo(-1, -1, 1, ColorSpace.GRAY))
+
+    def test_should_keep_decoded_frames_of_undeclared_formats(self):
+        plan, storage_plan = self._plan(
+            [self._udf(FrameInfo(-1, -1, 3, ColorSpace.RGB))]
+        )
+        push_down_frame_format(plan)
+        self.assertIsNone(storage_plan.frame_info)
+
+    def test_should_keep_decoded_frames_of_projected_pixels(self):
+        plan, storage_plan = self._plan(
+            [self._column("data"), self._udf(FrameInfo(48, 48, 1, ColorSpace.GRAY))]
+        )
+        push_down_frame_format(plan)
+        self.assertIsNone(storage_plan.frame_info)
+
+    def test_should_keep_decoded_frames_of_udfs_without_input_format(self):
+        udf_expr = self._udf(None)
+        plan, storage_plan = self._plan([udf_expr])
+        push_down_frame_format(plan)
+        self.assertIsNone(storage_plan.frame_info)
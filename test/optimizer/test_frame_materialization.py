@@ -0,0 +1,103 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+from mock import MagicMock
+
+from eva.expression.function_expression import FunctionExpression
+from eva.expression.tuple_value_expression import TupleValueExpression
+from eva.optimizer.frame_materialization import place_frame_materialization
+from eva.parser.types import ParserOrderBySortType
+from eva.planner.exchange_plan import ExchangePlan
+from eva.planner.limit_plan import LimitPlan
+from eva.planner.orderby_plan import OrderByPlan
+from eva.planner.predicate_plan import PredicatePlan
+from eva.planner.project_plan import ProjectPlan
+from eva.planner.seq_scan_plan import SeqScanPlan
+from eva.planner.storage_plan import StoragePlan
+from eva.planner.types import PlanOprType
+
+
+class FrameMaterializationTest(unittest.TestCase):
+    def setUp(self):
+        self.video = MagicMock(id=1, is_video=True)
+
+    def _column(self, name):
+        col_object = MagicMock(metadata_id=self.video.id)
+        col_object.name = name
+        return TupleValueExpression(col_name=name, col_object=col_object)
+
+    def _udf(self):
+        return FunctionExpression(
+            MagicMock(), name="udf", children=[self._column("data")]
+        )
+
+    def _scan(self, columns, predicate=None):
+        self.storage_plan = StoragePlan(self.video, batch_mem_size=3000)
+        exchange_plan = ExchangePlan(queue_size=2)
+        exchange_plan.append_child(self.storage_plan)
+        seq_scan_plan = SeqScanPlan(predicate, columns, "myvideo")
+        seq_scan_plan.append_child(exchange_plan)
+        return seq_scan_plan
+
+    def test_should_not_decode_frames_not_projected(self):
+        plan = self._scan([self._column("id")])
+
+        self.assertIs(place_frame_materialization(plan), plan)
+        self.assertTrue(self.storage_plan.lazy_frames)
+        self.assertIs(plan.children[0].children[0], self.storage_plan)
+
+    def test_should_decode_projected_frames_after_limit(self):
+        limit_plan = LimitPlan(MagicMock())
+        orderby_plan = OrderByPlan([(self._column("id"), ParserOrderBySortType.DESC)])
+        orderby_plan.append_child(
+            self._scan([self._column("id"), self._column("data")])
+        )
+        limit_plan.append_child(orderby_plan)
+
+        plan = place_frame_materialization(limit_plan)
+
+        self.assertEqual(plan.opr_type, PlanOprType.MATERIALIZE)
+        self.assertIs(plan.children[0], limit_plan)
+        self.assertTrue(self.storage_plan.lazy_frames)
+
+    def test_should_decode_frames_below_udf_after_filter(self):
+        project_plan = ProjectPlan([self._column("id")])
+        predicate_plan = PredicatePlan(self._udf())
+        seq_scan_plan = self._scan(None, predicate=MagicMock())
+        predicate_plan.append_child(seq_scan_plan)
+        project_plan.append_child(predicate_plan)
+
+        plan = place_frame_materialization(project_plan)
+
+        self.assertIs(plan, project_plan)
+        materialize_plan = predicate_plan.children[0]
+        self.assertEqual(materialize_plan.opr_type, PlanOprType.MATERIALIZE)
+        self.assertIs(materialize_plan.children[0], seq_scan_plan)
+        self.assertTrue(self.storage_plan.lazy_frames)
+
+    def test_should_decode_frames_in_storage_if_all_are_needed(self):
+        project_plan = ProjectPlan([self._column("id")])
+        predicate_plan = PredicatePlan(self._udf())
+        predicate_plan.append_child(self._scan(None))
+        project_plan.append_child(predicate_plan)
+
+        plan = place_frame_materialization(project_plan)
+
+        self.assertIs(plan, project_plan)
+        self.assertEqual(
+            predicate_plan.children[0].opr_type, PlanOprType.SEQUENTIAL_SCAN
+        )
+        self.assertFalse(self.storage_plan.lazy_frames)
@@ -15,7 +15,20 @@
 import unittest
 
 from eva.catalog.column_type import ColumnType, NdArrayType
-from eva.optimizer.optimizer_utils import column_definition_to_udf_io
+from eva.expression.abstract_expression import ExpressionType
+from eva.expression.comparison_expression import ComparisonExpression
+from eva.expression.constant_value_expression import ConstantValueExpression
+from eva.expression.function_expression import FunctionExpression
+from eva.expression.logical_expression import LogicalExpression
+from eva.expression.tuple_value_expression import TupleValueExpression
+from eva.optimizer.optimizer_utils import (
+    column_definition_to_udf_io,
+    extract_shared_function_expressions,
+    extract_table_pushdown_predicate,
+    projected_function_expression_to_column,
+    share_function_expressions,
+)
+from eva.parser.alias import Alias
 from eva.parser.create_statement import ColumnDefinition
 
 
@@ -45,3 +58,97 @@ class OptimizerUtilsTest(unittest.TestCase):
             self.assertEqual(io.array_dimensions, [None, None, None])
             self.assertEqual(io.is_input, True)
             self.assertEqual(io.udf_id, None)
+
+    def _func_expr(self, name="ObjDetector", output="labels"):
+        func_expr = FunctionExpression(
+            object(), name=name, output=output, alias=Alias(name.lower(), [output])
+        )
+        func_expr.append_child(
+            TupleValueExpression(col_name="data", col_alias="T.data")
+        )
+        return func_expr
+
+    def _cmp_expr(self, left):
+        return ComparisonExpression(
+            ExpressionType.COMPARE_GREATER, left, ConstantValueExpression(1)
+        )
+
+    def test_extract_shared_function_expressions(self):
+        pred_func, target_func = self._func_expr(), self._func_expr()
+        other_func = self._func_expr(output="bboxes")
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            self._cmp_expr(pred_func),
+            self._cmp_expr(other_func),
+        )
+        groups = extract_shared_function_expressions(
+            predicate, [target_func, TupleValueExpression(col_alias="T.id")]
+        )
+        self.assertEqual(groups, [[pred_func, target_func]])
+        self.assertIs(groups[0][0], pred_func)
+        self.assertIs(groups[0][1], target_func)
+
+        share_function_expressions(groups)
+        self.assertEqual(pred_func.hidden_alias, target_func.hidden_alias)
+        self.assertIs(pred_func.function, target_func.function)
+        self.assertIsNone(other_func.hidden_alias)
+        self.assertEqual(
+            extract_shared_function_expressions(predicate, [target_func]), []
+        )
+
+    def test_should_not_share_function_expressions_under_disjunction(self):
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_OR,
+            self._cmp_expr(TupleValueExpression(col_alias="T.id")),
+            self._cmp_expr(self._func_expr()),
+        )
+        groups = extract_shared_function_expressions(predicate, [self._func_expr()])
+        self.assertEqual(groups, [])
+
+    def test_extract_table_pushdown_predicate(self):
+        column_pred = self._cmp_expr(TupleValueExpression(col_alias="T.id"))
+        range_pred = LogicalExpression(
+            ExpressionType.LOGICAL_OR,
+            self._cmp_expr(TupleValueExpression(col_alias="T.label")),
+            ComparisonExpression(
+                ExpressionType.COMPARE_EQUAL,
+                TupleValueExpression(col_alias="T.label"),
+                ConstantValueExpression(0),
+            ),
+        )
+        func_pred = self._cmp_expr(self._func_expr())
+        two_column_pred = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER,
+            TupleValueExpression(col_alias="T.id"),
+            TupleValueExpression(col_alias="T.label"),
+        )
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            LogicalExpression(ExpressionType.LOGICAL_AND, column_pred, func_pred),
+            LogicalExpression(ExpressionType.LOGICAL_AND, range_pred, two_column_pred),
+        )
+
+        pushdown_pred, rem_pred = extract_table_pushdown_predicate(predicate)
+        self.assertEqual(
+            pushdown_pred,
+            LogicalExpression(ExpressionType.LOGICAL_AND, column_pred, range_pred),
+        )
+        self.assertEqual(
+            rem_pred,
+            LogicalExpression(ExpressionType.LOGICAL_AND, func_pred, two_column_pred),
+        )
+        self.assertEqual(extract_table_pushdown_predicate(None), (None, None))
+
+    def test_projected_function_expression_to_column(self):
+        target_list = [TupleValueExpression(col_alias="T.id"), self._func_expr()]
+        column = projected_function_expression_to_column(self._func_expr(), target_list)
+        self.assertEqual(column.col_alias, "objdetector.labels")
+
+        self.assertIsNone(
+            projected_function_expression_to_column(
+                self._func_expr(output="bboxes"), target_list
+            )
+        )
+        self.assertIsNone(
+            projected_function_expression_to_column(target_list[0], target_list)
+        )
@@ -0,0 +1,77 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from test.util import missing_config_keys
+
+from mock import MagicMock, patch
+
+from eva.optimizer.plan_generator import PlanGenerator
+from eva.optimizer.plan_partitioner import partition_plan
+from eva.planner.exchange_plan import ExchangePlan
+from eva.planner.limit_plan import LimitPlan
+from eva.planner.orderby_plan import OrderByPlan
+from eva.planner.predicate_plan import PredicatePlan
+from eva.planner.seq_scan_plan import SeqScanPlan
+from eva.planner.storage_plan import StoragePlan
+from eva.planner.types import PlanOprType
+
+
+class PlanPartitionerTest(unittest.TestCase):
+    def _scan_plan(self):
+        predicate_plan = PredicatePlan(MagicMock())
+        seq_scan_plan = SeqScanPlan(None, [MagicMock()], "myvideo")
+        exchange_plan = ExchangePlan(queue_size=2)
+        exchange_plan.append_child(StoragePlan(MagicMock(), batch_mem_size=3000))
+        seq_scan_plan.append_child(exchange_plan)
+        predicate_plan.append_child(seq_scan_plan)
+        return predicate_plan
+
+    def test_should_not_partition_without_parallelism(self):
+        plan = self._scan_plan()
+        self.assertIs(partition_plan(plan, 1), plan)
+        self.assertIs(partition_plan(plan, None), plan)
+
+    def test_should_gather_partitions_of_scan_pipeline(self):
+        limit_plan = LimitPlan(MagicMock())
+        orderby_plan = OrderByPlan([])
+        orderby_plan.append_child(self._scan_plan())
+        limit_plan.append_child(orderby_plan)
+
+        plan = partition_plan(limit_plan, 3)
+
+        # order by and limit are not partitionable and stay above the gather
+        self.assertIs(plan, limit_plan)
+        gather_plan = plan.children[0].children[0]
+        self.assertEqual(gather_plan.opr_type, PlanOprType.GATHER)
+        self.assertEqual(gather_plan.degree_of_parallelism, 3)
+        self.assertEqual(len(gather_plan.children), 3)
+        for shard, fragment in enumerate(gather_plan.children):
+            self.assertEqual(fragment.opr_type, PlanOprType.PREDICATE_FILTER)
+            storage_plan = fragment.children[0].children[0].children[0]
+            self.assertEqual(storage_plan.opr_type, PlanOprType.STORAGE_PLAN)
+            self.assertEqual(storage_plan.curr_shard, shard)
+            self.assertEqual(storage_plan.total_shards, 3)
+            self.assertEqual(storage_plan.batch_mem_size, 3000)
+
+    def test_should_default_parallelism_missing_in_config(self):
+        plan = self._scan_plan()
+        with missing_config_keys(
+            ("executor", "degree_of_parallelism"), ("executor", "gather_mem_size")
+        ):
+            with patch.object(PlanGenerator, "optimize", return_value=plan):
+                self.assertIs(PlanGenerator().build(MagicMock()), plan)
+            gather_plan = partition_plan(plan, 2)
+        # 150mb of gather_mem_size for batches of 30mb
+        self.assertEqual(gather_plan.queue_size, 5)
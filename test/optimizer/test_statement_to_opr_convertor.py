@@ -27,6 +27,7 @@ from eva.optimizer.operators import (
     LogicalInsert,
     LogicalJoin,
     LogicalLoadData,
+    LogicalOptimizeTable,
     LogicalOrderBy,
     LogicalQueryDerivedGet,
     LogicalRename,
@@ -40,6 +41,7 @@ from eva.parser.create_udf_statement import CreateUDFStatement
 from eva.parser.drop_statement import DropTableStatement
 from eva.parser.drop_udf_statement import DropUDFStatement
 from eva.parser.insert_statement import InsertTableStatement
+from eva.parser.optimize_statement import OptimizeTableStatement
 from eva.parser.rename_statement import RenameTableStatement
 from eva.parser.select_statement import SelectStatement
 from eva.parser.table_ref import TableInfo, TableRef
@@ -120,6 +122,7 @@ statement_to_opr_convertor.column_definition_to_udf_io"
         stmt.outputs = ["out"]
         stmt.impl_path = "tmp.py"
         stmt.udf_type = "classification"
+        stmt.udf_options = {"backend": "torchscript"}
         mock.side_effect = ["inp", "out"]
         convertor.visit_create_udf(stmt)
         mock.assert_any_call(stmt.inputs, True)
@@ -132,6 +135,7 @@ statement_to_opr_convertor.column_definition_to_udf_io"
             "out",
             stmt.impl_path,
             stmt.udf_type,
+            stmt.udf_options,
         )
 
     def test_visit_should_call_create_udf(self):
@@ -168,6 +172,23 @@ statement_to_opr_convertor.column_definition_to_udf_io"
         mock.assert_called_once()
         mock.assert_called_with(stmt)
 
+    @patch("eva.optimizer.statement_to_opr_convertor.LogicalOptimizeTable")
+    def test_visit_optimize_table(self, l_optimize_table_mock):
+        convertor = StatementToPlanConvertor()
+        stmt = MagicMock()
+        convertor.visit_optimize_table(stmt)
+        l_optimize_table_mock.assert_called_once_with(stmt.table_ref, stmt.sort_column)
+
+    def test_visit_should_call_optimize_table(self):
+        stmt = MagicMock(spec=OptimizeTableStatement)
+        convertor = StatementToPlanConvertor()
+        mock = MagicMock()
+        convertor.visit_optimize_table = mock
+
+        convertor.visit(stmt)
+        mock.assert_called_once()
+        mock.assert_called_with(stmt)
+
     def test_visit_should_call_insert(self):
         stmt = MagicMock(spec=InsertTableStatement)
         convertor = StatementToPlanConvertor()
@@ -221,6 +242,7 @@ statement_to_opr_convertor.column_definition_to_udf_io"
         show_plan = LogicalShow(MagicMock())
         drop_plan = LogicalDrop([MagicMock()], True)
         drop_udf_plan = LogicalDropUDF("FakeUDF", False)
+        optimize_table_plan = LogicalOptimizeTable(TableRef(TableInfo("table")))
         get_plan = LogicalGet(MagicMock(), MagicMock(), MagicMock())
         sample_plan = LogicalSample(MagicMock())
         filter_plan = LogicalFilter(MagicMock())
@@ -239,6 +261,7 @@ statement_to_opr_convertor.column_definition_to_udf_io"
         plans.append(rename_plan)
         plans.append(drop_plan)
         plans.append(drop_udf_plan)
+        plans.append(optimize_table_plan)
         plans.append(get_plan)
         plans.append(sample_plan)
         plans.append(filter_plan)
@@ -29,6 +29,7 @@ from eva.parser.drop_statement import DropTableStatement
 from eva.parser.drop_udf_statement import DropUDFStatement
 from eva.parser.insert_statement import InsertTableStatement
 from eva.parser.load_statement import LoadDataStatement
+from eva.parser.optimize_statement import OptimizeTableStatement
 from eva.parser.parser import Parser
 from eva.parser.rename_statement import RenameTableStatement
 from eva.parser.select_statement import SelectStatement
@@ -106,6 +107,24 @@ class ParserTests(unittest.TestCase):
         self.assertEqual(str(expected_stmt1), drop_udf_query1)
         self.assertEqual(str(expected_stmt2), drop_udf_query2)
 
+    def test_optimize_table_statement(self):
+        parser = Parser()
+        optimize_query = "OPTIMIZE TABLE MyCSV ORDER BY frame_id;"
+        expected_stmt = OptimizeTableStatement(TableRef(TableInfo("MyCSV")), "frame_id")
+        eva_statement_list = parser.parse(optimize_query)
+        self.assertIsInstance(eva_statement_list, list)
+        self.assertEqual(len(eva_statement_list), 1)
+        self.assertEqual(eva_statement_list[0].stmt_type, StatementType.OPTIMIZE_TABLE)
+        self.assertEqual(eva_statement_list[0], expected_stmt)
+        self.assertEqual(
+            str(eva_statement_list[0]), "OPTIMIZE TABLE MyCSV ORDER BY frame_id"
+        )
+
+        eva_statement_list = parser.parse("OPTIMIZE TABLE MyCSV;")
+        self.assertEqual(
+            eva_statement_list[0], OptimizeTableStatement(TableRef(TableInfo("MyCSV")))
+        )
+
     def test_single_statement_queries(self):
         parser = Parser()
 
@@ -399,6 +418,22 @@ class ParserTests(unittest.TestCase):
 
         self.assertEqual(create_udf_stmt, expected_stmt)
 
+    def test_create_udf_statement_with_options(self):
+        parser = Parser()
+        create_udf_query = """CREATE UDF FastRCNN
+                  INPUT  (Frame_Array NDARRAY UINT8(3, 256, 256))
+                  OUTPUT (Labels NDARRAY STR(10))
+                  TYPE  Classification
+                  IMPL  'data/fastrcnn.py'
+                  WITH  BACKEND = torchscript, threshold = 0.5, tag = 'cars';
+        """
+        create_udf_stmt = parser.parse(create_udf_query)[0]
+        self.assertEqual(
+            create_udf_stmt.udf_options,
+            {"backend": "torchscript", "threshold": 0.5, "tag": "cars"},
+        )
+        self.assertIn("WITH backend=torchscript", str(create_udf_stmt))
+
     def test_load_video_data_statement(self):
         parser = Parser()
         load_data_query = """LOAD FILE 'data/video.mp4'
@@ -420,6 +455,20 @@ class ParserTests(unittest.TestCase):
         load_data_stmt = eva_statement_list[0]
         self.assertEqual(load_data_stmt, expected_stmt)
 
+    def test_load_video_data_statement_with_options(self):
+        parser = Parser()
+        load_data_query = """LOAD FILE 'data/video.mp4'
+                             INTO MyVideo WITH FORMAT VIDEO, link = 'reference';"""
+        file_options = {"file_format": FileFormatType.VIDEO, "link": "reference"}
+        expected_stmt = LoadDataStatement(
+            TableRef(TableInfo("MyVideo")),
+            Path("data/video.mp4"),
+            None,
+            file_options,
+        )
+        eva_statement_list = parser.parse(load_data_query)
+        self.assertEqual(eva_statement_list[0], expected_stmt)
+
     def test_load_csv_data_statement(self):
         parser = Parser()
         load_data_query = """LOAD FILE 'data/meta.csv'
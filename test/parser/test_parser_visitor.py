@@ -369,7 +369,7 @@ class ParserVisitorTests(unittest.TestCase):
 
         create_udf_mock.assert_called_once()
         create_udf_mock.assert_called_with(
-            udf_name, True, "col", "col", "udf_impl", udf_type
+            udf_name, True, "col", "col", "udf_impl", udf_type, {}
         )
 
         self.assertEqual(actual, create_udf_mock.return_value)
@@ -26,6 +26,7 @@ from eva.planner.drop_plan import DropPlan
 from eva.planner.drop_udf_plan import DropUDFPlan
 from eva.planner.insert_plan import InsertPlan
 from eva.planner.load_data_plan import LoadDataPlan
+from eva.planner.optimize_table_plan import OptimizeTablePlan
 from eva.planner.rename_plan import RenamePlan
 from eva.planner.types import PlanOprType
 from eva.planner.union_plan import UnionPlan
@@ -104,6 +105,13 @@ class PlanNodeTests(unittest.TestCase):
         self.assertEqual(node.opr_type, PlanOprType.DROP_UDF)
         self.assertEqual(node.if_exists, True)
 
+    def test_optimize_table_plan(self):
+        table_ref = TableRef(TableInfo("MyCSV"))
+        node = OptimizeTablePlan(table_ref, "id")
+        self.assertEqual(node.opr_type, PlanOprType.OPTIMIZE_TABLE)
+        self.assertEqual(node.table_ref, table_ref)
+        self.assertEqual(node.sort_column, "id")
+
     def test_load_data_plan(self):
         table_metainfo = "meta_info"
         file_path = "test.mp4"
@@ -17,14 +17,22 @@ import unittest
 from test.util import (
     FRAME_SIZE,
     NUM_FRAMES,
+    convert_bbox,
     create_dummy_csv_batches,
     create_sample_csv,
     file_remove,
     upload_dir_from_config,
 )
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from eva.catalog.column_type import ColumnType, NdArrayType
+from eva.catalog.models.df_column import DataFrameColumn
 from eva.expression.tuple_value_expression import TupleValueExpression
-from eva.readers.csv_reader import CSVReader
+from eva.models.storage.batch import Batch
+from eva.readers.csv_reader import CSVReader, convert_csv_strings_to_ndarrays
 
 
 class CSVLoaderTest(unittest.TestCase):
@@ -55,3 +63,39 @@ class CSVLoaderTest(unittest.TestCase):
 
         # assert batches are equal
         self.assertTrue(batches, expected)
+
+    def test_should_convert_ndarray_columns_in_small_batches(self):
+        column_list = [
+            TupleValueExpression(
+                col_name=name,
+                table_alias="dummy",
+                col_object=DataFrameColumn(name, col_type, array_type=array_type),
+            )
+            for name, col_type, array_type in [
+                ("id", ColumnType.INTEGER, None),
+                ("label", ColumnType.TEXT, None),
+                ("bbox", ColumnType.NDARRAY, NdArrayType.FLOAT32),
+            ]
+        ]
+        csv_loader = CSVReader(
+            file_url=os.path.join(upload_dir_from_config, "dummy.csv"),
+            column_list=column_list,
+            batch_mem_size=100,
+        )
+
+        batches = list(csv_loader.read())
+        self.assertGreater(len(batches), 1)
+        expected = pd.read_csv(
+            os.path.join(upload_dir_from_config, "dummy.csv"),
+            converters={"bbox": convert_bbox},
+            usecols=["id", "label", "bbox"],
+        )
+        self.assertEqual(Batch.concat(batches, copy=False), Batch(expected))
+        self.assertEqual(batches[0].frames["bbox"][0].dtype, np.float32)
+
+    def test_should_convert_strings_to_ndarrays(self):
+        strings = pa.array(["1, 2.5,3", None, "4"])
+        arrays = convert_csv_strings_to_ndarrays(strings.slice(0, 3))
+        self.assertTrue(np.array_equal(arrays[0], np.float32([1, 2.5, 3])))
+        self.assertIsNone(arrays[1])
+        self.assertTrue(np.array_equal(arrays[2], np.float32([4])))
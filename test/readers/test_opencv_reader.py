@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import shutil
+import tempfile
 import unittest
 from test.util import (
     FRAME_SIZE,
@@ -22,13 +24,22 @@ from test.util import (
     file_remove,
     upload_dir_from_config,
 )
+from unittest.mock import patch
 
 from eva.expression.abstract_expression import ExpressionType
 from eva.expression.comparison_expression import ComparisonExpression
 from eva.expression.constant_value_expression import ConstantValueExpression
 from eva.expression.logical_expression import LogicalExpression
 from eva.expression.tuple_value_expression import TupleValueExpression
-from eva.readers.opencv_reader import OpenCVReader
+from eva.models.catalog.frame_info import FrameInfo
+from eva.models.catalog.properties import ColorSpace
+from eva.readers.opencv_reader import (
+    FrameReference,
+    OpenCVReader,
+    VideoProperties,
+    probe_video,
+)
+from eva.storage.frame_cache import FrameCache
 
 
 class VideoLoaderTest(unittest.TestCase):
@@ -154,3 +165,131 @@ class VideoLoaderTest(unittest.TestCase):
                 create_dummy_batches(filters=[i for i in range(start, 8, k)])
             )
         self.assertTrue(batches, expected)
+
+    def test_should_read_disjoint_shards_covering_all_frames(self):
+        for shard_count in range(1, 5):
+            frame_ids = []
+            for cur_shard in range(shard_count):
+                video_loader = OpenCVReader(
+                    file_url=os.path.join(upload_dir_from_config, "dummy.avi"),
+                    batch_mem_size=FRAME_SIZE * NUM_FRAMES,
+                    cur_shard=cur_shard,
+                    shard_count=shard_count,
+                    sampling_rate=2,
+                )
+                for batch in video_loader.read():
+                    frame_ids.extend(batch.frames["id"])
+            self.assertEqual(frame_ids, list(range(0, NUM_FRAMES, 2)))
+
+    def test_should_resize_and_convert_frames_to_frame_info(self):
+        video_loader = OpenCVReader(
+            file_url=os.path.join(upload_dir_from_config, "dummy.avi"),
+            batch_mem_size=FRAME_SIZE * NUM_FRAMES,
+            frame_info=FrameInfo(1, 1, 1, ColorSpace.GRAY),
+        )
+        frames = [
+            frame for batch in video_loader.read() for frame in batch.frames["data"]
+        ]
+        self.assertEqual(len(frames), NUM_FRAMES)
+        for frame in frames:
+            self.assertEqual(frame.shape, (1, 1))
+
+    def test_should_not_upscale_frames(self):
+        video_loader = OpenCVReader(
+            file_url=os.path.join(upload_dir_from_config, "dummy.avi"),
+            batch_mem_size=FRAME_SIZE * NUM_FRAMES,
+            frame_info=FrameInfo(4, 4, 3, ColorSpace.BGR),
+        )
+        expected = OpenCVReader(
+            file_url=os.path.join(upload_dir_from_config, "dummy.avi"),
+            batch_mem_size=FRAME_SIZE * NUM_FRAMES,
+        )
+        for batch, expected_batch in zip(video_loader.read(), expected.read()):
+            for frame, expected_frame in zip(
+                batch.frames["data"], expected_batch.frames["data"]
+            ):
+                self.assertEqual(frame.shape, (2, 2, 3))
+                self.assertTrue((frame == expected_frame).all())
+
+    def test_should_return_frame_references_of_lazy_frames(self):
+        video_file = os.path.join(upload_dir_from_config, "dummy.avi")
+        video_loader = OpenCVReader(
+            file_url=video_file,
+            batch_mem_size=FRAME_SIZE * NUM_FRAMES,
+            sampling_rate=2,
+            lazy_frames=True,
+        )
+        references = [
+            reference
+            for batch in video_loader.read()
+            for reference in batch.frames["data"]
+        ]
+        self.assertEqual(
+            references,
+            [FrameReference(video_file, i) for i in range(0, NUM_FRAMES, 2)],
+        )
+
+    def test_should_probe_video_properties(self):
+        video_file = os.path.join(upload_dir_from_config, "dummy.avi")
+        self.assertEqual(
+            probe_video(video_file),
+            VideoProperties(
+                num_frames=NUM_FRAMES, fps=10.0, width=2, height=2, codec="MJPG"
+            ),
+        )
+        self.assertIsNone(probe_video(video_file + ".missing"))
+
+    @patch("eva.readers.opencv_reader.probe_video")
+    def test_should_read_ranges_of_cached_video_properties(self, mock_probe):
+        video_file = os.path.join(upload_dir_from_config, "dummy.avi")
+        # the cached frame count bounds the frames read
+        video_loader = OpenCVReader(
+            file_url=video_file,
+            batch_mem_size=FRAME_SIZE * NUM_FRAMES,
+            video_properties=VideoProperties(
+                num_frames=4, fps=10.0, width=2, height=2, codec="MJPG"
+            ),
+        )
+        frame_ids = [
+            frame_id for batch in video_loader.read() for frame_id in batch.frames["id"]
+        ]
+        self.assertEqual(frame_ids, [0, 1, 2, 3])
+        mock_probe.assert_not_called()
+
+    def test_should_read_decoded_frames_from_frame_cache(self):
+        video_file = os.path.join(upload_dir_from_config, "dummy.avi")
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        frame_cache = FrameCache(cache_dir, 1 << 20, chunk_frames=4, min_misses=1)
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER,
+            TupleValueExpression(col_name="id"),
+            ConstantValueExpression(2),
+        )
+
+        def read(**kwargs):
+            video_loader = OpenCVReader(
+                file_url=video_file,
+                batch_mem_size=FRAME_SIZE * NUM_FRAMES,
+                predicate=predicate,
+                sampling_rate=2,
+                **kwargs,
+            )
+            return [
+                (frame_id, frame)
+                for batch in video_loader.read()
+                for frame_id, frame in zip(batch.frames["id"], batch.frames["data"])
+            ]
+
+        expected = read()
+        self.assertEqual([frame_id for frame_id, _ in expected], [4, 6, 8])
+        for _ in range(2):
+            frames = read(frame_cache=frame_cache, cache_key="dummy")
+            self.assertEqual(len(frames), len(expected))
+            for (frame_id, frame), (expected_id, expected_frame) in zip(
+                frames, expected
+            ):
+                self.assertEqual(frame_id, expected_id)
+                self.assertTrue((frame == expected_frame).all())
+        # the chunks of frames 0-3 and 4-7 and 8-9
+        self.assertEqual((frame_cache.hits, frame_cache.misses), (3, 3))
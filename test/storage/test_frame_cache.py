@@ -0,0 +1,106 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from eva.models.catalog.frame_info import FrameInfo
+from eva.models.catalog.properties import ColorSpace
+from eva.storage.frame_cache import FrameCache
+
+
+class FrameCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.frame_info = FrameInfo(2, 2, 3, ColorSpace.RGB)
+
+    def _frames(self, value, num_frames=4):
+        return [np.full((2, 2, 3), value, dtype=np.uint8)] * num_frames
+
+    def _put(self, cache, chunk_begin, frames):
+        # the chunks are stored once missed
+        cache.get("video", self.frame_info, chunk_begin)
+        cache.put("video", self.frame_info, chunk_begin, frames)
+
+    def test_should_return_cached_frames(self):
+        cache = FrameCache(self.cache_dir, 1 << 20, chunk_frames=4, min_misses=1)
+        self._put(cache, 0, self._frames(1))
+
+        frames = cache.get("video", self.frame_info, 0)
+        self.assertEqual(frames.shape, (4, 2, 2, 3))
+        self.assertTrue((frames == self._frames(1)).all())
+        self.assertTrue(frames.flags.writeable)
+        # the chunks are keyed by the video, the frame info and the range
+        self.assertIsNone(cache.get("other", self.frame_info, 0))
+        self.assertIsNone(cache.get("video", None, 0))
+        self.assertIsNone(cache.get("video", self.frame_info, 4))
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+        self.assertEqual(cache.hit_rate, 0.2)
+
+    def test_should_store_chunks_missed_repeatedly(self):
+        cache = FrameCache(self.cache_dir, 1 << 20, chunk_frames=4)
+        self._put(cache, 0, self._frames(1))
+        self.assertEqual(cache.size, 0)
+        self._put(cache, 0, self._frames(1))
+        self.assertGreater(cache.size, 0)
+        self.assertIsNotNone(cache.get("video", self.frame_info, 0))
+
+    def test_should_compress_chunks(self):
+        frames = [np.zeros((64, 64, 3), dtype=np.uint8)] * 4
+        uncompressed = FrameCache(self.cache_dir / "raw", 1 << 20, min_misses=1)
+        self._put(uncompressed, 0, frames)
+        cache = FrameCache(
+            self.cache_dir / "zstd", 1 << 20, compression="zstd", min_misses=1
+        )
+        self._put(cache, 0, frames)
+        self.assertLess(cache.size, uncompressed.size // 10)
+        self.assertTrue((cache.get("video", self.frame_info, 0) == frames).all())
+
+    def test_should_evict_least_recently_used_chunks(self):
+        cache = FrameCache(self.cache_dir, 1 << 20, chunk_frames=4, min_misses=1)
+        self._put(cache, 0, self._frames(1))
+        chunk_size = cache.size
+        cache.max_size = 2 * chunk_size
+        self._put(cache, 4, self._frames(2))
+        cache.get("video", self.frame_info, 0)
+        self._put(cache, 8, self._frames(3))
+
+        self.assertEqual(cache.size, 2 * chunk_size)
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 2)
+        self.assertIsNotNone(cache.get("video", self.frame_info, 0))
+        self.assertIsNone(cache.get("video", self.frame_info, 4))
+        self.assertIsNotNone(cache.get("video", self.frame_info, 8))
+
+    def test_should_reuse_chunks_of_previous_instances(self):
+        self._put(
+            FrameCache(self.cache_dir, 1 << 20, chunk_frames=4, min_misses=1),
+            0,
+            self._frames(1, num_frames=3),
+        )
+        cache = FrameCache(self.cache_dir, 1 << 20, chunk_frames=4)
+        self.assertGreater(cache.size, 0)
+        frames = cache.get("video", self.frame_info, 0)
+        self.assertTrue((frames == self._frames(1, num_frames=3)).all())
+
+        # corrupted chunks are discarded
+        for chunk_file in self.cache_dir.iterdir():
+            chunk_file.write_bytes(b"corrupted")
+        self.assertIsNone(cache.get("video", self.frame_info, 0))
+        self.assertEqual(cache.size, 0)
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
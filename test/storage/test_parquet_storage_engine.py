@@ -0,0 +1,359 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import shutil
+import unittest
+from pathlib import Path
+from test.util import NUM_FRAMES, create_dummy_batches, missing_config_keys
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from mock import patch
+
+from eva.catalog.column_type import ColumnType, Dimension, NdArrayType
+from eva.catalog.models.df_column import DataFrameColumn
+from eva.catalog.models.df_metadata import DataFrameMetadata
+from eva.expression.abstract_expression import ExpressionType
+from eva.expression.comparison_expression import ComparisonExpression
+from eva.expression.constant_value_expression import ConstantValueExpression
+from eva.expression.logical_expression import LogicalExpression
+from eva.expression.tuple_value_expression import TupleValueExpression
+from eva.models.storage.batch import Batch
+from eva.storage.parquet_storage_engine import (
+    ColumnStatistics,
+    ParquetStorageEngine,
+    ParquetWriteSession,
+    may_match,
+)
+from eva.storage.write_session import FILE_MEM_SIZE, ROW_GROUP_MEM_SIZE
+
+
+class ParquetStorageEngineTest(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.table = None
+
+    def create_sample_table(self):
+        table_info = DataFrameMetadata("dataset", "dataset")
+        column_0 = DataFrameColumn("name", ColumnType.TEXT, False)
+        column_1 = DataFrameColumn("id", ColumnType.INTEGER, False)
+        column_2 = DataFrameColumn(
+            "data", ColumnType.NDARRAY, False, NdArrayType.UINT8, [2, 2, 3]
+        )
+        table_info.schema = [column_0, column_1, column_2]
+        return table_info
+
+    def setUp(self):
+        self.table = self.create_sample_table()
+
+    def tearDown(self):
+        shutil.rmtree("dataset", ignore_errors=True)
+
+    def _write_dummy_batches(self, engine):
+        dummy_batches = list(create_dummy_batches())
+        for batch in dummy_batches:
+            batch.drop_column_alias()
+            engine.write(self.table, batch)
+        return dummy_batches
+
+    def test_should_create_empty_table(self):
+        parquet = ParquetStorageEngine()
+        parquet.create(self.table)
+        records = list(parquet.read(self.table, batch_mem_size=3000))
+        self.assertEqual(records, [])
+
+    def test_should_write_rows_to_table(self):
+        parquet = ParquetStorageEngine()
+        parquet.create(self.table)
+        dummy_batches = self._write_dummy_batches(parquet)
+
+        read_batch = Batch.concat(parquet.read(self.table, batch_mem_size=3000))
+        self.assertEqual(read_batch, Batch.concat(dummy_batches))
+
+    def test_should_return_even_frames(self):
+        parquet = ParquetStorageEngine()
+        parquet.create(self.table)
+        self._write_dummy_batches(parquet)
+
+        read_batch = Batch.concat(
+            parquet.read(
+                self.table,
+                batch_mem_size=3000,
+                columns=["id"],
+                predicate_func=lambda id: id % 2 == 0,
+            )
+        )
+        expected_batch = Batch.concat(
+            create_dummy_batches(filters=[i for i in range(NUM_FRAMES) if i % 2 == 0])
+        )
+        expected_batch.drop_column_alias()
+        self.assertEqual(read_batch, expected_batch)
+
+    def test_should_only_read_projected_columns(self):
+        parquet = ParquetStorageEngine()
+        parquet.create(self.table)
+        dummy_batches = self._write_dummy_batches(parquet)
+
+        read_batch = Batch.concat(
+            parquet.read(self.table, batch_mem_size=3000, projection=["id"])
+        )
+        expected_batch = Batch.concat(dummy_batches)
+        self.assertEqual(list(read_batch.frames.columns), ["id"])
+        self.assertEqual(
+            list(read_batch.frames["id"]), list(expected_batch.frames["id"])
+        )
+
+    def _id_predicate(self, etype, value):
+        return ComparisonExpression(
+            etype,
+            TupleValueExpression(col_name="id", col_alias="dataset.id"),
+            ConstantValueExpression(value),
+        )
+
+    def test_should_skip_row_groups_not_matching_predicate(self):
+        parquet = ParquetStorageEngine()
+        parquet.create(self.table)
+        for batch in create_dummy_batches(batch_size=1):
+            batch.drop_column_alias()
+            parquet.write(self.table, batch)
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_AND,
+            self._id_predicate(ExpressionType.COMPARE_GEQ, 3),
+            self._id_predicate(ExpressionType.COMPARE_LESSER, 5),
+        )
+
+        with patch.object(pq, "ParquetFile", wraps=pq.ParquetFile) as parquet_file:
+            read_batch = Batch.concat(
+                parquet.read(
+                    self.table,
+                    batch_mem_size=3000,
+                    projection=["name"],
+                    predicate=predicate,
+                )
+            )
+        # the footers are read beforehand to check the statistics
+        opened_files = [
+            call for call in parquet_file.call_args_list if "metadata" in call.kwargs
+        ]
+        self.assertEqual(len(opened_files), 2)
+        self.assertEqual(list(read_batch.frames["id"]), [3, 4])
+        self.assertEqual(list(read_batch.frames.columns), ["name", "id"])
+
+    def test_should_rule_out_rows_with_statistics(self):
+        statistics = {"id": ColumnStatistics(10, 20, 0, 5)}
+        for etype, value, expected in [
+            (ExpressionType.COMPARE_EQUAL, 15, True),
+            (ExpressionType.COMPARE_EQUAL, 21, False),
+            (ExpressionType.COMPARE_GREATER, 20, False),
+            (ExpressionType.COMPARE_GEQ, 20, True),
+            (ExpressionType.COMPARE_LESSER, 10, False),
+            (ExpressionType.COMPARE_LEQ, 10, True),
+            (ExpressionType.COMPARE_NEQ, 10, True),
+        ]:
+            predicate = self._id_predicate(etype, value)
+            self.assertEqual(may_match(predicate, statistics), expected)
+
+        # the constant on the left side of the comparison
+        predicate = ComparisonExpression(
+            ExpressionType.COMPARE_GREATER,
+            ConstantValueExpression(10),
+            TupleValueExpression(col_name="id"),
+        )
+        self.assertFalse(may_match(predicate, statistics))
+        predicate = LogicalExpression(
+            ExpressionType.LOGICAL_OR,
+            self._id_predicate(ExpressionType.COMPARE_LESSER, 5),
+            self._id_predicate(ExpressionType.COMPARE_GREATER, 15),
+        )
+        self.assertTrue(may_match(predicate, statistics))
+        # null values satisfy no comparison
+        statistics = {"id": ColumnStatistics(None, None, 5, 5)}
+        predicate = self._id_predicate(ExpressionType.COMPARE_NEQ, 10)
+        self.assertFalse(may_match(predicate, statistics))
+        self.assertTrue(may_match(predicate, {}))
+
+    def test_should_show_rows_of_write_session_once_committed(self):
+        parquet = ParquetStorageEngine()
+        parquet.create(self.table)
+        dummy_batches = list(create_dummy_batches(batch_size=1))
+        row_size = ParquetWriteSession(parquet, self.table, 1, 1)._prepare(
+            dummy_batches[0]
+        )[1]
+        # row groups of two rows and files of two row groups
+        session = ParquetWriteSession(parquet, self.table, 2 * row_size, 4 * row_size)
+        for batch in dummy_batches:
+            batch.drop_column_alias()
+            session.append(batch)
+            self.assertEqual(list(parquet.read(self.table, batch_mem_size=3000)), [])
+        session.commit()
+
+        read_batch = Batch.concat(parquet.read(self.table, batch_mem_size=3000))
+        self.assertEqual(read_batch, Batch.concat(dummy_batches))
+        files = parquet._files(self.table)
+        self.assertEqual(len(files), 3)
+        self.assertEqual(
+            [pq.ParquetFile(str(path)).num_row_groups for path in files], [2, 2, 1]
+        )
+
+    def test_should_discard_rows_of_aborted_write_session(self):
+        parquet = ParquetStorageEngine()
+        parquet.create(self.table)
+        with self.assertRaises(RuntimeError):
+            with parquet.open_write_session(self.table) as session:
+                for batch in create_dummy_batches():
+                    batch.drop_column_alias()
+                    session.append(batch)
+                raise RuntimeError("failed query")
+
+        self.assertEqual(list(parquet.read(self.table, batch_mem_size=3000)), [])
+        self.assertEqual(
+            sorted(path.name for path in Path("dataset").iterdir()),
+            ["_manifest.json"],
+        )
+
+    def _write_reversed_rows(self, engine):
+        dummy_batches = list(create_dummy_batches(batch_size=1))
+        for batch in reversed(dummy_batches):
+            batch.drop_column_alias()
+            engine.write(self.table, batch)
+        return dummy_batches
+
+    def test_should_compact_small_files_into_sorted_file(self):
+        parquet = ParquetStorageEngine()
+        parquet.create(self.table)
+        dummy_batches = self._write_reversed_rows(parquet)
+        old_files = parquet._files(self.table)
+        self.assertEqual(len(old_files), NUM_FRAMES)
+
+        # a scan started before the compaction
+        reader = parquet.read(self.table, batch_mem_size=3000)
+        first_batch = next(reader)
+        self.assertEqual(parquet.compact(self.table), (NUM_FRAMES, 1))
+        read_batch = Batch.concat([first_batch] + list(reader))
+        self.assertEqual(sorted(read_batch.frames["id"]), list(range(NUM_FRAMES)))
+
+        files = parquet._files(self.table)
+        self.assertEqual(len(files), 1)
+        self.assertTrue(all(path.exists() for path in old_files))
+        read_batch = Batch.concat(parquet.read(self.table, batch_mem_size=3000))
+        self.assertEqual(read_batch, Batch.concat(dummy_batches))
+
+        # the replaced files are deleted once no scan can use them
+        with patch("eva.storage.parquet_storage_engine._OBSOLETE_FILE_TTL", -1):
+            self.assertEqual(parquet.compact(self.table), (0, 0))
+        self.assertFalse(any(path.exists() for path in old_files))
+        self.assertEqual(parquet._files(self.table), files)
+
+    def test_should_compact_by_sort_column(self):
+        parquet = ParquetStorageEngine()
+        parquet.create(self.table)
+        self._write_reversed_rows(parquet)
+        parquet.compact(self.table, "name")
+        read_batch = Batch.concat(parquet.read(self.table, batch_mem_size=3000))
+        names = list(read_batch.frames["name"])
+        self.assertEqual(names, sorted(names))
+
+        with self.assertRaises(RuntimeError):
+            parquet.compact(self.table, "label")
+
+    def test_should_compact_table_in_background(self):
+        parquet = ParquetStorageEngine()
+        parquet.create(self.table)
+        config = {
+            "compaction_min_files": NUM_FRAMES,
+            "row_group_mem_size": 64 * 1024,
+            "file_mem_size": 1024 * 1024,
+        }
+        with patch(
+            "eva.storage.parquet_storage_engine.ConfigurationManager"
+        ) as mock_config:
+            mock_config.return_value.get_value.side_effect = (
+                lambda category, key, default=None: config[key]
+            )
+            dummy_batches = self._write_reversed_rows(parquet)
+            parquet._compaction_executor.shutdown(wait=True)
+
+        self.assertEqual(len(parquet._files(self.table)), 1)
+        read_batch = Batch.concat(parquet.read(self.table, batch_mem_size=3000))
+        self.assertEqual(read_batch, Batch.concat(dummy_batches))
+
+    def test_should_default_sizes_missing_in_config(self):
+        parquet = ParquetStorageEngine()
+        parquet.create(self.table)
+        with missing_config_keys(
+            ("storage", "row_group_mem_size"),
+            ("storage", "file_mem_size"),
+            ("storage", "compaction_min_files"),
+        ):
+            with parquet.open_write_session(self.table) as session:
+                self.assertEqual(session._buffer_mem_size, ROW_GROUP_MEM_SIZE)
+                self.assertEqual(session._file_mem_size, FILE_MEM_SIZE)
+                for batch in create_dummy_batches():
+                    batch.drop_column_alias()
+                    session.append(batch)
+            # fewer small files than the default compaction_min_files
+            dummy_batches = self._write_reversed_rows(parquet)
+
+        self.assertIsNone(parquet._compaction_executor)
+        self.assertEqual(len(parquet._files(self.table)), NUM_FRAMES + 1)
+        read_batch = Batch.concat(parquet.read(self.table, batch_mem_size=3000))
+        self.assertEqual(len(read_batch), 2 * len(Batch.concat(dummy_batches)))
+
+    def test_should_read_disjoint_shards_covering_all_rows(self):
+        parquet = ParquetStorageEngine()
+        parquet.create(self.table)
+        for batch in create_dummy_batches(batch_size=1):
+            batch.drop_column_alias()
+            parquet.write(self.table, batch)
+
+        for total_shards in range(1, 5):
+            ids = []
+            for curr_shard in range(total_shards):
+                for batch in parquet.read(
+                    self.table,
+                    batch_mem_size=3000,
+                    curr_shard=curr_shard,
+                    total_shards=total_shards,
+                ):
+                    ids.extend(batch.frames["id"])
+            self.assertEqual(ids, list(range(NUM_FRAMES)))
+
+    def test_should_store_arrays_of_any_shape(self):
+        self.table.schema = [
+            DataFrameColumn("id", ColumnType.INTEGER, False),
+            DataFrameColumn(
+                "labels", ColumnType.NDARRAY, True, NdArrayType.STR, [Dimension.ANYDIM]
+            ),
+            DataFrameColumn(
+                "scores",
+                ColumnType.NDARRAY,
+                True,
+                NdArrayType.FLOAT32,
+                [Dimension.ANYDIM],
+            ),
+        ]
+        rows = pd.DataFrame(
+            {
+                "id": [0, 1, 2],
+                "labels": [np.array(["car"]), np.array(["car", "person"]), None],
+                "scores": [np.array([0.5]), np.array([0.25, 0.75]), None],
+            }
+        )
+        parquet = ParquetStorageEngine()
+        parquet.create(self.table)
+        parquet.write(self.table, Batch(rows))
+
+        read_batch = Batch.concat(parquet.read(self.table, batch_mem_size=3000))
+        self.assertEqual(read_batch, Batch(rows))
@@ -12,17 +12,38 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import shutil
 import struct
+import tempfile
 import unittest
+from pathlib import Path
+from test.util import (
+    NUM_FRAMES,
+    create_sample_video,
+    missing_config_keys,
+    upload_dir_from_config,
+)
 from unittest.mock import MagicMock
 
 import mock
+import pandas as pd
 from mock import mock_open
 
 from eva.catalog.column_type import ColumnType, NdArrayType
 from eva.catalog.models.df_column import DataFrameColumn
 from eva.catalog.models.df_metadata import DataFrameMetadata
 from eva.configuration.configuration_manager import ConfigurationManager
+from eva.models.storage.batch import Batch
+from eva.readers.opencv_reader import VideoProperties, probe_video
+from eva.storage.frame_cache import FrameCache
+from eva.storage.opencv_storage_engine import (
+    COPY,
+    HARDLINK,
+    REFERENCE,
+    REFLINK,
+    OpenCVStorageEngine,
+)
 from eva.storage.storage_engine import VideoStorageEngine
 
 
@@ -69,3 +90,192 @@ class VideoStorageEngineTest(unittest.TestCase):
         table.file_url = Exception()
         with self.assertRaises(Exception):
             self.video_engine.write(table, batch)
+
+    def _load_sample_video(self, link_mode, with_properties=False):
+        dir_path = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, dir_path)
+        create_sample_video()
+        video_file = dir_path / "dummy.avi"
+        shutil.move(os.path.join(upload_dir_from_config, "dummy.avi"), video_file)
+        # the name of the video is stored in the first column
+        name_column = MagicMock()
+        name_column.name = "name"
+        self.table = MagicMock(file_url=str(dir_path / "table"), columns=[name_column])
+        self.video_engine.create(self.table)
+        video = {"video_file_path": str(video_file)}
+        if with_properties:
+            video.update(probe_video(str(video_file))._asdict())
+        self.video_engine.write(
+            self.table, Batch(pd.DataFrame([video])), link_mode=link_mode
+        )
+        return video_file
+
+    def _read_names(self):
+        names = []
+        for batch in self.video_engine.read(self.table, batch_mem_size=3000):
+            names.extend(batch.frames["name"])
+        return names
+
+    def test_should_read_referenced_video_in_place(self):
+        video_file = self._load_sample_video(REFERENCE)
+        self.assertEqual(os.listdir(self.table.file_url), ["metadata"])
+        self.assertEqual(self._read_names(), ["dummy.avi"] * NUM_FRAMES)
+
+        # touching the video does not change its content
+        os.utime(video_file, ns=(0, 0))
+        self.assertEqual(len(self._read_names()), NUM_FRAMES)
+
+        with open(video_file, "ab") as f:
+            f.write(b"0")
+        with self.assertRaises(RuntimeError):
+            self._read_names()
+        video_file.unlink()
+        with self.assertRaises(RuntimeError):
+            self._read_names()
+
+    def test_should_link_video_into_table(self):
+        video_file = self._load_sample_video(HARDLINK)
+        stored_file = Path(self.table.file_url) / "dummy.avi"
+        self.assertTrue(stored_file.samefile(video_file))
+        self.assertEqual(self._read_names(), ["dummy.avi"] * NUM_FRAMES)
+
+    def test_should_clone_or_copy_video_into_table(self):
+        video_file = self._load_sample_video(REFLINK)
+        stored_file = Path(self.table.file_url) / "dummy.avi"
+        self.assertFalse(stored_file.samefile(video_file))
+        self.assertEqual(stored_file.read_bytes(), video_file.read_bytes())
+        self.assertEqual(self._read_names(), ["dummy.avi"] * NUM_FRAMES)
+
+    @mock.patch("eva.readers.opencv_reader.probe_video")
+    def test_should_cache_video_properties_in_metadata(self, mock_probe):
+        for link_mode in [COPY, REFERENCE]:
+            video_file = self._load_sample_video(link_mode, with_properties=True)
+            video_path = "dummy.avi" if link_mode == COPY else video_file.resolve()
+            self.assertEqual(
+                self.video_engine.get_video_properties(self.table),
+                [
+                    (
+                        Path(video_path),
+                        VideoProperties(
+                            num_frames=NUM_FRAMES,
+                            fps=10.0,
+                            width=2,
+                            height=2,
+                            codec="MJPG",
+                        ),
+                    )
+                ],
+            )
+            self.assertEqual(self._read_names(), ["dummy.avi"] * NUM_FRAMES)
+            mock_probe.assert_not_called()
+
+    def test_should_probe_videos_without_cached_properties(self):
+        self._load_sample_video(COPY)
+        self.assertEqual(
+            self.video_engine.get_video_properties(self.table),
+            [(Path("dummy.avi"), None)],
+        )
+        self.assertEqual(self._read_names(), ["dummy.avi"] * NUM_FRAMES)
+
+    def test_should_read_frames_from_frame_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.video_engine = OpenCVStorageEngine()
+        self.video_engine.frame_cache = FrameCache(cache_dir, 1 << 20, min_misses=1)
+        video_file = self._load_sample_video(REFERENCE, with_properties=True)
+
+        self.assertEqual(self._read_names(), ["dummy.avi"] * NUM_FRAMES)
+        self.assertEqual(self._read_names(), ["dummy.avi"] * NUM_FRAMES)
+        frame_cache = self.video_engine.frame_cache
+        self.assertEqual((frame_cache.hits, frame_cache.misses), (1, 1))
+
+        # the cached frames of a video are not read once it changed
+        os.utime(video_file, ns=(0, 0))
+        self.video_engine.write(
+            self.table,
+            Batch(pd.DataFrame([{"video_file_path": str(video_file)}])),
+            link_mode=REFERENCE,
+        )
+        self.assertEqual(len(self._read_names()), 2 * NUM_FRAMES)
+        self.assertEqual((frame_cache.hits, frame_cache.misses), (2, 2))
+
+    def test_should_disable_frame_cache_missing_in_config(self):
+        with missing_config_keys(
+            ("storage", "frame_cache_size"),
+            ("storage", "frame_cache_dir"),
+            ("storage", "frame_cache_chunk_frames"),
+            ("storage", "frame_cache_compression"),
+        ):
+            self.assertIsNone(OpenCVStorageEngine().frame_cache)
+
+    def test_should_not_overwrite_videos_of_the_same_name(self):
+        dir_path = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, dir_path)
+        video_files = []
+        for name in ["a", "b"]:
+            (dir_path / name).mkdir()
+            video_files.append(dir_path / name / "clip.mp4")
+            video_files[-1].write_bytes(name.encode() * 8)
+        name_column = MagicMock()
+        name_column.name = "name"
+        self.table = MagicMock(file_url=str(dir_path / "table"), columns=[name_column])
+        self.video_engine.create(self.table)
+
+        def write(paths, link_mode):
+            self.video_engine.write(
+                self.table,
+                Batch(pd.DataFrame({"video_file_path": list(map(str, paths))})),
+                link_mode=link_mode,
+            )
+
+        for link_mode in [HARDLINK, REFLINK, COPY]:
+            write(video_files[:1], link_mode)
+            write(video_files[1:], link_mode)
+            self.assertEqual(video_files[0].read_bytes(), b"a" * 8)
+            stored_file = Path(self.table.file_url) / "clip.mp4"
+            self.assertEqual(stored_file.read_bytes(), b"b" * 8)
+
+        # the videos of a load cannot have the same name
+        with self.assertRaises(RuntimeError):
+            write(video_files, HARDLINK)
+        self.assertEqual(video_files[0].read_bytes(), b"a" * 8)
+        self.assertEqual(
+            sorted(os.listdir(self.table.file_url)), ["clip.mp4", "metadata"]
+        )
+
+    def test_should_read_shards_in_table_order(self):
+        video_file = self._load_sample_video(COPY, with_properties=True)
+        other_video_file = video_file.with_name("other.avi")
+        shutil.copy(video_file, other_video_file)
+        self.video_engine.write(
+            self.table,
+            Batch(
+                pd.DataFrame(
+                    [
+                        {
+                            "video_file_path": str(other_video_file),
+                            **probe_video(str(other_video_file))._asdict(),
+                        }
+                    ]
+                )
+            ),
+        )
+
+        def read_rows(**kwargs):
+            return [
+                (name, frame_id)
+                for batch in self.video_engine.read(
+                    self.table, batch_mem_size=3000, **kwargs
+                )
+                for name, frame_id in zip(batch.frames["name"], batch.frames["id"])
+            ]
+
+        rows = read_rows()
+        self.assertEqual(len(rows), 2 * NUM_FRAMES)
+        for total_shards in [2, 3, 4]:
+            shard_rows = [
+                row
+                for shard in range(total_shards)
+                for row in read_rows(curr_shard=shard, total_shards=total_shards)
+            ]
+            self.assertEqual(shard_rows, rows)
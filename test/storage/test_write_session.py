@@ -0,0 +1,43 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from test.util import create_dummy_batches
+
+from mock import MagicMock
+
+from eva.models.storage.batch import Batch
+from eva.storage.write_session import AppendWriteSession
+
+
+class AppendWriteSessionTest(unittest.TestCase):
+    def test_should_write_buffered_rows_at_once(self):
+        engine = MagicMock()
+        batches = list(create_dummy_batches(batch_size=1))
+        row_size = AppendWriteSession(engine, "table", 0)._prepare(batches[0])[1]
+        with AppendWriteSession(engine, "table", 2 * row_size) as session:
+            for batch in batches:
+                session.append(batch)
+
+        written_batches = [call.args[1] for call in engine.write.call_args_list]
+        self.assertEqual([len(batch) for batch in written_batches], [2] * 5)
+        self.assertEqual(Batch.concat(written_batches), Batch.concat(batches))
+
+    def test_should_raise_write_errors_on_commit(self):
+        engine = MagicMock()
+        engine.write.side_effect = RuntimeError("failed write")
+        session = AppendWriteSession(engine, "table", 1)
+        session.append(next(create_dummy_batches()))
+        with self.assertRaises(RuntimeError):
+            session.commit()
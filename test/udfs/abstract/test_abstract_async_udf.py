@@ -0,0 +1,73 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import time
+import unittest
+
+import pandas as pd
+
+from eva.udfs.abstract.abstract_udf import AbstractAsyncUDF
+
+
+class LookupUDF(AbstractAsyncUDF):
+    def setup(self, delay=0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def name(self) -> str:
+        return "LookupUDF"
+
+    async def forward(self, frames: pd.DataFrame) -> pd.DataFrame:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # later rows complete first
+        await asyncio.sleep(self.delay / (1 + abs(frames["id"][0])))
+        self.in_flight -= 1
+        if (frames["id"] < 0).any():
+            raise ValueError("lookup failure")
+        return pd.DataFrame({"value": frames["id"] * 10})
+
+
+class AbstractAsyncUDFTest(unittest.TestCase):
+    def test_should_preserve_row_order(self):
+        udf = LookupUDF()
+        udf.chunk_size = 2
+        outcome = udf(pd.DataFrame({"id": range(7)}))
+        self.assertEqual(list(outcome["value"]), [10 * i for i in range(7)])
+
+    def test_should_run_forward_calls_concurrently(self):
+        udf = LookupUDF(delay=0.2)
+        udf.max_concurrency = 8
+        start = time.perf_counter()
+        outcome = udf(pd.DataFrame({"id": [0] * 8}))
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(len(outcome), 8)
+        self.assertEqual(udf.max_in_flight, 8)
+
+    def test_should_limit_concurrency(self):
+        udf = LookupUDF(delay=0.01)
+        udf.max_concurrency = 3
+        udf(pd.DataFrame({"id": range(10)}))
+        self.assertEqual(udf.max_in_flight, 3)
+
+    def test_should_raise_forward_exception(self):
+        with self.assertRaises(ValueError):
+            LookupUDF()(pd.DataFrame({"id": [1, -1, 2]}))
+
+    def test_should_return_empty_frame_for_no_rows(self):
+        outcome = LookupUDF()(pd.DataFrame({"id": []}))
+        self.assertTrue(outcome.empty)
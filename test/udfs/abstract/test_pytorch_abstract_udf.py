@@ -0,0 +1,82 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import List
+
+import numpy as np
+import pandas as pd
+import torch
+from torch import Tensor
+from torchvision.transforms import transforms
+
+from eva.udfs.abstract.pytorch_abstract_udf import PytorchAbstractClassifierUDF
+
+
+class IdentityClassifier(PytorchAbstractClassifierUDF):
+    def setup(self):
+        self.linear = torch.nn.Linear(1, 1)
+
+    @property
+    def name(self) -> str:
+        return "IdentityClassifier"
+
+    @property
+    def labels(self) -> List[str]:
+        return []
+
+    def forward(self, frames: Tensor) -> pd.DataFrame:
+        return pd.DataFrame({"frame": [frame.numpy() for frame in frames]})
+
+
+class ResizeClassifier(IdentityClassifier):
+    def setup(self):
+        super().setup()
+        self.batch_transforms = [transforms.Resize([4, 6])]
+
+
+class PerFrameClassifier(IdentityClassifier):
+    def setup(self):
+        super().setup()
+        self.transforms = [transforms.Resize([4, 6]), transforms.ToTensor()]
+
+
+class PytorchAbstractClassifierUDFTest(unittest.TestCase):
+    def _frames(self, num_frames, height=8, width=12):
+        return [
+            np.random.randint(0, 256, size=(height, width, 3), dtype=np.uint8)
+            for _ in range(num_frames)
+        ]
+
+    def test_should_preprocess_default_transforms_in_batch(self):
+        udf = IdentityClassifier()
+        self.assertEqual(udf.batch_transforms, [])
+
+        frames = self._frames(3)
+        expected = torch.cat([udf.transform(frame) for frame in frames])
+        actual = udf._preprocess(frames)
+        self.assertEqual(actual.shape, (3, 3, 8, 12))
+        self.assertTrue(torch.allclose(actual, expected))
+
+    def test_should_apply_batch_transforms(self):
+        udf = ResizeClassifier()
+        actual = udf._preprocess(self._frames(3) + self._frames(2, 16, 24))
+        self.assertEqual(actual.shape, (5, 3, 4, 6))
+
+    def test_should_keep_custom_per_frame_transforms(self):
+        udf = PerFrameClassifier()
+        self.assertIsNone(udf.batch_transforms)
+        outcome = udf(self._frames(2))
+        self.assertEqual(len(outcome), 2)
+        self.assertEqual(outcome["frame"][0].shape, (3, 4, 6))
@@ -0,0 +1,143 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import importlib.util
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pandas as pd
+import torch
+from torch import Tensor, nn
+
+from eva.udfs import execution_backends
+from eva.udfs.abstract.pytorch_abstract_udf import PytorchAbstractClassifierUDF
+from eva.udfs.backend_comparison import compare_backends
+from eva.utils.generic_utils import configure_udf
+
+
+class TinyClassifier(PytorchAbstractClassifierUDF):
+    def setup(self):
+        torch.manual_seed(0)
+        self.model = nn.Sequential(
+            nn.Conv2d(3, 4, 3, padding=1),
+            nn.ReLU(),
+            nn.AdaptiveAvgPool2d(1),
+            nn.Flatten(),
+            nn.Linear(4, 2),
+        ).eval()
+
+    @property
+    def name(self) -> str:
+        return "TinyClassifier"
+
+    @property
+    def labels(self) -> List[str]:
+        return ["a", "b"]
+
+    def forward(self, frames: Tensor) -> pd.DataFrame:
+        scores = self.as_numpy(self.model(frames))
+        return pd.DataFrame({"scores": list(scores)})
+
+
+class ExecutionBackendsTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+        self.frames = [
+            np.random.randint(0, 256, size=(8, 12, 3), dtype=np.uint8) for _ in range(4)
+        ]
+
+    def tearDown(self):
+        execution_backends._runners.clear()
+        shutil.rmtree(self.cache_dir)
+
+    def _scores(self, udf):
+        with torch.no_grad():
+            return np.stack(udf(self.frames)["scores"])
+
+    def _check_backend(self, backend, atol):
+        expected = self._scores(TinyClassifier())
+        udf = TinyClassifier().set_backend(backend, self.cache_dir)
+        self.assertEqual(udf.backend, backend)
+        self.assertIsInstance(udf.model, execution_backends.CompiledModel)
+        self.assertTrue(np.allclose(self._scores(udf), expected, atol=atol))
+
+        artifact = udf.model.artifact_path((3, 8, 12))
+        self.assertTrue(artifact.exists())
+        # a new instance loads the cached artifact
+        execution_backends._runners.clear()
+        udf = TinyClassifier().set_backend(backend, self.cache_dir)
+        self.assertTrue(np.allclose(self._scores(udf), expected, atol=atol))
+
+    def test_should_run_torchscript_backend(self):
+        self._check_backend(execution_backends.TORCHSCRIPT, 1e-5)
+
+    def test_should_run_quantized_backend(self):
+        self._check_backend(execution_backends.QUANTIZED, 1e-1)
+
+    @unittest.skipIf(
+        importlib.util.find_spec("onnxruntime") is None, "onnxruntime not installed"
+    )
+    def test_should_run_onnxruntime_backend(self):
+        self._check_backend(execution_backends.ONNXRUNTIME, 1e-4)
+
+    def test_should_switch_back_to_eager_backend(self):
+        udf = TinyClassifier()
+        model = udf.model
+        udf.set_backend(execution_backends.TORCHSCRIPT, self.cache_dir)
+        udf.set_backend(execution_backends.EAGER)
+        self.assertIs(udf.model, model)
+        self.assertEqual(udf.backend, execution_backends.EAGER)
+
+    def test_should_raise_on_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            TinyClassifier().set_backend("tensorrt")
+
+    def test_should_reject_unsupported_backend(self):
+        class EagerClassifier(TinyClassifier):
+            supported_backends = (execution_backends.EAGER,)
+
+        udf = EagerClassifier()
+        with self.assertRaises(ValueError):
+            udf.set_backend(execution_backends.TORCHSCRIPT, self.cache_dir)
+        self.assertEqual(udf.backend, execution_backends.EAGER)
+        with self.assertRaises(ValueError):
+            configure_udf(udf, {"backend": execution_backends.ONNXRUNTIME})
+
+    def test_should_configure_udf_backend(self):
+        udf = TinyClassifier()
+        configure_udf(udf, {"backend": execution_backends.TORCHSCRIPT})
+        self.assertEqual(udf.backend, execution_backends.TORCHSCRIPT)
+
+        with self.assertRaises(RuntimeError):
+            configure_udf(udf, {"unknown": 1})
+        with self.assertRaises(RuntimeError):
+            configure_udf(object(), {"backend": execution_backends.TORCHSCRIPT})
+
+    def test_should_compare_backends(self):
+        results = compare_backends(
+            TinyClassifier,
+            self.frames,
+            [execution_backends.TORCHSCRIPT, "tensorrt"],
+            batch_size=2,
+            cache_dir=self.cache_dir,
+        )
+        self.assertEqual(list(results["backend"]), ["eager", "torchscript", "tensorrt"])
+        self.assertEqual(list(results["agreement"][:2]), [1.0, 1.0])
+        self.assertEqual(list(results["error"][:2]), ["", ""])
+        self.assertTrue(results["error"][2])
+        self.assertTrue(np.isnan(results["frames_per_second"][2]))
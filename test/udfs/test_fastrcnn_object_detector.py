@@ -52,6 +52,12 @@ class FastRCNNObjectDetectorTest(unittest.TestCase):
 
                 pass
 
+    def test_should_support_torchscript_backends_only(self):
+        from eva.udfs.execution_backends import ONNXRUNTIME
+        from eva.udfs.fastrcnn_object_detector import FastRCNNObjectDetector
+
+        self.assertNotIn(ONNXRUNTIME, FastRCNNObjectDetector.supported_backends)
+
     @unittest.skip("disable test due to model downloading time")
     def test_should_return_batches_equivalent_to_number_of_frames(self):
         from eva.udfs.fastrcnn_object_detector import FastRCNNObjectDetector
@@ -0,0 +1,56 @@
+# coding=utf-8
+# Copyright 2018-2022 EVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from eva.udfs.udf_output_builder import UDFOutputBuilder
+
+
+class UDFOutputBuilderTest(unittest.TestCase):
+    def test_should_build_dataframe_with_array_cells(self):
+        builder = UDFOutputBuilder(["labels", "scores", "bboxes"], num_rows=2)
+        builder.add_row(
+            labels=np.array(["car"]), scores=np.array([0.9]), bboxes=np.ones((1, 4))
+        )
+        builder.add_row(labels=np.array([]), scores=np.array([]), bboxes=[])
+        outcome = builder.build()
+
+        self.assertEqual(list(outcome.columns), ["labels", "scores", "bboxes"])
+        self.assertEqual(len(outcome), 2)
+        self.assertEqual(list(outcome["labels"][0]), ["car"])
+        self.assertEqual(outcome["bboxes"][0].shape, (1, 4))
+        self.assertEqual(len(outcome["scores"][1]), 0)
+
+    def test_should_grow_past_preallocated_rows(self):
+        builder = UDFOutputBuilder(["count"], num_rows=1)
+        for count in range(3):
+            builder.add_row(count=count)
+        self.assertEqual(len(builder), 3)
+        pd.testing.assert_frame_equal(
+            builder.build(), pd.DataFrame({"count": [0, 1, 2]})
+        )
+
+    def test_should_only_build_added_rows(self):
+        builder = UDFOutputBuilder(["count"], num_rows=5)
+        builder.add_row(count=1)
+        pd.testing.assert_frame_equal(builder.build(), pd.DataFrame({"count": [1]}))
+        self.assertEqual(len(UDFOutputBuilder(["count"]).build()), 0)
+
+    def test_should_raise_on_missing_columns(self):
+        builder = UDFOutputBuilder(["labels", "scores"])
+        with self.assertRaises(ValueError):
+            builder.add_row(labels=[])
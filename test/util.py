@@ -20,6 +20,7 @@ from pathlib import Path
 import cv2
 import numpy as np
 import pandas as pd
+from mock import patch
 
 from eva.binder.statement_binder import StatementBinder
 from eva.binder.statement_binder_context import StatementBinderContext
@@ -45,6 +46,21 @@ upload_dir_from_config = config.get_value("storage", "upload_dir")
 EVA_TEST_DATA_DIR = Path(config.get_value("core", "eva_installation_dir")).parent
 
 
+def missing_config_keys(*keys):
+    """
+    Patches the configuration as if its eva.yml was created before the
+    (category, key) pairs in keys were added, e.g., by an older release.
+    """
+    get = ConfigurationManager._get.__func__
+
+    def _get(cls, category, key):
+        if (category, key) in keys:
+            raise KeyError(key)
+        return get(cls, category, key)
+
+    return patch.object(ConfigurationManager, "_get", classmethod(_get))
+
+
 def get_logical_query_plan(query: str) -> Operator:
     """Get the query plan
 
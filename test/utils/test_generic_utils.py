@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -20,6 +21,7 @@ from mock import MagicMock, patch
 
 from eva.readers.opencv_reader import OpenCVReader
 from eva.utils.generic_utils import (
+    find_files,
     generate_file_path,
     is_gpu_available,
     path_to_class,
@@ -78,3 +80,25 @@ class ModulePathTest(unittest.TestCase):
 
         mock_conf_inst.get_value.return_value = None
         self.assertRaises(KeyError, generate_file_path)
+
+
+class FindFilesTest(unittest.TestCase):
+    def test_should_find_files_in_search_dir(self):
+        with tempfile.TemporaryDirectory() as search_dir:
+            for name in ["b.mp4", "a.mp4", "c.csv"]:
+                (Path(search_dir) / name).touch()
+            (Path(search_dir) / "d.mp4").mkdir()
+
+            self.assertEqual(
+                find_files("*.mp4", search_dir),
+                [Path(search_dir) / "a.mp4", Path(search_dir) / "b.mp4"],
+            )
+            self.assertEqual(
+                find_files(str(Path(search_dir) / "c.csv"), "."),
+                [Path(search_dir) / "c.csv"],
+            )
+            self.assertEqual(
+                find_files("c.csv", search_dir), [Path(search_dir) / "c.csv"]
+            )
+            self.assertEqual(find_files("*.avi", search_dir), [])
+            self.assertEqual(find_files("e.mp4", search_dir), [])